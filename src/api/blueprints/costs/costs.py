@@ -1,18 +1,49 @@
 """Costs blueprint for handling cost-related operations."""
+from datetime import datetime, timezone
+from functools import lru_cache
 from uuid import UUID
 from flask import Blueprint, jsonify, request
 from flask_restful import Resource
+from pydantic import ValidationError
 
+from src.domain.entities.cost import Cost, CostSettings
+from src.domain.services.cost.cost_cache import get_cost_result_cache
 from src.domain.services.cost.cost_calculation import CostCalculationService
-from src.domain.services.cost.cost_settings import CostSettingsServiceImpl as CostSettingsService
+from src.domain.services.cost.recalculation import CostRecalculationService
+from src.infrastructure.repositories.cost_repository import CostRepository
 from src.infrastructure.repositories.route_repository import RouteRepository
 from src.infrastructure.repositories.cost_settings_repository import CostSettingsRepository
-from src.infrastructure.database import get_db
+from src.infrastructure.database import Database, get_db
 from src.infrastructure.logging import get_logger
 from src.api.models import ErrorResponse
 
 costs_bp = Blueprint('costs', __name__)
 
+@lru_cache
+def get_cost_recalculator() -> CostRecalculationService:
+    """Get the recalculator of stored costs.
+    
+    Recalculation jobs run and are tracked in this process only.
+    """
+    return CostRecalculationService(CostRepository(Database()))
+
+def _cost_response(cost: Cost) -> dict:
+    """Convert a cost record to the response format."""
+    return {
+        "route_id": str(cost.route_id),
+        "cost_id": str(cost.id),
+        "breakdown": cost.breakdown.model_dump(mode="json"),
+        "total": {
+            "amount": str(cost.total_cost),
+            "currency": cost.breakdown.currency
+        },
+        "metadata": {
+            "version": cost.version,
+            "calculation_method": cost.calculation_method,
+            "calculated_at": cost.calculated_at.isoformat()
+        }
+    }
+
 class RouteCalculationResource(Resource):
     """Resource for route cost calculations."""
 
@@ -20,7 +51,7 @@ class RouteCalculationResource(Resource):
         self.logger = get_logger(__name__)
 
     def post(self, route_id: UUID):
-        """Calculate costs for a route using current settings."""
+        """Calculate costs for a route using its cost settings."""
         logger = self.logger.bind(
             endpoint="route_calculation",
             method="POST",
@@ -32,51 +63,36 @@ class RouteCalculationResource(Resource):
         try:
             with get_db() as db:
                 # Initialize repositories and services
-                route_repository = RouteRepository(db=db)
+                route_repository = RouteRepository()
                 cost_settings_repository = CostSettingsRepository(db=db)
-                cost_settings_service = CostSettingsService(
-                    settings_repository=cost_settings_repository,
-                    route_repository=route_repository
-                )
                 cost_calculation_service = CostCalculationService(
-                    settings_service=cost_settings_service,
-                    route_repository=route_repository
+                    result_cache=get_cost_result_cache()
+                )
+                
+                route = route_repository.get(route_id)
+                if not route:
+                    return ErrorResponse(
+                        error=f"Route {route_id} not found",
+                        code="NOT_FOUND"
+                    ).dict(), 404
+                
+                # Routes without their own settings use the defaults
+                settings = (
+                    cost_settings_repository.get_by_route_id(route_id)
+                    or CostSettings.get_default(route_id)
                 )
                 
                 # Calculate costs
                 try:
-                    cost_breakdown = cost_calculation_service.calculate_costs(route_id)
+                    cost = cost_calculation_service.calculate_detailed_cost(route, settings)
                 except ValueError as e:
-                    if "not found" in str(e):
-                        return ErrorResponse(
-                            error=str(e),
-                            code="NOT_FOUND"
-                        ).dict(), 404
-                    else:
-                        return ErrorResponse(
-                            error=str(e),
-                            code="BAD_REQUEST"
-                        ).dict(), 400
-                
-                # Convert to response format
-                response = {
-                    "route_id": str(route_id),
-                    "breakdown": {
-                        "components": [comp.dict() for comp in cost_breakdown.components],
-                        "total": {
-                            "amount": str(cost_breakdown.total_amount),
-                            "currency": cost_breakdown.currency
-                        }
-                    },
-                    "metadata": {
-                        "version": cost_breakdown.version,
-                        "created_at": cost_breakdown.created_at.isoformat() if cost_breakdown.created_at else None,
-                        "created_by": cost_breakdown.created_by
-                    }
-                }
+                    return ErrorResponse(
+                        error=str(e),
+                        code="BAD_REQUEST"
+                    ).dict(), 400
                 
                 logger.info("Successfully calculated costs")
-                return response, 200
+                return _cost_response(cost), 200
                 
         except Exception as e:
             logger.exception("Error calculating costs")
@@ -97,52 +113,15 @@ class RouteCalculationResource(Resource):
         logger.info("Retrieving costs for route")
         
         try:
-            with get_db() as db:
-                # Initialize repositories and services
-                route_repository = RouteRepository(db=db)
-                cost_settings_repository = CostSettingsRepository(db=db)
-                cost_settings_service = CostSettingsService(
-                    settings_repository=cost_settings_repository,
-                    route_repository=route_repository
-                )
-                cost_calculation_service = CostCalculationService(
-                    settings_service=cost_settings_service,
-                    route_repository=route_repository
-                )
-                
-                # Get latest costs
-                try:
-                    cost_breakdown = cost_calculation_service.get_latest_costs(route_id)
-                    if not cost_breakdown:
-                        return ErrorResponse(
-                            error=f"No costs found for route {route_id}",
-                            code="NOT_FOUND"
-                        ).dict(), 404
-                except ValueError as e:
-                    return ErrorResponse(
-                        error=str(e),
-                        code="NOT_FOUND"
-                    ).dict(), 404
-                
-                # Convert to response format
-                response = {
-                    "route_id": str(route_id),
-                    "breakdown": {
-                        "components": [comp.dict() for comp in cost_breakdown.components],
-                        "total": {
-                            "amount": str(cost_breakdown.total_amount),
-                            "currency": cost_breakdown.currency
-                        }
-                    },
-                    "metadata": {
-                        "version": cost_breakdown.version,
-                        "created_at": cost_breakdown.created_at.isoformat() if cost_breakdown.created_at else None,
-                        "created_by": cost_breakdown.created_by
-                    }
-                }
-                
-                logger.info("Successfully retrieved costs")
-                return response, 200
+            cost = CostRepository(Database()).get_latest_for_route(route_id)
+            if not cost:
+                return ErrorResponse(
+                    error=f"No costs found for route {route_id}",
+                    code="NOT_FOUND"
+                ).dict(), 404
+            
+            logger.info("Successfully retrieved costs")
+            return _cost_response(cost), 200
                 
         except Exception as e:
             logger.exception("Error retrieving costs")
@@ -251,12 +230,32 @@ class CostSettingsResource(Resource):
                         code="NOT_FOUND"
                     ).dict(), 404
                 
-                # Update settings
-                for key, value in data.items():
-                    setattr(existing, key, value)
-                repository.update(existing)
+                # Validate the update as new settings; the modification time
+                # makes it a new version for compiled snapshots and the cache
+                try:
+                    updated = CostSettings.model_validate({
+                        **existing.model_dump(),
+                        **data,
+                        "id": existing.id,
+                        "route_id": existing.route_id,
+                        "modified_at": datetime.now(timezone.utc)
+                    })
+                except ValidationError as e:
+                    return ErrorResponse(
+                        error=str(e),
+                        code="BAD_REQUEST"
+                    ).dict(), 400
+                repository.save(updated)
+                
+                # Drop costs computed with the old settings
+                cost_cache = get_cost_result_cache()
+                cost_cache.invalidate_settings(updated.id)
+                cost_cache.invalidate_route(route_id)
+                
+                # Recompute stored cost components depending on changed rates
+                job = get_cost_recalculator().start(existing, updated)
                 
-                return existing.dict(), 200
+                return {**updated.model_dump(mode="json"), "recalculation_job_id": str(job.id)}, 200
                 
         except Exception as e:
             logger.exception("Error updating settings")
@@ -266,6 +265,51 @@ class CostSettingsResource(Resource):
                 details=str(e)
             ).dict(), 500
 
+class CostCacheResource(Resource):
+    """Resource for the cost result cache."""
+
+    def __init__(self):
+        self.logger = get_logger(__name__)
+
+    def get(self):
+        """Get cost cache hit/miss statistics."""
+        return get_cost_result_cache().get_stats(), 200
+
+    def delete(self):
+        """Drop all cached costs."""
+        logger = self.logger.bind(
+            endpoint="cost_cache",
+            method="DELETE",
+            remote_ip=request.remote_addr
+        )
+        removed = get_cost_result_cache().clear()
+        logger.info("Cleared cost cache", removed=removed)
+        return {"removed": removed}, 200
+
+class RecalculationJobResource(Resource):
+    """Resource for stored cost recalculation jobs."""
+
+    def __init__(self):
+        self.logger = get_logger(__name__)
+
+    def get(self, job_id: UUID = None):
+        """Get the progress of one recalculation job, or list all jobs.
+        
+        Jobs are kept per process, so only the process that ran the
+        settings update knows its job.
+        """
+        recalculator = get_cost_recalculator()
+        if job_id is None:
+            return {"jobs": [job.to_dict() for job in recalculator.list_jobs()]}, 200
+        
+        job = recalculator.get_job(job_id)
+        if not job:
+            return ErrorResponse(
+                error=f"Recalculation job {job_id} not found",
+                code="NOT_FOUND"
+            ).dict(), 404
+        return job.to_dict(), 200
+
 # Register resources
 costs_bp.add_url_rule('/routes/<uuid:route_id>/calculate', 
                       view_func=RouteCalculationResource.as_view('route_calculation'))
@@ -273,3 +317,9 @@ costs_bp.add_url_rule('/routes/<uuid:route_id>/costs',
                       view_func=RouteCalculationResource.as_view('route_costs'))
 costs_bp.add_url_rule('/routes/<uuid:route_id>/settings', 
                       view_func=CostSettingsResource.as_view('route_settings'))
+costs_bp.add_url_rule('/costs/cache', 
+                      view_func=CostCacheResource.as_view('cost_cache'))
+costs_bp.add_url_rule('/costs/recalculations', 
+                      view_func=RecalculationJobResource.as_view('cost_recalculations'))
+costs_bp.add_url_rule('/costs/recalculations/<uuid:job_id>', 
+                      view_func=RecalculationJobResource.as_view('cost_recalculation'))
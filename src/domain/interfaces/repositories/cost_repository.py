@@ -1,11 +1,12 @@
 """Cost repository interface."""
 from abc import abstractmethod
-from typing import List, Optional
+from typing import Dict, Iterable, List, Mapping, Optional, Set
 from uuid import UUID
 
 from src.domain.entities.cost import Cost
 from src.domain.interfaces.repositories.base import Repository
 from src.domain.interfaces.exceptions.repository_errors import EntityNotFoundError, ValidationError
+from src.domain.value_objects import Money
 
 class CostRepository(Repository[Cost]):
     """Interface for cost data access."""
@@ -70,3 +71,62 @@ class CostRepository(Repository[Cost]):
             EntityNotFoundError: If cost not found
         """
         pass
+
+    @abstractmethod
+    def save_dependencies(self, cost_id: UUID, dependencies: Mapping[str, object]) -> None:
+        """Record the settings dependencies of a cost's components.
+        
+        Args:
+            cost_id: Cost ID
+            dependencies: Component dependencies by component path
+            
+        Raises:
+            EntityNotFoundError: If cost not found
+        """
+        pass
+
+    @abstractmethod
+    def get_dependencies(self, cost_id: UUID) -> Dict[str, object]:
+        """Get the recorded settings dependencies of a cost's components.
+        
+        Args:
+            cost_id: Cost ID
+            
+        Returns:
+            Component dependencies by component path
+        """
+        pass
+
+    @abstractmethod
+    def find_by_settings_keys(self, keys: Iterable[str]) -> Dict[UUID, Set[str]]:
+        """Find the cost components depending on settings keys.
+        
+        Args:
+            keys: Settings keys
+            
+        Returns:
+            Component paths by cost ID
+        """
+        pass
+
+    @abstractmethod
+    def list_settings_keys(self) -> Set[str]:
+        """Get every settings key some cost component depends on.
+        
+        Returns:
+            Settings keys
+        """
+        pass
+
+    @abstractmethod
+    def update_components(self, cost_id: UUID, amounts: Mapping[str, Money]) -> Optional[Cost]:
+        """Replace the amounts of some components of a cost.
+        
+        Args:
+            cost_id: Cost ID
+            amounts: New amounts in cents by component path
+            
+        Returns:
+            Updated cost if exists, None otherwise
+        """
+        pass
@@ -5,6 +5,8 @@ The LocationService interface provides methods for:
 - Distance calculations
 - Duration estimates
 - Route segmentation
+- Route summaries (totals and segments from one lookup)
+- Distance matrices for many origin/destination pairs
 - Location validation
 
 Implementation Requirements:
@@ -46,14 +48,22 @@ Example Usage:
         destination="Paris, France",
         include_tolls=True
     )
+    
+    # Get distance, duration and segments together
+    summary = location_service.get_route_summary(
+        origin=origin,
+        destination=destination
+    )
     ```
 """
 from abc import ABC, abstractmethod
 from decimal import Decimal
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Optional, Tuple, Union
 from uuid import UUID
 
-from src.domain.value_objects import Location, CountrySegment
+from src.domain.value_objects import (
+    ArrayDistanceMatrix, CountrySegment, DistanceMatrix, Location, RouteSummary
+)
 from src.domain.interfaces.exceptions.service_errors import LocationServiceError
 
 class LocationService(ABC):
@@ -148,6 +158,79 @@ class LocationService(ABC):
         """
         pass
 
+    def get_route_summary(
+        self,
+        origin: Location,
+        destination: Location,
+        include_tolls: bool = False
+    ) -> RouteSummary:
+        """Get distance, duration and country segments for a route.
+        
+        Args:
+            origin: Starting location
+            destination: End location
+            include_tolls: Whether to include toll information
+            
+        Returns:
+            Route summary with totals and country segments
+            
+        Raises:
+            LocationServiceError: If route calculation fails
+            
+        Implementation Notes:
+            - Should derive everything from a single routing request
+            - The default implementation composes the individual calls
+        """
+        return RouteSummary(
+            origin=origin,
+            destination=destination,
+            distance_km=Decimal(str(self.calculate_distance(origin, destination))),
+            duration_hours=Decimal(str(self.calculate_duration(origin, destination))),
+            country_segments=self.get_route_segments(
+                origin,
+                destination,
+                include_tolls=include_tolls
+            )
+        )
+
+    def get_distance_matrix(
+        self,
+        origins: List[Location],
+        destinations: List[Location],
+        as_array: bool = False
+    ) -> Union[DistanceMatrix, ArrayDistanceMatrix]:
+        """Get distances and durations for every origin/destination pair.
+        
+        Args:
+            origins: Starting locations
+            destinations: End locations
+            as_array: Whether to return an ArrayDistanceMatrix
+            
+        Returns:
+            Distance matrix indexed by origin and destination position
+            
+        Raises:
+            LocationServiceError: If matrix calculation fails
+            
+        Implementation Notes:
+            - Should batch pairs into as few provider requests as possible
+            - The default implementation makes one call per pair
+        """
+        matrix = DistanceMatrix(
+            origins=origins,
+            destinations=destinations,
+            distances=[
+                [float(self.calculate_distance(origin, destination)) for destination in destinations]
+                for origin in origins
+            ],
+            durations=[
+                [float(self.calculate_duration(origin, destination)) for destination in destinations]
+                for origin in origins
+            ],
+            countries=[[origin.country] * len(destinations) for origin in origins]
+        )
+        return ArrayDistanceMatrix.from_distance_matrix(matrix) if as_array else matrix
+
     @abstractmethod
     def validate_location(
         self,
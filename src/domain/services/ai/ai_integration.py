@@ -47,6 +47,7 @@ class AIIntegrationService(BaseService, AIService):
         self._cache_service = cache_service
         self._retry_count = 3
         self._cache_ttl = 3600  # 1 hour
+        self._cache_stale_ttl = 600  # served while refreshing
     
     def optimize_route(
         self,
@@ -74,52 +75,21 @@ class AIIntegrationService(BaseService, AIService):
         )
         
         try:
-            # Check cache first
+            # Concurrent misses share one model call per key; the frozen
+            # result is cached as is, so hits skip validation
             cache_key = f"route_opt_{route.id}_{optimization_type}"
             if self._cache_service:
-                cached = self._cache_service.get(cache_key)
-                if cached:
-                    return RouteOptimization(**cached)
-            
-            # Prepare optimization request
-            request = {
-                "route_data": route.dict(),
-                "optimization_type": optimization_type,
-                "constraints": constraints or {}
-            }
-            
-            # Call AI model
-            response = self._call_model_with_retry(
-                "route_optimization",
-                request
-            )
-            
-            if not response:
-                raise ValueError("Failed to get optimization response")
-            
-            # Process results
-            optimization = RouteOptimization(
-                route_id=route.id,
-                original_distance=route.distance_km,
-                optimized_distance=response.get("distance"),
-                original_duration=route.duration_hours,
-                optimized_duration=response.get("duration"),
-                optimization_type=optimization_type,
-                improvements=response.get("improvements", []),
-                score=response.get("score"),
-                metadata={
-                    "model_version": response.get("model_version"),
-                    "optimization_time": response.get("processing_time"),
-                    "confidence": response.get("confidence")
-                }
-            )
-            
-            # Cache results
-            if self._cache_service:
-                self._cache_service.set(
+                optimization = self._cache_service.get_or_compute(
                     cache_key,
-                    optimization.dict(),
-                    self._cache_ttl
+                    lambda: self._compute_route_optimization(
+                        route, optimization_type, constraints
+                    ),
+                    self._cache_ttl,
+                    stale_ttl=self._cache_stale_ttl
+                )
+            else:
+                optimization = self._compute_route_optimization(
+                    route, optimization_type, constraints
                 )
             
             self._log_exit("optimize_route", optimization)
@@ -280,6 +250,58 @@ class AIIntegrationService(BaseService, AIService):
             self._log_error("process_query", e)
             raise ValueError(f"Query processing failed: {str(e)}")
     
+    def _compute_route_optimization(
+        self,
+        route: Route,
+        optimization_type: str,
+        constraints: Optional[Dict]
+    ) -> RouteOptimization:
+        """Run route optimization on the AI model.
+        
+        Args:
+            route: Route to optimize
+            optimization_type: Type of optimization
+            constraints: Optional constraints
+            
+        Returns:
+            Optimization results
+            
+        Raises:
+            ValueError: If the model gives no response
+        """
+        # Prepare optimization request
+        request = {
+            "route_data": route.dict(),
+            "optimization_type": optimization_type,
+            "constraints": constraints or {}
+        }
+        
+        # Call AI model
+        response = self._call_model_with_retry(
+            "route_optimization",
+            request
+        )
+        
+        if not response:
+            raise ValueError("Failed to get optimization response")
+        
+        # Process results
+        return RouteOptimization(
+            route_id=route.id,
+            original_distance=route.distance_km,
+            optimized_distance=response.get("distance"),
+            original_duration=route.duration_hours,
+            optimized_duration=response.get("duration"),
+            optimization_type=optimization_type,
+            improvements=response.get("improvements", []),
+            score=response.get("score"),
+            metadata={
+                "model_version": response.get("model_version"),
+                "optimization_time": response.get("processing_time"),
+                "confidence": response.get("confidence")
+            }
+        )
+    
     def _call_model_with_retry(
         self,
         endpoint: str,
@@ -6,14 +6,44 @@ It provides:
 - Cache invalidation
 - TTL management
 - Cache statistics
+- Selectable O(1) eviction (see eviction.py)
+- Incremental expiry (see expiry.py)
+- Stampede-protected loading with early refresh and stale serving
+- Tag and namespace invalidation
+- Byte-budgeted memory tier with per-namespace usage (see sizing.py)
+- Binary payloads for the remote tiers (see SerializerRegistry)
 """
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Any, Dict, List, Optional, Set, Union
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
 import json
+import math
+import random
 import threading
 import time
 
 from src.domain.services.common.base import BaseService
+from src.domain.services.common.eviction import CacheEntry, create_eviction_policy
+from src.domain.services.common.expiry import ExpiryWheel
+from src.infrastructure.services.serialization import get_serializer_registry
+from src.infrastructure.services.shared_cache import get_shared_cache_tier
+from src.domain.services.common.sizing import CompressedValue, estimate_size
+from src.infrastructure.services.single_flight import SingleFlight
+
+# Keys are namespaced by the part before the first separator ("cost:...")
+NAMESPACE_SEPARATOR = ":"
+_NAMESPACE_TAG = "namespace:{}"
+# Redis set holding the keys of a tag
+_TAG_INDEX_KEY = "cache-tag:{}"
+# Namespace reported for keys without a prefix
+DEFAULT_NAMESPACE = "default"
+
+
+def _unwrap(value: Any) -> Any:
+    """Get a cached value, decompressing it if needed."""
+    return value.load() if isinstance(value, CompressedValue) else value
+
 
 class CacheService(BaseService):
     """Service for caching data.
@@ -23,13 +53,35 @@ class CacheService(BaseService):
     - Cache invalidation
     - TTL enforcement
     - Cache statistics
+    
+    Entries can carry tags (for example "settings:3" or "country:DE") and
+    belong to the namespace named by their key prefix. Tag indexes are kept
+    in memory and, with Redis, as Redis sets, so invalidate_tag() and
+    invalidate_namespace() remove only the affected entries from both
+    tiers. Memory tiers of other processes are not reached.
+    
+    An optional shared tier (see SharedCacheTier) sits between memory and
+    Redis, so worker processes on one host reuse each other's values.
+    
+    Memory entries are kept as objects. Redis values are written as
+    serializer registry payloads, so cached pydantic models come back
+    through model_construct instead of being validated on every hit.
     """
     
     def __init__(
         self,
         redis_client: Optional['RedisClient'] = None,
         max_memory_items: int = 10000,
-        default_ttl: int = 3600
+        default_ttl: int = 3600,
+        eviction_policy: str = "lru",
+        sweep_interval: float = 1.0,
+        sweep_batch_size: int = 1000,
+        refresh_workers: int = 4,
+        max_memory_bytes: Optional[int] = None,
+        max_entry_bytes: Optional[int] = None,
+        compress_oversized: bool = True,
+        shared_tier: Optional['SharedCacheTier'] = None,
+        serializer: Optional[str] = None
     ):
         """Initialize cache service.
         
@@ -37,15 +89,56 @@ class CacheService(BaseService):
             redis_client: Optional Redis client
             max_memory_items: Maximum items in memory cache
             default_ttl: Default TTL in seconds
+            eviction_policy: Memory eviction policy ("lru" or "tinylfu")
+            sweep_interval: Seconds between expiry sweeps
+            sweep_batch_size: Maximum entries removed per lock acquisition
+            refresh_workers: Threads refreshing stale entries in the background
+            max_memory_bytes: Optional budget for the approximate size of
+                the memory cache; least valuable entries are evicted to fit
+            max_entry_bytes: Optional size limit for one memory entry
+            compress_oversized: Compress entries over max_entry_bytes
+                instead of keeping them out of the memory cache
+            shared_tier: Optional cache shared by the workers on this host
+            serializer: Serializer for Redis payloads (defaults to the
+                registry default)
         """
         super().__init__()
         self._redis = redis_client
-        self._memory_cache: Dict[str, Any] = {}
-        self._memory_ttl: Dict[str, float] = {}
-        self._memory_hits: Dict[str, int] = {}
+        self._shared = shared_tier
+        self._serializer = serializer
+        self._registry = get_serializer_registry()
+        self._memory = create_eviction_policy(
+            eviction_policy,
+            max_memory_items,
+            max_weight=max_memory_bytes
+        )
         self._max_items = max_memory_items
+        self._max_bytes = max_memory_bytes
+        self._max_entry_bytes = max_entry_bytes
+        self._compress_oversized = compress_oversized
+        self._namespaces: Dict[str, Dict[str, int]] = {}
+        self._compressed = 0
+        self._rejected = 0
         self._default_ttl = default_ttl
         self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._expiry = ExpiryWheel(resolution=sweep_interval)
+        self._sweep_interval = sweep_interval
+        self._sweep_batch_size = sweep_batch_size
+        self._stopped = threading.Event()
+        self._computes = 0
+        self._early_refreshes = 0
+        self._stale_served = 0
+        self._tags: Dict[str, Set[str]] = {}
+        self._invalidations = 0
+        self._flights = SingleFlight("cache")
+        self._refresher = ThreadPoolExecutor(
+            max_workers=refresh_workers,
+            thread_name_prefix="cache-refresh"
+        )
         
         # Start cleanup thread
         self._cleanup_thread = threading.Thread(
@@ -73,30 +166,28 @@ class CacheService(BaseService):
         try:
             # Try memory cache first
             with self._lock:
-                if key in self._memory_cache:
-                    if self._is_valid(key):
-                        self._memory_hits[key] = (
-                            self._memory_hits.get(key, 0) + 1
-                        )
-                        value = self._memory_cache[key]
-                        self._log_exit("get", "memory_hit")
-                        return value
-                    else:
-                        # Remove expired entry
-                        self._remove_memory_entry(key)
-            
-            # Try Redis if available
-            if self._redis:
-                value = self._redis.get(key)
-                if value is not None:
-                    # Cache in memory
-                    self.set(
-                        key,
-                        value,
-                        self._redis.ttl(key)
-                    )
-                    self._log_exit("get", "redis_hit")
-                    return value
+                entry = self._memory.get(key)
+                now = time.time()
+                hit = entry is not None and now < min(entry.fresh_until, entry.expires_at)
+                if hit:
+                    self._hits += 1
+                    value = entry.value
+                else:
+                    # Remove expired entry; stale ones are kept for get_or_compute
+                    if entry is not None and now >= entry.expires_at:
+                        self._remove_entry(key)
+                        self._expirations += 1
+                    self._misses += 1
+            
+            if hit:
+                self._log_exit("get", "memory_hit")
+                return _unwrap(value)
+            
+            # Try the shared tier, then Redis
+            found = self._get_remote([key])
+            if key in found:
+                self._log_exit("get", "remote_hit")
+                return found[key]
             
             self._log_exit("get", "miss")
             return default
@@ -109,7 +200,8 @@ class CacheService(BaseService):
         self,
         key: str,
         value: Any,
-        ttl: Optional[int] = None
+        ttl: Optional[int] = None,
+        tags: Optional[Iterable[str]] = None
     ) -> bool:
         """Set cache value.
         
@@ -117,6 +209,7 @@ class CacheService(BaseService):
             key: Cache key
             value: Value to cache
             ttl: Optional TTL in seconds
+            tags: Optional tags for invalidate_tag()
             
         Returns:
             True if successful
@@ -124,39 +217,177 @@ class CacheService(BaseService):
         self._log_entry("set", key=key, ttl=ttl)
         
         try:
-            ttl = ttl or self._default_ttl
+            success = self._store(key, value, ttl or self._default_ttl, tags=tags)
+            self._log_exit("set", "success" if success else "redis_fail")
+            return success
             
-            # Set in Redis if available
-            if self._redis:
-                success = self._redis.set(
-                    key,
-                    value,
-                    ex=ttl
-                )
-                if not success:
-                    self._log_exit("set", "redis_fail")
-                    return False
+        except Exception as e:
+            self._log_error("set", e)
+            return False
+    
+    def get_many(self, keys: Iterable[str]) -> Dict[str, Any]:
+        """Get several values from cache.
+        
+        Keys missing from memory are looked up in the shared tier with one
+        query, then in Redis with one pipeline that also fetches their TTLs.
+        Values found remotely are stored in memory in a single pass.
+        
+        Args:
+            keys: Cache keys
             
-            # Set in memory cache
+        Returns:
+            Cached values by key; keys not found are left out
+        """
+        keys = list(dict.fromkeys(keys))
+        self._log_entry("get_many", count=len(keys))
+        
+        try:
+            found = {}
             with self._lock:
-                # Check if we need to make space
-                if (
-                    len(self._memory_cache) >= self._max_items and
-                    key not in self._memory_cache
-                ):
-                    self._evict_entries()
-                
-                self._memory_cache[key] = value
-                self._memory_ttl[key] = time.time() + ttl
-                self._memory_hits[key] = 0
+                now = time.time()
+                for key in keys:
+                    entry = self._memory.get(key)
+                    if entry is not None and now < min(entry.fresh_until, entry.expires_at):
+                        self._hits += 1
+                        found[key] = entry.value
+                        continue
+                    if entry is not None and now >= entry.expires_at:
+                        self._remove_entry(key)
+                        self._expirations += 1
+                    self._misses += 1
+            found = {key: _unwrap(value) for key, value in found.items()}
             
-            self._log_exit("set", "success")
-            return True
+            missing = [key for key in keys if key not in found]
+            if missing:
+                found.update(self._get_remote(missing))
+            
+            self._log_exit("get_many", len(found))
+            return found
             
         except Exception as e:
-            self._log_error("set", e)
+            self._log_error("get_many", e)
+            return {}
+    
+    def set_many(
+        self,
+        items: Dict[str, Any],
+        ttl: Optional[int] = None,
+        tags: Optional[Iterable[str]] = None
+    ) -> bool:
+        """Set several cache values.
+        
+        Redis writes, tag indexing included, go through pipelines, the
+        shared tier is written in one transaction and the memory cache under
+        one lock acquisition.
+        
+        Args:
+            items: Values by key
+            ttl: Optional TTL in seconds
+            tags: Optional tags for invalidate_tag(), applied to every key
+            
+        Returns:
+            True if successful
+        """
+        self._log_entry("set_many", count=len(items), ttl=ttl)
+        
+        try:
+            ttl = ttl or self._default_ttl
+            success = self._store_many(
+                {key: (value, ttl) for key, value in items.items()},
+                tags=tags
+            )
+            self._log_exit("set_many", "success" if success else "redis_fail")
+            return success
+            
+        except Exception as e:
+            self._log_error("set_many", e)
             return False
     
+    def get_or_compute(
+        self,
+        key: str,
+        loader: Callable[[], Any],
+        ttl: Optional[int] = None,
+        beta: float = 1.0,
+        stale_ttl: int = 0,
+        tags: Optional[Iterable[str]] = None
+    ) -> Any:
+        """Get value from cache, computing it at most once per key.
+        
+        Concurrent misses for a key share one loader call. Fresh entries
+        may be recomputed shortly before they expire, with a probability
+        that rises as expiry nears and with how long the loader took
+        (XFetch), so hot keys are refreshed by one caller instead of
+        expiring under load. With stale_ttl, an expired value is served
+        for that much longer while a background call refreshes it; stale
+        values are kept in the memory tier only.
+        
+        Args:
+            key: Cache key
+            loader: Callable computing the value on a miss
+            ttl: Optional TTL in seconds
+            beta: Early refresh eagerness; 0 disables early refresh
+            stale_ttl: Seconds an expired value may be served while refreshing
+            tags: Optional tags for invalidate_tag()
+            
+        Returns:
+            Cached or computed value
+            
+        Raises:
+            Exception: Whatever the loader raised when no value was cached
+        """
+        self._log_entry("get_or_compute", key=key, ttl=ttl)
+        ttl = ttl or self._default_ttl
+        
+        with self._lock:
+            entry = self._memory.get(key)
+            now = time.time()
+            refresh = None
+            if entry is not None and now < entry.expires_at:
+                value = entry.value
+                if now >= entry.fresh_until:
+                    refresh = "stale"
+                    self._stale_served += 1
+                elif self._refresh_early(entry, now, beta):
+                    refresh = "early"
+                    self._early_refreshes += 1
+                else:
+                    refresh = "fresh"
+                    self._hits += 1
+            else:
+                self._misses += 1
+        
+        if refresh == "fresh":
+            self._log_exit("get_or_compute", "memory_hit")
+            return _unwrap(value)
+        
+        if refresh is None:
+            value = self._load(key, loader, ttl, stale_ttl, tags, refresh=False)
+            self._log_exit("get_or_compute", "computed")
+            return value
+        
+        value = _unwrap(value)
+        
+        # Another caller is already refreshing this key
+        if self._flights.in_flight(key):
+            self._log_exit("get_or_compute", f"{refresh}_hit")
+            return value
+        
+        if refresh == "stale":
+            self._refresher.submit(
+                self._refresh_in_background, key, loader, ttl, stale_ttl, tags
+            )
+            self._log_exit("get_or_compute", "stale_hit")
+            return value
+        
+        try:
+            value = self._load(key, loader, ttl, stale_ttl, tags, refresh=True)
+        except Exception as e:
+            # The cached value has not expired yet, so keep serving it
+            self._log_error("get_or_compute", e)
+        self._log_exit("get_or_compute", "early_refresh")
+        return value
+    
     def delete(self, key: str) -> bool:
         """Delete cache entry.
         
@@ -173,13 +404,17 @@ class CacheService(BaseService):
             
             # Delete from memory
             with self._lock:
-                if key in self._memory_cache:
-                    self._remove_memory_entry(key)
-                    deleted = True
+                entry = self._remove_entry(key)
+                deleted = entry is not None
+            
+            if self._shared:
+                deleted = self._shared.delete(key) or deleted
             
             # Delete from Redis
             if self._redis:
                 redis_deleted = self._redis.delete(key) > 0
+                for tag in entry.tags if entry is not None else ():
+                    self._redis.srem(_TAG_INDEX_KEY.format(tag), key)
                 deleted = deleted or redis_deleted
             
             self._log_exit("delete", deleted)
@@ -200,9 +435,13 @@ class CacheService(BaseService):
         try:
             # Clear memory cache
             with self._lock:
-                self._memory_cache.clear()
-                self._memory_ttl.clear()
-                self._memory_hits.clear()
+                self._memory.clear()
+                self._expiry.clear()
+                self._tags.clear()
+                self._namespaces.clear()
+            
+            if self._shared:
+                self._shared.clear()
             
             # Clear Redis if available
             if self._redis:
@@ -215,6 +454,68 @@ class CacheService(BaseService):
             self._log_error("clear", e)
             return False
     
+    def invalidate_tag(self, tag: str) -> int:
+        """Remove all entries carrying a tag.
+        
+        Args:
+            tag: Tag given when the entries were set
+            
+        Returns:
+            Number of keys invalidated
+        """
+        self._log_entry("invalidate_tag", tag=tag)
+        
+        try:
+            # Memory index, plus keys other processes tagged in Redis
+            with self._lock:
+                keys = set(self._tags.get(tag, ()))
+            if self._shared:
+                keys.update(self._shared.invalidate_tag(tag))
+            if self._redis:
+                index_key = _TAG_INDEX_KEY.format(tag)
+                keys.update(
+                    key.decode() if isinstance(key, bytes) else key
+                    for key in self._redis.smembers(index_key)
+                )
+                self._redis.delete(*keys, index_key)
+            
+            with self._lock:
+                for key in keys:
+                    self._remove_entry(key)
+                self._tags.pop(tag, None)
+                self._invalidations += len(keys)
+            
+            self._log_exit("invalidate_tag", len(keys))
+            return len(keys)
+            
+        except Exception as e:
+            self._log_error("invalidate_tag", e)
+            return 0
+    
+    def invalidate_namespace(self, namespace: str) -> int:
+        """Remove all entries whose key starts with a namespace.
+        
+        Args:
+            namespace: Namespace, as passed to make_key()
+            
+        Returns:
+            Number of keys invalidated
+        """
+        return self.invalidate_tag(_NAMESPACE_TAG.format(namespace))
+    
+    @staticmethod
+    def make_key(namespace: str, *parts: Any) -> str:
+        """Build a namespaced cache key.
+        
+        Args:
+            namespace: Namespace for invalidate_namespace()
+            parts: Key parts
+            
+        Returns:
+            Key such as "cost:route-1:3"
+        """
+        return NAMESPACE_SEPARATOR.join([namespace, *(str(part) for part in parts)])
+    
     def get_stats(self) -> Dict[str, Any]:
         """Get cache statistics.
         
@@ -224,15 +525,36 @@ class CacheService(BaseService):
         self._log_entry("get_stats")
         
         try:
-            stats = {
-                "memory_cache": {
-                    "size": len(self._memory_cache),
-                    "max_size": self._max_items,
-                    "hits": sum(self._memory_hits.values()),
-                    "items": len(self._memory_cache),
-                    "expired": self._count_expired()
+            with self._lock:
+                stats = {
+                    "memory_cache": {
+                        "size": len(self._memory),
+                        "max_size": self._max_items,
+                        "policy": self._memory.name,
+                        "hits": self._hits,
+                        "misses": self._misses,
+                        "evictions": self._evictions,
+                        "expirations": self._expirations,
+                        "computes": self._computes,
+                        "early_refreshes": self._early_refreshes,
+                        "stale_served": self._stale_served,
+                        "tags": len(self._tags),
+                        "invalidations": self._invalidations,
+                        "bytes": self._memory.weight,
+                        "max_bytes": self._max_bytes,
+                        "compressed": self._compressed,
+                        "rejected": self._rejected,
+                        "namespaces": {
+                            namespace: dict(usage)
+                            for namespace, usage in sorted(self._namespaces.items())
+                        },
+                        "items": len(self._memory),
+                        "expired": self._count_expired()
+                    }
                 }
-            }
+            
+            if self._shared:
+                stats["shared"] = self._shared.get_stats()
             
             # Add Redis stats if available
             if self._redis:
@@ -252,87 +574,463 @@ class CacheService(BaseService):
             self._log_error("get_stats", e)
             return {"error": str(e)}
     
-    def _is_valid(self, key: str) -> bool:
-        """Check if cache entry is valid.
+    def close(self) -> None:
+        """Stop the background expiry sweep and refreshes."""
+        self._stopped.set()
+        self._refresher.shutdown(wait=False)
+    
+    def _store(
+        self,
+        key: str,
+        value: Any,
+        ttl: int,
+        stale_ttl: int = 0,
+        delta: float = 0.0,
+        tags: Optional[Iterable[str]] = None
+    ) -> bool:
+        """Store a value in every tier.
         
         Args:
             key: Cache key
+            value: Value to cache
+            ttl: TTL in seconds
+            stale_ttl: Seconds the memory entry outlives its TTL as stale
+            delta: Seconds it took to compute the value
+            tags: Optional tags; the key's namespace is added automatically
             
         Returns:
-            True if valid
+            False if Redis rejected the value, or there is no other tier and
+            the value is too large for the memory cache
         """
-        return (
-            key in self._memory_ttl and
-            time.time() < self._memory_ttl[key]
-        )
+        return self._store_many({key: (value, ttl)}, stale_ttl, delta, tags)
     
-    def _count_expired(self) -> int:
-        """Count expired cache entries.
+    def _store_many(
+        self,
+        items: Dict[str, Tuple[Any, float]],
+        stale_ttl: int = 0,
+        delta: float = 0.0,
+        tags: Optional[Iterable[str]] = None,
+        to_redis: bool = True,
+        to_shared: bool = True
+    ) -> bool:
+        """Store values in the memory cache and, optionally, the other tiers.
         
+        Args:
+            items: Value and TTL in seconds by key
+            stale_ttl: Seconds memory entries outlive their TTL as stale
+            delta: Seconds it took to compute the values
+            tags: Optional tags; each key's namespace is added automatically
+            to_redis: Also write to Redis
+            to_shared: Also write to the shared tier
+            
         Returns:
-            Number of expired entries
+            False if Redis rejected a value, or there is no other tier and
+            a value is too large for the memory cache
         """
-        now = time.time()
-        return sum(
-            1 for ttl in self._memory_ttl.values()
-            if ttl < now
-        )
+        tags = frozenset(tags or ())
+        tagged = {
+            key: (value, ttl, self._key_tags(key, tags))
+            for key, (value, ttl) in items.items()
+        }
+        to_redis = bool(self._redis) and to_redis
+        to_shared = bool(self._shared) and to_shared
+        
+        if to_redis and not self._redis_set_many(tagged):
+            return False
+        if to_shared:
+            self._shared.set_many(tagged)
+        
+        # Sized outside the lock; compressing a large value takes a while
+        fitted = {key: self._fit(key, value) for key, (value, _, _) in tagged.items()}
+        
+        # Set in memory cache; the policy evicts in O(1) when full
+        with self._lock:
+            now = time.time()
+            for key, (_, ttl, key_tags) in tagged.items():
+                if fitted[key] is None:
+                    self._rejected += 1
+                    # Never leave an older value behind in memory
+                    self._remove_entry(key)
+                    continue
+                value, weight = fitted[key]
+                self._put(key, value, weight, now + ttl, stale_ttl, delta, key_tags)
+        
+        if any(result is None for result in fitted.values()):
+            return to_redis or to_shared
+        return True
     
-    def _remove_memory_entry(self, key: str) -> None:
-        """Remove entry from memory cache.
+    def _put(
+        self,
+        key: str,
+        value: Any,
+        weight: int,
+        fresh_until: float,
+        stale_ttl: int,
+        delta: float,
+        tags: frozenset
+    ) -> None:
+        """Put a value into the memory cache.
+        
+        Must be called with the lock held.
         
         Args:
             key: Cache key
+            value: Value, possibly compressed
+            weight: Estimated size of the value
+            fresh_until: Time the value expires
+            stale_ttl: Seconds the entry outlives fresh_until as stale
+            delta: Seconds it took to compute the value
+            tags: Tags of the entry
         """
-        self._memory_cache.pop(key, None)
-        self._memory_ttl.pop(key, None)
-        self._memory_hits.pop(key, None)
+        if isinstance(value, CompressedValue):
+            self._compressed += 1
+        existing = self._memory.peek(key)
+        if existing is not None:
+            self._account(existing, -1)
+        evicted = self._memory.put(key, value, fresh_until + stale_ttl, weight)
+        self._evictions += len(evicted)
+        for entry in evicted:
+            # A new key refused admission was never accounted
+            if entry.key != key:
+                self._discard(entry)
+        entry = self._memory.peek(key)
+        if entry is not None:
+            self._account(entry, 1)
+            entry.fresh_until = fresh_until
+            entry.delta = delta
+            if entry.tags != tags:
+                self._untag(entry)
+                entry.tags = tags
+                for tag in tags:
+                    self._tags.setdefault(tag, set()).add(key)
+            self._expiry.schedule(entry)
     
-    def _evict_entries(self) -> None:
-        """Evict entries to make space.
+    def _key_tags(self, key: str, tags: frozenset) -> frozenset:
+        """Get the tags of a key, including its namespace tag."""
+        if NAMESPACE_SEPARATOR in key:
+            return tags | {_NAMESPACE_TAG.format(self._namespace(key))}
+        return tags
+    
+    def _redis_set_many(self, items: Dict[str, Tuple[Any, float, frozenset]]) -> bool:
+        """Write values and their tag indexes to Redis in pipelines.
         
-        Eviction strategy:
-        1. Remove expired entries
-        2. Remove least recently used entries
+        Args:
+            items: Value, TTL and tags by key
+            
+        Returns:
+            True if Redis stored every value
         """
-        # Remove expired entries
-        now = time.time()
-        expired = [
-            k for k, ttl in self._memory_ttl.items()
-            if ttl < now
+        pipe = self._redis.pipeline(transaction=False)
+        index_ttls: Dict[str, float] = {}
+        set_positions = []
+        position = 0
+        for key, (value, ttl, tags) in items.items():
+            pipe.set(key, self._registry.dumps(value, self._serializer), ex=ttl)
+            set_positions.append(position)
+            position += 1
+            for tag in tags:
+                index_key = _TAG_INDEX_KEY.format(tag)
+                pipe.sadd(index_key, key)
+                position += 1
+                index_ttls[index_key] = max(index_ttls.get(index_key, 0), ttl)
+        for index_key in index_ttls:
+            pipe.ttl(index_key)
+        results = pipe.execute()
+        
+        # Index sets live as long as their longest-lived key
+        current_ttls = results[position:]
+        extend = [
+            (index_key, ttl)
+            for (index_key, ttl), current in zip(index_ttls.items(), current_ttls)
+            if current < ttl
         ]
-        for key in expired:
-            self._remove_memory_entry(key)
-        
-        # If still need space, remove least used
-        if len(self._memory_cache) >= self._max_items:
-            # Sort by hits (least used first)
-            sorted_entries = sorted(
-                self._memory_hits.items(),
-                key=lambda x: x[1]
-            )
+        if extend:
+            pipe = self._redis.pipeline(transaction=False)
+            for index_key, ttl in extend:
+                pipe.expire(index_key, ttl)
+            pipe.execute()
+        return all(results[index] for index in set_positions)
+    
+    def _get_remote(self, keys: List[str]) -> Dict[str, Any]:
+        """Look keys up in the shared tier, then Redis, and keep copies in memory.
+        
+        Args:
+            keys: Keys missing from memory
             
-            # Remove bottom 10%
-            to_remove = max(
-                len(sorted_entries) // 10,
-                1
+        Returns:
+            Values found by key
+        """
+        found: Dict[str, Any] = {}
+        if self._shared:
+            now = time.time()
+            shared = self._shared.get_many(keys)
+            if shared:
+                self._store_many(
+                    {key: (value, expires_at - now) for key, (value, expires_at) in shared.items()},
+                    to_redis=False,
+                    to_shared=False
+                )
+                found.update({key: value for key, (value, _) in shared.items()})
+        
+        missing = [key for key in keys if key not in found]
+        if missing and self._redis:
+            # Values and TTLs in one round trip
+            pipe = self._redis.pipeline(transaction=False)
+            for key in missing:
+                pipe.get(key)
+                pipe.ttl(key)
+            results = pipe.execute()
+            remote = {}
+            for key, payload, ttl in zip(missing, results[::2], results[1::2]):
+                if payload is None:
+                    continue
+                try:
+                    value = self._decode(payload)
+                except ValueError as e:
+                    # Another model schema version: treat as a miss
+                    self.logger.debug(f"Ignoring Redis value for {key}: {str(e)}")
+                    continue
+                remote[key] = (value, ttl if ttl > 0 else self._default_ttl)
+            if remote:
+                self._store_many(remote, to_redis=False)
+                found.update({key: value for key, (value, _) in remote.items()})
+        return found
+    
+    def _decode(self, payload: Any) -> Any:
+        """Deserialize a Redis value; values not written as payloads are returned as is."""
+        if self._registry.is_payload(payload):
+            return self._registry.loads(payload)
+        return payload
+    
+    def _fit(self, key: str, value: Any) -> Optional[Tuple[Any, int]]:
+        """Prepare a value for the memory cache.
+        
+        Args:
+            key: Cache key
+            value: Value to cache
+            
+        Returns:
+            Value to store (compressed if it was over the entry limit) and
+            its estimated size, or None if it does not fit
+        """
+        weight = estimate_size(value)
+        if self._max_entry_bytes is None or weight <= self._max_entry_bytes:
+            return value, weight
+        
+        if self._compress_oversized:
+            try:
+                compressed = CompressedValue(value)
+            except Exception as e:
+                self.logger.warning(f"Cannot compress cache value for {key}: {str(e)}")
+            else:
+                compressed_weight = estimate_size(compressed)
+                if compressed_weight <= self._max_entry_bytes:
+                    return compressed, compressed_weight
+        
+        self.logger.warning(
+            f"Cache value for {key} is too large for memory",
+            size=weight,
+            limit=self._max_entry_bytes
+        )
+        return None
+    
+    def _load(
+        self,
+        key: str,
+        loader: Callable[[], Any],
+        ttl: int,
+        stale_ttl: int,
+        tags: Optional[Iterable[str]],
+        refresh: bool
+    ) -> Any:
+        """Compute and store a value, sharing the call with concurrent callers.
+        
+        Args:
+            key: Cache key
+            loader: Callable computing the value
+            ttl: TTL in seconds
+            stale_ttl: Seconds the value may be served stale
+            tags: Optional tags for invalidate_tag()
+            refresh: Recompute even if a fresh value is cached
+            
+        Returns:
+            Computed or cached value
+        """
+        def compute() -> Any:
+            if not refresh:
+                # A caller that just finished may have filled the cache
+                with self._lock:
+                    entry = self._memory.peek(key)
+                    fresh = entry is not None and time.time() < entry.fresh_until
+                    value = entry.value if fresh else None
+                if fresh:
+                    return _unwrap(value)
+                found = self._get_remote([key])
+                if key in found:
+                    return found[key]
+            
+            started = time.time()
+            value = loader()
+            with self._lock:
+                self._computes += 1
+            self._store(key, value, ttl, stale_ttl, time.time() - started, tags)
+            return value
+        
+        return self._flights.do(key, compute)
+    
+    def _refresh_in_background(
+        self,
+        key: str,
+        loader: Callable[[], Any],
+        ttl: int,
+        stale_ttl: int,
+        tags: Optional[Iterable[str]]
+    ) -> None:
+        """Refresh a stale entry, keeping it if the loader fails."""
+        try:
+            self._load(key, loader, ttl, stale_ttl, tags, refresh=True)
+        except Exception as e:
+            self.logger.error(
+                f"Background refresh error for {key}: {str(e)}",
+                exc_info=True
             )
-            for key, _ in sorted_entries[:to_remove]:
-                self._remove_memory_entry(key)
+    
+    @staticmethod
+    def _refresh_early(entry: CacheEntry, now: float, beta: float) -> bool:
+        """Decide whether to recompute a fresh entry before it expires.
+        
+        XFetch: refresh when now - delta * beta * log(rand) reaches the
+        expiry time. The log term is an exponentially distributed head
+        start scaled by the compute time, so slow values are refreshed
+        earlier and concurrent callers rarely pick the same moment.
+        
+        Args:
+            entry: Fresh cache entry
+            now: Current time
+            beta: Eagerness; values above 1 refresh earlier
+            
+        Returns:
+            True if the caller should recompute the entry
+        """
+        if beta <= 0 or entry.delta <= 0:
+            return False
+        # 1 - random() lies in (0, 1], keeping log() finite
+        head_start = -entry.delta * beta * math.log(1.0 - random.random())
+        return now + head_start >= entry.fresh_until
+    
+    def _count_expired(self) -> int:
+        """Count expired cache entries not yet swept.
+        
+        Returns:
+            Number of expired entries
+        """
+        return self._expiry.due_count(time.time())
+    
+    def _remove_entry(self, key: str) -> Optional[CacheEntry]:
+        """Remove entry from memory cache and expiry tracking.
+        
+        Must be called with the lock held.
+        
+        Args:
+            key: Cache key
+            
+        Returns:
+            Removed entry, or None if not cached
+        """
+        entry = self._memory.pop(key)
+        if entry is not None:
+            self._discard(entry)
+        return entry
+    
+    def _discard(self, entry: CacheEntry) -> None:
+        """Drop bookkeeping for an entry that left the memory cache.
+        
+        Must be called with the lock held.
+        
+        Args:
+            entry: Removed or evicted entry
+        """
+        self._expiry.cancel(entry)
+        self._untag(entry)
+        self._account(entry, -1)
+    
+    def _account(self, entry: CacheEntry, sign: int) -> None:
+        """Add an entry to, or with sign -1 remove it from, namespace usage.
+        
+        Must be called with the lock held.
+        
+        Args:
+            entry: Cache entry
+            sign: 1 when the entry is stored, -1 when it leaves
+        """
+        namespace = self._namespace(entry.key)
+        usage = self._namespaces.setdefault(namespace, {"items": 0, "bytes": 0})
+        usage["items"] += sign
+        usage["bytes"] += sign * entry.weight
+        if usage["items"] <= 0:
+            del self._namespaces[namespace]
+    
+    @staticmethod
+    def _namespace(key: str) -> str:
+        """Get the namespace of a key."""
+        if NAMESPACE_SEPARATOR in key:
+            return key.split(NAMESPACE_SEPARATOR, 1)[0]
+        return DEFAULT_NAMESPACE
+    
+    def _untag(self, entry: CacheEntry) -> None:
+        """Drop an entry from the memory tag index.
+        
+        Must be called with the lock held.
+        
+        Args:
+            entry: Entry removed or retagged
+        """
+        for tag in entry.tags:
+            keys = self._tags.get(tag)
+            if keys is not None:
+                keys.discard(entry.key)
+                if not keys:
+                    del self._tags[tag]
+        entry.tags = frozenset()
+    
+    def _remove_expired(self) -> int:
+        """Remove expired entries from memory cache.
+        
+        Only due entries are touched, and the lock is released after each
+        batch so requests are never blocked for a whole sweep.
+        
+        Returns:
+            Number of entries removed
+        """
+        removed = 0
+        while True:
+            with self._lock:
+                now = time.time()
+                batch = self._expiry.pop_due(now, self._sweep_batch_size)
+                for entry in batch:
+                    # Entries replaced or evicted since scheduling are skipped
+                    if self._memory.peek(entry.key) is entry and entry.expires_at <= now:
+                        self._memory.pop(entry.key)
+                        self._discard(entry)
+                        self._expirations += 1
+                        removed += 1
+            if len(batch) < self._sweep_batch_size:
+                return removed
     
     def _cleanup_loop(self) -> None:
         """Background cleanup loop."""
-        while True:
+        while not self._stopped.wait(self._sweep_interval):
             try:
-                # Sleep for 60 seconds
-                time.sleep(60)
-                
-                # Perform cleanup
-                with self._lock:
-                    self._evict_entries()
+                self._remove_expired()
                 
             except Exception as e:
                 self.logger.error(
                     f"Cleanup error: {str(e)}",
                     exc_info=True
                 )
+
+
+@lru_cache
+def get_cache_service() -> CacheService:
+    """Get the process-wide cache, backed by the host-wide shared tier when configured."""
+    return CacheService(shared_tier=get_shared_cache_tier())
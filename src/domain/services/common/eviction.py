@@ -0,0 +1,402 @@
+"""Eviction policies for the in-memory cache tier.
+
+This module implements constant-time eviction for CacheService.
+It provides:
+- CacheEntry objects holding value, expiry and access frequency
+- LRU eviction over a doubly linked list
+- W-TinyLFU eviction, which admits new keys only if they are used more
+  often than the entry they would replace
+- An optional weight budget (approximate bytes) on top of the item limit
+- A factory selecting a policy by name
+
+Every policy keeps a dict from key to entry plus intrusive linked lists, so
+lookups, inserts, updates and evictions are O(1) regardless of cache size.
+Policies are not thread-safe; CacheService serializes access with its lock.
+"""
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Iterator, List, Optional
+
+
+class CacheEntry:
+    """Cached value with expiry, frequency and list links."""
+
+    __slots__ = (
+        "key", "value", "expires_at", "fresh_until", "delta", "tags", "weight",
+        "frequency", "expiry_slot", "region", "prev", "next"
+    )
+
+    def __init__(self, key: Any = None, value: Any = None, expires_at: float = 0.0):
+        self.key = key
+        self.value = value
+        self.expires_at = expires_at
+        # Values served past fresh_until are stale; delta is the compute time
+        self.fresh_until = expires_at
+        self.delta = 0.0
+        self.tags: frozenset = frozenset()
+        self.weight = 1
+        self.frequency = 0
+        self.expiry_slot: Optional[int] = None
+        self.region: Optional["_LinkedList"] = None
+        self.prev: Optional["CacheEntry"] = None
+        self.next: Optional["CacheEntry"] = None
+
+
+class _LinkedList:
+    """Intrusive doubly linked list of entries, most recently used first."""
+
+    __slots__ = ("_head", "size")
+
+    def __init__(self):
+        # Sentinel node; head.next is the most recent entry, head.prev the least
+        self._head = CacheEntry()
+        self._head.prev = self._head.next = self._head
+        self.size = 0
+
+    def push_front(self, entry: CacheEntry) -> None:
+        """Insert an entry as the most recently used."""
+        head = self._head
+        entry.prev, entry.next = head, head.next
+        head.next.prev = entry
+        head.next = entry
+        entry.region = self
+        self.size += 1
+
+    def unlink(self, entry: CacheEntry) -> None:
+        """Remove an entry from the list."""
+        entry.prev.next = entry.next
+        entry.next.prev = entry.prev
+        entry.prev = entry.next = entry.region = None
+        self.size -= 1
+
+    def move_to_front(self, entry: CacheEntry) -> None:
+        """Mark an entry as the most recently used."""
+        if self._head.next is not entry:
+            self.unlink(entry)
+            self.push_front(entry)
+
+    def back(self) -> Optional[CacheEntry]:
+        """Get the least recently used entry."""
+        return None if self.size == 0 else self._head.prev
+
+    def __iter__(self) -> Iterator[CacheEntry]:
+        entry = self._head.next
+        while entry is not self._head:
+            yield entry
+            entry = entry.next
+
+
+class EvictionPolicy(ABC):
+    """Bounded key to entry map with a replacement policy."""
+
+    name = ""
+
+    def __init__(self, capacity: int, max_weight: Optional[int] = None):
+        """Initialize the policy.
+
+        Args:
+            capacity: Maximum number of entries
+            max_weight: Optional maximum total entry weight
+        """
+        if capacity <= 0:
+            raise ValueError("Cache capacity must be positive")
+        if max_weight is not None and max_weight <= 0:
+            raise ValueError("Cache weight budget must be positive")
+        self.capacity = capacity
+        self.max_weight = max_weight
+        self.weight = 0
+        self._entries: Dict[Any, CacheEntry] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._entries
+
+    def peek(self, key: Any) -> Optional[CacheEntry]:
+        """Get an entry without recording an access."""
+        return self._entries.get(key)
+
+    def get(self, key: Any) -> Optional[CacheEntry]:
+        """Get an entry and record an access.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Entry, or None if the key is not cached
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            entry.frequency += 1
+            self._on_access(entry)
+        return entry
+
+    def put(self, key: Any, value: Any, expires_at: float, weight: int = 1) -> List[CacheEntry]:
+        """Insert or update an entry.
+
+        Updating a key counts as an access and keeps its frequency, so hot
+        keys are not demoted by being refreshed. With a weight budget,
+        victims are evicted until the total weight fits again; the entry
+        just stored is kept even if it alone exceeds the budget.
+
+        Args:
+            key: Cache key
+            value: Value to store
+            expires_at: Absolute expiry time
+            weight: Entry weight counted against max_weight
+
+        Returns:
+            Entries evicted to make room
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            entry.value = value
+            entry.expires_at = expires_at
+            self.weight += weight - entry.weight
+            entry.weight = weight
+            entry.frequency += 1
+            self._on_access(entry)
+            evicted = []
+        else:
+            entry = CacheEntry(key, value, expires_at)
+            entry.weight = weight
+            self._entries[key] = entry
+            self.weight += weight
+            evicted = self._on_insert(entry)
+            for victim in evicted:
+                del self._entries[victim.key]
+                self.weight -= victim.weight
+
+        while self.max_weight is not None and self.weight > self.max_weight and len(self._entries) > 1:
+            victim = self._victim(exclude=entry)
+            victim.region.unlink(victim)
+            del self._entries[victim.key]
+            self.weight -= victim.weight
+            evicted.append(victim)
+        return evicted
+
+    def pop(self, key: Any) -> Optional[CacheEntry]:
+        """Remove an entry.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Removed entry, or None if the key is not cached
+        """
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            entry.region.unlink(entry)
+            self.weight -= entry.weight
+        return entry
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        self._entries.clear()
+        self.weight = 0
+        self._reset()
+
+    def entries(self) -> List[CacheEntry]:
+        """Get a snapshot of all entries."""
+        return list(self._entries.values())
+
+    @abstractmethod
+    def _on_access(self, entry: CacheEntry) -> None:
+        """Update recency or frequency state after an access."""
+
+    @abstractmethod
+    def _on_insert(self, entry: CacheEntry) -> List[CacheEntry]:
+        """Place a new entry and unlink the entries to evict."""
+
+    @abstractmethod
+    def _reset(self) -> None:
+        """Drop all list state."""
+
+    @abstractmethod
+    def _victim(self, exclude: CacheEntry) -> CacheEntry:
+        """Get the entry to evict next, other than exclude."""
+
+
+class LRUPolicy(EvictionPolicy):
+    """Evicts the least recently used entry."""
+
+    name = "lru"
+
+    def __init__(self, capacity: int, max_weight: Optional[int] = None):
+        super().__init__(capacity, max_weight)
+        self._list = _LinkedList()
+
+    def _on_access(self, entry: CacheEntry) -> None:
+        self._list.move_to_front(entry)
+
+    def _on_insert(self, entry: CacheEntry) -> List[CacheEntry]:
+        self._list.push_front(entry)
+        if self._list.size <= self.capacity:
+            return []
+        victim = self._list.back()
+        self._list.unlink(victim)
+        return [victim]
+
+    def _reset(self) -> None:
+        self._list = _LinkedList()
+
+    def _victim(self, exclude: CacheEntry) -> CacheEntry:
+        victim = self._list.back()
+        # The list has another entry whenever a victim is needed
+        return victim if victim is not exclude else victim.prev
+
+
+_HALVE = bytes(value >> 1 for value in range(256))
+
+
+class FrequencySketch:
+    """Count-min sketch of access frequencies with periodic aging.
+
+    Counters saturate at 15. After ``sample_size`` increments every counter
+    is halved, so the sketch tracks recent popularity rather than all-time
+    counts.
+    """
+
+    __slots__ = ("_rows", "_mask", "_additions", "sample_size")
+
+    _SEEDS = (0x9E3779B1, 0x85EBCA77, 0xC2B2AE3D, 0x27D4EB2F)
+
+    def __init__(self, capacity: int):
+        width = 1
+        while width < max(4 * capacity, 16):
+            width <<= 1
+        self._rows = [bytearray(width) for _ in self._SEEDS]
+        self._mask = width - 1
+        self._additions = 0
+        self.sample_size = 10 * max(capacity, 16)
+
+    def increment(self, key: Any) -> None:
+        """Record an access."""
+        h = hash(key)
+        for row, seed in zip(self._rows, self._SEEDS):
+            index = ((h * seed) >> 16) & self._mask
+            if row[index] < 15:
+                row[index] += 1
+        self._additions += 1
+        if self._additions >= self.sample_size:
+            self._age()
+
+    def estimate(self, key: Any) -> int:
+        """Estimate the recent access count of a key."""
+        h = hash(key)
+        return min(
+            row[((h * seed) >> 16) & self._mask]
+            for row, seed in zip(self._rows, self._SEEDS)
+        )
+
+    def _age(self) -> None:
+        """Halve all counters."""
+        for row in self._rows:
+            row[:] = row.translate(_HALVE)
+        self._additions //= 2
+
+
+class TinyLFUPolicy(EvictionPolicy):
+    """Window TinyLFU eviction.
+
+    New entries land in a small LRU window. Entries leaving the window
+    compete with the least recently used entry of the main area, and the one
+    the frequency sketch has seen less often is evicted. The main area is a
+    segmented LRU: entries are promoted from probation to protected when hit
+    again, so one-off keys cannot flush frequently used ones.
+    """
+
+    name = "tinylfu"
+
+    def __init__(
+        self,
+        capacity: int,
+        max_weight: Optional[int] = None,
+        window_ratio: float = 0.01,
+        protected_ratio: float = 0.8
+    ):
+        """Initialize the policy.
+
+        Args:
+            capacity: Maximum number of entries
+            max_weight: Optional maximum total entry weight
+            window_ratio: Share of capacity used by the admission window
+            protected_ratio: Share of the main area reserved for entries hit twice
+        """
+        super().__init__(capacity, max_weight)
+        self.window_capacity = max(1, int(capacity * window_ratio))
+        main_capacity = max(capacity - self.window_capacity, 1)
+        self.protected_capacity = int(main_capacity * protected_ratio)
+        self.main_capacity = main_capacity
+        self.sketch = FrequencySketch(capacity)
+        self._reset()
+
+    def _reset(self) -> None:
+        self._window = _LinkedList()
+        self._probation = _LinkedList()
+        self._protected = _LinkedList()
+
+    def _victim(self, exclude: CacheEntry) -> CacheEntry:
+        # Probation first, then protected, then the window
+        for region in (self._probation, self._protected, self._window):
+            victim = region.back()
+            if victim is exclude:
+                victim = victim.prev if region.size > 1 else None
+            if victim is not None:
+                return victim
+        raise LookupError("No entry to evict")
+
+    def _on_access(self, entry: CacheEntry) -> None:
+        self.sketch.increment(entry.key)
+        region = entry.region
+        if region is self._probation:
+            region.unlink(entry)
+            self._protected.push_front(entry)
+            if self._protected.size > self.protected_capacity:
+                demoted = self._protected.back()
+                self._protected.unlink(demoted)
+                self._probation.push_front(demoted)
+        else:
+            region.move_to_front(entry)
+
+    def _on_insert(self, entry: CacheEntry) -> List[CacheEntry]:
+        self.sketch.increment(entry.key)
+        self._window.push_front(entry)
+        if self._window.size <= self.window_capacity:
+            return []
+
+        candidate = self._window.back()
+        self._window.unlink(candidate)
+        if self._probation.size + self._protected.size < self.main_capacity:
+            self._probation.push_front(candidate)
+            return []
+
+        victim = self._probation.back() or self._protected.back()
+        if self.sketch.estimate(candidate.key) > self.sketch.estimate(victim.key):
+            victim.region.unlink(victim)
+            self._probation.push_front(candidate)
+            return [victim]
+        return [candidate]
+
+
+_POLICIES = {policy.name: policy for policy in (LRUPolicy, TinyLFUPolicy)}
+
+
+def create_eviction_policy(name: str, capacity: int, max_weight: Optional[int] = None) -> EvictionPolicy:
+    """Create an eviction policy by name.
+
+    Args:
+        name: Policy name ("lru" or "tinylfu")
+        capacity: Maximum number of entries
+        max_weight: Optional maximum total entry weight
+
+    Returns:
+        Eviction policy
+
+    Raises:
+        ValueError: If the policy name is unknown
+    """
+    try:
+        return _POLICIES[name](capacity, max_weight=max_weight)
+    except KeyError:
+        raise ValueError(f"Unknown eviction policy: {name}")
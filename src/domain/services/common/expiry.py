@@ -0,0 +1,126 @@
+"""Expiry tracking for the in-memory cache tier.
+
+This module implements a timing wheel for CacheService entries.
+It provides:
+- Scheduling, rescheduling and cancelling entry expiry in O(1)
+- Draining due entries in bounded batches
+- Counting due entries without scanning the cache
+
+Entries are grouped into buckets of ``resolution`` seconds. A bucket is due
+once every entry in it has expired, so a sweep only touches entries that
+actually need removing. A min-heap orders the bucket slots; empty buckets
+are dropped when they reach the front.
+"""
+import heapq
+from math import ceil, floor
+from typing import Dict, List, Set
+
+from src.domain.services.common.eviction import CacheEntry
+
+
+class ExpiryWheel:
+    """Buckets cache entries by expiry time."""
+
+    def __init__(self, resolution: float = 1.0):
+        """Initialize the wheel.
+
+        Args:
+            resolution: Bucket width in seconds
+        """
+        if resolution <= 0:
+            raise ValueError("Expiry resolution must be positive")
+        self.resolution = resolution
+        self._buckets: Dict[int, Set[CacheEntry]] = {}
+        self._slots: List[int] = []
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def schedule(self, entry: CacheEntry) -> None:
+        """Track an entry, moving it if its expiry changed.
+
+        Args:
+            entry: Entry whose expires_at is set
+        """
+        slot = ceil(entry.expires_at / self.resolution)
+        if entry.expiry_slot == slot:
+            return
+        self.cancel(entry)
+        bucket = self._buckets.get(slot)
+        if bucket is None:
+            bucket = self._buckets[slot] = set()
+            heapq.heappush(self._slots, slot)
+        bucket.add(entry)
+        entry.expiry_slot = slot
+        self._size += 1
+
+    def cancel(self, entry: CacheEntry) -> None:
+        """Stop tracking an entry.
+
+        Args:
+            entry: Entry removed from the cache
+        """
+        if entry.expiry_slot is None:
+            return
+        bucket = self._buckets.get(entry.expiry_slot)
+        if bucket is not None and entry in bucket:
+            bucket.discard(entry)
+            self._size -= 1
+        entry.expiry_slot = None
+
+    def pop_due(self, now: float, limit: int = 1000) -> List[CacheEntry]:
+        """Remove and return expired entries.
+
+        Args:
+            now: Current time
+            limit: Maximum number of entries to return
+
+        Returns:
+            Up to limit entries that expired at or before now
+        """
+        due_slot = floor(now / self.resolution)
+        batch: List[CacheEntry] = []
+        while self._slots and self._slots[0] <= due_slot and len(batch) < limit:
+            slot = self._slots[0]
+            bucket = self._buckets[slot]
+            while bucket and len(batch) < limit:
+                entry = bucket.pop()
+                entry.expiry_slot = None
+                batch.append(entry)
+            if not bucket:
+                del self._buckets[slot]
+                heapq.heappop(self._slots)
+        self._size -= len(batch)
+        return batch
+
+    def due_count(self, now: float) -> int:
+        """Count entries that have expired but are still tracked.
+
+        Entries are counted once their whole bucket is due, so the count
+        may lag by up to one resolution. Walks only the heap nodes that are due (plus their direct
+        children), which is a handful when the wheel is swept regularly.
+
+        Args:
+            now: Current time
+
+        Returns:
+            Number of expired entries
+        """
+        due_slot = floor(now / self.resolution)
+        count = 0
+        pending = [0] if self._slots else []
+        while pending:
+            index = pending.pop()
+            slot = self._slots[index]
+            if slot > due_slot:
+                continue
+            count += len(self._buckets[slot])
+            pending.extend(child for child in (2 * index + 1, 2 * index + 2) if child < len(self._slots))
+        return count
+
+    def clear(self) -> None:
+        """Stop tracking all entries."""
+        self._buckets.clear()
+        self._slots.clear()
+        self._size = 0
@@ -0,0 +1,75 @@
+"""Size estimation and compression for cached values.
+
+This module lets CacheService budget its memory tier in bytes.
+It provides:
+- A recursive sizeof estimate of cached values
+- Compressed storage for values too large to keep as objects
+
+The estimate follows containers, pydantic models and plain objects,
+counting each object once. It does not account for interpreter
+overheads such as allocator padding, so treat it as approximate.
+"""
+import pickle
+import sys
+import zlib
+from typing import Any
+
+from pydantic import BaseModel
+
+_ATOMIC = (str, bytes, bytearray, int, float, complex, bool, type(None))
+
+
+def estimate_size(value: Any) -> int:
+    """Estimate the memory held by a value and everything it references.
+
+    Args:
+        value: Value to measure
+
+    Returns:
+        Approximate size in bytes
+    """
+    seen = set()
+    pending = [value]
+    total = 0
+    while pending:
+        obj = pending.pop()
+        if id(obj) in seen:
+            continue
+        seen.add(id(obj))
+        total += sys.getsizeof(obj)
+        if isinstance(obj, _ATOMIC):
+            continue
+        if isinstance(obj, CompressedValue):
+            pending.append(obj.data)
+        elif isinstance(obj, dict):
+            pending.extend(obj.keys())
+            pending.extend(obj.values())
+        elif isinstance(obj, (list, tuple, set, frozenset)):
+            pending.extend(obj)
+        elif isinstance(obj, BaseModel):
+            pending.append(obj.__dict__)
+        elif hasattr(obj, "__dict__"):
+            pending.append(vars(obj))
+    return total
+
+
+class CompressedValue:
+    """Value kept as a compressed pickle until it is read."""
+
+    __slots__ = ("data",)
+
+    def __init__(self, value: Any, level: int = 6):
+        """Compress a value.
+
+        Args:
+            value: Picklable value
+            level: zlib compression level
+
+        Raises:
+            pickle.PicklingError: If the value cannot be pickled
+        """
+        self.data = zlib.compress(pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL), level)
+
+    def load(self) -> Any:
+        """Get a fresh copy of the original value."""
+        return pickle.loads(zlib.decompress(self.data))
@@ -0,0 +1,369 @@
+"""Columnar cost calculation for many routes at once.
+
+The per-component methods of ``CostCalculationService`` build one
+``CostComponent`` per segment and category, converting every product to
+``Decimal``. That is fine for one route and far too slow for repricing tens
+of thousands. The batch path works on columns instead:
+
+1. Country segments of all routes are flattened into arrays of route index,
+   country index, distance and duration.
+2. Rates are gathered from the compiled settings into vectors per batch
+   country and joined to the segments by country index.
+3. Segment amounts are rounded to cents and summed per route and component
+   as integers; maintenance, overhead and empty driving are computed per
+   route.
+
+The products are the same float operations, in the same order, as in the
+scalar path, and each is rounded to the cent once, like ``Money.from_float``.
+Breakdown entries and totals are integer sums of those cents, so entries add
+up to the total and both paths agree to the cent. Toll service lookups are
+remote calls per route and are not part of the batch: tolls come from the
+settings rates, as in the scalar path without a toll service.
+"""
+from decimal import Decimal
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+
+from src.domain.services.cost.compiled_settings import COMPONENT_BITS, RateVectors
+from src.domain.value_objects import CostBreakdown, Money
+from src.domain.value_objects.money import CENTS_PER_UNIT, NOISE_PLACES
+
+CENT = Decimal("0.01")
+
+# Components computed per country segment, then per route
+SEGMENT_COMPONENTS = ("fuel", "toll", "driver")
+ROUTE_COMPONENTS = (
+    "maintenance",
+    "overhead",
+    "empty_driving_fuel",
+    "empty_driving_maintenance"
+)
+COMPONENTS = SEGMENT_COMPONENTS + ROUTE_COMPONENTS
+# Settings component that enables each of COMPONENTS
+_ENABLED_BY = ("fuel", "toll", "driver", "maintenance", "overhead", "fuel", "maintenance")
+
+_SCALE = 10 ** NOISE_PLACES
+_SCALED_PER_CENT = _SCALE // CENTS_PER_UNIT
+# Below this magnitude a float scales to NOISE_PLACES digits exactly
+_EXACT_FLOAT_LIMIT = 2.0 ** 52 / _SCALE
+
+
+def to_cent_array(values: np.ndarray) -> np.ndarray:
+    """Round float amounts to integer cents, as ``Money.from_float`` does.
+
+    Args:
+        values: Amounts as floats
+
+    Returns:
+        Amounts in cents, rounded half up after dropping float noise
+    """
+    values = np.asarray(values, dtype=np.float64)
+    large = np.abs(values) >= _EXACT_FLOAT_LIMIT
+    scaled = np.rint(np.round(np.where(large, 0.0, values), NOISE_PLACES) * _SCALE)
+    magnitude = np.abs(scaled).astype(np.int64)
+    cents = (magnitude + _SCALED_PER_CENT // 2) // _SCALED_PER_CENT
+    cents = np.where(scaled < 0, -cents, cents)
+    if large.any():
+        # Too large to scale exactly as floats
+        cents[large] = [Money.from_float(value).cents for value in values[large].tolist()]
+    return cents
+
+
+class RouteColumns:
+    """Country segments and per-route quantities of many routes as arrays."""
+
+    def __init__(
+        self,
+        route_ids: List[Any],
+        country_codes: Tuple[Optional[str], ...],
+        route_index: np.ndarray,
+        country_index: np.ndarray,
+        distances: np.ndarray,
+        durations: np.ndarray,
+        route_distances: np.ndarray,
+        route_durations: np.ndarray,
+        empty_distances: np.ndarray,
+        empty_country_index: np.ndarray
+    ):
+        """Initialize the columns.
+
+        Args:
+            route_ids: Route IDs in batch order
+            country_codes: Country code of each country index
+            route_index: Route of each segment
+            country_index: Country of each segment
+            distances: Distance of each segment in km
+            durations: Duration of each segment in hours
+            route_distances: Total distance of each route in km
+            route_durations: Total duration of each route in hours
+            empty_distances: Empty driving distance of each route (0 if none)
+            empty_country_index: Country of each route's empty driving origin
+        """
+        self.route_ids = route_ids
+        self.country_codes = country_codes
+        self.route_index = route_index
+        self.country_index = country_index
+        self.distances = distances
+        self.durations = durations
+        self.route_distances = route_distances
+        self.route_durations = route_durations
+        self.empty_distances = empty_distances
+        self.empty_country_index = empty_country_index
+        # Segments of route i are offsets[i]:offsets[i + 1]
+        self.offsets = np.searchsorted(route_index, np.arange(len(route_ids) + 1))
+
+    def __len__(self) -> int:
+        """Get the number of routes."""
+        return len(self.route_ids)
+
+    @classmethod
+    def from_routes(
+        cls,
+        routes: Iterable[Any],
+        segments_of: Callable[[Any], List[Dict]],
+        empty_driving_of: Optional[Callable[[Any], Optional[Dict]]] = None
+    ) -> "RouteColumns":
+        """Flatten routes into columns.
+
+        Args:
+            routes: Routes to flatten
+            segments_of: Gets the country segment dicts of a route
+            empty_driving_of: Gets the empty driving dict of a route (None skips empty driving)
+
+        Returns:
+            Route columns
+        """
+        countries: Dict[Optional[str], int] = {}
+        route_ids: List[Any] = []
+        route_index: List[int] = []
+        country_index: List[int] = []
+        distances: List[float] = []
+        durations: List[float] = []
+        route_distances: List[float] = []
+        route_durations: List[float] = []
+        empty_distances: List[float] = []
+        empty_country_index: List[int] = []
+
+        for i, route in enumerate(routes):
+            route_ids.append(route.id)
+            route_distances.append(route.distance_km)
+            route_durations.append(route.duration_hours)
+            for segment in segments_of(route):
+                route_index.append(i)
+                country_index.append(countries.setdefault(segment["country_code"], len(countries)))
+                distances.append(segment["distance_km"])
+                durations.append(segment.get("duration_hours", 0))
+
+            empty_driving = empty_driving_of(route) if empty_driving_of else None
+            if empty_driving:
+                # Location dumps carry "country"; older metadata used "country_code"
+                origin = empty_driving["origin"]
+                code = origin.get("country_code") or origin.get("country")
+                empty_distances.append(empty_driving["distance_km"])
+                empty_country_index.append(countries.setdefault(code, len(countries)))
+            else:
+                empty_distances.append(0.0)
+                empty_country_index.append(-1)
+
+        return cls(
+            route_ids=route_ids,
+            country_codes=tuple(countries),
+            route_index=np.array(route_index, dtype=np.int64),
+            country_index=np.array(country_index, dtype=np.int64),
+            distances=np.array(distances, dtype=np.float64),
+            durations=np.array(durations, dtype=np.float64),
+            route_distances=np.array(route_distances, dtype=np.float64),
+            route_durations=np.array(route_durations, dtype=np.float64),
+            empty_distances=np.array(empty_distances, dtype=np.float64),
+            empty_country_index=np.array(empty_country_index, dtype=np.int64)
+        )
+
+
+class CostBatchResult:
+    """Component totals of a batch of routes."""
+
+    def __init__(
+        self,
+        columns: RouteColumns,
+        segment_cents: np.ndarray,
+        totals: np.ndarray,
+        currency: str = "EUR"
+    ):
+        """Initialize the result.
+
+        Args:
+            columns: Route columns the result was computed from
+            segment_cents: (segments, SEGMENT_COMPONENTS) amounts in cents
+            totals: (routes, COMPONENTS) amounts in cents
+            currency: Currency of all amounts
+        """
+        self.columns = columns
+        self.segment_cents = segment_cents
+        self.totals = totals
+        self.currency = currency
+
+    def __len__(self) -> int:
+        """Get the number of routes."""
+        return len(self.columns)
+
+    @property
+    def route_ids(self) -> List[Any]:
+        """Get the route IDs in batch order."""
+        return self.columns.route_ids
+
+    def route_totals(self) -> np.ndarray:
+        """Get the total of every route in cents."""
+        return self.totals.sum(axis=1)
+
+    def component_money(self, index: int) -> Dict[str, Money]:
+        """Get the component totals of one route in cents.
+
+        Args:
+            index: Position of the route in the batch
+
+        Returns:
+            Mapping of component name to amount
+        """
+        return {
+            name: Money(cents, self.currency)
+            for name, cents in zip(COMPONENTS, self.totals[index].tolist())
+        }
+
+    def component_totals(self, index: int) -> Dict[str, Decimal]:
+        """Get the component totals of one route, rounded to the cent.
+
+        Args:
+            index: Position of the route in the batch
+
+        Returns:
+            Mapping of component name to amount
+        """
+        return {
+            name: amount.to_decimal()
+            for name, amount in self.component_money(index).items()
+        }
+
+    def total_money(self, index: int) -> Money:
+        """Get the total of one route in cents.
+
+        Args:
+            index: Position of the route in the batch
+
+        Returns:
+            Total amount
+        """
+        return Money(int(self.totals[index].sum()), self.currency)
+
+    def total(self, index: int) -> Decimal:
+        """Get the total of one route, rounded to the cent.
+
+        Args:
+            index: Position of the route in the batch
+
+        Returns:
+            Total amount
+        """
+        return self.total_money(index).to_decimal()
+
+    def breakdown(
+        self,
+        index: int,
+        vehicle_type: str = "truck",
+        toll_costs: Optional[Dict[str, Money]] = None
+    ) -> CostBreakdown:
+        """Build the cost breakdown of one route.
+
+        Args:
+            index: Position of the route in the batch
+            vehicle_type: Key of the maintenance cost
+            toll_costs: Optional tolls per country priced elsewhere, such
+                as by a toll service; they replace the settings tolls
+
+        Returns:
+            Cost breakdown with per-country segment costs
+        """
+        columns = self.columns
+        start, end = columns.offsets[index], columns.offsets[index + 1]
+        per_country: Tuple[Dict[str, Money], ...] = ({}, {}, {})
+        for country, amounts in zip(
+            columns.country_index[start:end].tolist(),
+            self.segment_cents[start:end].tolist()
+        ):
+            code = columns.country_codes[country]
+            for costs, cents in zip(per_country, amounts):
+                costs[code] = costs.get(code, Money(0, self.currency)) + Money(cents, self.currency)
+
+        fuel, toll, driver = (
+            {code: amount.to_decimal() for code, amount in costs.items()}
+            for costs in per_country
+        )
+        total = self.total_money(index)
+        if toll_costs is not None:
+            total += sum(toll_costs.values(), Money(0, self.currency)) - self.component_money(index)["toll"]
+            toll = {code: amount.to_decimal() for code, amount in toll_costs.items()}
+        totals = self.component_totals(index)
+        empty_driving_costs = {}
+        if columns.empty_country_index[index] >= 0:
+            code = columns.country_codes[columns.empty_country_index[index]] or "unknown"
+            empty_driving_costs[code] = {
+                "fuel": totals["empty_driving_fuel"],
+                "maintenance": totals["empty_driving_maintenance"]
+            }
+
+        return CostBreakdown(
+            route_id=columns.route_ids[index],
+            fuel_costs=fuel,
+            toll_costs=toll,
+            driver_costs=driver,
+            maintenance_costs={vehicle_type: totals["maintenance"]},
+            overheads={"overhead": totals["overhead"]},
+            empty_driving_costs=empty_driving_costs,
+            total_cost=total.to_decimal(),
+            currency=self.currency
+        )
+
+
+def calculate_component_totals(columns: RouteColumns, rates: RateVectors) -> CostBatchResult:
+    """Compute the component totals of every route in one pass.
+
+    Components the settings disable are left at zero.
+
+    Args:
+        columns: Route columns
+        rates: Rate vectors indexed like the columns' countries
+
+    Returns:
+        Batch result
+    """
+    country = columns.country_index
+    segment_cents = np.column_stack((
+        to_cent_array(columns.distances * rates.consumption * rates.fuel[country]),
+        to_cent_array(columns.distances * rates.toll[country]),
+        to_cent_array(columns.durations * rates.driver[country])
+    ))
+
+    count = len(columns)
+    totals = np.zeros((count, len(COMPONENTS)), dtype=np.int64)
+    for k in range(len(SEGMENT_COMPONENTS)):
+        np.add.at(totals[:, k], columns.route_index, segment_cents[:, k])
+
+    offset = len(SEGMENT_COMPONENTS)
+    totals[:, offset] = to_cent_array(columns.route_distances * rates.maintenance_rate)
+    totals[:, offset + 1] = to_cent_array(columns.route_durations * rates.overhead_rate)
+
+    has_empty = columns.empty_country_index >= 0
+    if has_empty.any():
+        empty = columns.empty_distances[has_empty]
+        fuel_price = rates.fuel[columns.empty_country_index[has_empty]]
+        totals[has_empty, offset + 2] = to_cent_array(empty * rates.consumption * fuel_price)
+        totals[has_empty, offset + 3] = to_cent_array(empty * rates.maintenance_rate)
+
+    enabled = np.array(
+        [bool(rates.enabled_mask & COMPONENT_BITS[name]) for name in _ENABLED_BY]
+    )
+    if not enabled.all():
+        totals[:, ~enabled] = 0
+        segment_cents[:, ~enabled[:len(SEGMENT_COMPONENTS)]] = 0
+
+    return CostBatchResult(columns, segment_cents, totals)
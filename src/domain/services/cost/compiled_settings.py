@@ -0,0 +1,446 @@
+"""Compiled rate tables for one cost settings version.
+
+Cost calculation used to ask the settings for a fuel, toll and driver rate
+on every segment, and the toll service fetched the current settings on
+every call. ``CompiledCostSettings`` resolves all rates of a
+``CostSettings`` version once:
+
+- Countries listed in the fuel, toll or driver rates get a dense index, and
+  their rates are stored as read-only float arrays in that order, for
+  gathers in the batch path, and as tuples for the scalar path. A country
+  missing from one table gets that table's "default" entry.
+- Toll rates are per vehicle type; the tables hold the truck rate, and the
+  toll service reads the Decimal rates of other vehicle types.
+- Countries the settings do not list get the "default" entries, or the
+  module defaults if the settings have none.
+- Vehicle toll multipliers and the enabled cost components (as a bitmask)
+  are part of the snapshot.
+
+Snapshots are never modified after compiling, so threads share them without
+locking. ``CompiledSettingsHolder`` keeps the snapshot of the current
+settings and swaps in a new one when settings are published.
+"""
+import hashlib
+import json
+import threading
+from collections import OrderedDict
+from decimal import Decimal
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, Hashable, Iterable, Mapping, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.domain.entities.cost import CostSettings
+
+# Toll multipliers by vehicle type, used when the settings define none
+VEHICLE_MULTIPLIERS: Mapping[str, Decimal] = MappingProxyType({
+    "truck": Decimal("1.0"),
+    "bus": Decimal("0.8"),
+    "van": Decimal("0.6"),
+    "car": Decimal("0.4")
+})
+
+COMPONENT_BITS: Mapping[str, int] = MappingProxyType({
+    "fuel": 1,
+    "toll": 2,
+    "driver": 4,
+    "maintenance": 8,
+    "overhead": 16
+})
+ALL_COMPONENTS = sum(COMPONENT_BITS.values())
+
+# Rates used when the settings have neither a country nor a "default"
+# entry; they match CostSettings.get_default
+DEFAULT_FUEL_PRICE = Decimal("1.5")
+DEFAULT_TOLL_RATE = Decimal("0.2")
+DEFAULT_DRIVER_RATE = Decimal("30.0")
+DEFAULT_MAINTENANCE_RATE = Decimal("0.15")
+DEFAULT_OVERHEAD_RATE = Decimal("10.0")
+# Settings have no fuel consumption; vehicle specifications override it
+DEFAULT_FUEL_CONSUMPTION = Decimal("0.35")
+# Vehicle type of the toll and maintenance rates in the tables
+BASE_VEHICLE_TYPE = "truck"
+# Overhead entry charged per hour of driving
+OVERHEAD_TIME_KEY = "time"
+
+# Settings attributes whose keys name the configured countries
+_COUNTRY_TABLES = ("fuel_rates", "toll_rates", "driver_rates")
+_DEFAULT_KEY = "default"
+# Settings attributes the compiled rates are read from
+_RATE_FIELDS = _COUNTRY_TABLES + ("overhead_rates", "maintenance_rates", "enabled_components")
+
+
+def _rates_digest(settings: Any) -> str:
+    """Hash the rate fields of settings."""
+    values = {}
+    for name in _RATE_FIELDS:
+        value = getattr(settings, name, None)
+        if isinstance(value, (set, frozenset)):
+            value = sorted(value)
+        values[name] = value
+    raw = json.dumps(values, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.blake2b(raw.encode("utf-8"), digest_size=16).hexdigest()
+
+
+def settings_version_key(settings: Any) -> Hashable:
+    """Get the key identifying a settings version.
+
+    Settings with an ID are keyed by ID, version, modification time and a
+    hash of their rates, so a re-fetched copy of the same version shares
+    its snapshot while settings changed in place get a new one. Settings
+    without an ID are keyed by identity.
+
+    Args:
+        settings: Cost settings
+
+    Returns:
+        Hashable version key
+    """
+    settings_id = getattr(settings, "id", None)
+    if settings_id is None:
+        return ("object", id(settings))
+    modified = getattr(settings, "modified_at", None) or getattr(settings, "updated_at", None)
+    return (
+        str(settings_id),
+        str(getattr(settings, "version", None)),
+        modified,
+        _rates_digest(settings)
+    )
+
+
+def _read_only(values: Iterable[float]) -> np.ndarray:
+    """Build a read-only float array."""
+    array = np.array(list(values), dtype=np.float64)
+    array.flags.writeable = False
+    return array
+
+
+def _gather(table: np.ndarray, index: np.ndarray) -> np.ndarray:
+    """Gather table values by index, leaving negative indices at zero."""
+    values = np.zeros(len(index), dtype=np.float64)
+    known = index >= 0
+    values[known] = table[index[known]]
+    return values
+
+
+def _rate(table: Mapping[str, Any], key: Optional[str], default: Decimal) -> Decimal:
+    """Get a rate from a settings table, falling back to its "default" entry."""
+    rate = table.get(key) if key is not None else None
+    if rate is None:
+        rate = table.get(_DEFAULT_KEY, default)
+    return Decimal(rate)
+
+
+class RateVectors:
+    """Rates of one settings version, indexed like a batch's countries."""
+
+    def __init__(
+        self,
+        fuel: np.ndarray,
+        toll: np.ndarray,
+        driver: np.ndarray,
+        consumption: float,
+        maintenance_rate: float,
+        overhead_rate: float,
+        enabled_mask: int = ALL_COMPONENTS
+    ):
+        """Initialize the rate vectors.
+
+        Args:
+            fuel: Fuel price per country index
+            toll: Toll rate per km per country index
+            driver: Driver rate per hour per country index
+            consumption: Fuel consumption per km
+            maintenance_rate: Maintenance rate per km
+            overhead_rate: Overhead rate per hour
+            enabled_mask: Bitmask of enabled cost components
+        """
+        self.fuel = fuel
+        self.toll = toll
+        self.driver = driver
+        self.consumption = consumption
+        self.maintenance_rate = maintenance_rate
+        self.overhead_rate = overhead_rate
+        self.enabled_mask = enabled_mask
+
+
+class CompiledCostSettings:
+    """Immutable rate tables of one cost settings version."""
+
+    def __init__(
+        self,
+        source: Any,
+        key: Hashable,
+        country_codes: Tuple[str, ...],
+        fuel: Tuple[float, ...],
+        toll: Tuple[float, ...],
+        driver: Tuple[float, ...],
+        toll_tables: Mapping[str, Mapping[str, Decimal]],
+        defaults: Tuple[float, float, float],
+        fuel_consumption: float,
+        maintenance_rate: float,
+        overhead_rate: float,
+        vehicle_multipliers: Mapping[str, Decimal],
+        enabled_mask: int
+    ):
+        """Initialize the snapshot; use compile() to build one from settings.
+
+        Args:
+            source: Settings the snapshot was compiled from
+            key: Settings version key
+            country_codes: Configured countries in index order
+            fuel: Fuel price per country index
+            toll: Toll rate per km per country index
+            driver: Driver rate per hour per country index
+            toll_tables: Toll rate by vehicle type per country, and per
+                "default" for countries the settings do not list
+            defaults: Fuel, toll and driver rates of unlisted countries
+            fuel_consumption: Default fuel consumption per km
+            maintenance_rate: Default maintenance rate per km
+            overhead_rate: Overhead rate per hour
+            vehicle_multipliers: Toll multiplier by vehicle type
+            enabled_mask: Bitmask of enabled cost components
+        """
+        self.source = source
+        self.key = key
+        self.country_codes = country_codes
+        self.country_index: Mapping[str, int] = MappingProxyType(
+            {code: index for index, code in enumerate(country_codes)}
+        )
+        self._fuel = fuel
+        self._toll = toll
+        self._driver = driver
+        self.fuel = _read_only(fuel)
+        self.toll = _read_only(toll)
+        self.driver = _read_only(driver)
+        self.toll_tables: Mapping[str, Mapping[str, Decimal]] = MappingProxyType({
+            code: MappingProxyType(dict(rates)) for code, rates in toll_tables.items()
+        })
+        self._defaults = defaults
+        self.fuel_consumption = fuel_consumption
+        self.maintenance_rate = maintenance_rate
+        self.overhead_rate = overhead_rate
+        self.vehicle_multipliers = MappingProxyType(dict(vehicle_multipliers))
+        self.enabled_mask = enabled_mask
+
+    @classmethod
+    def compile(cls, settings: CostSettings) -> "CompiledCostSettings":
+        """Resolve every rate of a settings version.
+
+        Args:
+            settings: Cost settings
+
+        Returns:
+            Compiled snapshot
+        """
+        country_codes = tuple(sorted({
+            code
+            for table in _COUNTRY_TABLES
+            for code in getattr(settings, table)
+            if code != _DEFAULT_KEY
+        }))
+
+        default_tolls = {
+            vehicle_type: Decimal(rate)
+            for vehicle_type, rate in settings.toll_rates.get(_DEFAULT_KEY, {}).items()
+        }
+        toll_tables = {_DEFAULT_KEY: default_tolls}
+        for code in country_codes:
+            toll_tables[code] = {
+                **default_tolls,
+                **{
+                    vehicle_type: Decimal(rate)
+                    for vehicle_type, rate in settings.toll_rates.get(code, {}).items()
+                }
+            }
+
+        def toll_rate(code: str) -> float:
+            return float(toll_tables[code].get(BASE_VEHICLE_TYPE, DEFAULT_TOLL_RATE))
+
+        enabled_mask = 0
+        for component in settings.enabled_components:
+            enabled_mask |= COMPONENT_BITS.get(component, 0)
+
+        return cls(
+            source=settings,
+            key=settings_version_key(settings),
+            country_codes=country_codes,
+            fuel=tuple(float(_rate(settings.fuel_rates, code, DEFAULT_FUEL_PRICE)) for code in country_codes),
+            toll=tuple(toll_rate(code) for code in country_codes),
+            driver=tuple(float(_rate(settings.driver_rates, code, DEFAULT_DRIVER_RATE)) for code in country_codes),
+            toll_tables=toll_tables,
+            defaults=(
+                float(_rate(settings.fuel_rates, None, DEFAULT_FUEL_PRICE)),
+                toll_rate(_DEFAULT_KEY),
+                float(_rate(settings.driver_rates, None, DEFAULT_DRIVER_RATE))
+            ),
+            fuel_consumption=float(DEFAULT_FUEL_CONSUMPTION),
+            maintenance_rate=float(_rate(settings.maintenance_rates, BASE_VEHICLE_TYPE, DEFAULT_MAINTENANCE_RATE)),
+            overhead_rate=float(settings.overhead_rates.get(OVERHEAD_TIME_KEY, DEFAULT_OVERHEAD_RATE)),
+            vehicle_multipliers=VEHICLE_MULTIPLIERS,
+            enabled_mask=enabled_mask
+        )
+
+    def has_country(self, country_code: Optional[str]) -> bool:
+        """Check whether the settings configure a country."""
+        return country_code in self.country_index
+
+    def is_enabled(self, component: str) -> bool:
+        """Check whether a cost component is enabled."""
+        return bool(self.enabled_mask & COMPONENT_BITS.get(component, 0))
+
+    def fuel_price(self, country_code: Optional[str]) -> float:
+        """Get the fuel price of a country."""
+        index = self.country_index.get(country_code)
+        if index is None:
+            return self._defaults[0]
+        return self._fuel[index]
+
+    def toll_rate(self, country_code: Optional[str]) -> float:
+        """Get the truck toll rate per km of a country."""
+        index = self.country_index.get(country_code)
+        if index is None:
+            return self._defaults[1]
+        return self._toll[index]
+
+    def driver_rate(self, country_code: Optional[str]) -> float:
+        """Get the driver rate per hour of a country."""
+        index = self.country_index.get(country_code)
+        if index is None:
+            return self._defaults[2]
+        return self._driver[index]
+
+    def vehicle_toll_rates(self, country_code: Optional[str]) -> Mapping[str, Decimal]:
+        """Get the toll rates per km by vehicle type of a country."""
+        return self.toll_tables.get(country_code, self.toll_tables[_DEFAULT_KEY])
+
+    def consumption_for(self, vehicle_spec: Optional[Any] = None) -> float:
+        """Get the fuel consumption per km for a vehicle."""
+        if vehicle_spec:
+            return float(vehicle_spec.fuel_consumption)
+        return self.fuel_consumption
+
+    def maintenance_rate_for(self, vehicle_spec: Optional[Any] = None) -> float:
+        """Get the maintenance rate per km for a vehicle."""
+        if vehicle_spec:
+            return float(vehicle_spec.maintenance_rate)
+        return self.maintenance_rate
+
+    def rate_vectors(
+        self,
+        country_codes: Sequence[Optional[str]],
+        vehicle_spec: Optional[Any] = None
+    ) -> RateVectors:
+        """Gather the rates of a batch's countries.
+
+        Args:
+            country_codes: Country code of each batch country index
+            vehicle_spec: Optional vehicle specifications
+
+        Returns:
+            Rate vectors indexed like the batch's countries
+        """
+        index = np.array(
+            [self.country_index.get(code, -1) for code in country_codes],
+            dtype=np.int64
+        )
+        fuel, toll, driver = (
+            _gather(table, index) for table in (self.fuel, self.toll, self.driver)
+        )
+        for position in np.flatnonzero(index < 0):
+            code = country_codes[position]
+            fuel[position] = self.fuel_price(code)
+            toll[position] = self.toll_rate(code)
+            driver[position] = self.driver_rate(code)
+
+        return RateVectors(
+            fuel=fuel,
+            toll=toll,
+            driver=driver,
+            consumption=self.consumption_for(vehicle_spec),
+            maintenance_rate=self.maintenance_rate_for(vehicle_spec),
+            overhead_rate=self.overhead_rate,
+            enabled_mask=self.enabled_mask
+        )
+
+
+class CompiledSettingsHolder:
+    """Keeps the compiled snapshot of the current settings."""
+
+    def __init__(self, max_versions: int = 8):
+        """Initialize the holder.
+
+        Args:
+            max_versions: Compiled versions kept besides the current one
+        """
+        if max_versions <= 0:
+            raise ValueError("Number of kept versions must be positive")
+
+        self.max_versions = max_versions
+        self._lock = threading.Lock()
+        self._current: Optional[CompiledCostSettings] = None
+        self._versions: "OrderedDict[Hashable, CompiledCostSettings]" = OrderedDict()
+        self._compiles = 0
+
+    @property
+    def current(self) -> Optional[CompiledCostSettings]:
+        """Get the snapshot of the current settings, if published."""
+        return self._current
+
+    def publish(self, settings: Any) -> CompiledCostSettings:
+        """Make a settings version current.
+
+        Args:
+            settings: New current settings
+
+        Returns:
+            Compiled snapshot of the settings
+        """
+        compiled = self.get(settings)
+        self._current = compiled
+        return compiled
+
+    def get(self, settings: Any) -> CompiledCostSettings:
+        """Get the compiled snapshot of a settings version.
+
+        Args:
+            settings: Cost settings
+
+        Returns:
+            Compiled snapshot, compiled on first use of the version
+        """
+        if isinstance(settings, CompiledCostSettings):
+            return settings
+
+        key = settings_version_key(settings)
+        current = self._current
+        if current is not None and current.key == key:
+            return current
+
+        with self._lock:
+            compiled = self._versions.get(key)
+            if compiled is not None:
+                self._versions.move_to_end(key)
+                return compiled
+            compiled = CompiledCostSettings.compile(settings)
+            self._compiles += 1
+            self._versions[key] = compiled
+            while len(self._versions) > self.max_versions:
+                self._versions.popitem(last=False)
+            return compiled
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get holder statistics."""
+        current = self._current
+        return {
+            "current": current.key if current else None,
+            "versions": len(self._versions),
+            "compiles": self._compiles
+        }
+
+
+@lru_cache
+def get_compiled_settings_holder() -> CompiledSettingsHolder:
+    """Get the process-wide compiled settings holder."""
+    return CompiledSettingsHolder()
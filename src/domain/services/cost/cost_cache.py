@@ -0,0 +1,305 @@
+"""Memoized cost results.
+
+Re-opening a route or generating a second offer used to recompute the whole
+cost breakdown, including the toll service calls of services configured
+with one. ``CostResultCache`` keeps computed costs keyed by everything the
+result depends on:
+
+- A content hash of the route: its country segments, distance, duration
+  and empty driving. The route ID is part of the key as well, since costs
+  carry it and toll service lookups go by route.
+- The settings version key, so a new settings version is a miss.
+- The vehicle and cargo specifications, and the calculation options,
+  including whether tolls come from a toll service.
+
+Entries are tagged with the route, the settings and the specifications, so
+each can be invalidated explicitly when it changes. Settings that carry no
+ID have no version to key on and are never cached. A result is never kept
+longer than it stays valid.
+"""
+import hashlib
+import json
+import threading
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, Optional, TypeVar
+from uuid import UUID
+
+from pydantic import BaseModel
+
+from src.domain.services.common.cache import CacheService
+from src.domain.services.cost.compiled_settings import (
+    CompiledCostSettings, settings_version_key
+)
+from src.infrastructure.services.shared_cache import SharedCacheTier, get_shared_cache_tier
+from src.settings import get_settings
+
+T = TypeVar("T")
+
+NAMESPACE = "cost"
+_ROUTE_TAG = "cost-route:{}"
+_SETTINGS_TAG = "cost-settings:{}"
+_VEHICLE_TAG = "cost-vehicle:{}"
+_CARGO_TAG = "cost-cargo:{}"
+
+
+def _digest(value: Any) -> str:
+    """Hash a JSON-serializable value."""
+    raw = json.dumps(value, sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def route_fingerprint(
+    segments: Iterable[Dict],
+    distance_km: float,
+    duration_hours: float,
+    empty_driving: Optional[Dict] = None
+) -> str:
+    """Hash the route contents costs are computed from.
+
+    Args:
+        segments: Country segment dicts
+        distance_km: Total distance of the route
+        duration_hours: Total duration of the route
+        empty_driving: Optional empty driving dict
+
+    Returns:
+        Hex digest
+    """
+    empty = None
+    if empty_driving:
+        origin = empty_driving.get("origin") or {}
+        empty = [
+            empty_driving.get("distance_km"),
+            empty_driving.get("duration_hours"),
+            origin.get("country_code") or origin.get("country")
+        ]
+    return _digest({
+        "segments": [
+            [segment.get("country_code"), segment.get("distance_km"), segment.get("duration_hours", 0)]
+            for segment in segments
+        ],
+        "distance_km": distance_km,
+        "duration_hours": duration_hours,
+        "empty_driving": empty
+    })
+
+
+def spec_fingerprint(spec: Optional[Any]) -> str:
+    """Hash a vehicle or cargo specification.
+
+    Args:
+        spec: Specification model, or None
+
+    Returns:
+        Hex digest, or "none" without a specification
+    """
+    if spec is None:
+        return "none"
+    if isinstance(spec, BaseModel):
+        return _digest(spec.model_dump(mode="json"))
+    return _digest(vars(spec))
+
+
+class CostResultCache:
+    """Caches computed costs with explicit invalidation."""
+
+    def __init__(
+        self,
+        cache_service: Optional[CacheService] = None,
+        ttl: int = 1800,
+        max_entries: int = 5000,
+        shared_tier: Optional[SharedCacheTier] = None
+    ):
+        """Initialize the cache.
+
+        Args:
+            cache_service: Optional cache to store results in (a private
+                memory cache is created otherwise)
+            ttl: Seconds a result is kept
+            max_entries: Maximum results in the private memory cache
+            shared_tier: Optional tier shared by the workers on this host,
+                behind the private memory cache
+        """
+        self.cache_service = cache_service or CacheService(
+            max_memory_items=max_entries,
+            default_ttl=ttl,
+            shared_tier=shared_tier
+        )
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._skipped = 0
+        self._invalidations = 0
+
+    def get_or_compute(
+        self,
+        route_id: UUID,
+        fingerprint: str,
+        settings: Any,
+        compute: Callable[[], T],
+        vehicle_spec: Optional[Any] = None,
+        cargo_spec: Optional[Any] = None,
+        max_ttl: Optional[float] = None,
+        **options: Any
+    ) -> T:
+        """Get a cached result or compute and store it.
+
+        Args:
+            route_id: Route ID
+            fingerprint: Route content hash from route_fingerprint()
+            settings: Cost settings (or compiled settings) the result uses
+            compute: Callable computing the result on a miss
+            vehicle_spec: Optional vehicle specifications
+            cargo_spec: Optional cargo specifications
+            max_ttl: Optional seconds the result stays valid; a computed
+                result is kept no longer than that
+            **options: Further calculation options that change the result
+
+        Returns:
+            Cached or computed result
+        """
+        settings_id = self._settings_id(settings)
+        if settings_id is None:
+            with self._lock:
+                self._skipped += 1
+            return compute()
+
+        vehicle = spec_fingerprint(vehicle_spec)
+        cargo = spec_fingerprint(cargo_spec)
+        key = CacheService.make_key(
+            NAMESPACE,
+            route_id,
+            _digest([fingerprint, settings_version_key(self._source(settings)), vehicle, cargo, options])
+        )
+
+        computed = []
+
+        def load() -> T:
+            computed.append(True)
+            return compute()
+
+        ttl = self.ttl
+        if max_ttl is not None:
+            ttl = max(1, min(ttl, int(max_ttl)))
+
+        result = self.cache_service.get_or_compute(
+            key,
+            load,
+            ttl,
+            beta=0.0,
+            tags=[
+                _ROUTE_TAG.format(route_id),
+                _SETTINGS_TAG.format(settings_id),
+                _VEHICLE_TAG.format(vehicle),
+                _CARGO_TAG.format(cargo)
+            ]
+        )
+        with self._lock:
+            if computed:
+                self._misses += 1
+            else:
+                self._hits += 1
+        return result
+
+    def invalidate_route(self, route_id: UUID) -> int:
+        """Drop the results of a route.
+
+        Args:
+            route_id: Route ID
+
+        Returns:
+            Number of results dropped
+        """
+        return self._invalidate(_ROUTE_TAG.format(route_id))
+
+    def invalidate_settings(self, settings_id: Any) -> int:
+        """Drop the results computed with any version of some settings.
+
+        Args:
+            settings_id: Settings ID
+
+        Returns:
+            Number of results dropped
+        """
+        return self._invalidate(_SETTINGS_TAG.format(settings_id))
+
+    def invalidate_vehicle(self, vehicle_spec: Optional[Any]) -> int:
+        """Drop the results computed for a vehicle specification.
+
+        Args:
+            vehicle_spec: Vehicle specifications
+
+        Returns:
+            Number of results dropped
+        """
+        return self._invalidate(_VEHICLE_TAG.format(spec_fingerprint(vehicle_spec)))
+
+    def invalidate_cargo(self, cargo_spec: Optional[Any]) -> int:
+        """Drop the results computed for a cargo specification.
+
+        Args:
+            cargo_spec: Cargo specifications
+
+        Returns:
+            Number of results dropped
+        """
+        return self._invalidate(_CARGO_TAG.format(spec_fingerprint(cargo_spec)))
+
+    def clear(self) -> int:
+        """Drop all cached results.
+
+        Returns:
+            Number of results dropped
+        """
+        count = self.cache_service.invalidate_namespace(NAMESPACE)
+        with self._lock:
+            self._invalidations += count
+        return count
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get hit/miss statistics."""
+        with self._lock:
+            hits, misses = self._hits, self._misses
+            stats = {
+                "hits": hits,
+                "misses": misses,
+                "hit_rate": hits / (hits + misses) if hits + misses else 0.0,
+                "skipped": self._skipped,
+                "invalidations": self._invalidations
+            }
+        return stats
+
+    def _invalidate(self, tag: str) -> int:
+        """Drop the results carrying a tag."""
+        count = self.cache_service.invalidate_tag(tag)
+        with self._lock:
+            self._invalidations += count
+        return count
+
+    @staticmethod
+    def _source(settings: Any) -> Any:
+        """Get the settings a compiled snapshot was built from."""
+        if isinstance(settings, CompiledCostSettings):
+            return settings.source
+        return settings
+
+    def _settings_id(self, settings: Any) -> Optional[str]:
+        """Get the ID of the settings, or None if they have none."""
+        settings_id = getattr(self._source(settings), "id", None)
+        return None if settings_id is None else str(settings_id)
+
+
+@lru_cache
+def get_cost_result_cache() -> CostResultCache:
+    """Get the process-wide cost result cache.
+
+    Results are shared with the other workers on the host through the
+    shared cache tier when it is configured.
+    """
+    settings = get_settings().service
+    return CostResultCache(
+        ttl=settings.cost_cache_ttl,
+        max_entries=settings.cost_cache_max_entries,
+        shared_tier=get_shared_cache_tier()
+    )
@@ -6,21 +6,54 @@ It provides functionality for:
 - Breaking down costs by category
 - Handling different pricing strategies
 - Managing cost components
+- Repricing many routes at once in columnar batches
+- Reading rates from compiled per-version settings snapshots
+- Serving repeated cost requests from a result cache
+- Recording the settings each cost component depends on
+- Rounding reported totals to integer cents
 """
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from decimal import Decimal
-from typing import Dict, List, Optional
-from uuid import UUID
+from typing import Dict, List, NamedTuple, Optional, Sequence, Tuple
+from uuid import UUID, uuid4
 
 from src.domain.entities.cost import Cost, CostSettings
+from src.domain.entities.cost import CostBreakdown as CostBreakdownEntity
 from src.domain.entities.route import Route, TransportType
 from src.domain.entities.cargo import CargoSpecification
 from src.domain.entities.vehicle import VehicleSpecification
-from src.domain.interfaces.services.cost_service import CostService
+from src.domain.interfaces.repositories.cost_repository import CostRepository
+from src.domain.interfaces.services.cost_service import CostService, CostServiceError
 from src.domain.services.common.base import BaseService
-from src.domain.value_objects import (
-    CostBreakdown, CostComponent, CountrySegment
+from src.domain.services.cost.batch_cost import (
+    CENT, CostBatchResult, RouteColumns, calculate_component_totals
 )
+from src.domain.services.cost.compiled_settings import (
+    CompiledCostSettings, CompiledSettingsHolder, get_compiled_settings_holder
+)
+from src.domain.services.cost.cost_cache import (
+    CostResultCache, get_cost_result_cache, route_fingerprint
+)
+from src.domain.services.cost.dependencies import (
+    DRIVER_RATE, FUEL_CONSUMPTION, FUEL_PRICE, MAINTENANCE_RATE, OVERHEAD_RATE,
+    TOLL_RATE, ComponentDependency, join_path, settings_key
+)
+from src.domain.value_objects import Money
+
+# How long a calculated cost stays valid unless the caller says otherwise
+DEFAULT_VALIDITY_PERIOD = timedelta(hours=24)
+
+
+class _RouteQuantities(NamedTuple):
+    """Route quantities passed to calculate_route_cost, shaped like a route."""
+
+    id: UUID
+    distance_km: float
+    duration_hours: float
+    metadata: Dict
+    country_segments: Tuple = ()
+    empty_driving: Optional[Dict] = None
+
 
 class CostCalculationService(BaseService, CostService):
     """Service for calculating transport costs.
@@ -35,17 +68,26 @@ class CostCalculationService(BaseService, CostService):
     def __init__(
         self,
         settings_service: Optional['CostSettingsService'] = None,
-        toll_service: Optional['TollRateService'] = None
+        toll_service: Optional['TollRateService'] = None,
+        cost_repository: Optional[CostRepository] = None,
+        compiled_settings: Optional[CompiledSettingsHolder] = None,
+        result_cache: Optional[CostResultCache] = None
     ):
         """Initialize cost calculation service.
         
         Args:
             settings_service: Optional service for cost settings
             toll_service: Optional service for toll rates
+            cost_repository: Optional repository of stored costs
+            compiled_settings: Optional holder of compiled settings snapshots
+            result_cache: Optional cache of computed costs
         """
         super().__init__()
         self.settings_service = settings_service
         self.toll_service = toll_service
+        self.cost_repository = cost_repository
+        self.compiled_settings = compiled_settings or get_compiled_settings_holder()
+        self.result_cache = result_cache or get_cost_result_cache()
     
     def calculate_detailed_cost(
         self,
@@ -69,7 +111,8 @@ class CostCalculationService(BaseService, CostService):
             validity_period: Optional validity period
             
         Returns:
-            Detailed cost breakdown
+            Detailed cost breakdown; each call returns a new cost record,
+            also when the result is served from the cache
             
         Raises:
             ValueError: If calculation fails
@@ -90,56 +133,38 @@ class CostCalculationService(BaseService, CostService):
             if not settings:
                 raise ValueError("Cost settings are required")
             
-            # Initialize cost components
-            components: List[CostComponent] = []
-            
-            # Calculate base costs
-            components.extend(self._calculate_fuel_costs(
-                route,
-                settings,
-                vehicle_spec
-            ))
+            # Rates of this settings version, compiled once per version
+            rates = self.compiled_settings.get(settings)
+            validity_period = validity_period or DEFAULT_VALIDITY_PERIOD
             
-            components.extend(self._calculate_toll_costs(
-                route,
-                settings,
-                vehicle_spec
-            ))
-            
-            components.extend(self._calculate_driver_costs(
-                route,
-                settings
-            ))
-            
-            components.extend(self._calculate_maintenance_costs(
-                route,
-                settings,
-                vehicle_spec
-            ))
-            
-            components.extend(self._calculate_overhead_costs(
-                route,
-                settings
-            ))
-            
-            # Add empty driving costs if needed
-            if include_empty_driving and route.metadata.get("empty_driving"):
-                components.extend(self._calculate_empty_driving_costs(
+            # Repeated requests for the same route contents, settings
+            # version, specifications and toll pricing are served from the
+            # cache, for no longer than the cost stays valid
+            cached = self.result_cache.get_or_compute(
+                route.id,
+                self._get_route_fingerprint(route),
+                rates,
+                lambda: self._calculate_cost(
                     route,
-                    settings,
-                    vehicle_spec
-                ))
-            
-            # Create cost object
-            cost = Cost(
-                route_id=route.id,
-                components=components,
-                validity_period=validity_period or timedelta(hours=24),
-                calculated_at=datetime.utcnow()
+                    rates,
+                    vehicle_spec,
+                    include_empty_driving,
+                    validity_period
+                ),
+                vehicle_spec=vehicle_spec,
+                cargo_spec=cargo_spec,
+                max_ttl=validity_period.total_seconds(),
+                toll_service=type(self.toll_service).__qualname__ if self.toll_service else None,
+                include_empty_driving=include_empty_driving,
+                include_country_breakdown=include_country_breakdown,
+                validity_period=validity_period
             )
             
-            # Update totals
-            self._update_cost_totals(cost, components)
+            # The cached cost is shared; callers get their own record
+            cost = cached.model_copy(
+                deep=True,
+                update={"id": uuid4(), "calculated_at": datetime.now(timezone.utc)}
+            )
             
             self._log_exit("calculate_detailed_cost", cost)
             return cost
@@ -148,309 +173,488 @@ class CostCalculationService(BaseService, CostService):
             self._log_error("calculate_detailed_cost", e)
             raise ValueError(f"Failed to calculate costs: {str(e)}")
     
-    def _calculate_fuel_costs(
+    def calculate_batch(
         self,
-        route: Route,
-        settings: CostSettings,
-        vehicle_spec: Optional[VehicleSpecification]
-    ) -> List[CostComponent]:
-        """Calculate fuel costs for each country segment.
+        routes: Sequence[Route],
+        settings: Optional[CostSettings] = None,
+        vehicle_spec: Optional[VehicleSpecification] = None,
+        include_empty_driving: bool = True
+    ) -> CostBatchResult:
+        """Calculate component totals for many routes at once.
+        
+        Uses the same rates and formulas as the per-component methods, on
+        columns of all country segments instead of one component at a
+        time. Tolls always come from the settings rates.
         
         Args:
-            route: Route to calculate for
-            settings: Cost settings to use
-            vehicle_spec: Optional vehicle specifications
+            routes: Routes to calculate costs for
+            settings: Optional cost settings to use
+            vehicle_spec: Optional vehicle specifications for all routes
+            include_empty_driving: Whether to include empty driving
             
         Returns:
-            List of fuel cost components
+            Component totals per route, in the order of the routes
+            
+        Raises:
+            ValueError: If calculation fails
         """
-        components = []
-        
-        # Get fuel consumption rate
-        consumption = (
-            vehicle_spec.fuel_consumption
-            if vehicle_spec
-            else settings.default_fuel_consumption
+        self._log_entry(
+            "calculate_batch",
+            routes=len(routes),
+            settings=settings,
+            vehicle_spec=vehicle_spec
         )
         
-        # Calculate for each segment
-        for segment in route.metadata.get("country_segments", []):
-            fuel_price = settings.get_fuel_price(segment["country_code"])
-            distance = segment["distance_km"]
+        try:
+            if not settings and self.settings_service:
+                settings = self.settings_service.get_current_settings()
             
-            cost = Decimal(str(distance * consumption * fuel_price))
+            if not settings:
+                raise ValueError("Cost settings are required")
             
-            components.append(CostComponent(
-                category="fuel",
-                amount=cost,
-                country_code=segment["country_code"],
-                details={
-                    "distance_km": distance,
-                    "consumption_rate": consumption,
-                    "fuel_price": fuel_price
-                }
-            ))
-        
-        return components
+            columns = RouteColumns.from_routes(
+                routes,
+                self._get_country_segments,
+                self._get_empty_driving if include_empty_driving else None
+            )
+            rates = self.compiled_settings.get(settings).rate_vectors(
+                columns.country_codes,
+                vehicle_spec
+            )
+            result = calculate_component_totals(columns, rates)
+            
+            self._log_exit("calculate_batch", f"{len(result)} routes")
+            return result
+            
+        except Exception as e:
+            self._log_error("calculate_batch", e)
+            raise ValueError(f"Failed to calculate batch costs: {str(e)}")
     
-    def _calculate_toll_costs(
+    def calculate_route_cost(
         self,
-        route: Route,
-        settings: CostSettings,
-        vehicle_spec: Optional[VehicleSpecification]
-    ) -> List[CostComponent]:
-        """Calculate toll costs for each country segment.
+        route_id: UUID,
+        distance_km: Decimal,
+        duration_hours: Decimal,
+        country_segments: List[Dict],
+        settings: Optional[CostSettings] = None
+    ) -> Cost:
+        """Calculate cost for a route from its distance, duration and segments.
+        
+        Segments may use "country" or "country_code", "distance" or
+        "distance_km" and "duration" or "duration_hours". Segments without
+        a duration get a share of the route duration by distance.
         
         Args:
-            route: Route to calculate for
-            settings: Cost settings to use
-            vehicle_spec: Optional vehicle specifications
+            route_id: ID of the route
+            distance_km: Total distance in kilometers
+            duration_hours: Total duration in hours
+            country_segments: List of country segments with distances
+            settings: Optional specific settings to use
+            
+        Returns:
+            Calculated cost with breakdown
+            
+        Raises:
+            CostServiceError: If calculation fails
+        """
+        self._log_entry(
+            "calculate_route_cost",
+            route_id=route_id,
+            distance_km=distance_km,
+            duration_hours=duration_hours
+        )
+        
+        try:
+            segments = []
+            for segment in country_segments:
+                distance = float(segment.get("distance_km", segment.get("distance", 0)))
+                duration = segment.get("duration_hours", segment.get("duration"))
+                if duration is None:
+                    duration = (
+                        float(duration_hours) * distance / float(distance_km)
+                        if distance_km else 0.0
+                    )
+                segments.append({
+                    "country_code": segment.get("country_code", segment.get("country")),
+                    "distance_km": distance,
+                    "duration_hours": float(duration)
+                })
+            
+            route = _RouteQuantities(
+                id=route_id,
+                distance_km=float(distance_km),
+                duration_hours=float(duration_hours),
+                metadata={"country_segments": segments}
+            )
+            breakdown = self.calculate_batch(
+                [route],
+                settings,
+                include_empty_driving=False
+            ).breakdown(0)
+            
+            cost = Cost(
+                route_id=route_id,
+                breakdown=CostBreakdownEntity.model_validate(breakdown.model_dump()),
+                calculation_method="standard",
+                total_cost=breakdown.total_cost
+            )
+            
+            self._log_exit("calculate_route_cost", cost)
+            return cost
+            
+        except Exception as e:
+            self._log_error("calculate_route_cost", e)
+            raise CostServiceError(
+                f"Failed to calculate route cost: {str(e)}",
+                original_error=e
+            )
+    
+    def get_cost_breakdown(self, cost_id: UUID) -> Dict:
+        """Get detailed breakdown of a stored cost.
+        
+        Args:
+            cost_id: ID of the cost calculation
             
         Returns:
-            List of toll cost components
+            Cost breakdown as a dictionary
+            
+        Raises:
+            CostServiceError: If breakdown retrieval fails
         """
-        components = []
-        
-        # Use toll service if available
-        if self.toll_service:
-            for segment in route.metadata.get("country_segments", []):
-                toll = self.toll_service.calculate_toll(
-                    route.id,
-                    vehicle_spec.vehicle_type if vehicle_spec else "truck"
-                )
-                
-                components.append(CostComponent(
-                    category="toll",
-                    amount=toll,
-                    country_code=segment["country_code"],
-                    details={
-                        "vehicle_type": (
-                            vehicle_spec.vehicle_type
-                            if vehicle_spec
-                            else "truck"
-                        )
-                    }
-                ))
-        else:
-            # Use simple estimation
-            for segment in route.metadata.get("country_segments", []):
-                distance = segment["distance_km"]
-                rate = settings.get_toll_rate(segment["country_code"])
-                
-                cost = Decimal(str(distance * rate))
-                
-                components.append(CostComponent(
-                    category="toll",
-                    amount=cost,
-                    country_code=segment["country_code"],
-                    details={
-                        "distance_km": distance,
-                        "toll_rate": rate
-                    }
-                ))
-        
-        return components
+        self._log_entry("get_cost_breakdown", cost_id=cost_id)
+        
+        try:
+            if not self.cost_repository:
+                raise ValueError("Cost repository is required")
+            
+            cost = self.cost_repository.get(cost_id)
+            if not cost:
+                raise ValueError(f"Cost {cost_id} not found")
+            
+            breakdown = cost.breakdown.model_dump()
+            self._log_exit("get_cost_breakdown", breakdown)
+            return breakdown
+            
+        except Exception as e:
+            self._log_error("get_cost_breakdown", e)
+            raise CostServiceError(
+                f"Failed to get cost breakdown: {str(e)}",
+                original_error=e
+            )
     
-    def _calculate_driver_costs(
+    def validate_cost(
         self,
-        route: Route,
-        settings: CostSettings
-    ) -> List[CostComponent]:
-        """Calculate driver costs for each country segment.
+        cost: Cost,
+        settings: Optional[CostSettings] = None
+    ) -> bool:
+        """Validate a cost calculation.
+        
+        A cost is valid while it is within its validity period, has no
+        negative amounts and its total equals the sum of its breakdown up
+        to the rounding of each amount.
         
         Args:
-            route: Route to calculate for
-            settings: Cost settings to use
+            cost: Cost to validate
+            settings: Optional settings to validate against (unused)
             
         Returns:
-            List of driver cost components
+            True if cost is valid, False otherwise
+            
+        Raises:
+            CostServiceError: If validation fails
         """
-        components = []
+        self._log_entry("validate_cost", cost=cost)
         
-        for segment in route.metadata.get("country_segments", []):
-            duration = segment.get("duration_hours", 0)
-            rate = settings.get_driver_rate(segment["country_code"])
+        try:
+            breakdown = cost.breakdown
+            amounts = [
+                *breakdown.fuel_costs.values(),
+                *breakdown.toll_costs.values(),
+                *breakdown.maintenance_costs.values(),
+                *breakdown.driver_costs.values(),
+                breakdown.rest_period_costs,
+                breakdown.loading_unloading_costs,
+                *(
+                    amount
+                    for costs in breakdown.empty_driving_costs.values()
+                    for amount in costs.values()
+                ),
+                *breakdown.cargo_specific_costs.values(),
+                *breakdown.overheads.values()
+            ]
             
-            cost = Decimal(str(duration * rate))
+            is_valid = (
+                cost.is_valid()
+                and all(amount >= 0 for amount in amounts)
+                and abs(sum(amounts, Decimal("0")) - breakdown.total_cost) <= CENT / 2 * len(amounts)
+            )
             
-            components.append(CostComponent(
-                category="driver",
-                amount=cost,
-                country_code=segment["country_code"],
-                details={
-                    "duration_hours": duration,
-                    "driver_rate": rate
-                }
-            ))
+            self._log_exit("validate_cost", is_valid)
+            return is_valid
+            
+        except Exception as e:
+            self._log_error("validate_cost", e)
+            raise CostServiceError(
+                f"Failed to validate cost: {str(e)}",
+                original_error=e
+            )
+    
+    def get_cost_history(self, route_id: UUID) -> List[Cost]:
+        """Get the stored costs of a route, newest first.
+        
+        Args:
+            route_id: ID of the route
+            
+        Returns:
+            List of historical costs
+            
+        Raises:
+            CostServiceError: If history retrieval fails
+        """
+        self._log_entry("get_cost_history", route_id=route_id)
         
-        return components
+        try:
+            if not self.cost_repository:
+                raise ValueError("Cost repository is required")
+            
+            history = sorted(
+                self.cost_repository.get_by_route_id(route_id),
+                key=lambda cost: cost.calculated_at,
+                reverse=True
+            )
+            
+            self._log_exit("get_cost_history", f"{len(history)} costs")
+            return history
+            
+        except Exception as e:
+            self._log_error("get_cost_history", e)
+            raise CostServiceError(
+                f"Failed to get cost history: {str(e)}",
+                original_error=e
+            )
     
-    def _calculate_maintenance_costs(
+    def get_cost_dependencies(
         self,
         route: Route,
-        settings: CostSettings,
-        vehicle_spec: Optional[VehicleSpecification]
-    ) -> List[CostComponent]:
-        """Calculate maintenance costs.
+        settings: Optional[CostSettings] = None,
+        vehicle_spec: Optional[VehicleSpecification] = None,
+        include_empty_driving: bool = True
+    ) -> Dict[str, ComponentDependency]:
+        """Get the settings dependencies of each cost breakdown entry.
+        
+        Entries are keyed like stored breakdowns ("fuel_costs.DE",
+        "maintenance_costs.truck", "empty_driving_costs.DE.fuel") and
+        record the same products the calculation forms, so a stale entry
+        can be recomputed from new settings alone. Tolls depend on the
+        settings toll rates also when a toll service prices them, since
+        the service prices with the calculation's settings; they are
+        recomputed at the settings truck rate.
         
         Args:
-            route: Route to calculate for
-            settings: Cost settings to use
+            route: Route the costs were calculated for
+            settings: Optional cost settings to use
             vehicle_spec: Optional vehicle specifications
+            include_empty_driving: Whether empty driving was included
             
         Returns:
-            List of maintenance cost components
+            Dependencies by component path
+            
+        Raises:
+            ValueError: If settings are missing
         """
-        components = []
+        if not settings and self.settings_service:
+            settings = self.settings_service.get_current_settings()
+        
+        if not settings:
+            raise ValueError("Cost settings are required")
         
-        # Get maintenance rate
-        rate = (
-            vehicle_spec.maintenance_rate
+        rates = self.compiled_settings.get(settings)
+        consumption = (
+            float(vehicle_spec.fuel_consumption)
+            if vehicle_spec
+            else settings_key(FUEL_CONSUMPTION)
+        )
+        maintenance = (
+            float(vehicle_spec.maintenance_rate)
             if vehicle_spec
-            else settings.default_maintenance_rate
+            else settings_key(MAINTENANCE_RATE)
         )
+        dependencies: Dict[str, ComponentDependency] = {}
+        
+        def entry(component: str, *path: str) -> ComponentDependency:
+            key = join_path(*path)
+            if key not in dependencies:
+                dependencies[key] = ComponentDependency(key, component)
+            return dependencies[key]
+        
+        for segment in self._get_country_segments(route):
+            code = segment["country_code"]
+            distance = segment["distance_km"]
+            duration = segment.get("duration_hours", 0)
+            entry("fuel", "fuel_costs", code).add_term(
+                distance, consumption, settings_key(FUEL_PRICE, code)
+            )
+            entry("toll", "toll_costs", code).add_term(
+                distance, settings_key(TOLL_RATE, code)
+            )
+            entry("driver", "driver_costs", code).add_term(
+                duration, settings_key(DRIVER_RATE, code)
+            )
         
-        # Calculate for total distance
-        distance = route.distance_km
-        cost = Decimal(str(distance * rate))
+        vehicle_type = vehicle_spec.vehicle_type if vehicle_spec else "truck"
+        entry("maintenance", "maintenance_costs", vehicle_type).add_term(
+            route.distance_km, maintenance
+        )
+        entry("overhead", "overheads", "overhead").add_term(
+            route.duration_hours, settings_key(OVERHEAD_RATE)
+        )
         
-        components.append(CostComponent(
-            category="maintenance",
-            amount=cost,
-            details={
-                "distance_km": distance,
-                "maintenance_rate": rate
-            }
-        ))
+        empty_driving = self._get_empty_driving(route) if include_empty_driving else None
+        if empty_driving:
+            origin = empty_driving["origin"]
+            code = origin.get("country_code") or origin.get("country") or "unknown"
+            distance = empty_driving["distance_km"]
+            entry("fuel", "empty_driving_costs", code, "fuel").add_term(
+                distance, consumption, settings_key(FUEL_PRICE, code)
+            )
+            entry("maintenance", "empty_driving_costs", code, "maintenance").add_term(
+                distance, maintenance
+            )
         
-        return components
+        # Components the settings disable have no stored entry to track
+        return {
+            path: dependency
+            for path, dependency in dependencies.items()
+            if rates.is_enabled(dependency.component)
+        }
     
-    def _calculate_overhead_costs(
+    def _calculate_cost(
         self,
         route: Route,
-        settings: CostSettings
-    ) -> List[CostComponent]:
-        """Calculate overhead costs.
+        rates: CompiledCostSettings,
+        vehicle_spec: Optional[VehicleSpecification],
+        include_empty_driving: bool,
+        validity_period: timedelta
+    ) -> Cost:
+        """Calculate the cost record of a route.
+        
+        The breakdown comes from the batch path, which keeps per-country
+        amounts. Tolls are priced by the toll service when one is
+        configured, otherwise with the settings rates.
         
         Args:
-            route: Route to calculate for
-            settings: Cost settings to use
+            route: Route to calculate costs for
+            rates: Compiled cost settings to use
+            vehicle_spec: Optional vehicle specifications
+            include_empty_driving: Whether to include empty driving
+            validity_period: Validity period
             
         Returns:
-            List of overhead cost components
+            Cost with its breakdown and total
         """
-        components = []
-        
-        # Calculate based on duration
-        duration = route.duration_hours
-        rate = settings.overhead_rate
-        
-        cost = Decimal(str(duration * rate))
-        
-        components.append(CostComponent(
-            category="overhead",
-            amount=cost,
-            details={
-                "duration_hours": duration,
-                "overhead_rate": rate
-            }
-        ))
-        
-        return components
+        vehicle_type = vehicle_spec.vehicle_type if vehicle_spec else "truck"
+        toll_costs = (
+            self._calculate_toll_costs(route, rates, vehicle_type)
+            if self.toll_service and rates.is_enabled("toll")
+            else None
+        )
+        breakdown = self.calculate_batch(
+            [route],
+            rates,
+            vehicle_spec,
+            include_empty_driving
+        ).breakdown(0, vehicle_type, toll_costs)
+        
+        return Cost(
+            route_id=route.id,
+            breakdown=CostBreakdownEntity.model_validate(breakdown.model_dump()),
+            calculation_method="detailed",
+            validity_period=validity_period,
+            total_cost=breakdown.total_cost
+        )
     
-    def _calculate_empty_driving_costs(
+    def _calculate_toll_costs(
         self,
         route: Route,
-        settings: CostSettings,
-        vehicle_spec: Optional[VehicleSpecification]
-    ) -> List[CostComponent]:
-        """Calculate costs for empty driving segments.
+        rates: CompiledCostSettings,
+        vehicle_type: str
+    ) -> Dict[str, Money]:
+        """Calculate toll costs per country with the toll service.
         
         Args:
             route: Route to calculate for
-            settings: Cost settings to use
-            vehicle_spec: Optional vehicle specifications
+            rates: Compiled cost settings to use
+            vehicle_type: Type of vehicle
             
         Returns:
-            List of empty driving cost components
+            Toll per country, each segment rounded to the cent
         """
-        components = []
-        
-        empty_driving = route.metadata.get("empty_driving")
-        if not empty_driving:
-            return components
+        tolls: Dict[str, Money] = {}
+        for segment in self._get_country_segments(route):
+            # Tolls are priced with this calculation's settings
+            toll = self.toll_service.calculate_toll(
+                route.id,
+                vehicle_type,
+                country_code=segment["country_code"],
+                distance=segment["distance_km"],
+                settings=rates
+            )
+            code = segment["country_code"]
+            tolls[code] = tolls.get(code, Money()) + Money.from_number(toll)
+        return tolls
+    
+    def _get_country_segments(self, route: Route) -> List[Dict]:
+        """Get country segments of a route.
         
-        # Calculate fuel costs
-        consumption = (
-            vehicle_spec.fuel_consumption
-            if vehicle_spec
-            else settings.default_fuel_consumption
-        )
+        Segments from the route summary are preferred; metadata is only
+        read for routes created before segments were stored on the route.
         
-        distance = empty_driving["distance_km"]
-        fuel_price = settings.get_fuel_price(
-            empty_driving["origin"]["country_code"]
-        )
+        Args:
+            route: Route to read segments from
+            
+        Returns:
+            List of segment dictionaries
+        """
+        if route.country_segments:
+            return [
+                {
+                    "country_code": segment.country_code,
+                    "distance_km": float(segment.distance),
+                    "duration_hours": float(segment.duration_hours)
+                }
+                for segment in route.country_segments
+            ]
+        if isinstance(route.metadata, dict):
+            return route.metadata.get("country_segments", [])
+        return []
+    
+    def _get_route_fingerprint(self, route: Route) -> str:
+        """Hash the route contents costs are computed from.
         
-        fuel_cost = Decimal(str(distance * consumption * fuel_price))
-        
-        components.append(CostComponent(
-            category="empty_driving_fuel",
-            amount=fuel_cost,
-            details={
-                "distance_km": distance,
-                "consumption_rate": consumption,
-                "fuel_price": fuel_price
-            }
-        ))
-        
-        # Calculate maintenance
-        rate = (
-            vehicle_spec.maintenance_rate
-            if vehicle_spec
-            else settings.default_maintenance_rate
+        Args:
+            route: Route to hash
+            
+        Returns:
+            Hex digest of segments, distances and empty driving
+        """
+        return route_fingerprint(
+            self._get_country_segments(route),
+            route.distance_km,
+            route.duration_hours,
+            self._get_empty_driving(route)
         )
-        
-        maintenance_cost = Decimal(str(distance * rate))
-        
-        components.append(CostComponent(
-            category="empty_driving_maintenance",
-            amount=maintenance_cost,
-            details={
-                "distance_km": distance,
-                "maintenance_rate": rate
-            }
-        ))
-        
-        return components
     
-    def _update_cost_totals(
-        self,
-        cost: Cost,
-        components: List[CostComponent]
-    ) -> None:
-        """Update cost totals from components.
+    def _get_empty_driving(self, route: Route) -> Optional[Dict]:
+        """Get empty driving of a route.
         
         Args:
-            cost: Cost object to update
-            components: List of cost components
+            route: Route to read empty driving from
+            
+        Returns:
+            Empty driving dictionary, or None if the route has none
         """
-        # Calculate totals
-        cost.total_amount = sum(c.amount for c in components)
-        
-        # Calculate category subtotals
-        cost.breakdown = {}
-        for component in components:
-            if component.category not in cost.breakdown:
-                cost.breakdown[component.category] = Decimal("0")
-            cost.breakdown[component.category] += component.amount
-        
-        # Calculate country breakdown
-        cost.country_breakdown = {}
-        for component in components:
-            if not component.country_code:
-                continue
-                
-            if component.country_code not in cost.country_breakdown:
-                cost.country_breakdown[component.country_code] = Decimal("0")
-            cost.country_breakdown[component.country_code] += component.amount
+        if route.empty_driving:
+            return route.empty_driving.model_dump()
+        if isinstance(route.metadata, dict):
+            return route.metadata.get("empty_driving")
+        return None
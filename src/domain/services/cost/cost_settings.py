@@ -6,8 +6,12 @@ It provides functionality for:
 - Version control
 - Settings validation
 - Default values
+- Publishing compiled snapshots of the current settings
+- Invalidating costs computed with changed settings
+- Recalculating stored costs made stale by settings changes
 """
-from datetime import datetime
+import copy
+from datetime import datetime, timezone
 from decimal import Decimal
 from typing import Dict, List, Optional, Union
 from uuid import UUID
@@ -20,6 +24,11 @@ from src.domain.interfaces.services.cost_settings_service import (
     CostSettingsService
 )
 from src.domain.services.common.base import BaseService
+from src.domain.services.cost.compiled_settings import (
+    CompiledSettingsHolder, get_compiled_settings_holder
+)
+from src.domain.services.cost.cost_cache import CostResultCache, get_cost_result_cache
+from src.domain.services.cost.recalculation import CostRecalculationService
 from src.domain.value_objects import CountrySettings
 
 class CostSettingsServiceImpl(BaseService, CostSettingsService):
@@ -32,14 +41,27 @@ class CostSettingsServiceImpl(BaseService, CostSettingsService):
     - Providing default values
     """
     
-    def __init__(self, repository: CostSettingsRepository):
+    def __init__(
+        self,
+        repository: CostSettingsRepository,
+        compiled_settings: Optional[CompiledSettingsHolder] = None,
+        result_cache: Optional[CostResultCache] = None,
+        recalculator: Optional[CostRecalculationService] = None
+    ):
         """Initialize cost settings service.
         
         Args:
             repository: Repository for cost settings persistence
+            compiled_settings: Optional holder of compiled settings snapshots
+            result_cache: Optional cache of computed costs
+            recalculator: Optional service recalculating stored costs
+                after settings changes
         """
         super().__init__()
         self.repository = repository
+        self.compiled_settings = compiled_settings or get_compiled_settings_holder()
+        self.result_cache = result_cache or get_cost_result_cache()
+        self.recalculator = recalculator
     
     def create_settings(
         self,
@@ -153,12 +175,15 @@ class CostSettingsServiceImpl(BaseService, CostSettingsService):
             current_version = self.repository.get_latest_version(settings_id)
             new_version = current_version.version + 1 if current_version else 1
             
+            # Keep the old values, since settings are updated in place
+            previous = copy.deepcopy(settings) if self.recalculator else None
+            
             # Update settings
             for key, value in updates.items():
                 if hasattr(settings, key):
                     setattr(settings, key, value)
             
-            settings.updated_at = datetime.utcnow()
+            settings.modified_at = datetime.now(timezone.utc)
             
             # Validate updated settings
             self._validate_settings(settings)
@@ -180,6 +205,18 @@ class CostSettingsServiceImpl(BaseService, CostSettingsService):
             )
             self.repository.create_version(version)
             
+            # Swap the snapshot if the current settings changed
+            current = self.compiled_settings.current
+            if current is not None and getattr(current.source, "id", None) == settings.id:
+                self.compiled_settings.publish(settings)
+            
+            # Costs computed with earlier versions are no longer current
+            self.result_cache.invalidate_settings(settings.id)
+            
+            # Recompute the stored cost components the change made stale
+            if self.recalculator:
+                self.recalculator.start(previous, settings)
+            
             self._log_exit("update_settings", settings)
             return settings
             
@@ -253,13 +290,105 @@ class CostSettingsServiceImpl(BaseService, CostSettingsService):
                     description="Auto-generated default settings"
                 )
             
+            self.compiled_settings.publish(settings)
+            
             self._log_exit("get_current_settings", settings)
             return settings
             
         except Exception as e:
             self._log_error("get_current_settings", e)
             raise ValueError(f"Failed to get current settings: {str(e)}")
-    
+
+    def validate_settings(self, settings: CostSettings) -> bool:
+        """Validate settings with the repository rules.
+
+        Args:
+            settings: Settings to validate
+
+        Returns:
+            True if settings are valid
+
+        Raises:
+            ValueError: If validation fails
+        """
+        self._log_entry("validate_settings", settings=settings)
+
+        try:
+            valid = self.repository.validate(settings)
+
+            self._log_exit("validate_settings", valid)
+            return valid
+
+        except Exception as e:
+            self._log_error("validate_settings", e)
+            raise ValueError(f"Failed to validate settings: {str(e)}")
+
+    def get_settings_history(self) -> List[Dict]:
+        """Get history of settings changes.
+
+        Returns:
+            List of historical changes
+
+        Raises:
+            ValueError: If history retrieval fails
+        """
+        self._log_entry("get_settings_history")
+
+        try:
+            history = self.repository.get_history()
+
+            self._log_exit("get_settings_history", history)
+            return history
+
+        except Exception as e:
+            self._log_error("get_settings_history", e)
+            raise ValueError(f"Failed to get settings history: {str(e)}")
+
+    def get_settings_version(self, version: str) -> Optional[CostSettings]:
+        """Get settings by version.
+
+        Args:
+            version: Settings version
+
+        Returns:
+            Settings if found, None otherwise
+
+        Raises:
+            ValueError: If version retrieval fails
+        """
+        self._log_entry("get_settings_version", version=version)
+
+        try:
+            settings = self.repository.get_version(version)
+
+            self._log_exit("get_settings_version", settings)
+            return settings
+
+        except Exception as e:
+            self._log_error("get_settings_version", e)
+            raise ValueError(f"Failed to get settings version: {str(e)}")
+
+    def get_defaults(self) -> CostSettings:
+        """Get default settings configuration.
+
+        Returns:
+            Default settings
+
+        Raises:
+            ValueError: If defaults retrieval fails
+        """
+        self._log_entry("get_defaults")
+
+        try:
+            settings = self.repository.get_defaults()
+
+            self._log_exit("get_defaults", settings)
+            return settings
+
+        except Exception as e:
+            self._log_error("get_defaults", e)
+            raise ValueError(f"Failed to get default settings: {str(e)}")
+
     def _validate_settings(self, settings: CostSettings) -> None:
         """Validate cost settings.
         
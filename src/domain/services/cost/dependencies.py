@@ -0,0 +1,257 @@
+"""Settings dependencies of stored cost components.
+
+Every amount in a stored cost breakdown (for example the fuel cost in DE,
+``fuel_costs.DE``) is a sum of terms. Each term is a quantity of the route
+multiplied by factors, and each factor is either a fixed number (a vehicle
+specification value) or a settings key:
+
+- ``fuel_price:<country>``, ``toll_rate:<country>`` and
+  ``driver_rate:<country>`` for country rates
+- ``fuel_consumption``, ``maintenance_rate`` and ``overhead_rate`` for
+  the settings defaults
+- ``enabled:<component>`` for the enabled cost components
+
+``diff_settings`` compares two compiled settings versions key by key, so
+only components depending on a changed key are stale, and
+``ComponentDependency.recompute`` evaluates a component again from the new
+rates without the route.
+"""
+from typing import Any, Dict, FrozenSet, Iterable, List, Mapping, Optional, Sequence, Set, Tuple, Union
+
+from src.domain.services.cost.compiled_settings import COMPONENT_BITS, CompiledCostSettings
+from src.domain.value_objects import Money
+
+FUEL_PRICE = "fuel_price"
+TOLL_RATE = "toll_rate"
+DRIVER_RATE = "driver_rate"
+FUEL_CONSUMPTION = "fuel_consumption"
+MAINTENANCE_RATE = "maintenance_rate"
+OVERHEAD_RATE = "overhead_rate"
+ENABLED = "enabled"
+
+_COUNTRY_RATES = (FUEL_PRICE, TOLL_RATE, DRIVER_RATE)
+_DEFAULT_RATES = (FUEL_CONSUMPTION, MAINTENANCE_RATE, OVERHEAD_RATE)
+_KEY_SEPARATOR = ":"
+# Separates the breakdown field from the entry in component paths
+PATH_SEPARATOR = "."
+
+Factor = Union[str, float]
+
+
+def settings_key(name: str, country_code: Optional[str] = None) -> str:
+    """Build a settings key.
+
+    Args:
+        name: Rate name
+        country_code: Country of a country rate
+
+    Returns:
+        Key such as "fuel_price:DE"
+    """
+    if country_code is None:
+        return name
+    return f"{name}{_KEY_SEPARATOR}{country_code}"
+
+
+def enabled_key(component: str) -> str:
+    """Build the key of a component's enabled flag."""
+    return settings_key(ENABLED, component)
+
+
+def key_countries(keys: Iterable[str]) -> FrozenSet[str]:
+    """Get the countries named by country rate keys."""
+    countries = set()
+    for key in keys:
+        name, _, country_code = key.partition(_KEY_SEPARATOR)
+        if name in _COUNTRY_RATES:
+            countries.add(country_code)
+    return frozenset(countries)
+
+
+def resolve_key(rates: CompiledCostSettings, key: str) -> float:
+    """Get the value of a settings key.
+
+    Args:
+        rates: Compiled settings
+        key: Settings key
+
+    Returns:
+        Rate value, or 1.0/0.0 for enabled flags
+
+    Raises:
+        KeyError: If the key is unknown
+    """
+    name, _, country_code = key.partition(_KEY_SEPARATOR)
+    if name == FUEL_PRICE:
+        return rates.fuel_price(country_code)
+    if name == TOLL_RATE:
+        return rates.toll_rate(country_code)
+    if name == DRIVER_RATE:
+        return rates.driver_rate(country_code)
+    if name == FUEL_CONSUMPTION:
+        return rates.fuel_consumption
+    if name == MAINTENANCE_RATE:
+        return rates.maintenance_rate
+    if name == OVERHEAD_RATE:
+        return rates.overhead_rate
+    if name == ENABLED:
+        return 1.0 if rates.is_enabled(country_code) else 0.0
+    raise KeyError(f"Unknown settings key: {key}")
+
+
+def diff_settings(
+    old: CompiledCostSettings,
+    new: CompiledCostSettings,
+    countries: Iterable[str] = ()
+) -> FrozenSet[str]:
+    """Find the settings keys whose values differ between two versions.
+
+    Args:
+        old: Previous settings
+        new: New settings
+        countries: Further countries to compare, besides those either
+            version lists (for example countries of stored costs that
+            resolve to the settings defaults)
+
+    Returns:
+        Changed settings keys
+    """
+    keys = [settings_key(name) for name in _DEFAULT_RATES]
+    keys.extend(enabled_key(component) for component in COMPONENT_BITS)
+    codes = set(old.country_codes) | set(new.country_codes) | set(countries)
+    keys.extend(
+        settings_key(name, code)
+        for code in sorted(codes)
+        for name in _COUNTRY_RATES
+    )
+    return frozenset(
+        key for key in keys
+        if resolve_key(old, key) != resolve_key(new, key)
+    )
+
+
+class ComponentDependency:
+    """Settings inputs of one stored cost breakdown entry."""
+
+    def __init__(
+        self,
+        path: str,
+        component: str,
+        terms: Sequence[Tuple[float, Sequence[Factor]]] = ()
+    ):
+        """Initialize the dependency.
+
+        Args:
+            path: Breakdown entry, such as "fuel_costs.DE"
+            component: Settings component enabling the entry (fuel, toll, ...)
+            terms: (quantity, factors) pairs summed into the amount
+        """
+        self.path = path
+        self.component = component
+        self.terms: List[Tuple[float, Tuple[Factor, ...]]] = [
+            (quantity, tuple(factors)) for quantity, factors in terms
+        ]
+
+    def add_term(self, quantity: float, *factors: Factor) -> None:
+        """Add a quantity multiplied by factors.
+
+        Args:
+            quantity: Route quantity (distance or duration)
+            *factors: Settings keys or fixed numbers, in multiplication order
+        """
+        self.terms.append((quantity, factors))
+
+    @property
+    def keys(self) -> FrozenSet[str]:
+        """Get the settings keys the entry depends on."""
+        keys: Set[str] = {enabled_key(self.component)}
+        for _, factors in self.terms:
+            keys.update(factor for factor in factors if isinstance(factor, str))
+        return frozenset(keys)
+
+    @property
+    def countries(self) -> FrozenSet[str]:
+        """Get the countries whose rates the entry depends on."""
+        return key_countries(self.keys)
+
+    def is_stale(self, changed: FrozenSet[str]) -> bool:
+        """Check whether any settings key of the entry changed."""
+        return not self.keys.isdisjoint(changed)
+
+    def recompute(self, rates: CompiledCostSettings) -> Money:
+        """Compute the amount of the entry from settings.
+
+        Products are formed in the order of the scalar cost path and each
+        is rounded to the cent, so an unchanged entry recomputes to the
+        amount stored.
+
+        Args:
+            rates: Compiled settings
+
+        Returns:
+            Amount in cents (zero if the component is disabled)
+        """
+        total = Money()
+        if not rates.is_enabled(self.component):
+            return total
+        for quantity, factors in self.terms:
+            amount = quantity
+            for factor in factors:
+                amount *= resolve_key(rates, factor) if isinstance(factor, str) else factor
+            total += Money.from_float(amount)
+        return total
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-serializable dictionary."""
+        return {
+            "component": self.component,
+            "terms": [[quantity, list(factors)] for quantity, factors in self.terms],
+            "keys": sorted(self.keys),
+            "countries": sorted(self.countries)
+        }
+
+    @classmethod
+    def from_dict(cls, path: str, data: Mapping[str, Any]) -> "ComponentDependency":
+        """Build a dependency from its dictionary.
+
+        Args:
+            path: Breakdown entry
+            data: Dictionary from to_dict()
+
+        Returns:
+            Dependency
+        """
+        return cls(
+            path,
+            data["component"],
+            [(quantity, factors) for quantity, factors in data.get("terms", ())]
+        )
+
+
+def split_path(path: str) -> Tuple[str, ...]:
+    """Split a component path into the breakdown field and entry keys."""
+    return tuple(path.split(PATH_SEPARATOR))
+
+
+def join_path(*parts: str) -> str:
+    """Join a breakdown field and entry keys into a component path."""
+    return PATH_SEPARATOR.join(parts)
+
+
+def stale_components(
+    dependencies: Mapping[str, ComponentDependency],
+    changed: FrozenSet[str]
+) -> List[ComponentDependency]:
+    """Get the entries depending on changed settings keys.
+
+    Args:
+        dependencies: Dependencies by component path
+        changed: Changed settings keys from diff_settings()
+
+    Returns:
+        Stale entries
+    """
+    return [
+        dependency for dependency in dependencies.values()
+        if dependency.is_stale(changed)
+    ]
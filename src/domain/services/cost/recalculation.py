@@ -0,0 +1,232 @@
+"""Background recalculation of stored costs after a settings change.
+
+A settings update used to leave stored cost breakdowns at the old rates,
+and recomputing every stored cost would mean re-running whole routes.
+``CostRecalculationService`` instead:
+
+- Diffs the old and new settings into the changed settings keys, including
+  the countries stored costs resolve through the settings defaults.
+- Looks up, through the repository's settings key index, the stored costs
+  and components depending on those keys.
+- Recomputes only the stale components from their recorded dependencies
+  and writes the new amounts back, adjusting each cost's total.
+
+Both settings versions are compiled afresh: settings updated in place may
+keep the ID, version and modification time of the snapshot compiled before
+the change, so a shared snapshot could be the old rates.
+
+Jobs run on a worker thread of the process that started them and report
+their progress through ``RecalculationJob``. Jobs are kept in that
+process's memory only: other workers of a multi-process deployment do not
+see them, and they are lost on restart.
+"""
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import Any, Dict, List, Optional
+from uuid import UUID, uuid4
+
+from src.domain.interfaces.repositories.cost_repository import CostRepository
+from src.domain.services.common.base import BaseService
+from src.domain.services.cost.compiled_settings import CompiledCostSettings
+from src.domain.services.cost.dependencies import diff_settings, key_countries
+
+PENDING = "pending"
+RUNNING = "running"
+COMPLETED = "completed"
+FAILED = "failed"
+
+
+class RecalculationJob:
+    """Progress of one recalculation of stored costs."""
+
+    def __init__(self, settings_id: Optional[Any] = None):
+        """Initialize the job.
+
+        Args:
+            settings_id: ID of the changed settings
+        """
+        self.id: UUID = uuid4()
+        self.settings_id = settings_id
+        self.status = PENDING
+        self.changed_keys: List[str] = []
+        self.total = 0
+        self.processed = 0
+        self.recomputed_components = 0
+        self.errors: Dict[str, str] = {}
+        self.created_at = datetime.utcnow()
+        self.started_at: Optional[datetime] = None
+        self.finished_at: Optional[datetime] = None
+        self._lock = threading.Lock()
+
+    @property
+    def done(self) -> bool:
+        """Check whether the job has finished."""
+        return self.status in (COMPLETED, FAILED)
+
+    def advance(self, components: int = 0, error: Optional[str] = None, cost_id: Any = None) -> None:
+        """Record one processed cost.
+
+        Args:
+            components: Components recomputed for the cost
+            error: Error message if the cost failed
+            cost_id: ID of the cost
+        """
+        with self._lock:
+            self.processed += 1
+            self.recomputed_components += components
+            if error is not None:
+                self.errors[str(cost_id)] = error
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to a JSON-serializable dictionary."""
+        with self._lock:
+            return {
+                "id": str(self.id),
+                "settings_id": None if self.settings_id is None else str(self.settings_id),
+                "status": self.status,
+                "changed_keys": list(self.changed_keys),
+                "total": self.total,
+                "processed": self.processed,
+                "progress": self.processed / self.total if self.total else (1.0 if self.done else 0.0),
+                "recomputed_components": self.recomputed_components,
+                "errors": dict(self.errors),
+                "created_at": self.created_at.isoformat(),
+                "started_at": self.started_at.isoformat() if self.started_at else None,
+                "finished_at": self.finished_at.isoformat() if self.finished_at else None
+            }
+
+
+class CostRecalculationService(BaseService):
+    """Recomputes the stored cost components a settings change made stale.
+
+    Jobs and their progress are per process.
+    """
+
+    def __init__(
+        self,
+        cost_repository: CostRepository,
+        max_workers: int = 1,
+        max_jobs: int = 100
+    ):
+        """Initialize the service.
+
+        Args:
+            cost_repository: Repository of stored costs and their dependencies
+            max_workers: Maximum jobs running at once
+            max_jobs: Finished jobs kept for progress queries
+        """
+        super().__init__()
+        self.cost_repository = cost_repository
+        self.max_jobs = max_jobs
+        self._jobs: Dict[UUID, RecalculationJob] = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix="cost-recalculation"
+        )
+
+    def start(self, old_settings: Any, new_settings: Any) -> RecalculationJob:
+        """Start recalculating the costs stale after a settings change.
+
+        Args:
+            old_settings: Settings before the change (a copy, since updates
+                modify settings in place)
+            new_settings: Settings after the change
+
+        Returns:
+            Job, running in the background
+        """
+        job = RecalculationJob(getattr(new_settings, "id", None))
+        self._add_job(job)
+        self._executor.submit(self.run, job, old_settings, new_settings)
+        return job
+
+    def run(self, job: RecalculationJob, old_settings: Any, new_settings: Any) -> RecalculationJob:
+        """Recalculate the costs stale after a settings change.
+
+        Failures of single costs are recorded on the job, and the remaining
+        costs are still recalculated.
+
+        Args:
+            job: Job to report progress to
+            old_settings: Settings before the change
+            new_settings: Settings after the change
+
+        Returns:
+            Finished job
+        """
+        self._log_entry("run", job_id=job.id, settings_id=job.settings_id)
+        job.status = RUNNING
+        job.started_at = datetime.utcnow()
+
+        try:
+            old_rates = CompiledCostSettings.compile(old_settings)
+            new_rates = CompiledCostSettings.compile(new_settings)
+            countries = key_countries(self.cost_repository.list_settings_keys())
+            changed = diff_settings(old_rates, new_rates, countries)
+            job.changed_keys = sorted(changed)
+
+            stale = self.cost_repository.find_by_settings_keys(changed) if changed else {}
+            job.total = len(stale)
+
+            for cost_id, paths in stale.items():
+                try:
+                    dependencies = self.cost_repository.get_dependencies(cost_id)
+                    amounts = {
+                        path: dependencies[path].recompute(new_rates)
+                        for path in sorted(paths)
+                        if path in dependencies
+                    }
+                    if amounts:
+                        self.cost_repository.update_components(cost_id, amounts)
+                    job.advance(len(amounts))
+                except Exception as e:
+                    self.logger.warning(
+                        "cost_recalculation_failed",
+                        job_id=str(job.id),
+                        cost_id=str(cost_id),
+                        error=str(e)
+                    )
+                    job.advance(error=str(e), cost_id=cost_id)
+
+            job.status = COMPLETED
+
+        except Exception as e:
+            self._log_error("run", e)
+            job.errors["job"] = str(e)
+            job.status = FAILED
+
+        job.finished_at = datetime.utcnow()
+        self._log_exit("run", f"{job.processed}/{job.total} costs, {job.recomputed_components} components")
+        return job
+
+    def get_job(self, job_id: UUID) -> Optional[RecalculationJob]:
+        """Get a job by ID.
+
+        Args:
+            job_id: Job ID
+
+        Returns:
+            Job if started by this process and still kept, None otherwise
+        """
+        with self._lock:
+            return self._jobs.get(job_id)
+
+    def list_jobs(self) -> List[RecalculationJob]:
+        """Get the known jobs, newest first."""
+        with self._lock:
+            return sorted(self._jobs.values(), key=lambda job: job.created_at, reverse=True)
+
+    def close(self) -> None:
+        """Stop accepting jobs and wait for the running ones."""
+        self._executor.shutdown(wait=True)
+
+    def _add_job(self, job: RecalculationJob) -> None:
+        """Track a job, dropping the oldest finished jobs over the limit."""
+        with self._lock:
+            self._jobs[job.id] = job
+            finished = [known for known in self._jobs.values() if known.done]
+            finished.sort(key=lambda known: known.created_at)
+            for known in finished[:max(0, len(self._jobs) - self.max_jobs)]:
+                del self._jobs[known.id]
@@ -6,17 +6,22 @@ It provides functionality for:
 - Managing toll settings
 - Handling vehicle types
 - Country-specific rates
+- Reading rates from compiled settings snapshots
 """
 from datetime import datetime
 from decimal import Decimal
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Mapping, Optional, Tuple, Union
 from uuid import UUID
 
 from src.domain.entities.cost import CostSettings
 from src.domain.entities.route import Route, TransportType
 from src.domain.entities.vehicle import VehicleSpecification
-from src.domain.interfaces.services.toll_rate_service import TollRateService
+from src.domain.interfaces.services.toll_rate_service import TollRateService, TollRateServiceError
 from src.domain.services.common.base import BaseService
+from src.domain.services.cost.compiled_settings import (
+    BASE_VEHICLE_TYPE, DEFAULT_TOLL_RATE, VEHICLE_MULTIPLIERS,
+    CompiledCostSettings, CompiledSettingsHolder, get_compiled_settings_holder
+)
 from src.domain.value_objects import CountrySegment, TollRate
 
 class TollRateServiceImpl(BaseService, TollRateService):
@@ -32,17 +37,21 @@ class TollRateServiceImpl(BaseService, TollRateService):
     def __init__(
         self,
         settings_service: Optional['CostSettingsService'] = None,
-        toll_api_client: Optional['TollAPIClient'] = None
+        toll_api_client: Optional['TollAPIClient'] = None,
+        compiled_settings: Optional[CompiledSettingsHolder] = None
     ):
         """Initialize toll rate service.
         
         Args:
             settings_service: Optional service for cost settings
             toll_api_client: Optional client for toll API
+            compiled_settings: Optional holder of compiled settings snapshots
         """
         super().__init__()
         self.settings_service = settings_service
         self._toll_api_client = toll_api_client
+        self.compiled_settings = compiled_settings or get_compiled_settings_holder()
+        self._rate_history: List[Dict] = []
     
     def calculate_toll(
         self,
@@ -51,7 +60,8 @@ class TollRateServiceImpl(BaseService, TollRateService):
         country_code: Optional[str] = None,
         distance: Optional[float] = None,
         axles: Optional[int] = None,
-        weight: Optional[float] = None
+        weight: Optional[float] = None,
+        settings: Optional[Union[CostSettings, CompiledCostSettings]] = None
     ) -> Decimal:
         """Calculate toll cost for a route segment.
         
@@ -62,6 +72,8 @@ class TollRateServiceImpl(BaseService, TollRateService):
             distance: Optional distance in km
             axles: Optional number of axles
             weight: Optional vehicle weight
+            settings: Settings of the calculation (defaults to the
+                settings service's current settings)
             
         Returns:
             Calculated toll cost
@@ -97,7 +109,8 @@ class TollRateServiceImpl(BaseService, TollRateService):
                 country_code,
                 distance,
                 axles,
-                weight
+                weight,
+                settings
             )
             
             self._log_exit("calculate_toll", toll)
@@ -112,7 +125,8 @@ class TollRateServiceImpl(BaseService, TollRateService):
         country_code: str,
         vehicle_type: str,
         axles: Optional[int] = None,
-        weight: Optional[float] = None
+        weight: Optional[float] = None,
+        settings: Optional[Union[CostSettings, CompiledCostSettings]] = None
     ) -> TollRate:
         """Get toll rate for specific parameters.
         
@@ -121,6 +135,8 @@ class TollRateServiceImpl(BaseService, TollRateService):
             vehicle_type: Type of vehicle
             axles: Optional number of axles
             weight: Optional vehicle weight
+            settings: Settings of the calculation (defaults to the
+                settings service's current settings)
             
         Returns:
             Toll rate configuration
@@ -135,33 +151,29 @@ class TollRateServiceImpl(BaseService, TollRateService):
         )
         
         try:
-            # Get current settings
-            settings = (
-                self.settings_service.get_current_settings()
-                if self.settings_service
-                else None
-            )
+            compiled = self._get_compiled_settings(settings)
             
-            if not settings:
+            if not compiled or not compiled.has_country(country_code):
                 return self._get_default_toll_rate(
                     country_code,
                     vehicle_type
                 )
             
-            # Get country settings
-            country_settings = settings.country_settings.get(country_code)
-            if not country_settings:
-                return self._get_default_toll_rate(
-                    country_code,
-                    vehicle_type
-                )
-            
-            # Apply vehicle multiplier
-            base_rate = country_settings.toll_rate
+            # A rate set for the vehicle type replaces the truck rate and
+            # its multiplier; other vehicle types scale the truck rate
+            rates = compiled.vehicle_toll_rates(country_code)
+            vehicle = vehicle_type.lower()
+            if vehicle in rates:
+                base_rate = rates[vehicle]
+                base_multipliers = {}
+            else:
+                base_rate = rates.get(BASE_VEHICLE_TYPE, DEFAULT_TOLL_RATE)
+                base_multipliers = compiled.vehicle_multipliers
             multiplier = self._get_vehicle_multiplier(
                 vehicle_type,
                 axles,
-                weight
+                weight,
+                base_multipliers
             )
             
             rate = TollRate(
@@ -183,6 +195,170 @@ class TollRateServiceImpl(BaseService, TollRateService):
             self._log_error("get_toll_rate", e)
             raise ValueError(f"Failed to get toll rate: {str(e)}")
     
+    def get_current_rates(self, region: str) -> Dict:
+        """Get current toll rates for a country.
+        
+        Args:
+            region: Country code
+        
+        Returns:
+            Toll rates per km by vehicle type
+        
+        Raises:
+            TollRateServiceError: If rates cannot be read
+        """
+        self._log_entry("get_current_rates", region=region)
+        
+        try:
+            compiled = self._get_compiled_settings()
+            if compiled and compiled.has_country(region):
+                rates = dict(compiled.vehicle_toll_rates(region))
+            else:
+                rates = {
+                    BASE_VEHICLE_TYPE: self._get_default_toll_rate(region, BASE_VEHICLE_TYPE).base_rate
+                }
+            
+            self._log_exit("get_current_rates", rates)
+            return rates
+        
+        except Exception as e:
+            self._log_error("get_current_rates", e)
+            raise TollRateServiceError(
+                f"Failed to get current toll rates: {str(e)}",
+                original_error=e
+            )
+    
+    def update_rates(
+        self,
+        region: str,
+        new_rates: Dict,
+        effective_date: datetime
+    ) -> bool:
+        """Update the toll rates of a country in the current settings.
+        
+        Args:
+            region: Country code
+            new_rates: Toll rates per km by vehicle type
+            effective_date: When rates become effective
+        
+        Returns:
+            True if update successful
+        
+        Raises:
+            TollRateServiceError: If update fails
+        """
+        self._log_entry("update_rates", region=region, effective_date=effective_date)
+        
+        try:
+            if not self.settings_service:
+                raise ValueError("Settings service is required")
+            self.validate_rates(new_rates)
+            
+            rates = {
+                vehicle_type.lower(): Decimal(str(rate))
+                for vehicle_type, rate in new_rates.items()
+            }
+            settings = self.settings_service.get_current_settings()
+            self.settings_service.update_settings(
+                settings.id,
+                {"toll_rates": {**settings.toll_rates, region: rates}}
+            )
+            self._rate_history.append({
+                "region": region,
+                "rates": rates,
+                "effective_date": effective_date,
+                "settings_id": settings.id
+            })
+            
+            self._log_exit("update_rates", True)
+            return True
+        
+        except Exception as e:
+            self._log_error("update_rates", e)
+            raise TollRateServiceError(
+                f"Failed to update toll rates: {str(e)}",
+                original_error=e
+            )
+    
+    def validate_rates(self, rates: Dict) -> bool:
+        """Validate toll rates by vehicle type.
+        
+        Args:
+            rates: Toll rates per km by vehicle type
+        
+        Returns:
+            True if rates are valid
+        
+        Raises:
+            TollRateServiceError: If a rate is not a non-negative number
+        """
+        if not rates:
+            raise TollRateServiceError("Toll rates must not be empty")
+        for vehicle_type, rate in rates.items():
+            try:
+                value = Decimal(str(rate))
+            except ArithmeticError as e:
+                raise TollRateServiceError(
+                    f"Invalid toll rate for {vehicle_type}: {rate}",
+                    original_error=e
+                )
+            if not value.is_finite() or value < 0:
+                raise TollRateServiceError(f"Invalid toll rate for {vehicle_type}: {rate}")
+        return True
+    
+    def get_rate_history(
+        self,
+        region: str,
+        start_date: datetime,
+        end_date: datetime
+    ) -> List[Dict]:
+        """Get the toll rate updates of a country made by this service.
+        
+        Args:
+            region: Country code
+            start_date: Start of period
+            end_date: End of period
+        
+        Returns:
+            Rate updates effective in the period, oldest first
+        """
+        return [
+            entry for entry in self._rate_history
+            if entry["region"] == region and start_date <= entry["effective_date"] <= end_date
+        ]
+    
+    def has_toll_roads(self, country_code: str) -> bool:
+        """Check if trucks pay tolls in a country.
+        
+        Args:
+            country_code: ISO country code
+        
+        Returns:
+            True if the truck toll rate is positive
+        """
+        return self.get_toll_rate(country_code, BASE_VEHICLE_TYPE).effective_rate > 0
+    
+    def _get_compiled_settings(
+        self,
+        settings: Optional[Union[CostSettings, CompiledCostSettings]] = None
+    ) -> Optional[CompiledCostSettings]:
+        """Get the compiled settings of a calculation.
+        
+        Snapshots are compiled once per settings version, so fetching the
+        current settings per call only costs the settings lookup.
+        
+        Args:
+            settings: Settings of the calculation, if the caller has them
+            
+        Returns:
+            Compiled settings or None if there are none
+        """
+        if settings is None and self.settings_service:
+            settings = self.settings_service.get_current_settings()
+        if settings is None:
+            return None
+        return self.compiled_settings.get(settings)
+    
     def _calculate_toll_from_api(
         self,
         route_id: UUID,
@@ -237,7 +413,8 @@ class TollRateServiceImpl(BaseService, TollRateService):
         country_code: Optional[str],
         distance: Optional[float],
         axles: Optional[int],
-        weight: Optional[float]
+        weight: Optional[float],
+        settings: Optional[Union[CostSettings, CompiledCostSettings]] = None
     ) -> Decimal:
         """Calculate toll using internal logic.
         
@@ -248,6 +425,7 @@ class TollRateServiceImpl(BaseService, TollRateService):
             distance: Optional distance in km
             axles: Optional number of axles
             weight: Optional vehicle weight
+            settings: Optional settings of the calculation
             
         Returns:
             Calculated toll
@@ -263,7 +441,8 @@ class TollRateServiceImpl(BaseService, TollRateService):
             country_code,
             vehicle_type,
             axles,
-            weight
+            weight,
+            settings
         )
         
         # Calculate toll
@@ -309,7 +488,8 @@ class TollRateServiceImpl(BaseService, TollRateService):
         self,
         vehicle_type: str,
         axles: Optional[int] = None,
-        weight: Optional[float] = None
+        weight: Optional[float] = None,
+        base_multipliers: Mapping[str, Decimal] = VEHICLE_MULTIPLIERS
     ) -> Decimal:
         """Get toll multiplier for vehicle type.
         
@@ -317,18 +497,11 @@ class TollRateServiceImpl(BaseService, TollRateService):
             vehicle_type: Type of vehicle
             axles: Optional number of axles
             weight: Optional vehicle weight
+            base_multipliers: Base multipliers by vehicle type
             
         Returns:
             Toll multiplier
         """
-        # Base multipliers by vehicle type
-        base_multipliers = {
-            "truck": Decimal("1.0"),
-            "bus": Decimal("0.8"),
-            "van": Decimal("0.6"),
-            "car": Decimal("0.4")
-        }
-        
         multiplier = base_multipliers.get(vehicle_type.lower(), Decimal("1.0"))
         
         # Adjust for axles
@@ -8,12 +8,16 @@ It provides functionality for:
 - Location validation
 """
 from decimal import Decimal
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Union
 from math import radians, sin, cos, sqrt, atan2
 
+import numpy as np
+
 from src.domain.interfaces.services.location_service import LocationService as LocationServiceInterface
 from src.domain.services.common.base import BaseService
-from src.domain.value_objects import Location, CountrySegment
+from src.domain.value_objects import (
+    ArrayDistanceMatrix, CountrySegment, DistanceMatrix, Location, RouteSummary
+)
 from src.infrastructure.logging import get_logger
 from src.infrastructure.services.google_maps_service import GoogleMapsService
 from src.infrastructure.services.toll_rate_service import DefaultTollRateService
@@ -273,7 +277,7 @@ class LocationIntegrationService(BaseService, LocationServiceInterface):
                 # Get segments with toll rates
                 segments = []
                 for segment in self._maps_client.get_route_segments(origin=origin, destination=destination):
-                    segments.append(CountrySegment(
+                    segments.append(self._country_segment(
                         country_code=segment.country_code,
                         distance=segment.distance,
                         duration_hours=segment.duration_hours,
@@ -298,7 +302,7 @@ class LocationIntegrationService(BaseService, LocationServiceInterface):
                         )
                     
                     segments = [
-                        CountrySegment(
+                        self._country_segment(
                             country_code=origin.country,
                             distance=distance_decimal,
                             duration_hours=duration_hours,
@@ -322,13 +326,13 @@ class LocationIntegrationService(BaseService, LocationServiceInterface):
                     
                     # Split distance roughly between countries
                     segments = [
-                        CountrySegment(
+                        self._country_segment(
                             country_code=origin.country,
                             distance=distance_decimal * Decimal("0.5"),
                             duration_hours=duration_hours * Decimal("0.5"),
                             toll_rates=toll_rates.get(origin.country) if include_tolls else None
                         ),
-                        CountrySegment(
+                        self._country_segment(
                             country_code=destination.country,
                             distance=distance_decimal * Decimal("0.5"),
                             duration_hours=duration_hours * Decimal("0.5"),
@@ -342,6 +346,179 @@ class LocationIntegrationService(BaseService, LocationServiceInterface):
             self._logger.error("Segment calculation failed", error=str(e))
             raise ValueError(f"Failed to calculate segments: {str(e)}")
             
+    def get_route_summary(
+        self,
+        origin: Location,
+        destination: Location,
+        include_tolls: bool = False,
+        vehicle_type: str = "truck"
+    ) -> RouteSummary:
+        """Get distance, duration and country segments for a route.
+        
+        With a maps client this is a single directions lookup; otherwise the
+        summary is estimated from the straight-line distance.
+        
+        Args:
+            origin: Starting location
+            destination: End location
+            include_tolls: Whether to include toll information
+            vehicle_type: Type of vehicle for toll calculations
+            
+        Returns:
+            Route summary with totals and country segments
+            
+        Raises:
+            ValueError: If route calculation fails
+        """
+        self._logger.info(
+            "Getting route summary",
+            origin=origin.model_dump(),
+            destination=destination.model_dump(),
+            include_tolls=include_tolls,
+            vehicle_type=vehicle_type
+        )
+        
+        try:
+            # Validate locations
+            if not self.validate_location(origin):
+                raise ValueError("Invalid origin location")
+            if not self.validate_location(destination):
+                raise ValueError("Invalid destination location")
+                
+            if self._maps_client:
+                summary = self._maps_client.get_route_summary(origin, destination)
+                
+                if include_tolls and self._toll_rate_service:
+                    # Fetch toll rates once per country on the route
+                    toll_rates_by_country = {
+                        country: self._toll_rate_service.get_toll_rates(
+                            country=country,
+                            vehicle_type=vehicle_type
+                        )
+                        for country in {segment.country_code for segment in summary.country_segments}
+                    }
+                    summary = summary.model_copy(update={
+                        "country_segments": [
+                            self._country_segment(
+                                country_code=segment.country_code,
+                                distance=segment.distance,
+                                duration_hours=segment.duration_hours,
+                                toll_rates=toll_rates_by_country.get(segment.country_code)
+                            )
+                            for segment in summary.country_segments
+                        ]
+                    })
+            else:
+                # Fallback segments already carry the estimated totals
+                segments = self.get_route_segments(
+                    origin,
+                    destination,
+                    include_tolls=include_tolls,
+                    vehicle_type=vehicle_type
+                )
+                summary = RouteSummary(
+                    origin=origin,
+                    destination=destination,
+                    distance_km=sum((segment.distance for segment in segments), Decimal("0")),
+                    duration_hours=sum((segment.duration_hours for segment in segments), Decimal("0")),
+                    country_segments=segments
+                )
+                
+            self._logger.info(
+                "Route summary calculated",
+                distance=float(summary.distance_km),
+                duration=float(summary.duration_hours),
+                segments=len(summary.country_segments)
+            )
+            return summary
+            
+        except Exception as e:
+            self._logger.error("Route summary calculation failed", error=str(e))
+            raise ValueError(f"Failed to calculate route summary: {str(e)}")
+            
+    def get_distance_matrix(
+        self,
+        origins: List[Location],
+        destinations: List[Location],
+        as_array: bool = False
+    ) -> Union[DistanceMatrix, ArrayDistanceMatrix]:
+        """Get distances and durations for every origin/destination pair.
+        
+        Args:
+            origins: Starting locations
+            destinations: End locations
+            as_array: Whether to return an ArrayDistanceMatrix
+            
+        Returns:
+            Distance matrix indexed by origin and destination position
+            
+        Raises:
+            ValueError: If matrix calculation fails
+        """
+        self._logger.info(
+            "Calculating distance matrix",
+            origins=len(origins),
+            destinations=len(destinations)
+        )
+        
+        try:
+            if self._maps_client:
+                return self._maps_client.get_distance_matrix(origins, destinations, as_array=as_array)
+                
+            # Fallback to straight-line distances at 60 km/h average speed
+            distances = self._calculate_simple_distances(origins, destinations)
+            countries = [[origin.country] * len(destinations) for origin in origins]
+            if as_array:
+                return ArrayDistanceMatrix.from_lists(
+                    origins=origins,
+                    destinations=destinations,
+                    distances=distances,
+                    durations=distances / 60.0,
+                    countries=countries
+                )
+            return DistanceMatrix(
+                origins=origins,
+                destinations=destinations,
+                distances=distances.tolist(),
+                durations=(distances / 60.0).tolist(),
+                countries=countries
+            )
+            
+        except Exception as e:
+            self._logger.error("Distance matrix calculation failed", error=str(e))
+            raise ValueError(f"Failed to calculate distance matrix: {str(e)}")
+            
+    def _country_segment(
+        self,
+        country_code: str,
+        distance: Decimal,
+        duration_hours: Decimal,
+        toll_rates: Optional[Dict[str, Decimal]] = None
+    ) -> CountrySegment:
+        """Create a country segment, keeping default toll rates when none are given.
+        
+        Args:
+            country_code: ISO country code
+            distance: Distance in kilometers
+            duration_hours: Duration in hours
+            toll_rates: Optional toll rates by road type
+            
+        Returns:
+            Country segment
+        """
+        if toll_rates is None:
+            return CountrySegment(
+                country_code=country_code,
+                distance=distance,
+                duration_hours=duration_hours
+            )
+        return CountrySegment(
+            country_code=country_code,
+            distance=distance,
+            duration_hours=duration_hours,
+            toll_rates=toll_rates
+        )
+        
     def _calculate_simple_distance(
         self,
         origin: Location,
@@ -374,6 +551,32 @@ class LocationIntegrationService(BaseService, LocationServiceInterface):
         
         return r * c
         
+    def _calculate_simple_distances(
+        self,
+        origins: List[Location],
+        destinations: List[Location]
+    ) -> np.ndarray:
+        """Calculate straight-line distances for every origin/destination pair.
+        
+        Args:
+            origins: Starting locations
+            destinations: Ending locations
+            
+        Returns:
+            Distances in kilometers with shape (origins, destinations)
+        """
+        lat1 = np.radians([origin.latitude for origin in origins])[:, None]
+        lon1 = np.radians([origin.longitude for origin in origins])[:, None]
+        lat2 = np.radians([destination.latitude for destination in destinations])[None, :]
+        lon2 = np.radians([destination.longitude for destination in destinations])[None, :]
+        
+        # Haversine formula, broadcast over all pairs
+        a = np.sin((lat2 - lat1) / 2) ** 2 + np.cos(lat1) * np.cos(lat2) * np.sin((lon2 - lon1) / 2) ** 2
+        c = 2 * np.arctan2(np.sqrt(a), np.sqrt(1 - a))
+        
+        # Earth radius in kilometers
+        return 6371 * c
+        
     def _is_valid_postal_code(
         self,
         postal_code: str,
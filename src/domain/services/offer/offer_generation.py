@@ -18,6 +18,7 @@ from src.domain.entities.cost import Cost, CostSettings
 from src.domain.entities.cargo import Cargo
 from src.domain.interfaces.services.ai_service import AIService
 from src.domain.services.common.base import BaseService
+from src.domain.services.common.cache import get_cache_service
 from src.domain.services.cost.cost_calculation import CostCalculationService
 from src.domain.services.offer.pricing import PricingService
 from src.domain.value_objects import PricePrediction
@@ -54,7 +55,9 @@ class OfferGenerationService(BaseService):
         self.repository = repository
         self.route_service = route_service
         self.cost_service = cost_service or CostCalculationService()
-        self.pricing_service = pricing_service or PricingService()
+        self.pricing_service = pricing_service or PricingService(
+            cache_service=get_cache_service()
+        )
         self.ai_service = ai_service
     
     def generate_offer(
@@ -6,6 +6,9 @@ It provides:
 - Market-based adjustments
 - Competitor analysis
 - Historical pricing
+
+Strategies price in integer cents with Money; a price becomes a Decimal
+only when it is returned.
 """
 from datetime import datetime, timedelta
 from decimal import Decimal
@@ -21,7 +24,8 @@ from src.domain.value_objects import (
     PricingStrategy,
     MarketConditions,
     PriceHistory,
-    CompetitorPrice
+    CompetitorPrice,
+    Money
 )
 
 class PricingService(BaseService):
@@ -52,6 +56,7 @@ class PricingService(BaseService):
         self._market_client = market_client
         self._cache_service = cache_service
         self._cache_ttl = 1800  # 30 minutes
+        self._cache_stale_ttl = 300  # served while refreshing
     
     def calculate_optimal_price(
         self,
@@ -111,6 +116,7 @@ class PricingService(BaseService):
             else:
                 raise ValueError(f"Unknown pricing strategy: {strategy}")
             
+            price = price.to_decimal()
             self._log_exit("calculate_optimal_price", price)
             return price
             
@@ -144,46 +150,17 @@ class PricingService(BaseService):
         try:
             window = window or timedelta(days=30)
             
-            # Check cache
-            cache_key = f"market_{route.id}_{window.days}"
+            # Concurrent misses share one market data call
             if self._cache_service:
-                cached = self._cache_service.get(cache_key)
-                if cached:
-                    return MarketConditions(**cached)
-            
-            # Get market data
-            if self._market_client:
-                data = self._market_client.get_market_data(
-                    route.origin["country_code"],
-                    route.destination["country_code"],
-                    window
+                conditions = self._cache_service.get_or_compute(
+                    f"market_{route.id}_{window.days}",
+                    lambda: self._fetch_market_conditions(route, window),
+                    self._cache_ttl,
+                    stale_ttl=self._cache_stale_ttl,
+                    tags=self._market_tags(route)
                 )
             else:
-                data = self._get_default_market_data()
-            
-            # Analyze conditions
-            conditions = MarketConditions(
-                demand_level=data.get("demand_level", 0.5),
-                supply_level=data.get("supply_level", 0.5),
-                price_trend=data.get("price_trend", 0),
-                seasonality=data.get("seasonality", 0),
-                competitor_activity=data.get("competitor_activity", []),
-                market_events=data.get("market_events", []),
-                timestamp=datetime.utcnow(),
-                metadata={
-                    "data_source": data.get("source"),
-                    "confidence": data.get("confidence"),
-                    "window_days": window.days
-                }
-            )
-            
-            # Cache results
-            if self._cache_service:
-                self._cache_service.set(
-                    cache_key,
-                    conditions.dict(),
-                    self._cache_ttl
-                )
+                conditions = self._fetch_market_conditions(route, window)
             
             self._log_exit("analyze_market_conditions", conditions)
             return conditions
@@ -218,41 +195,18 @@ class PricingService(BaseService):
         try:
             window = window or timedelta(days=7)
             
-            # Check cache
-            cache_key = f"comp_prices_{route.id}_{window.days}"
+            # Concurrent misses share one market data call
             if self._cache_service:
-                cached = self._cache_service.get(cache_key)
-                if cached:
-                    return [CompetitorPrice(**p) for p in cached]
-            
-            # Get competitor data
-            if self._market_client:
-                prices = self._market_client.get_competitor_prices(
-                    route.origin["country_code"],
-                    route.destination["country_code"],
-                    window
-                )
-            else:
-                prices = self._get_default_competitor_prices()
-            
-            # Process prices
-            competitor_prices = []
-            for price in prices:
-                competitor_prices.append(CompetitorPrice(
-                    competitor_id=price.get("competitor_id"),
-                    price=price.get("price"),
-                    timestamp=price.get("timestamp"),
-                    route_match_score=price.get("match_score", 1.0),
-                    metadata=price.get("metadata", {})
+                # Copy the cached list; the prices themselves are frozen
+                competitor_prices = list(self._cache_service.get_or_compute(
+                    f"comp_prices_{route.id}_{window.days}",
+                    lambda: self._fetch_competitor_prices(route, window),
+                    self._cache_ttl,
+                    stale_ttl=self._cache_stale_ttl,
+                    tags=self._market_tags(route)
                 ))
-            
-            # Cache results
-            if self._cache_service:
-                self._cache_service.set(
-                    cache_key,
-                    [p.dict() for p in competitor_prices],
-                    self._cache_ttl
-                )
+            else:
+                competitor_prices = self._fetch_competitor_prices(route, window)
             
             self._log_exit("get_competitor_prices", competitor_prices)
             return competitor_prices
@@ -287,47 +241,17 @@ class PricingService(BaseService):
         try:
             window = window or timedelta(days=90)
             
-            # Check cache
-            cache_key = f"price_hist_{route.id}_{window.days}"
+            # Concurrent misses share one market data call
             if self._cache_service:
-                cached = self._cache_service.get(cache_key)
-                if cached:
-                    return PriceHistory(**cached)
-            
-            # Get historical data
-            if self._market_client:
-                history = self._market_client.get_price_history(
-                    route.origin["country_code"],
-                    route.destination["country_code"],
-                    window
+                price_history = self._cache_service.get_or_compute(
+                    f"price_hist_{route.id}_{window.days}",
+                    lambda: self._fetch_price_history(route, window),
+                    self._cache_ttl,
+                    stale_ttl=self._cache_stale_ttl,
+                    tags=self._market_tags(route)
                 )
             else:
-                history = self._get_default_price_history()
-            
-            # Process history
-            price_history = PriceHistory(
-                average_price=history.get("average_price"),
-                min_price=history.get("min_price"),
-                max_price=history.get("max_price"),
-                price_trend=history.get("trend"),
-                seasonality=history.get("seasonality", []),
-                volume_correlation=history.get("volume_correlation"),
-                timestamps=history.get("timestamps", []),
-                prices=history.get("prices", []),
-                metadata={
-                    "data_points": len(history.get("prices", [])),
-                    "window_days": window.days,
-                    "confidence": history.get("confidence")
-                }
-            )
-            
-            # Cache results
-            if self._cache_service:
-                self._cache_service.set(
-                    cache_key,
-                    price_history.dict(),
-                    self._cache_ttl
-                )
+                price_history = self._fetch_price_history(route, window)
             
             self._log_exit("get_price_history", price_history)
             return price_history
@@ -336,38 +260,168 @@ class PricingService(BaseService):
             self._log_error("get_price_history", e)
             raise ValueError(f"Failed to get price history: {str(e)}")
     
-    def _calculate_cost_plus(self, base_cost: Cost) -> Decimal:
+    def _market_tags(self, route: Route) -> List[str]:
+        """Get cache tags for market data of a route.
+        
+        Market data is tagged with both countries so an update for one
+        country invalidates only the routes touching it.
+        
+        Args:
+            route: Route being priced
+            
+        Returns:
+            Cache tags
+        """
+        return [
+            f"country:{route.origin['country_code']}",
+            f"country:{route.destination['country_code']}"
+        ]
+    
+    def _fetch_market_conditions(
+        self,
+        route: Route,
+        window: timedelta
+    ) -> MarketConditions:
+        """Get market conditions from the market client.
+        
+        Args:
+            route: Route to analyze
+            window: Time window
+            
+        Returns:
+            Market conditions analysis
+        """
+        # Get market data
+        if self._market_client:
+            data = self._market_client.get_market_data(
+                route.origin["country_code"],
+                route.destination["country_code"],
+                window
+            )
+        else:
+            data = self._get_default_market_data()
+        
+        # Analyze conditions
+        return MarketConditions(
+            demand_level=data.get("demand_level", 0.5),
+            supply_level=data.get("supply_level", 0.5),
+            price_trend=data.get("price_trend", 0),
+            seasonality=data.get("seasonality", 0),
+            competitor_activity=data.get("competitor_activity", []),
+            market_events=data.get("market_events", []),
+            timestamp=datetime.utcnow(),
+            metadata={
+                "data_source": data.get("source"),
+                "confidence": data.get("confidence"),
+                "window_days": window.days
+            }
+        )
+    
+    def _fetch_competitor_prices(
+        self,
+        route: Route,
+        window: timedelta
+    ) -> List[CompetitorPrice]:
+        """Get competitor prices from the market client.
+        
+        Args:
+            route: Route to analyze
+            window: Time window
+            
+        Returns:
+            List of competitor prices
+        """
+        # Get competitor data
+        if self._market_client:
+            prices = self._market_client.get_competitor_prices(
+                route.origin["country_code"],
+                route.destination["country_code"],
+                window
+            )
+        else:
+            prices = self._get_default_competitor_prices()
+        
+        # Process prices
+        competitor_prices = []
+        for price in prices:
+            competitor_prices.append(CompetitorPrice(
+                competitor_id=price.get("competitor_id"),
+                price=price.get("price"),
+                timestamp=price.get("timestamp"),
+                route_match_score=price.get("match_score", 1.0),
+                metadata=price.get("metadata", {})
+            ))
+        return competitor_prices
+    
+    def _fetch_price_history(
+        self,
+        route: Route,
+        window: timedelta
+    ) -> PriceHistory:
+        """Get price history from the market client.
+        
+        Args:
+            route: Route to analyze
+            window: Time window
+            
+        Returns:
+            Price history analysis
+        """
+        # Get historical data
+        if self._market_client:
+            history = self._market_client.get_price_history(
+                route.origin["country_code"],
+                route.destination["country_code"],
+                window
+            )
+        else:
+            history = self._get_default_price_history()
+        
+        # Process history
+        return PriceHistory(
+            average_price=history.get("average_price"),
+            min_price=history.get("min_price"),
+            max_price=history.get("max_price"),
+            price_trend=history.get("trend"),
+            seasonality=history.get("seasonality", []),
+            volume_correlation=history.get("volume_correlation"),
+            timestamps=history.get("timestamps", []),
+            prices=history.get("prices", []),
+            metadata={
+                "data_points": len(history.get("prices", [])),
+                "window_days": window.days,
+                "confidence": history.get("confidence")
+            }
+        )
+    
+    def _base_amount(self, base_cost: Cost) -> Money:
+        """Get the base cost in cents."""
+        return Money.from_number(base_cost.total_amount)
+    
+    def _calculate_cost_plus(self, base_cost: Cost, adjustments: Decimal = Decimal("1")) -> Money:
         """Calculate price using cost-plus strategy.
         
         Args:
             base_cost: Base cost calculation
+            adjustments: Market adjustment factor
             
         Returns:
             Calculated price
         """
         margin = Decimal("0.20")  # 20% margin
-        return base_cost.total_amount * (1 + margin)
+        return self._base_amount(base_cost).multiply((1 + margin) * adjustments)
     
-    def _calculate_market_based(
-        self,
-        route: Route,
-        base_cost: Cost,
-        market_data: Optional[Dict]
-    ) -> Decimal:
-        """Calculate price using market-based strategy.
+    def _get_market_price(self, route: Route) -> Optional[Decimal]:
+        """Get the competitor price average weighted by route match.
         
         Args:
             route: Route to price
-            base_cost: Base cost calculation
-            market_data: Optional market data
             
         Returns:
-            Calculated price
+            Unrounded market price, None without competitor prices
         """
         # Get competitor prices
         competitors = self.get_competitor_prices(route)
-        if not competitors:
-            return self._calculate_cost_plus(base_cost)
         
         # Calculate weighted average
         total_weight = Decimal("0")
@@ -379,19 +433,44 @@ class PricingService(BaseService):
             total_weight += weight
         
         if total_weight > 0:
-            market_price = weighted_sum / total_weight
-            # Ensure minimum margin
-            min_price = base_cost.total_amount * Decimal("1.1")
-            return max(market_price, min_price)
+            return weighted_sum / total_weight
+        return None
+    
+    def _calculate_market_based(
+        self,
+        route: Route,
+        base_cost: Cost,
+        market_data: Optional[Dict],
+        adjustments: Decimal = Decimal("1")
+    ) -> Money:
+        """Calculate price using market-based strategy.
+        
+        The market price and the minimum are adjusted before rounding, so a
+        price is rounded to the cent once.
         
-        return self._calculate_cost_plus(base_cost)
+        Args:
+            route: Route to price
+            base_cost: Base cost calculation
+            market_data: Optional market data
+            adjustments: Market adjustment factor
+            
+        Returns:
+            Calculated price
+        """
+        market_price = self._get_market_price(route)
+        if market_price is None:
+            return self._calculate_cost_plus(base_cost, adjustments)
+        
+        # Ensure minimum margin
+        min_price = self._base_amount(base_cost).multiply(Decimal("1.1") * adjustments)
+        return max(Money.from_decimal(market_price * adjustments), min_price)
     
     def _calculate_dynamic(
         self,
         route: Route,
         base_cost: Cost,
         market_data: Optional[Dict]
-    ) -> Decimal:
+    ) -> Money:
         """Calculate price using dynamic strategy.
         
         Args:
@@ -405,10 +484,7 @@ class PricingService(BaseService):
         # Get market conditions
         conditions = self.analyze_market_conditions(route)
         
-        # Calculate base price
-        base_price = self._calculate_market_based(route, base_cost, market_data)
-        
-        # Apply market adjustments
+        # Collect market adjustments
         adjustments = Decimal("1.0")
         
         # Demand adjustment
@@ -429,11 +505,11 @@ class PricingService(BaseService):
         elif conditions.price_trend < -0.1:
             adjustments *= Decimal("0.95")
         
-        # Calculate final price
-        price = base_price * adjustments
+        # Calculate final price from the adjusted market-based price
+        price = self._calculate_market_based(route, base_cost, market_data, adjustments)
         
         # Ensure minimum margin
-        min_price = base_cost.total_amount * Decimal("1.05")
+        min_price = self._base_amount(base_cost).multiply(Decimal("1.05"))
         return max(price, min_price)
     
     def _get_default_strategy(self) -> PricingStrategy:
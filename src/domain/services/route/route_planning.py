@@ -6,9 +6,13 @@ It provides functionality for:
 - Calculating distances and durations
 - Managing empty driving
 - Handling route metadata
+- Running independent location lookups concurrently
 """
+import time
+from concurrent.futures import FIRST_EXCEPTION, ThreadPoolExecutor, wait
 from datetime import datetime
-from typing import Dict, List, Optional
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Tuple, TypeVar
 from uuid import UUID
 
 from src.domain.entities.route import Route, RouteStatus, TransportType
@@ -18,6 +22,28 @@ from src.domain.value_objects import (
     Location, EmptyDriving, RouteMetadata, RouteSegment
 )
 
+T = TypeVar("T")
+
+
+@lru_cache
+def get_lookup_executor(max_workers: int = 4) -> ThreadPoolExecutor:
+    """Get the location lookup executor shared by route planning services.
+    
+    Services are built per request, so the worker threads live for the
+    process instead of one pool per service instance.
+    
+    Args:
+        max_workers: Maximum concurrent location lookups
+        
+    Returns:
+        Shared executor with that many workers
+    """
+    return ThreadPoolExecutor(
+        max_workers=max_workers,
+        thread_name_prefix="route-planning"
+    )
+
+
 class RoutePlanningService(BaseService):
     """Service for planning and validating transport routes.
     
@@ -31,17 +57,23 @@ class RoutePlanningService(BaseService):
     def __init__(
         self,
         location_service: LocationService,
-        cost_service: Optional['CostCalculationService'] = None
+        cost_service: Optional['CostCalculationService'] = None,
+        lookup_deadline: float = 30.0,
+        max_workers: int = 4
     ):
         """Initialize route planning service.
         
         Args:
             location_service: Service for location operations
             cost_service: Optional service for cost calculations
+            lookup_deadline: Seconds allowed for the location lookups of one route
+            max_workers: Maximum concurrent location lookups
         """
         super().__init__()
         self.location_service = location_service
         self._cost_service = cost_service
+        self.lookup_deadline = lookup_deadline
+        self._executor = get_lookup_executor(max_workers)
     
     def create_route(
         self,
@@ -86,41 +118,34 @@ class RoutePlanningService(BaseService):
             self._validate_required(pickup_time, "pickup_time")
             self._validate_required(delivery_time, "delivery_time")
             
-            # Calculate main route
-            distance = self.location_service.calculate_distance(origin, destination)
-            duration = self.location_service.calculate_duration(origin, destination)
-            
-            # Get country segments
-            self.logger.info("Getting country segments")
-            country_segments = self.location_service.get_country_segments(
-                origin,
-                destination
-            )
-            
-            # Calculate empty driving if needed
-            empty_driving = None
+            # The loaded route and the empty driving return are independent
+            # lookups, so they run concurrently under one deadline
+            lookups = {
+                "route": lambda: self.location_service.get_route_summary(origin, destination)
+            }
             if origin != destination:
-                self.logger.info("Calculating empty driving")
-                empty_distance = self.location_service.calculate_distance(
-                    destination,
-                    origin
-                )
-                empty_duration = self.location_service.calculate_duration(
+                lookups["empty_driving"] = lambda: self.location_service.get_route_summary(
                     destination,
                     origin
                 )
+            results, planning_data = self._run_lookups(lookups)
+            summary = results["route"]
+            
+            # Calculate empty driving if needed
+            empty_driving = None
+            if "empty_driving" in results:
+                empty_summary = results["empty_driving"]
                 empty_driving = EmptyDriving(
-                    distance_km=empty_distance,
-                    duration_hours=empty_duration,
-                    origin=origin.dict(),
-                    destination=destination.dict()
+                    distance_km=float(empty_summary.distance_km),
+                    duration_hours=float(empty_summary.duration_hours),
+                    origin=empty_summary.origin,
+                    destination=empty_summary.destination,
+                    segments=empty_summary.country_segments
                 )
             
-            # Create route metadata
+            # Create route metadata; lookup timings are not caller-supplied
             route_metadata = RouteMetadata(
-                country_segments=country_segments,
-                empty_driving=empty_driving,
-                **metadata or {}
+                **{**(metadata or {}), "planning_data": planning_data}
             )
             
             # Create route
@@ -130,10 +155,12 @@ class RoutePlanningService(BaseService):
                 pickup_time=pickup_time,
                 delivery_time=delivery_time,
                 transport_type=transport_type or TransportType.TRUCK,
-                distance_km=distance,
-                duration_hours=duration,
+                distance_km=float(summary.distance_km),
+                duration_hours=float(summary.duration_hours),
+                country_segments=summary.country_segments,
+                empty_driving=empty_driving,
                 status=RouteStatus.DRAFT,
-                metadata=route_metadata.dict(),
+                metadata=route_metadata,
                 cargo_id=cargo_id
             )
             
@@ -144,6 +171,65 @@ class RoutePlanningService(BaseService):
             self._log_error("create_route", e)
             raise ValueError(f"Failed to create route: {str(e)}")
     
+    def _run_lookups(
+        self,
+        lookups: Dict[str, Callable[[], T]]
+    ) -> Tuple[Dict[str, T], Dict]:
+        """Run independent location lookups concurrently.
+        
+        Args:
+            lookups: Lookup callables by name
+            
+        Returns:
+            Results by name, and timings for route metadata
+            
+        Raises:
+            TimeoutError: If the lookups do not finish within the deadline
+        """
+        def timed(lookup: Callable[[], T]) -> Tuple[T, float]:
+            started = time.perf_counter()
+            return lookup(), time.perf_counter() - started
+        
+        started = time.perf_counter()
+        futures = {
+            name: self._executor.submit(timed, lookup)
+            for name, lookup in lookups.items()
+        }
+        done, pending = wait(
+            futures.values(),
+            timeout=self.lookup_deadline,
+            return_when=FIRST_EXCEPTION
+        )
+        for future in done:
+            if future.exception():
+                for other in pending:
+                    other.cancel()
+                raise future.exception()
+        if pending:
+            for future in pending:
+                future.cancel()
+            raise TimeoutError(
+                f"Location lookups exceeded deadline of {self.lookup_deadline}s"
+            )
+        wall_clock = time.perf_counter() - started
+        
+        results = {}
+        lookup_seconds = {}
+        for name, future in futures.items():
+            results[name], lookup_seconds[name] = future.result()
+        
+        planning_data = {
+            "lookup_seconds": {
+                name: round(seconds, 4) for name, seconds in lookup_seconds.items()
+            },
+            "wall_clock_seconds": round(wall_clock, 4),
+            "time_saved_seconds": round(
+                max(0.0, sum(lookup_seconds.values()) - wall_clock), 4
+            )
+        }
+        self.logger.info("Location lookups completed", **planning_data)
+        return results, planning_data
+    
     def validate_route(self, route: Route) -> bool:
         """Validate route configuration.
         
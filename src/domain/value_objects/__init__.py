@@ -10,9 +10,10 @@ from .ai import (
     RouteOptimization
 )
 from .common import BaseValueObject
-from .cost import Cost, CostBreakdown, Currency, CountrySettings
+from .cost import Cost, CostBreakdown, Currency, CountrySettings, TollRate
 from .cost_component import CostComponent
-from .location import Location, Address
+from .location import Location, Address, ArrayDistanceMatrix, DistanceMatrix
+from .money import Money
 from .offer import OfferMetadata
 from .pricing import (
     PricingStrategy,
@@ -27,7 +28,8 @@ from .route import (
     CountrySegment,
     EmptyDriving,
     RouteMetadata,
-    RouteSegment
+    RouteSegment,
+    RouteSummary
 )
 
 __all__ = [
@@ -39,9 +41,13 @@ __all__ = [
     'CostBreakdown',
     'Currency',
     'CountrySettings',
+    'TollRate',
     'CostComponent',
     'Location',
     'Address',
+    'ArrayDistanceMatrix',
+    'DistanceMatrix',
+    'Money',
     'OfferMetadata',
     'PricingStrategy',
     'PricingRules',
@@ -53,5 +59,6 @@ __all__ = [
     'CountrySegment',
     'EmptyDriving',
     'RouteMetadata',
-    'RouteSegment'
+    'RouteSegment',
+    'RouteSummary'
 ]
@@ -8,8 +8,13 @@ class BaseValueObject(BaseModel):
     """Base class for all value objects in the domain.
     
     Provides common functionality and configuration for all value objects.
+    Frozen value objects compute their hash once and keep it in a slot, so
+    repeated dict and set lookups do not walk the fields again. The slot is
+    not part of the pickled or copied state, so copies hash afresh.
     """
     
+    __slots__ = ("_hash_value",)
+    
     metadata: Optional[Dict[str, Any]] = Field(
         default=None,
         description="Additional metadata for extensibility"
@@ -26,10 +31,37 @@ class BaseValueObject(BaseModel):
     
     def __eq__(self, other: Any) -> bool:
         """Compare value objects based on their attribute values."""
+        if self is other:
+            return True
         if not isinstance(other, self.__class__):
             return False
-        return self.model_dump() == other.model_dump()
+        return self.__dict__ == other.__dict__
     
     def __hash__(self) -> int:
         """Hash value objects based on their frozen state."""
-        return hash(tuple(sorted(self.model_dump().items())))
+        try:
+            return self._hash_value
+        except AttributeError:
+            pass
+        value = hash((self.__class__, _freeze(self.__dict__)))
+        if self.model_config.get("frozen"):
+            object.__setattr__(self, "_hash_value", value)
+        return value
+
+
+def _freeze(value: Any) -> Any:
+    """Convert a field value into a hashable equivalent.
+    
+    Dicts become frozensets of items, so the result does not depend on key
+    order; lists and tuples become tuples, and plain models are frozen by
+    their field values. Value objects are left as is and use their own hash.
+    """
+    if isinstance(value, dict):
+        return frozenset((key, _freeze(item)) for key, item in value.items())
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    if isinstance(value, (set, frozenset)):
+        return frozenset(_freeze(item) for item in value)
+    if isinstance(value, BaseModel) and not isinstance(value, BaseValueObject):
+        return (value.__class__, _freeze(value.__dict__))
+    return value
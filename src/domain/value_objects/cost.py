@@ -49,6 +49,16 @@ class CountrySettings(BaseValueObject):
         return v.upper()
 
 
+class TollRate(BaseValueObject):
+    """Toll rate of a vehicle type in a country."""
+
+    base_rate: Decimal = Field(..., ge=0, description="Base rate per km")
+    vehicle_multiplier: Decimal = Field(default=Decimal("1"), ge=0)
+    effective_rate: Decimal = Field(..., ge=0, description="Rate per km for the vehicle")
+    country_code: str = Field(..., description="Country code")
+    vehicle_type: str = Field(..., description="Vehicle type")
+
+
 class Cost(BaseValueObject):
     """Value object representing a cost component."""
 
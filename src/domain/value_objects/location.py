@@ -1,7 +1,11 @@
 """Location-related value objects."""
 
-from typing import Dict, List, Optional
-from pydantic import Field, confloat, field_validator
+import json
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+from pydantic import Field, confloat, field_validator, model_validator
 
 from .common import BaseValueObject
 
@@ -99,3 +103,242 @@ class DistanceMatrix(BaseValueObject):
     def get_country(self, origin_idx: int, destination_idx: int) -> str:
         """Get country code for route between origin and destination indices."""
         return self.countries[origin_idx][destination_idx]
+
+
+class ArrayDistanceMatrix(BaseValueObject):
+    """Distance matrix backed by read-only NumPy arrays.
+
+    Distances and durations are float32 arrays of shape (origins, destinations).
+    Country codes are interned: ``country_index`` holds positions into
+    ``country_codes``. Validation only checks array shapes, so construction
+    cost does not grow with the number of pairs.
+    """
+
+    origins: List[Location]
+    destinations: List[Location]
+    distances: np.ndarray = Field(description="Distances in kilometers")
+    durations: np.ndarray = Field(description="Durations in hours")
+    country_index: np.ndarray = Field(description="Index into country_codes for each pair")
+    country_codes: Tuple[str, ...] = Field(description="Interned country codes")
+    status: str = Field(default="OK")
+    error_message: Optional[str] = None
+
+    @field_validator("distances", "durations", mode="before")
+    def validate_values(cls, v: Any) -> np.ndarray:
+        """Coerce values to a read-only float32 array."""
+        return _read_only(np.asanyarray(v, dtype=np.float32))
+
+    @field_validator("country_index", mode="before")
+    def validate_country_index(cls, v: Any) -> np.ndarray:
+        """Coerce country positions to a read-only integer array."""
+        return _read_only(np.asanyarray(v, dtype=np.uint16))
+
+    @model_validator(mode="after")
+    def validate_shapes(self) -> "ArrayDistanceMatrix":
+        """Validate array shapes against origins and destinations."""
+        shape = (len(self.origins), len(self.destinations))
+        for name in ("distances", "durations", "country_index"):
+            if getattr(self, name).shape != shape:
+                raise ValueError(f"{name.capitalize()} matrix must be {shape[0]}x{shape[1]}")
+        if self.country_index.size and int(self.country_index.max()) >= len(self.country_codes):
+            raise ValueError("Country index out of range")
+        return self
+
+    @classmethod
+    def from_lists(
+        cls,
+        origins: List[Location],
+        destinations: List[Location],
+        distances: Any,
+        durations: Any,
+        countries: List[List[str]],
+        status: str = "OK",
+        error_message: Optional[str] = None
+    ) -> "ArrayDistanceMatrix":
+        """Create a matrix from nested values and a nested country code grid.
+
+        Args:
+            origins: Starting locations
+            destinations: End locations
+            distances: Distances in kilometers, nested lists or an array
+            durations: Durations in hours, nested lists or an array
+            countries: Country code for each pair
+            status: Matrix status
+            error_message: Optional error description
+
+        Returns:
+            Array-backed distance matrix
+        """
+        codes: Dict[str, int] = {}
+        index = np.fromiter(
+            (codes.setdefault(code, len(codes)) for row in countries for code in row),
+            dtype=np.uint16,
+            count=len(origins) * len(destinations)
+        )
+        return cls(
+            origins=origins,
+            destinations=destinations,
+            distances=distances,
+            durations=durations,
+            country_index=index.reshape(len(origins), len(destinations)),
+            country_codes=tuple(codes),
+            status=status,
+            error_message=error_message
+        )
+
+    @classmethod
+    def from_distance_matrix(cls, matrix: DistanceMatrix) -> "ArrayDistanceMatrix":
+        """Create an array-backed copy of a list-backed matrix."""
+        return cls.from_lists(
+            origins=matrix.origins,
+            destinations=matrix.destinations,
+            distances=matrix.distances,
+            durations=matrix.durations,
+            countries=matrix.countries,
+            status=matrix.status,
+            error_message=matrix.error_message
+        )
+
+    def to_distance_matrix(self) -> DistanceMatrix:
+        """Create a list-backed copy of this matrix."""
+        return DistanceMatrix(
+            origins=self.origins,
+            destinations=self.destinations,
+            distances=self.distances.tolist(),
+            durations=self.durations.tolist(),
+            countries=self._country_grid().tolist(),
+            status=self.status,
+            error_message=self.error_message
+        )
+
+    def get_distance(self, origin_idx: int, destination_idx: int) -> float:
+        """Get distance between origin and destination indices."""
+        return float(self.distances[origin_idx, destination_idx])
+
+    def get_duration(self, origin_idx: int, destination_idx: int) -> float:
+        """Get duration between origin and destination indices."""
+        return float(self.durations[origin_idx, destination_idx])
+
+    def get_country(self, origin_idx: int, destination_idx: int) -> str:
+        """Get country code for route between origin and destination indices."""
+        return self.country_codes[self.country_index[origin_idx, destination_idx]]
+
+    def row(self, origin_idx: int, by: str = "distance") -> np.ndarray:
+        """Get values from one origin to every destination.
+
+        Args:
+            origin_idx: Origin index
+            by: "distance" or "duration"
+
+        Returns:
+            Read-only view of the row
+        """
+        return self._values(by)[origin_idx]
+
+    def column(self, destination_idx: int, by: str = "distance") -> np.ndarray:
+        """Get values from every origin to one destination.
+
+        Args:
+            destination_idx: Destination index
+            by: "distance" or "duration"
+
+        Returns:
+            Read-only view of the column
+        """
+        return self._values(by)[:, destination_idx]
+
+    def nearest_destination(self, origin_idx: int, by: str = "distance") -> int:
+        """Get the index of the closest destination for an origin."""
+        return int(np.argmin(self.row(origin_idx, by)))
+
+    def nearest_origin(self, destination_idx: int, by: str = "distance") -> int:
+        """Get the index of the closest origin for a destination."""
+        return int(np.argmin(self.column(destination_idx, by)))
+
+    def nearest_destinations(self, by: str = "distance") -> np.ndarray:
+        """Get the index of the closest destination for every origin."""
+        return np.argmin(self._values(by), axis=1)
+
+    def nearest_origins(self, by: str = "distance") -> np.ndarray:
+        """Get the index of the closest origin for every destination."""
+        return np.argmin(self._values(by), axis=0)
+
+    def save(self, directory: Union[str, Path]) -> None:
+        """Write the matrix as ``.npy`` arrays plus a JSON header.
+
+        Args:
+            directory: Target directory, created if missing
+        """
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        np.save(directory / "distances.npy", self.distances)
+        np.save(directory / "durations.npy", self.durations)
+        np.save(directory / "country_index.npy", self.country_index)
+        header = {
+            "origins": [location.model_dump(mode="json") for location in self.origins],
+            "destinations": [location.model_dump(mode="json") for location in self.destinations],
+            "country_codes": list(self.country_codes),
+            "status": self.status,
+            "error_message": self.error_message
+        }
+        (directory / "matrix.json").write_text(json.dumps(header))
+
+    @classmethod
+    def load(cls, directory: Union[str, Path], mmap_mode: Optional[str] = "r") -> "ArrayDistanceMatrix":
+        """Read a matrix written by save.
+
+        Args:
+            directory: Directory written by save
+            mmap_mode: NumPy memory-map mode, or None to read arrays into memory
+
+        Returns:
+            Array-backed distance matrix
+        """
+        directory = Path(directory)
+        header = json.loads((directory / "matrix.json").read_text())
+        return cls(
+            origins=[Location(**location) for location in header["origins"]],
+            destinations=[Location(**location) for location in header["destinations"]],
+            distances=np.load(directory / "distances.npy", mmap_mode=mmap_mode),
+            durations=np.load(directory / "durations.npy", mmap_mode=mmap_mode),
+            country_index=np.load(directory / "country_index.npy", mmap_mode=mmap_mode),
+            country_codes=tuple(header["country_codes"]),
+            status=header["status"],
+            error_message=header["error_message"]
+        )
+
+    def _country_grid(self) -> np.ndarray:
+        """Get the country code for every pair as an object array."""
+        return np.asarray(self.country_codes + ("",), dtype=object)[self.country_index]
+
+    def _values(self, by: str) -> np.ndarray:
+        """Get the distance or duration array."""
+        if by == "distance":
+            return self.distances
+        if by == "duration":
+            return self.durations
+        raise ValueError(f"Unknown matrix value: {by}")
+
+    def __eq__(self, other: Any) -> bool:
+        """Compare matrices by locations, values and countries."""
+        if not isinstance(other, ArrayDistanceMatrix):
+            return False
+        return (
+            self.origins == other.origins
+            and self.destinations == other.destinations
+            and np.array_equal(self.distances, other.distances)
+            and np.array_equal(self.durations, other.durations)
+            and np.array_equal(self._country_grid(), other._country_grid())
+            and self.status == other.status
+        )
+
+    def __hash__(self) -> int:
+        """Hash matrices by shape and values."""
+        return hash((self.distances.shape, self.distances.tobytes(), self.durations.tobytes()))
+
+
+def _read_only(array: np.ndarray) -> np.ndarray:
+    """Get a read-only view of an array without touching the caller's flags."""
+    view = array.view()
+    view.flags.writeable = False
+    return view
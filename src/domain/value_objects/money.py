@@ -0,0 +1,235 @@
+"""Money in integer minor units.
+
+Cost and pricing code used to build a ``Decimal`` for every amount, mostly
+through ``Decimal(str(x))`` and ``.quantize``. ``Money`` keeps an amount as
+an integer number of cents instead, so sums and comparisons are plain
+integer operations, and a ``Decimal`` is only built at API and persistence
+boundaries with ``to_decimal()``.
+
+Rounding is explicit wherever an amount enters:
+
+- ``from_float`` first drops float noise at six decimal places (products
+  such as ``14.719 * 25.0`` give ``367.97499999999997``), then rounds to
+  the cent. This is the rule cost amounts have always been rounded with.
+- ``from_decimal`` rounds the exact decimal value to the cent.
+- ``multiply`` rounds the exact product to the cent.
+
+Each takes ``ROUND_HALF_UP`` (the default) or ``ROUND_HALF_EVEN``, the
+``decimal`` module's default used by a bare ``quantize``.
+"""
+from decimal import ROUND_HALF_EVEN, ROUND_HALF_UP, Decimal
+from functools import total_ordering
+from typing import Any, Union
+
+CENTS_PER_UNIT = 100
+# Float noise is dropped at this many places before rounding to the cent
+NOISE_PLACES = 6
+
+_SCALE = 10 ** NOISE_PLACES
+_SCALED_PER_CENT = _SCALE // CENTS_PER_UNIT
+# Below this magnitude a float scales to NOISE_PLACES digits exactly
+_EXACT_FLOAT_LIMIT = 2.0 ** 52 / _SCALE
+_ROUNDINGS = (ROUND_HALF_UP, ROUND_HALF_EVEN)
+
+Number = Union[int, float, Decimal]
+
+
+def _divide(numerator: int, denominator: int, rounding: str) -> int:
+    """Divide integers, rounding ties as given.
+
+    Args:
+        numerator: Dividend
+        denominator: Positive divisor
+        rounding: ROUND_HALF_UP (ties away from zero) or ROUND_HALF_EVEN
+
+    Returns:
+        Rounded quotient
+    """
+    quotient, remainder = divmod(abs(numerator), denominator)
+    twice = 2 * remainder
+    if twice > denominator or (
+        twice == denominator and (rounding == ROUND_HALF_UP or quotient % 2)
+    ):
+        quotient += 1
+    return -quotient if numerator < 0 else quotient
+
+
+def _check_rounding(rounding: str) -> None:
+    """Reject rounding modes Money does not implement."""
+    if rounding not in _ROUNDINGS:
+        raise ValueError(f"Unsupported rounding: {rounding}")
+
+
+@total_ordering
+class Money:
+    """Immutable amount of money in integer cents."""
+
+    __slots__ = ("_cents", "_currency")
+
+    def __init__(self, cents: int = 0, currency: str = "EUR"):
+        """Initialize the amount.
+
+        Args:
+            cents: Amount in cents
+            currency: ISO 4217 currency code
+        """
+        object.__setattr__(self, "_cents", int(cents))
+        object.__setattr__(self, "_currency", currency)
+
+    @classmethod
+    def from_float(
+        cls,
+        value: float,
+        currency: str = "EUR",
+        rounding: str = ROUND_HALF_UP
+    ) -> "Money":
+        """Round a float amount to the cent, dropping float noise first.
+
+        Args:
+            value: Amount as a float
+            currency: ISO 4217 currency code
+            rounding: ROUND_HALF_UP or ROUND_HALF_EVEN
+
+        Returns:
+            Amount in cents
+        """
+        _check_rounding(rounding)
+        value = round(float(value), NOISE_PLACES)
+        if abs(value) < _EXACT_FLOAT_LIMIT:
+            scaled = round(value * _SCALE)
+        else:
+            numerator, denominator = Decimal(repr(value)).as_integer_ratio()
+            scaled = _divide(numerator * _SCALE, denominator, rounding)
+        return cls(_divide(scaled, _SCALED_PER_CENT, rounding), currency)
+
+    @classmethod
+    def from_decimal(
+        cls,
+        value: Decimal,
+        currency: str = "EUR",
+        rounding: str = ROUND_HALF_UP
+    ) -> "Money":
+        """Round a decimal amount to the cent.
+
+        Args:
+            value: Amount as a Decimal (or int)
+            currency: ISO 4217 currency code
+            rounding: ROUND_HALF_UP or ROUND_HALF_EVEN
+
+        Returns:
+            Amount in cents
+        """
+        _check_rounding(rounding)
+        numerator, denominator = value.as_integer_ratio()
+        return cls(_divide(numerator * CENTS_PER_UNIT, denominator, rounding), currency)
+
+    @classmethod
+    def from_number(
+        cls,
+        value: Number,
+        currency: str = "EUR",
+        rounding: str = ROUND_HALF_UP
+    ) -> "Money":
+        """Round a Decimal, int or float amount to the cent."""
+        if isinstance(value, (Decimal, int)):
+            return cls.from_decimal(value, currency, rounding)
+        return cls.from_float(value, currency, rounding)
+
+    @property
+    def cents(self) -> int:
+        """Get the amount in cents."""
+        return self._cents
+
+    @property
+    def currency(self) -> str:
+        """Get the currency code."""
+        return self._currency
+
+    def to_decimal(self) -> Decimal:
+        """Convert to a Decimal with two places."""
+        return Decimal(self._cents).scaleb(-2)
+
+    def multiply(self, factor: Number, rounding: str = ROUND_HALF_UP) -> "Money":
+        """Multiply by a factor, rounding the product to the cent.
+
+        Args:
+            factor: Factor; floats are taken at their shortest repr
+            rounding: ROUND_HALF_UP or ROUND_HALF_EVEN
+
+        Returns:
+            Product in cents
+        """
+        if isinstance(factor, int):
+            return Money(self._cents * factor, self._currency)
+        _check_rounding(rounding)
+        if not isinstance(factor, Decimal):
+            factor = Decimal(repr(float(factor)))
+        numerator, denominator = factor.as_integer_ratio()
+        return Money(_divide(self._cents * numerator, denominator, rounding), self._currency)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("Money is immutable")
+
+    def __float__(self) -> float:
+        return self._cents / CENTS_PER_UNIT
+
+    def __bool__(self) -> bool:
+        return self._cents != 0
+
+    def __neg__(self) -> "Money":
+        return Money(-self._cents, self._currency)
+
+    def __add__(self, other: Any) -> "Money":
+        if not isinstance(other, Money):
+            return NotImplemented
+        self._check_currency(other)
+        return Money(self._cents + other._cents, self._currency)
+
+    def __radd__(self, other: Any) -> "Money":
+        # Lets sum() start from 0
+        if other == 0:
+            return self
+        return NotImplemented
+
+    def __sub__(self, other: Any) -> "Money":
+        if not isinstance(other, Money):
+            return NotImplemented
+        self._check_currency(other)
+        return Money(self._cents - other._cents, self._currency)
+
+    def __mul__(self, other: Any) -> "Money":
+        if not isinstance(other, int):
+            return NotImplemented
+        return Money(self._cents * other, self._currency)
+
+    __rmul__ = __mul__
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, Money):
+            return NotImplemented
+        return self._cents == other._cents and self._currency == other._currency
+
+    def __lt__(self, other: Any) -> bool:
+        if not isinstance(other, Money):
+            return NotImplemented
+        self._check_currency(other)
+        return self._cents < other._cents
+
+    def __hash__(self) -> int:
+        return hash((self._cents, self._currency))
+
+    def __repr__(self) -> str:
+        return f"Money({self._cents}, {self._currency!r})"
+
+    def __str__(self) -> str:
+        return f"{self.to_decimal()} {self._currency}"
+
+    def __reduce__(self):
+        return (Money, (self._cents, self._currency))
+
+    def _check_currency(self, other: "Money") -> None:
+        """Reject arithmetic across currencies."""
+        if other._currency != self._currency:
+            raise ValueError(
+                f"Currency mismatch: {self._currency} and {other._currency}"
+            )
@@ -49,6 +49,29 @@ class CountrySegment(BaseValueObject):
         return v
 
 
+class RouteSummary(BaseValueObject):
+    """Totals, legs and country segments of a route from a single directions lookup."""
+
+    origin: Location
+    destination: Location
+    distance_km: Decimal = Field(..., description="Total distance in kilometers", gt=0)
+    duration_hours: Decimal = Field(..., description="Total duration in hours", gt=0)
+    legs: List[Dict] = Field(
+        default_factory=list,
+        description="Route legs as returned by the provider, including their steps"
+    )
+    country_segments: List[CountrySegment] = Field(
+        default_factory=list,
+        description="Route split by country"
+    )
+    polyline: Optional[str] = Field(None, description="Encoded overview polyline")
+
+    @property
+    def steps(self) -> List[Dict]:
+        """All steps of the route in driving order."""
+        return [step for leg in self.legs for step in leg.get("steps", [])]
+
+
 class RouteMetadata(BaseValueObject):
     """Metadata for route entities with extension points."""
 
@@ -67,6 +90,9 @@ class RouteMetadata(BaseValueObject):
     optimization_data: Optional[Dict] = Field(
         None, description="Route optimization metadata"
     )
+    planning_data: Optional[Dict] = Field(
+        None, description="Route planning timings"
+    )
 
 
 class RouteSegment(BaseValueObject):
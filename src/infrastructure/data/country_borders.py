@@ -0,0 +1,294 @@
+"""Simplified country border polygons for offline country attribution.
+
+Borders are coarse (roughly 10-30 km accuracy) and cover the core
+continental European transport network. Land borders are defined once as
+shared chains between tripoints and reused (reversed where needed) by both
+neighbouring countries, so adjacent polygons neither overlap nor leave gaps.
+Coastlines are drawn generously into the sea.
+
+Points outside every polygon, or close to a land border, are expected to be
+resolved by a remote geocoder instead.
+
+All coordinates are (latitude, longitude) pairs in decimal degrees.
+"""
+from typing import Dict, List, Sequence, Tuple
+
+Point = Tuple[float, float]
+Ring = List[Point]
+
+
+def _ring(*chains: Sequence[Point]) -> Ring:
+    """Join border chains into a single ring, dropping repeated joints.
+
+    Args:
+        *chains: Border chains in ring order
+
+    Returns:
+        Closed ring (first point is not repeated at the end)
+    """
+    ring: Ring = []
+    for chain in chains:
+        for point in chain:
+            if not ring or ring[-1] != point:
+                ring.append(point)
+    if len(ring) > 1 and ring[0] == ring[-1]:
+        ring.pop()
+    return ring
+
+
+def _rev(chain: Sequence[Point]) -> List[Point]:
+    """Reverse a border chain."""
+    return list(reversed(chain))
+
+
+# Shared land borders, each running from the first tripoint to the second.
+_FR_BE = [
+    (51.09, 2.54), (50.95, 2.62), (50.80, 2.90), (50.72, 3.20), (50.48, 3.65),
+    (50.33, 4.05), (50.00, 4.15), (49.98, 4.50), (50.15, 4.83), (49.80, 4.87),
+    (49.65, 5.40), (49.55, 5.82),
+]
+_FR_LU = [(49.55, 5.82), (49.45, 6.10), (49.47, 6.37)]
+_FR_DE = [
+    (49.47, 6.37), (49.35, 6.60), (49.16, 6.95), (49.12, 7.35), (49.05, 7.70),
+    (48.97, 8.23), (48.58, 7.80), (48.00, 7.57), (47.59, 7.59),
+]
+_FR_CH = [
+    (47.59, 7.59), (47.50, 7.15), (47.45, 6.95), (47.30, 6.95), (47.05, 6.70),
+    (46.75, 6.40), (46.45, 6.07), (46.20, 5.96), (46.20, 6.25), (46.40, 6.50),
+    (46.38, 6.80), (46.10, 6.85), (45.92, 7.04),
+]
+_FR_IT = [
+    (45.92, 7.04), (45.65, 6.85), (45.25, 6.95), (45.10, 6.65), (44.85, 6.95),
+    (44.40, 6.90), (44.15, 7.65), (43.78, 7.53),
+]
+_FR_ES = [
+    (42.43, 3.17), (42.47, 2.85), (42.43, 1.95), (42.55, 1.45), (42.85, 0.75),
+    (42.70, 0.00), (42.80, -0.55), (43.05, -1.35), (43.37, -1.78),
+]
+_BE_NL = [
+    (51.37, 3.37), (51.25, 3.55), (51.22, 3.95), (51.30, 4.25), (51.45, 4.50),
+    (51.45, 5.00), (51.30, 5.25), (51.20, 5.55), (51.05, 5.78), (50.77, 5.65),
+    (50.75, 6.02),
+]
+_BE_DE = [(50.75, 6.02), (50.60, 6.20), (50.40, 6.40), (50.13, 6.13)]
+_BE_LU = [(50.13, 6.13), (49.85, 5.75), (49.55, 5.82)]
+_LU_DE = [(50.13, 6.13), (49.95, 6.25), (49.80, 6.52), (49.60, 6.42), (49.47, 6.37)]
+_NL_DE = [
+    (53.32, 7.20), (53.00, 7.22), (52.65, 7.05), (52.23, 7.00), (51.85, 6.72),
+    (51.83, 6.10), (51.65, 6.00), (51.40, 6.22), (51.20, 6.10), (51.00, 5.93),
+    (50.75, 6.02),
+]
+_DE_DK = [(54.91, 8.66), (54.82, 9.00), (54.82, 9.45)]
+_DE_PL = [
+    (53.92, 14.23), (53.45, 14.40), (53.05, 14.35), (52.58, 14.62), (52.34, 14.56),
+    (52.00, 14.72), (51.55, 14.73), (51.15, 15.00), (50.87, 14.82),
+]
+_DE_CZ = [
+    (50.87, 14.82), (51.02, 14.55), (50.97, 14.30), (50.88, 14.23), (50.72, 13.75),
+    (50.40, 12.95), (50.32, 12.10), (50.05, 12.25), (49.65, 12.52), (49.33, 12.87),
+    (49.12, 13.23), (48.95, 13.55), (48.77, 13.84),
+]
+_DE_AT = [
+    (48.77, 13.84), (48.57, 13.45), (48.26, 13.03), (47.94, 12.95), (47.82, 13.00),
+    (47.50, 13.00), (47.72, 12.85), (47.60, 12.19), (47.41, 11.26), (47.42, 10.98),
+    (47.55, 10.70), (47.28, 10.20), (47.53, 9.71), (47.53, 9.60),
+]
+_DE_CH = [
+    (47.53, 9.60), (47.65, 9.20), (47.70, 8.85), (47.80, 8.60), (47.60, 8.40),
+    (47.60, 8.20), (47.59, 7.59),
+]
+_CH_AT = [(47.53, 9.60), (47.27, 9.55), (47.05, 9.58), (46.95, 9.90), (46.98, 10.20), (46.85, 10.47)]
+_CH_IT = [
+    (46.85, 10.47), (46.60, 10.45), (46.50, 10.10), (46.23, 10.15), (46.40, 9.70),
+    (46.50, 9.30), (46.15, 9.15), (45.82, 9.02), (46.00, 8.80), (46.10, 8.45),
+    (46.25, 8.10), (45.93, 7.87), (45.98, 7.66), (45.87, 7.17), (45.92, 7.04),
+]
+_AT_CZ = [
+    (48.77, 13.84), (48.55, 14.35), (48.78, 14.98), (49.00, 15.30), (48.80, 15.90),
+    (48.72, 16.50), (48.62, 16.94),
+]
+_AT_SK = [(48.62, 16.94), (48.35, 16.85), (48.15, 17.02), (48.01, 17.16)]
+_AT_HU = [
+    (48.01, 17.16), (47.72, 16.95), (47.72, 16.70), (47.60, 16.45), (47.40, 16.45),
+    (47.00, 16.50), (46.87, 16.11),
+]
+_AT_SI = [
+    (46.87, 16.11), (46.68, 16.00), (46.70, 15.65), (46.63, 15.00), (46.48, 14.55),
+    (46.45, 14.10), (46.52, 13.71),
+]
+_AT_IT = [
+    (46.52, 13.71), (46.60, 12.95), (46.68, 12.50), (46.72, 12.30), (47.05, 12.10),
+    (47.00, 11.50), (46.77, 11.00), (46.85, 10.47),
+]
+_SI_IT = [
+    (45.60, 13.72), (45.65, 13.90), (45.85, 13.60), (46.00, 13.63), (46.20, 13.45),
+    (46.40, 13.40), (46.52, 13.71),
+]
+_SI_HR = [
+    (46.48, 16.60), (46.40, 16.25), (46.25, 15.75), (46.00, 15.65), (45.85, 15.65),
+    (45.65, 15.35), (45.48, 15.10), (45.50, 14.60), (45.48, 14.25), (45.48, 13.60),
+]
+_HU_SI = [(46.48, 16.60), (46.60, 16.55), (46.75, 16.30), (46.87, 16.11)]
+_CZ_PL = [
+    (50.87, 14.82), (51.02, 15.15), (50.85, 15.35), (50.75, 15.90), (50.65, 16.30),
+    (50.43, 16.20), (50.10, 16.75), (50.35, 17.15), (50.20, 17.70), (50.00, 18.05),
+    (49.92, 18.40), (49.75, 18.63), (49.52, 18.85),
+]
+_CZ_SK = [
+    (49.52, 18.85), (49.40, 18.45), (49.15, 18.15), (48.90, 17.75), (48.80, 17.18),
+    (48.62, 16.94),
+]
+_PL_SK = [
+    (49.09, 22.56), (49.30, 22.00), (49.42, 21.50), (49.40, 21.00), (49.42, 20.50),
+    (49.20, 20.05), (49.40, 19.80), (49.57, 19.50), (49.45, 19.10), (49.52, 18.85),
+]
+_PL_LT = [(54.36, 22.79), (54.20, 23.45), (53.93, 23.51)]
+_SK_HU = [
+    (48.40, 22.15), (48.42, 21.60), (48.55, 21.20), (48.50, 20.45), (48.25, 20.05),
+    (48.15, 19.75), (48.07, 19.30), (47.95, 18.95), (47.80, 18.75), (47.76, 18.13),
+    (47.85, 17.70), (48.01, 17.16),
+]
+_ES_PT = [
+    (37.18, -7.40), (37.55, -7.50), (38.20, -7.10), (38.88, -7.05), (39.40, -7.45),
+    (39.65, -7.55), (40.00, -6.90), (40.60, -6.82), (41.00, -6.80), (41.55, -6.20),
+    (41.95, -6.60), (41.87, -7.45), (42.10, -8.15), (42.04, -8.64), (41.87, -8.87),
+]
+_LT_LV = [(55.68, 26.63), (56.05, 25.60), (56.35, 24.50), (56.25, 23.20), (56.40, 22.10), (56.07, 21.05)]
+_LV_EE = [(57.55, 27.35), (57.65, 26.60), (57.80, 26.02), (57.90, 25.30), (57.87, 24.35)]
+
+# Borders with neighbours that have no polygon of their own.
+_PL_RU = [(54.36, 19.63), (54.40, 20.50), (54.40, 21.50), (54.36, 22.79)]
+_PL_BY = [
+    (53.93, 23.51), (53.50, 23.70), (53.10, 23.95), (52.70, 23.95), (52.30, 23.20),
+    (52.08, 23.65), (51.56, 23.61),
+]
+_PL_UA = [
+    (51.56, 23.61), (51.15, 23.70), (50.80, 24.10), (50.40, 24.05), (50.10, 23.50),
+    (49.80, 23.00), (49.40, 22.75), (49.09, 22.56),
+]
+_SK_UA = [(49.09, 22.56), (48.90, 22.40), (48.60, 22.20), (48.40, 22.15)]
+_HU_UA = [(48.40, 22.15), (48.10, 22.60), (47.95, 22.90)]
+_HU_RO = [
+    (47.95, 22.90), (47.70, 22.45), (47.30, 22.00), (47.00, 21.70), (46.60, 21.45),
+    (46.30, 21.15), (46.15, 20.75), (46.13, 20.26),
+]
+_HU_RS = [(46.13, 20.26), (46.15, 19.70), (46.00, 19.30), (45.90, 18.90)]
+_HU_HR = [(45.90, 18.90), (45.85, 18.40), (45.80, 17.90), (46.00, 17.40), (46.30, 16.90), (46.48, 16.60)]
+_LT_RU = [(55.28, 20.98), (55.10, 21.40), (55.08, 22.00), (54.95, 22.60), (54.80, 22.90), (54.36, 22.79)]
+_LT_BY = [
+    (53.93, 23.51), (53.95, 24.00), (54.05, 24.70), (54.20, 25.50), (54.55, 25.75),
+    (54.85, 25.85), (55.15, 26.50), (55.68, 26.63),
+]
+_LV_BY_RU = [(55.68, 26.63), (55.90, 27.50), (56.00, 28.15), (56.60, 28.00), (57.20, 27.80), (57.55, 27.35)]
+_EE_RU = [(57.55, 27.35), (57.90, 27.70), (58.40, 27.50), (58.90, 27.40), (59.00, 28.00), (59.45, 28.05)]
+
+# Coastlines, generous towards the sea.
+_FR_COAST_MED = [(43.78, 7.53), (43.55, 7.00), (43.10, 6.20), (43.20, 5.40), (43.40, 4.80), (43.30, 3.50), (43.00, 3.05), (42.43, 3.17)]
+_FR_COAST_ATL = [
+    (43.37, -1.78), (44.60, -1.25), (45.60, -1.20), (46.30, -1.60), (47.30, -2.50),
+    (47.80, -4.40), (48.40, -4.80), (48.80, -3.00), (48.60, -2.00), (49.70, -1.90),
+    (49.35, -0.50), (49.50, 0.10), (50.20, 1.55), (50.95, 1.85), (51.09, 2.54),
+]
+_BE_COAST = [(51.09, 2.54), (51.37, 3.37)]
+_NL_COAST = [
+    (51.37, 3.37), (51.60, 3.50), (52.00, 4.10), (52.50, 4.55), (52.95, 4.70),
+    (53.40, 5.50), (53.45, 6.30), (53.32, 7.20),
+]
+_DE_COAST_NORTH = [(53.32, 7.20), (53.70, 7.30), (53.60, 8.10), (53.90, 8.70), (54.50, 8.60), (54.91, 8.66)]
+_DE_COAST_BALTIC = [
+    (54.82, 9.45), (54.45, 10.20), (54.45, 11.00), (53.95, 10.90), (54.10, 11.60),
+    (54.20, 12.10), (54.45, 12.50), (54.65, 13.40), (54.10, 13.80), (53.92, 14.23),
+]
+_DK_JUTLAND_COAST = [
+    (54.82, 9.45), (55.05, 9.75), (55.40, 9.70), (55.70, 9.60), (56.10, 10.30),
+    (56.50, 10.95), (57.10, 10.55), (57.75, 10.60), (57.15, 8.65), (56.60, 8.10),
+    (55.50, 8.10), (54.91, 8.66),
+]
+_PL_COAST = [(53.92, 14.23), (54.20, 15.50), (54.55, 16.60), (54.80, 18.00), (54.60, 18.50), (54.40, 18.90), (54.36, 19.63)]
+_IT_COAST = [
+    (45.60, 13.72), (45.78, 13.55), (45.65, 13.10), (45.40, 12.30), (45.00, 12.40),
+    (44.00, 12.60), (43.60, 13.50), (42.50, 14.20), (41.90, 15.20), (41.90, 16.10),
+    (41.10, 16.90), (40.60, 18.00), (40.10, 18.50), (39.80, 18.35), (40.50, 17.20),
+    (39.90, 16.60), (39.10, 17.10), (38.00, 16.10), (38.10, 15.65), (38.90, 16.20),
+    (39.90, 15.70), (40.60, 14.50), (40.85, 14.25), (41.25, 13.00), (41.75, 12.25),
+    (42.40, 11.20), (43.00, 10.50), (43.70, 10.30), (44.10, 9.80), (44.40, 8.90),
+    (43.90, 8.00), (43.78, 7.53),
+]
+_ES_COAST_MED = [
+    (42.43, 3.17), (41.90, 3.20), (41.40, 2.20), (41.10, 1.30), (40.70, 0.85),
+    (40.00, 0.00), (39.50, -0.30), (38.80, 0.20), (38.30, -0.50), (37.60, -0.70),
+    (36.80, -2.00), (36.75, -4.40), (36.00, -5.60), (36.50, -6.30), (37.18, -7.40),
+]
+_ES_COAST_NORTH = [
+    (41.87, -8.87), (42.90, -9.30), (43.40, -8.30), (43.70, -7.80), (43.55, -5.80),
+    (43.45, -3.80), (43.30, -2.90), (43.37, -1.78),
+]
+_PT_COAST = [
+    (37.18, -7.40), (37.00, -8.00), (37.10, -8.95), (38.50, -8.90), (38.70, -9.50),
+    (39.40, -9.35), (40.60, -8.75), (41.15, -8.65), (41.87, -8.87),
+]
+_SI_COAST = [(45.48, 13.60), (45.60, 13.72)]
+_LT_COAST = [(56.07, 21.05), (55.70, 21.10), (55.28, 20.98)]
+_LV_COAST = [
+    (57.87, 24.35), (57.60, 24.40), (57.05, 24.05), (56.97, 23.70), (57.35, 22.90),
+    (57.75, 22.60), (57.40, 21.60), (56.50, 21.00), (56.07, 21.05),
+]
+_EE_COAST = [(59.45, 28.05), (59.50, 27.00), (59.45, 24.75), (59.35, 24.05), (58.94, 23.54), (58.38, 24.50), (57.87, 24.35)]
+
+_DK_FUNEN = [(55.60, 9.90), (55.55, 10.60), (55.10, 10.80), (55.05, 10.20)]
+_DK_ZEALAND = [
+    (56.10, 12.50), (55.60, 12.65), (55.00, 12.40), (54.60, 11.90), (54.80, 11.00),
+    (55.40, 11.10), (55.95, 11.80),
+]
+_IT_SICILY = [
+    (38.27, 15.65), (37.00, 15.30), (36.68, 15.08), (37.10, 14.30), (37.60, 12.50),
+    (38.10, 12.60), (38.20, 13.30), (38.00, 14.00),
+]
+_IT_SARDINIA = [
+    (41.25, 9.20), (40.90, 9.70), (40.00, 9.70), (39.10, 9.50), (38.90, 8.60),
+    (39.20, 8.40), (40.60, 8.15), (41.00, 8.30),
+]
+
+COUNTRY_BORDERS: Dict[str, List[Ring]] = {
+    "PT": [_ring(_PT_COAST, _rev(_ES_PT))],
+    "ES": [_ring(_rev(_FR_ES), _ES_COAST_MED, _ES_PT, _ES_COAST_NORTH)],
+    "FR": [_ring(_FR_BE, _FR_LU, _FR_DE, _FR_CH, _FR_IT, _FR_COAST_MED, _FR_ES, _FR_COAST_ATL)],
+    "BE": [_ring(_BE_COAST, _BE_NL, _BE_DE, _BE_LU, _rev(_FR_BE))],
+    "NL": [_ring(_NL_COAST, _NL_DE, _rev(_BE_NL))],
+    "LU": [_ring(_LU_DE, _rev(_FR_LU), _rev(_BE_LU))],
+    "DE": [_ring(
+        _DE_COAST_NORTH, _DE_DK, _DE_COAST_BALTIC, _DE_PL, _DE_CZ, _DE_AT, _DE_CH,
+        _rev(_FR_DE), _rev(_LU_DE), _rev(_BE_DE), _rev(_NL_DE),
+    )],
+    "DK": [
+        _ring(_DK_JUTLAND_COAST, _DE_DK),
+        _ring(_DK_FUNEN),
+        _ring(_DK_ZEALAND),
+    ],
+    "CH": [_ring(_rev(_DE_CH), _CH_AT, _CH_IT, _rev(_FR_CH))],
+    "AT": [_ring(_rev(_DE_AT), _AT_CZ, _AT_SK, _AT_HU, _AT_SI, _AT_IT, _rev(_CH_AT))],
+    "IT": [
+        _ring(_rev(_FR_IT), _rev(_CH_IT), _rev(_AT_IT), _rev(_SI_IT), _IT_COAST),
+        _ring(_IT_SICILY),
+        _ring(_IT_SARDINIA),
+    ],
+    "SI": [_ring(_rev(_AT_SI), _rev(_HU_SI), _SI_HR, _SI_COAST, _SI_IT)],
+    "HU": [_ring(_rev(_SK_HU), _HU_UA, _HU_RO, _HU_RS, _HU_HR, _HU_SI, _rev(_AT_HU))],
+    "SK": [_ring(_rev(_PL_SK), _SK_UA, _SK_HU, _rev(_AT_SK), _rev(_CZ_SK))],
+    "CZ": [_ring(_CZ_PL, _CZ_SK, _rev(_AT_CZ), _rev(_DE_CZ))],
+    "PL": [_ring(_PL_COAST, _PL_RU, _PL_LT, _PL_BY, _PL_UA, _PL_SK, _rev(_CZ_PL), _rev(_DE_PL))],
+    "LT": [_ring(_LT_COAST, _LT_RU, _PL_LT, _LT_BY, _LT_LV)],
+    "LV": [_ring(_rev(_LT_LV), _LV_BY_RU, _LV_EE, _LV_COAST)],
+    "EE": [_ring(_rev(_LV_EE), _EE_RU, _EE_COAST)],
+}
+
+# Coastline chains. Their edges separate land from sea rather than from a
+# neighbouring country, so points near them are not ambiguous. Island rings
+# are closed explicitly.
+COASTLINES: List[List[Point]] = [
+    _FR_COAST_MED, _FR_COAST_ATL, _BE_COAST, _NL_COAST, _DE_COAST_NORTH,
+    _DE_COAST_BALTIC, _DK_JUTLAND_COAST, _PL_COAST, _IT_COAST, _ES_COAST_MED,
+    _ES_COAST_NORTH, _PT_COAST, _SI_COAST, _LT_COAST, _LV_COAST, _EE_COAST,
+    _DK_FUNEN + _DK_FUNEN[:1], _DK_ZEALAND + _DK_ZEALAND[:1],
+    _IT_SICILY + _IT_SICILY[:1], _IT_SARDINIA + _IT_SARDINIA[:1],
+]
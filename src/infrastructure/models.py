@@ -598,6 +598,7 @@ class Cost(Base):
     cost_components = Column(JSONEncodedDict, nullable=False)
     settings_snapshot = Column(JSONEncodedDict, nullable=False)
     route = relationship("Route", back_populates="costs")
+    dependencies = relationship("CostDependency", back_populates="cost", cascade="all, delete-orphan")
 
     __table_args__ = (
         Index('ix_costs_calculation_date', 'calculation_date'),
@@ -605,6 +606,24 @@ class Cost(Base):
     )
 
 
+class CostDependency(Base):
+    """Settings key a stored cost component depends on."""
+
+    __tablename__ = "cost_dependencies"
+
+    cost_id = Column(String(36), ForeignKey("costs.id", ondelete="CASCADE"), primary_key=True)
+    component = Column(String, primary_key=True)
+    settings_key = Column(String, primary_key=True)
+
+    # Relationships
+    cost = relationship("Cost", back_populates="dependencies")
+
+    # Indexes
+    __table_args__ = (
+        Index('ix_cost_dependencies_settings_key', 'settings_key'),
+    )
+
+
 def validate_version(version: str) -> bool:
     """Validate version format (X.Y)."""
     if not version or not isinstance(version, str):
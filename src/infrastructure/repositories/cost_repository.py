@@ -1,10 +1,11 @@
 """Cost repository implementation."""
 from datetime import datetime
 from decimal import Decimal, InvalidOperation
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterable, List, Mapping, Optional, Set, Tuple
 from uuid import UUID, uuid4
 
 from sqlalchemy.orm import Session
+from sqlalchemy.orm.attributes import flag_modified
 from sqlalchemy import desc
 
 from src.domain.entities.cost import Cost as CostEntity, CostBreakdown
@@ -12,7 +13,15 @@ from src.domain.interfaces.repositories.cost_repository import CostRepository as
 from src.domain.interfaces.exceptions.repository_errors import EntityNotFoundError, ValidationError
 from src.infrastructure.database import Database
 from src.infrastructure.logging import get_logger
-from src.infrastructure.models import Cost as CostModel
+from src.domain.services.cost.dependencies import ComponentDependency, split_path
+from src.domain.value_objects import Money
+from src.infrastructure.models import Cost as CostModel, CostDependency as CostDependencyModel
+from src.infrastructure.repositories.hydration import EntityHydrator, get_entity_hydrator
+
+# Key of the component dependencies in the stored cost components
+DEPENDENCIES_KEY = "dependencies"
+# Settings keys per IN (...) query, below SQLite's bound parameter limit
+_QUERY_CHUNK = 500
 
 
 def _serialize_uuid(obj: dict) -> dict:
@@ -61,6 +70,27 @@ def _serialize_breakdown(breakdown: CostBreakdown) -> dict:
     return _serialize_decimal(serialized)
 
 
+def _to_money(value) -> Money:
+    """Convert a stored or submitted amount to Money."""
+    if isinstance(value, Money):
+        return value
+    if isinstance(value, str):
+        value = Decimal(value)
+    return Money.from_number(value)
+
+
+def _to_decimal(value) -> Decimal:
+    """Convert a stored number to a Decimal."""
+    if isinstance(value, Decimal):
+        return value
+    return _to_money(value).to_decimal()
+
+
+def _decimal_map(costs: Optional[dict]) -> Dict[str, Decimal]:
+    """Convert a stored cost mapping to Decimal values."""
+    return {key: _to_decimal(value) for key, value in (costs or {}).items()}
+
+
 def _validate_breakdown(breakdown: dict, route_id: UUID) -> dict:
     """Validate and convert breakdown dictionary to proper format."""
     try:
@@ -105,10 +135,11 @@ def _validate_breakdown(breakdown: dict, route_id: UUID) -> dict:
 class CostRepository(CostRepositoryInterface):
     """Repository for managing cost entities."""
 
-    def __init__(self, db: Database):
+    def __init__(self, db: Database, hydrator: Optional[EntityHydrator] = None):
         """Initialize repository with database connection."""
         self.db = db
         self.model = CostModel
+        self.hydrator = hydrator or get_entity_hydrator()
 
     def create(self, entity: CostEntity) -> CostEntity:
         """Create a new cost entity."""
@@ -155,7 +186,11 @@ class CostRepository(CostRepositoryInterface):
             model.calculation_method = entity.calculation_method
             model.version = entity.version
             model.is_final = entity.is_final
+            dependencies = (model.cost_components or {}).get(DEPENDENCIES_KEY)
             model.cost_components = _serialize_breakdown(entity.breakdown)
+            if dependencies:
+                # Recorded separately; the breakdown does not carry them
+                model.cost_components[DEPENDENCIES_KEY] = dependencies
             model.settings_snapshot = _serialize_uuid(entity.metadata) if entity.metadata else {}
             
             session.add(model)
@@ -215,19 +250,16 @@ class CostRepository(CostRepositoryInterface):
             except ValidationError as e:
                 raise ValidationError(f"Invalid breakdown data: {str(e)}")
             
-            # Calculate total cost from components
-            total_cost = Decimal('0')
+            # Calculate total cost from components, in cents
+            total_cost = Money()
             cost_fields = ['fuel_costs', 'toll_costs', 'driver_costs', 'maintenance_costs']
             for field in cost_fields:
                 costs = breakdown.get(field, {})
                 if isinstance(costs, dict):
-                    total_cost += sum(Decimal(str(amount)) for amount in costs.values())
-            
-            # Convert all Decimal values to float for JSON serialization
-            for field in cost_fields:
-                costs = breakdown.get(field, {})
-                if isinstance(costs, dict):
-                    breakdown[field] = {k: float(Decimal(str(v))) for k, v in costs.items()}
+                    amounts = {k: _to_money(v) for k, v in costs.items()}
+                    total_cost += sum(amounts.values(), Money())
+                    # Convert to float for JSON serialization
+                    breakdown[field] = {k: float(amount) for k, amount in amounts.items()}
             
             try:
                 # Create CostBreakdown object and update entity
@@ -269,6 +301,132 @@ class CostRepository(CostRepositoryInterface):
         except Exception as e:
             raise ValidationError(f"Failed to save cost with breakdown: {str(e)}")
 
+    def save_dependencies(
+        self,
+        cost_id: UUID,
+        dependencies: Mapping[str, ComponentDependency]
+    ) -> None:
+        """Record the settings dependencies of a stored cost's components.
+
+        Dependencies are kept with the cost components, and every settings
+        key is indexed so find_by_settings_keys() can look up stale costs.
+
+        Args:
+            cost_id: Cost ID
+            dependencies: Dependencies by component path
+
+        Raises:
+            EntityNotFoundError: If the cost does not exist
+        """
+        with self.db.session() as session:
+            model = session.query(CostModel).filter_by(id=str(cost_id)).first()
+            if not model:
+                raise EntityNotFoundError(f"Cost {cost_id} not found")
+
+            components = dict(model.cost_components or {})
+            components[DEPENDENCIES_KEY] = {
+                path: dependency.to_dict()
+                for path, dependency in dependencies.items()
+            }
+            model.cost_components = components
+            flag_modified(model, "cost_components")
+
+            session.query(CostDependencyModel).filter_by(cost_id=str(cost_id)).delete()
+            session.add_all(
+                CostDependencyModel(cost_id=str(cost_id), component=path, settings_key=key)
+                for path, dependency in dependencies.items()
+                for key in sorted(dependency.keys)
+            )
+            session.commit()
+
+    def get_dependencies(self, cost_id: UUID) -> Dict[str, ComponentDependency]:
+        """Get the recorded dependencies of a stored cost's components.
+
+        Args:
+            cost_id: Cost ID
+
+        Returns:
+            Dependencies by component path (empty if none were recorded)
+        """
+        with self.db.session() as session:
+            model = session.query(CostModel).filter_by(id=str(cost_id)).first()
+            stored = (model.cost_components or {}).get(DEPENDENCIES_KEY) if model else None
+            return {
+                path: ComponentDependency.from_dict(path, data)
+                for path, data in (stored or {}).items()
+            }
+
+    def find_by_settings_keys(self, keys: Iterable[str]) -> Dict[UUID, Set[str]]:
+        """Find the stored cost components depending on settings keys.
+
+        Args:
+            keys: Settings keys, such as "fuel_price:DE"
+
+        Returns:
+            Component paths by cost ID
+        """
+        keys = sorted(set(keys))
+        found: Dict[UUID, Set[str]] = {}
+        with self.db.session() as session:
+            for start in range(0, len(keys), _QUERY_CHUNK):
+                rows = (
+                    session.query(CostDependencyModel.cost_id, CostDependencyModel.component)
+                    .filter(CostDependencyModel.settings_key.in_(keys[start:start + _QUERY_CHUNK]))
+                    .all()
+                )
+                for cost_id, component in rows:
+                    found.setdefault(UUID(cost_id), set()).add(component)
+        return found
+
+    def list_settings_keys(self) -> Set[str]:
+        """Get every settings key some stored cost component depends on."""
+        with self.db.session() as session:
+            rows = session.query(CostDependencyModel.settings_key).distinct().all()
+            return {key for key, in rows}
+
+    def update_components(
+        self,
+        cost_id: UUID,
+        amounts: Mapping[str, Money]
+    ) -> Optional[CostEntity]:
+        """Replace the amounts of some components of a stored cost.
+
+        The total is adjusted by the difference of the replaced amounts, so
+        components that are not replaced keep contributing as stored.
+
+        Args:
+            cost_id: Cost ID
+            amounts: New amounts in cents by component path ("fuel_costs.DE")
+
+        Returns:
+            Updated cost, or None if it does not exist
+        """
+        with self.db.session() as session:
+            model = session.query(CostModel).filter_by(id=str(cost_id)).first()
+            if not model:
+                return None
+
+            components = dict(model.cost_components or {})
+            delta = Money()
+            for path, amount in amounts.items():
+                field, *keys = split_path(path)
+                container = components.setdefault(field, {})
+                for key in keys[:-1]:
+                    container = container.setdefault(key, {})
+                amount = _to_money(amount)
+                delta += amount - _to_money(container.get(keys[-1], 0))
+                container[keys[-1]] = float(amount)
+
+            total_cost = _to_money(components.get('total_cost', model.total_cost or 0)) + delta
+            components['total_cost'] = float(total_cost)
+            model.cost_components = components
+            model.total_cost = float(total_cost)
+            flag_modified(model, "cost_components")
+
+            session.commit()
+            session.refresh(model)
+            return self._to_entity(model)
+
     def get_cost_history(self, cost_id: UUID) -> List[CostEntity]:
         """Get history of changes for a cost calculation."""
         with self.db.session() as session:
@@ -302,21 +460,26 @@ class CostRepository(CostRepositoryInterface):
         breakdown_dict['route_id'] = UUID(model.route_id)  
         
         # Create CostBreakdown with the new dictionary-based structure
-        breakdown = CostBreakdown(
+        breakdown = self.hydrator.build(
+            CostBreakdown,
             route_id=UUID(model.route_id),
-            fuel_costs=breakdown_dict.get('fuel_costs', {}),
-            toll_costs=breakdown_dict.get('toll_costs', {}),
-            driver_costs=breakdown_dict.get('driver_costs', {}),
-            maintenance_costs=breakdown_dict.get('maintenance_costs', {}),
-            rest_period_costs=breakdown_dict.get('rest_period_costs', 0),
-            loading_unloading_costs=breakdown_dict.get('loading_unloading_costs', 0),
-            empty_driving_costs=breakdown_dict.get('empty_driving_costs', {}),
-            cargo_specific_costs=breakdown_dict.get('cargo_specific_costs', {}),
-            overheads=breakdown_dict.get('overheads', {}),
-            total_cost=Decimal(str(total_cost))
+            fuel_costs=_decimal_map(breakdown_dict.get('fuel_costs')),
+            toll_costs=_decimal_map(breakdown_dict.get('toll_costs')),
+            driver_costs=_decimal_map(breakdown_dict.get('driver_costs')),
+            maintenance_costs=_decimal_map(breakdown_dict.get('maintenance_costs')),
+            rest_period_costs=_to_decimal(breakdown_dict.get('rest_period_costs', 0)),
+            loading_unloading_costs=_to_decimal(breakdown_dict.get('loading_unloading_costs', 0)),
+            empty_driving_costs={
+                country: _decimal_map(costs)
+                for country, costs in (breakdown_dict.get('empty_driving_costs') or {}).items()
+            },
+            cargo_specific_costs=_decimal_map(breakdown_dict.get('cargo_specific_costs')),
+            overheads=_decimal_map(breakdown_dict.get('overheads')),
+            total_cost=_to_decimal(total_cost)
         )
         
-        return CostEntity(
+        return self.hydrator.build(
+            CostEntity,
             id=UUID(model.id),
             route_id=UUID(model.route_id),
             breakdown=breakdown,
@@ -325,7 +488,7 @@ class CostRepository(CostRepositoryInterface):
             version=model.version,
             is_final=model.is_final,
             calculation_method=model.calculation_method,
-            total_cost=float(model.total_cost)
+            total_cost=_to_decimal(float(model.total_cost))
         )
 
     def _to_model(self, entity: CostEntity) -> CostModel:
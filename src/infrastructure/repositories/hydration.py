@@ -0,0 +1,123 @@
+"""Fast construction of domain entities from repository rows.
+
+Rows read back from our own tables were validated when they were written,
+yet every ``_to_entity`` ran the full pydantic validation again, which is
+most of the cost of a list endpoint. ``EntityHydrator`` builds entities with
+``model_construct`` instead. Full validation stays on API input and on
+every write path that builds entities from request data.
+
+- The repositories convert column values to the field types themselves
+  (UUIDs, Decimals, enums), since ``model_construct`` does no coercion.
+- ``REPOSITORY_FAST_HYDRATION=false`` restores validation on every read.
+- ``REPOSITORY_VALIDATE_SAMPLE_RATE`` re-validates that share of hydrated
+  entities and logs the ones that would have been rejected or coerced
+  differently, so drift between stored rows and the models is caught in
+  development without paying for it on every read.
+"""
+import random
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional, Type, TypeVar
+
+from pydantic import BaseModel, ValidationError
+
+from src.infrastructure.logging import get_logger
+from src.settings import get_settings
+
+logger = get_logger()
+
+M = TypeVar("M", bound=BaseModel)
+
+
+class EntityHydrator:
+    """Builds domain entities from trusted database rows."""
+
+    def __init__(
+        self,
+        fast: bool = True,
+        validate_sample_rate: float = 0.0,
+        sampler: Optional[Callable[[], float]] = None
+    ):
+        """Initialize the hydrator.
+
+        Args:
+            fast: Build entities without validation
+            validate_sample_rate: Share of fast-built entities to re-validate (0 to 1)
+            sampler: Source of uniform numbers in [0, 1) for sampling
+        """
+        if not 0.0 <= validate_sample_rate <= 1.0:
+            raise ValueError("Validation sample rate must be between 0 and 1")
+
+        self.fast = fast
+        self.validate_sample_rate = validate_sample_rate
+        self._sampler = sampler or random.random
+        self._logger = logger.bind(service="entity_hydrator")
+        self._sampled = 0
+        self._mismatches = 0
+
+    def build(self, model_cls: Type[M], **fields: Any) -> M:
+        """Build an entity from field values read from the database.
+
+        Args:
+            model_cls: Entity or value object class
+            **fields: Field values, already converted to the field types
+
+        Returns:
+            Entity instance
+
+        Raises:
+            ValidationError: If validation is on, or a sampled entity fails it
+        """
+        if not self.fast:
+            return model_cls(**fields)
+
+        entity = model_cls.model_construct(**fields)
+        if self.validate_sample_rate and self._sampler() < self.validate_sample_rate:
+            return self._revalidate(model_cls, fields, entity)
+        return entity
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get re-validation statistics."""
+        return {
+            "fast": self.fast,
+            "validate_sample_rate": self.validate_sample_rate,
+            "sampled": self._sampled,
+            "mismatches": self._mismatches
+        }
+
+    def _revalidate(self, model_cls: Type[M], fields: Dict[str, Any], entity: M) -> M:
+        """Validate a fast-built entity and log where the two differ."""
+        self._sampled += 1
+        try:
+            validated = model_cls(**fields)
+        except ValidationError as e:
+            self._mismatches += 1
+            self._logger.error(
+                "Hydrated entity fails validation",
+                entity=model_cls.__name__,
+                errors=e.errors()
+            )
+            raise
+
+        fast_fields = entity.__dict__
+        differing = [
+            name for name, value in validated.__dict__.items()
+            if name in fields and fast_fields.get(name) != value
+        ]
+        if differing:
+            self._mismatches += 1
+            self._logger.warning(
+                "Hydrated entity differs from validated entity",
+                entity=model_cls.__name__,
+                fields=differing
+            )
+        return validated
+
+
+@lru_cache
+def get_entity_hydrator() -> EntityHydrator:
+    """Get the process-wide entity hydrator."""
+    settings = get_settings().database
+    return EntityHydrator(
+        fast=settings.fast_hydration,
+        validate_sample_rate=settings.validate_sample_rate
+    )
@@ -1,7 +1,7 @@
 """Offer repository implementation."""
 import uuid
 from datetime import datetime, timezone, timedelta
-from decimal import Decimal, getcontext
+from decimal import ROUND_HALF_EVEN, Decimal, getcontext
 from typing import Dict, List, Optional, Tuple, Union
 from uuid import UUID, uuid4
 
@@ -11,19 +11,39 @@ from sqlalchemy.orm import Session
 from src.domain.entities.offer import Offer, OfferHistory
 from src.domain.interfaces.exceptions.repository_errors import OfferNotFoundError
 from src.domain.interfaces.repositories.offer_repository import OfferRepository as IOfferRepository
+from src.domain.value_objects.money import Money
 from src.domain.value_objects.offer import OfferStatus
 from src.infrastructure.models import Offer as OfferModel, OfferHistory as OfferHistoryModel
 from src.infrastructure.database import get_db
 from src.infrastructure.logging import get_logger
+from src.infrastructure.repositories.hydration import EntityHydrator, get_entity_hydrator
+
+_MARGIN_PLACES = Decimal('0.0001')
+
+
+def _to_decimal(value: Union[Decimal, float], places: Decimal) -> Decimal:
+    """Convert a stored number to a Decimal with fixed places."""
+    if not isinstance(value, Decimal):
+        value = Decimal(str(value))
+    return value.quantize(places)
+
+
+def _to_amount(value: Union[Decimal, float]) -> Decimal:
+    """Convert a stored amount to a Decimal in cents.
+
+    Rounds half to even, as a bare quantize of the stored value does.
+    """
+    return Money.from_number(value, rounding=ROUND_HALF_EVEN).to_decimal()
 
 
 class OfferRepository(IOfferRepository):
     """Repository for managing offer entities with version tracking and history."""
 
-    def __init__(self, db: Session):
+    def __init__(self, db: Session, hydrator: Optional[EntityHydrator] = None):
         """Initialize the repository with a database session."""
         self.db = db
         self.db_session = db  # Alias for db for compatibility
+        self.hydrator = hydrator or get_entity_hydrator()
 
     def create(self, offer: Offer) -> Offer:
         """Create a new offer."""
@@ -99,14 +119,15 @@ class OfferRepository(IOfferRepository):
             return None
 
         # Create an offer with the historical data
-        return Offer(
+        return self.hydrator.build(
+            Offer,
             id=UUID(history.offer_id),
             route_id=UUID(offer.route_id),
             cost_id=UUID(offer.cost_history_id) if offer.cost_history_id else None,
-            total_cost=Decimal(str(offer.total_cost)).quantize(Decimal('0.01')),
+            total_cost=_to_amount(offer.total_cost),
             status=OfferStatus(history.status),
-            margin=Decimal(str(history.margin)).quantize(Decimal('0.0001')),
-            final_price=Decimal(str(history.final_price)).quantize(Decimal('0.01')),
+            margin=_to_decimal(history.margin, _MARGIN_PLACES),
+            final_price=_to_amount(history.final_price),
             fun_fact=history.fun_fact,
             metadata=history.extra_data or {},
             version=history.version,
@@ -336,13 +357,14 @@ class OfferRepository(IOfferRepository):
         created_at = model.created_at.replace(tzinfo=timezone.utc) if model.created_at else None
         modified_at = model.modified_at.replace(tzinfo=timezone.utc) if model.modified_at else None
 
-        return Offer(
+        return self.hydrator.build(
+            Offer,
             id=UUID(model.id),
             route_id=UUID(model.route_id),
             cost_id=UUID(model.cost_history_id) if model.cost_history_id else None,
-            total_cost=Decimal(str(model.total_cost)).quantize(Decimal('0.01')),
-            margin=Decimal(str(model.margin)).quantize(Decimal('0.0001')),
-            final_price=Decimal(str(model.final_price)).quantize(Decimal('0.01')),
+            total_cost=_to_amount(model.total_cost),
+            margin=_to_decimal(model.margin, _MARGIN_PLACES),
+            final_price=_to_amount(model.final_price),
             fun_fact=model.fun_fact,
             status=OfferStatus(model.status),
             is_active=model.is_active,
@@ -361,13 +383,14 @@ class OfferRepository(IOfferRepository):
         # Ensure datetime fields have timezone info
         changed_at = model.changed_at.replace(tzinfo=timezone.utc) if model.changed_at else None
 
-        return OfferHistory(
+        return self.hydrator.build(
+            OfferHistory,
             id=UUID(model.id),
             offer_id=UUID(model.offer_id),
             version=model.version,
             status=OfferStatus(model.status),
-            margin=Decimal(str(model.margin)).quantize(Decimal('0.0001')),
-            final_price=Decimal(str(model.final_price)).quantize(Decimal('0.01')),
+            margin=_to_decimal(model.margin, _MARGIN_PLACES),
+            final_price=_to_amount(model.final_price),
             fun_fact=model.fun_fact,
             metadata=model.extra_data or {},
             changed_at=changed_at,
@@ -1,5 +1,6 @@
 """Route repository implementation."""
 from datetime import datetime, timezone
+from decimal import Decimal
 from typing import Dict, List, Optional, Set
 from uuid import UUID
 
@@ -10,18 +11,20 @@ from sqlalchemy import cast, Float
 from src.domain.entities.route import Route, RouteMetadata, RouteStatus
 from src.domain.interfaces.repositories.route_repository import RouteRepository as RouteRepositoryInterface
 from src.domain.interfaces.exceptions.repository_errors import EntityNotFoundError
-from src.domain.value_objects import Location, EmptyDriving
+from src.domain.value_objects import CountrySegment, Location, EmptyDriving
 from src.infrastructure.database import get_db
 from src.infrastructure.logging import get_logger
 from src.infrastructure.models import Route as RouteModel
+from src.infrastructure.repositories.hydration import EntityHydrator, get_entity_hydrator
 
 
 class RouteRepository(RouteRepositoryInterface):
     """Repository for managing route entities."""
 
-    def __init__(self):
+    def __init__(self, hydrator: Optional[EntityHydrator] = None):
         """Initialize repository."""
         self.db = get_db()
+        self.hydrator = hydrator or get_entity_hydrator()
 
     def create(self, entity: Route) -> Route:
         """Create a new route."""
@@ -36,6 +39,7 @@ class RouteRepository(RouteRepositoryInterface):
             distance_km=entity.distance_km,
             duration_hours=entity.duration_hours,
             empty_driving=entity.empty_driving.model_dump() if entity.empty_driving else None,
+            country_segments=[segment.model_dump(mode="json") for segment in entity.country_segments],
             is_feasible=entity.is_feasible,
             status=entity.status,
             is_active=entity.is_active,
@@ -78,6 +82,7 @@ class RouteRepository(RouteRepositoryInterface):
             "distance_km": entity.distance_km,
             "duration_hours": entity.duration_hours,
             "empty_driving": entity.empty_driving.model_dump() if entity.empty_driving else None,
+            "country_segments": [segment.model_dump(mode="json") for segment in entity.country_segments],
             "is_feasible": entity.is_feasible,
             "status": entity.status,
             "is_active": entity.is_active,
@@ -234,26 +239,47 @@ class RouteRepository(RouteRepositoryInterface):
         if not model:
             return None
 
+        build = self.hydrator.build
+
         # Create EmptyDriving if present
         empty_driving = None
         if model.empty_driving:
             origin_data = model.empty_driving.get("origin", {})
-            empty_driving = EmptyDriving(
+            empty_driving = build(
+                EmptyDriving,
                 distance_km=model.empty_driving.get("distance_km", 0),
                 duration_hours=model.empty_driving.get("duration_hours", 0),
-                origin=Location(**origin_data)
+                origin=build(Location, **origin_data)
+            )
+        
+        # Decimals are stored as strings so segment amounts round-trip exactly
+        country_segments = [
+            build(
+                CountrySegment,
+                country_code=segment["country_code"],
+                distance=Decimal(str(segment["distance"])),
+                duration_hours=Decimal(str(segment["duration_hours"])),
+                toll_rates={
+                    road: Decimal(str(rate))
+                    for road, rate in segment.get("toll_rates", {}).items()
+                },
+                has_tolls=segment.get("has_tolls", False)
             )
+            for segment in model.country_segments or []
+        ]
         
         # Create RouteMetadata if present
         metadata = None
         if model.extra_data:
-            metadata = RouteMetadata(
+            metadata = build(
+                RouteMetadata,
                 version=model.extra_data.get("version", ""),
                 tags=model.extra_data.get("tags", []),
                 notes=model.extra_data.get("notes", "")
             )
         
-        return Route(
+        return build(
+            Route,
             id=UUID(model.id),
             origin=model.origin,
             destination=model.destination,
@@ -263,6 +289,7 @@ class RouteRepository(RouteRepositoryInterface):
             cargo_id=UUID(model.cargo_id) if model.cargo_id else None,
             distance_km=model.distance_km,
             duration_hours=model.duration_hours,
+            country_segments=country_segments,
             empty_driving=empty_driving,
             is_feasible=model.is_feasible,
             status=model.status,
@@ -0,0 +1,138 @@
+"""Snapping of coordinates to cells for cache keys.
+
+Pickup points for the same site arrive with slightly different coordinates
+depending on where they were entered. Snapping both to the same cell lets
+them share cached responses. Two methods are available:
+
+- ``grid``: cells of roughly ``tolerance_m`` by ``tolerance_m``, with the
+  longitude step widened by latitude so cells stay square on the ground
+- ``geohash``: the coarsest geohash whose cells are no larger than the
+  tolerance
+
+Points on either side of a cell edge still get different keys, however
+close together they are; snapping raises the hit rate, it does not
+guarantee that all points within the tolerance share a key.
+"""
+from math import cos, floor, radians
+from typing import Tuple, Union
+
+_METERS_PER_DEG_LAT = 111_320.0
+_GEOHASH_ALPHABET = "0123456789bcdefghjkmnpqrstuvwxyz"
+
+# Approximate (height, width) in meters of geohash cells at the equator
+_GEOHASH_CELL_METERS = {
+    1: (5_000_000, 5_000_000),
+    2: (625_000, 1_250_000),
+    3: (156_000, 156_000),
+    4: (19_500, 39_100),
+    5: (4_890, 4_890),
+    6: (610, 1_220),
+    7: (153, 153),
+    8: (19, 38),
+    9: (4.8, 4.8),
+    10: (0.6, 1.2),
+    11: (0.15, 0.15),
+    12: (0.019, 0.037)
+}
+
+SnappedCoordinate = Union[Tuple[float, float], str]
+
+
+class CoordinateSnapper:
+    """Maps coordinates to cells of a chosen size."""
+
+    METHODS = ("grid", "geohash")
+
+    def __init__(self, tolerance_m: float = 100.0, method: str = "grid"):
+        """Initialize the snapper.
+
+        Args:
+            tolerance_m: Cell size in meters; 0 disables snapping
+            method: "grid" or "geohash"
+        """
+        if tolerance_m < 0:
+            raise ValueError("Snapping tolerance cannot be negative")
+        if method not in self.METHODS:
+            raise ValueError(f"Unknown snapping method: {method}")
+
+        self.tolerance_m = tolerance_m
+        self.method = method
+        self._lat_step = tolerance_m / _METERS_PER_DEG_LAT
+        self._geohash_precision = next(
+            (
+                precision
+                for precision, (height, width) in sorted(_GEOHASH_CELL_METERS.items())
+                if max(height, width) <= tolerance_m
+            ),
+            max(_GEOHASH_CELL_METERS)
+        )
+
+    @property
+    def enabled(self) -> bool:
+        """Whether coordinates are snapped at all."""
+        return self.tolerance_m > 0
+
+    def snap(self, latitude: float, longitude: float) -> SnappedCoordinate:
+        """Get the cell of a coordinate.
+
+        Args:
+            latitude: Latitude in decimal degrees
+            longitude: Longitude in decimal degrees
+
+        Returns:
+            Cell centre for the grid method, or the geohash string
+        """
+        if self.method == "geohash":
+            return geohash_encode(latitude, longitude, self._geohash_precision)
+
+        row = floor(latitude / self._lat_step)
+        center_lat = (row + 0.5) * self._lat_step
+        # Widen the longitude step with latitude; every point in the row
+        # uses the row centre so the step is the same for all of them
+        lng_step = self._lat_step / max(cos(radians(center_lat)), 0.01)
+        column = floor(longitude / lng_step)
+        return (round(center_lat, 6), round((column + 0.5) * lng_step, 6))
+
+    def describe(self) -> str:
+        """Short description for stats and logs."""
+        if not self.enabled:
+            return "off"
+        if self.method == "geohash":
+            return f"geohash:{self._geohash_precision}"
+        return f"grid:{self.tolerance_m:g}m"
+
+
+def geohash_encode(latitude: float, longitude: float, precision: int) -> str:
+    """Encode a coordinate as a geohash.
+
+    Args:
+        latitude: Latitude in decimal degrees
+        longitude: Longitude in decimal degrees
+        precision: Number of characters
+
+    Returns:
+        Geohash string
+    """
+    lat_range = [-90.0, 90.0]
+    lng_range = [-180.0, 180.0]
+    chars = []
+    bits = 0
+    bit_count = 0
+    even = True
+    while len(chars) < precision:
+        # Bits alternate between longitude and latitude, starting with longitude
+        value, bounds = (longitude, lng_range) if even else (latitude, lat_range)
+        middle = (bounds[0] + bounds[1]) / 2
+        if value >= middle:
+            bits = (bits << 1) | 1
+            bounds[0] = middle
+        else:
+            bits <<= 1
+            bounds[1] = middle
+        even = not even
+        bit_count += 1
+        if bit_count == 5:
+            chars.append(_GEOHASH_ALPHABET[bits])
+            bits = 0
+            bit_count = 0
+    return "".join(chars)
@@ -0,0 +1,323 @@
+"""Offline country lookup for route coordinates.
+
+Maps a coordinate to an ISO 3166-1 alpha-2 country code using simplified
+border polygons. A uniform grid sits in front of the point-in-polygon tests:
+cells that no border passes near are resolved once and memoized, so the vast
+majority of lookups are a dict access. Only cells close to a border run the
+exact tests.
+
+Lookups within ``border_margin_km`` of a land border, or outside every
+known polygon, return None so that callers can fall back to a remote
+geocoder. Coastline edges take part in the polygon tests but not in the
+border margin.
+"""
+from functools import lru_cache
+from math import cos, floor, radians, sqrt
+from typing import Dict, List, Optional, Set, Tuple
+
+import numpy as np
+
+from src.infrastructure.data.country_borders import (
+    COASTLINES, COUNTRY_BORDERS, Point, Ring
+)
+
+Cell = Tuple[int, int]
+Edge = Tuple[float, float, float, float]
+
+_KM_PER_DEG_LAT = 110.574
+_KM_PER_DEG_LNG = 111.320
+
+
+class CountryBoundaryIndex:
+    """Grid-indexed point-in-polygon lookup of country codes."""
+
+    def __init__(
+        self,
+        borders: Optional[Dict[str, List[Ring]]] = None,
+        coastlines: Optional[List[List[Point]]] = None,
+        cell_size_deg: float = 0.5,
+        border_margin_km: float = 15.0
+    ):
+        """Initialize the index.
+
+        Args:
+            borders: Country polygons keyed by ISO code (defaults to COUNTRY_BORDERS)
+            coastlines: Chains whose edges are not land borders (defaults to COASTLINES)
+            cell_size_deg: Grid cell size in degrees
+            border_margin_km: Distance to a border below which lookups are ambiguous
+        """
+        if cell_size_deg <= 0:
+            raise ValueError("Cell size must be positive")
+        if border_margin_km < 0:
+            raise ValueError("Border margin cannot be negative")
+
+        self.cell_size_deg = cell_size_deg
+        self.border_margin_km = border_margin_km
+        self._rings: List[Tuple[str, Ring, Tuple[float, float, float, float]]] = []
+        self._ring_cells: Dict[Cell, List[int]] = {}
+        self._exact_cells: Set[Cell] = set()
+        self._border_edges: Dict[Cell, List[Edge]] = {}
+        self._interior_cells: Dict[Cell, Optional[str]] = {}
+        self._coast_edges: Set[Tuple[Point, Point]] = set()
+
+        for chain in (coastlines if coastlines is not None else COASTLINES):
+            for start, end in zip(chain, chain[1:]):
+                self._coast_edges.add((start, end))
+                self._coast_edges.add((end, start))
+
+        for country_code, rings in (borders if borders is not None else COUNTRY_BORDERS).items():
+            for ring in rings:
+                self._add_ring(country_code.upper(), ring)
+
+    @property
+    def countries(self) -> List[str]:
+        """Country codes covered by the index."""
+        return sorted({country for country, _, _ in self._rings})
+
+    def lookup(self, latitude: float, longitude: float) -> Optional[str]:
+        """Get the country code for a coordinate.
+
+        Args:
+            latitude: Latitude in decimal degrees
+            longitude: Longitude in decimal degrees
+
+        Returns:
+            ISO country code, or None if the point is near a border or
+            outside every known country
+        """
+        cell = self._cell(latitude, longitude)
+        if cell not in self._exact_cells:
+            # No edge passes through or near this cell, so every point in it
+            # shares the country of the cell centre.
+            if cell not in self._interior_cells:
+                half = self.cell_size_deg / 2
+                self._interior_cells[cell] = self._locate(
+                    cell[0] * self.cell_size_deg + half,
+                    cell[1] * self.cell_size_deg + half
+                )
+            return self._interior_cells[cell]
+
+        edges = self._border_edges.get(cell)
+        if edges and self._distance_to_edges_km(latitude, longitude, edges) < self.border_margin_km:
+            return None
+        return self._locate(latitude, longitude)
+
+    def lookup_many(self, latitudes: np.ndarray, longitudes: np.ndarray) -> List[Optional[str]]:
+        """Get country codes for many coordinates.
+
+        Grid cells are computed in bulk and each distinct cell away from
+        borders is resolved once. Points in border cells run the margin and
+        point-in-polygon tests as array operations, one cell at a time.
+
+        Args:
+            latitudes: Latitudes in decimal degrees
+            longitudes: Longitudes in decimal degrees
+
+        Returns:
+            Country code (or None) per coordinate, as in lookup
+        """
+        latitudes = np.asarray(latitudes, dtype=float)
+        longitudes = np.asarray(longitudes, dtype=float)
+        if latitudes.shape != longitudes.shape:
+            raise ValueError("Latitudes and longitudes must have the same shape")
+
+        # Pack each cell into one integer so that deduplication is a 1-d sort
+        rows = np.floor(latitudes.reshape(-1) / self.cell_size_deg).astype(np.int64)
+        columns = np.floor(longitudes.reshape(-1) / self.cell_size_deg).astype(np.int64)
+        keys, inverse = np.unique((rows << 32) + columns, return_inverse=True)
+        key_rows = (keys + (1 << 31)) >> 32
+        unique_cells = list(zip(key_rows.tolist(), (keys - (key_rows << 32)).tolist()))
+        exact = np.array([cell in self._exact_cells for cell in unique_cells], dtype=bool)
+        cell_countries = [
+            None if is_exact else self.lookup(
+                (cell[0] + 0.5) * self.cell_size_deg,
+                (cell[1] + 0.5) * self.cell_size_deg
+            )
+            for cell, is_exact in zip(unique_cells, exact)
+        ]
+
+        countries = [cell_countries[i] for i in inverse]
+        flat_lats, flat_lngs = latitudes.reshape(-1), longitudes.reshape(-1)
+        exact_positions = np.flatnonzero(exact[inverse])
+        order = exact_positions[np.argsort(inverse[exact_positions], kind="stable")]
+        if not len(order):
+            return countries
+        groups = np.split(order, np.flatnonzero(np.diff(inverse[order])) + 1)
+        for positions in groups:
+            cell = unique_cells[inverse[positions[0]]]
+            for position, country in zip(
+                positions,
+                self._locate_many(cell, flat_lats[positions], flat_lngs[positions])
+            ):
+                countries[position] = country
+        return countries
+
+    def _locate_many(self, cell: Cell, latitudes: np.ndarray, longitudes: np.ndarray) -> List[Optional[str]]:
+        """Resolve points of one border cell, as lookup does for each point."""
+        ambiguous = np.zeros(len(latitudes), dtype=bool)
+        edges = self._border_edges.get(cell)
+        if edges:
+            ambiguous = _distances_to_edges_km(latitudes, longitudes, np.array(edges)) < self.border_margin_km
+
+        matches: Dict[str, np.ndarray] = {}
+        for ring_id in self._ring_cells.get(cell, []):
+            country_code, ring, (min_lat, min_lng, max_lat, max_lng) = self._rings[ring_id]
+            in_box = (
+                (latitudes >= min_lat) & (latitudes <= max_lat)
+                & (longitudes >= min_lng) & (longitudes <= max_lng)
+            )
+            if not in_box.any():
+                continue
+            inside = np.zeros(len(latitudes), dtype=bool)
+            inside[in_box] = _points_in_ring(latitudes[in_box], longitudes[in_box], np.array(ring))
+            matches[country_code] = matches.get(country_code, inside) | inside
+
+        if not matches:
+            return [None] * len(latitudes)
+        codes = list(matches)
+        contained = np.stack([matches[code] for code in codes])
+        unique_match = (contained.sum(axis=0) == 1) & ~ambiguous
+        first = contained.argmax(axis=0)
+        return [codes[i] if ok else None for i, ok in zip(first.tolist(), unique_match.tolist())]
+
+    def _add_ring(self, country_code: str, ring: Ring) -> None:
+        """Register a polygon ring in the grid.
+
+        Args:
+            country_code: ISO country code the ring belongs to
+            ring: Polygon ring as (lat, lng) points
+        """
+        if len(ring) < 3:
+            raise ValueError(f"Ring for {country_code} needs at least 3 points")
+
+        lats = [lat for lat, _ in ring]
+        lngs = [lng for _, lng in ring]
+        bbox = (min(lats), min(lngs), max(lats), max(lngs))
+        ring_id = len(self._rings)
+        self._rings.append((country_code, ring, bbox))
+
+        for cell in self._cells_in_box(*bbox):
+            self._ring_cells.setdefault(cell, []).append(ring_id)
+
+        # Cells crossed by any edge need exact tests; cells within the border
+        # margin of a land border additionally need the distance check.
+        margin_lat = self.border_margin_km / _KM_PER_DEG_LAT
+        for i, (lat1, lng1) in enumerate(ring):
+            lat2, lng2 = ring[(i + 1) % len(ring)]
+            if ((lat1, lng1), (lat2, lng2)) in self._coast_edges:
+                self._exact_cells.update(self._cells_in_box(
+                    min(lat1, lat2), min(lng1, lng2), max(lat1, lat2), max(lng1, lng2)
+                ))
+                continue
+            lat_scale = max(cos(radians(max(abs(lat1), abs(lat2)) + margin_lat)), 0.01)
+            margin_lng = self.border_margin_km / (_KM_PER_DEG_LNG * lat_scale)
+            for cell in self._cells_in_box(
+                min(lat1, lat2) - margin_lat,
+                min(lng1, lng2) - margin_lng,
+                max(lat1, lat2) + margin_lat,
+                max(lng1, lng2) + margin_lng
+            ):
+                self._exact_cells.add(cell)
+                self._border_edges.setdefault(cell, []).append((lat1, lng1, lat2, lng2))
+
+    def _cell(self, latitude: float, longitude: float) -> Cell:
+        """Get the grid cell containing a coordinate."""
+        return (
+            floor(latitude / self.cell_size_deg),
+            floor(longitude / self.cell_size_deg)
+        )
+
+    def _cells_in_box(
+        self,
+        min_lat: float,
+        min_lng: float,
+        max_lat: float,
+        max_lng: float
+    ) -> List[Cell]:
+        """Get all grid cells overlapping a bounding box."""
+        lat_start, lng_start = self._cell(min_lat, min_lng)
+        lat_end, lng_end = self._cell(max_lat, max_lng)
+        return [
+            (i, j)
+            for i in range(lat_start, lat_end + 1)
+            for j in range(lng_start, lng_end + 1)
+        ]
+
+    def _locate(self, latitude: float, longitude: float) -> Optional[str]:
+        """Run point-in-polygon tests against the rings near a coordinate.
+
+        Returns:
+            Country code if exactly one country contains the point
+        """
+        matches = set()
+        for ring_id in self._ring_cells.get(self._cell(latitude, longitude), []):
+            country_code, ring, (min_lat, min_lng, max_lat, max_lng) = self._rings[ring_id]
+            if not (min_lat <= latitude <= max_lat and min_lng <= longitude <= max_lng):
+                continue
+            if _point_in_ring(latitude, longitude, ring):
+                matches.add(country_code)
+        return matches.pop() if len(matches) == 1 else None
+
+    @staticmethod
+    def _distance_to_edges_km(latitude: float, longitude: float, edges: List[Edge]) -> float:
+        """Get the approximate distance from a coordinate to the nearest edge."""
+        lng_scale = _KM_PER_DEG_LNG * cos(radians(latitude))
+        best = float("inf")
+        for lat1, lng1, lat2, lng2 in edges:
+            # Project onto a local equirectangular plane centred on the point
+            ax = (lng1 - longitude) * lng_scale
+            ay = (lat1 - latitude) * _KM_PER_DEG_LAT
+            bx = (lng2 - longitude) * lng_scale
+            by = (lat2 - latitude) * _KM_PER_DEG_LAT
+            dx, dy = bx - ax, by - ay
+            length_sq = dx * dx + dy * dy
+            t = 0.0 if length_sq == 0 else max(0.0, min(1.0, -(ax * dx + ay * dy) / length_sq))
+            px, py = ax + t * dx, ay + t * dy
+            best = min(best, px * px + py * py)
+        return sqrt(best)
+
+
+def _distances_to_edges_km(latitudes: np.ndarray, longitudes: np.ndarray, edges: np.ndarray) -> np.ndarray:
+    """Array version of CountryBoundaryIndex._distance_to_edges_km."""
+    lat, lng = latitudes[:, None], longitudes[:, None]
+    lng_scale = _KM_PER_DEG_LNG * np.cos(np.radians(lat))
+    ax = (edges[:, 1] - lng) * lng_scale
+    ay = (edges[:, 0] - lat) * _KM_PER_DEG_LAT
+    bx = (edges[:, 3] - lng) * lng_scale
+    by = (edges[:, 2] - lat) * _KM_PER_DEG_LAT
+    dx, dy = bx - ax, by - ay
+    length_sq = dx * dx + dy * dy
+    with np.errstate(divide="ignore", invalid="ignore"):
+        t = np.where(length_sq == 0, 0.0, np.clip(-(ax * dx + ay * dy) / length_sq, 0.0, 1.0))
+    px, py = ax + t * dx, ay + t * dy
+    return np.sqrt((px * px + py * py).min(axis=1))
+
+
+def _points_in_ring(latitudes: np.ndarray, longitudes: np.ndarray, ring: np.ndarray) -> np.ndarray:
+    """Array version of _point_in_ring."""
+    lat_i, lng_i = ring[:, 0], ring[:, 1]
+    lat_j, lng_j = np.roll(lat_i, 1), np.roll(lng_i, 1)
+    lat = latitudes[:, None]
+    spans = (lat_i > lat) != (lat_j > lat)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        crossing = lng_i + (lat - lat_i) * (lng_j - lng_i) / (lat_j - lat_i)
+    return ((spans & (longitudes[:, None] < crossing)).sum(axis=1) % 2) == 1
+
+
+def _point_in_ring(latitude: float, longitude: float, ring: Ring) -> bool:
+    """Even-odd ray casting test."""
+    inside = False
+    lat_j, lng_j = ring[-1]
+    for lat_i, lng_i in ring:
+        if (lat_i > latitude) != (lat_j > latitude):
+            crossing = lng_i + (latitude - lat_i) * (lng_j - lng_i) / (lat_j - lat_i)
+            if longitude < crossing:
+                inside = not inside
+        lat_j, lng_j = lat_i, lng_i
+    return inside
+
+
+@lru_cache
+def get_country_boundary_index() -> CountryBoundaryIndex:
+    """Get the shared country boundary index built from the bundled borders."""
+    return CountryBoundaryIndex()
@@ -0,0 +1,375 @@
+"""Asyncio Google Maps client with a process-wide rate limiter.
+
+Every request in the process goes through one pooled ``httpx.AsyncClient``
+and one token bucket sized to the API quota, so bursts from many services
+queue for tokens instead of tripping 429 responses. Transient failures are
+retried with full-jitter exponential backoff on the event loop; no thread
+ever blocks in ``time.sleep``.
+
+Synchronous code uses ``GoogleMapsClient``, a thin wrapper that runs the
+coroutines on a shared background event loop. It mirrors the
+``googlemaps.Client`` methods the services call, and raises the same
+``googlemaps.exceptions`` types.
+"""
+import asyncio
+import random
+import threading
+import time
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from functools import lru_cache
+from typing import Any, Coroutine, Dict, List, Optional, Sequence, Tuple, TypeVar, Union
+
+import httpx
+from googlemaps.exceptions import ApiError, HTTPError, Timeout, TransportError
+
+from src.infrastructure.logging import get_logger
+from src.settings import get_settings
+
+logger = get_logger()
+
+T = TypeVar("T")
+LatLng = Union[str, Tuple[float, float], Sequence[float]]
+
+BASE_URL = "https://maps.googleapis.com/maps/api"
+
+# API statuses that are worth retrying
+_RETRYABLE_STATUSES = {"OVER_QUERY_LIMIT", "UNKNOWN_ERROR"}
+
+
+class TokenBucket:
+    """Asyncio token bucket limiting requests per second."""
+
+    def __init__(self, rate: float, capacity: Optional[float] = None):
+        """Initialize the bucket.
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum burst size (defaults to one second of tokens)
+        """
+        if rate <= 0:
+            raise ValueError("Rate must be positive")
+        self.rate = rate
+        self.capacity = capacity or max(rate, 1.0)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self) -> None:
+        """Wait until a token is available and take it."""
+        async with self._lock:
+            self._refill()
+            if self._tokens < 1:
+                # Waiters queue on the lock, so tokens are handed out in order
+                await asyncio.sleep((1 - self._tokens) / self.rate)
+                self._refill()
+            self._tokens -= 1
+
+    def drain(self) -> None:
+        """Empty the bucket after the API reports the quota as exhausted."""
+        self._refill()
+        self._tokens = min(self._tokens, 0.0)
+
+    def _refill(self) -> None:
+        """Add the tokens accrued since the last update."""
+        now = time.monotonic()
+        self._tokens = min(self.capacity, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+
+class AsyncGoogleMapsClient:
+    """Asyncio client for the Google Maps web services."""
+
+    def __init__(
+        self,
+        api_key: str,
+        limiter: TokenBucket,
+        http_client: Optional[httpx.AsyncClient] = None,
+        max_retries: int = 3,
+        retry_delay: float = 1.0,
+        timeout: float = 10.0,
+        base_url: str = BASE_URL
+    ):
+        """Initialize the client.
+
+        Args:
+            api_key: Google Maps API key
+            limiter: Rate limiter shared by every client in the process
+            http_client: Optional pooled HTTP client
+            max_retries: Maximum attempts per request
+            retry_delay: Base delay for the exponential backoff in seconds
+            timeout: Timeout per HTTP request in seconds
+            base_url: API base URL
+        """
+        if max_retries < 1:
+            raise ValueError("At least one attempt is required")
+        self.api_key = api_key
+        self.limiter = limiter
+        self.max_retries = max_retries
+        self.retry_delay = retry_delay
+        self.timeout = timeout
+        self.base_url = base_url.rstrip("/")
+        self._http = http_client or httpx.AsyncClient(
+            timeout=timeout,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=20)
+        )
+        self._logger = logger.bind(service="google_maps_client")
+
+    async def directions(
+        self,
+        origin: LatLng,
+        destination: LatLng,
+        mode: str = "driving",
+        alternatives: bool = False,
+        units: str = "metric",
+        avoid: Optional[str] = None,
+        departure_time: Optional[Union[str, int]] = None,
+        language: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Get directions between two points.
+
+        Returns:
+            List of routes, empty if none was found
+        """
+        body = await self._request("directions", {
+            "origin": _format_latlng(origin),
+            "destination": _format_latlng(destination),
+            "mode": mode,
+            "alternatives": "true" if alternatives else "false",
+            "units": units,
+            "avoid": avoid,
+            "departure_time": departure_time,
+            "language": language
+        })
+        return body.get("routes", [])
+
+    async def distance_matrix(
+        self,
+        origins: Sequence[LatLng],
+        destinations: Sequence[LatLng],
+        mode: str = "driving",
+        units: str = "metric"
+    ) -> Dict[str, Any]:
+        """Get distances and durations between origins and destinations.
+
+        Returns:
+            Distance Matrix response with one row per origin
+        """
+        return await self._request("distancematrix", {
+            "origins": "|".join(_format_latlng(origin) for origin in origins),
+            "destinations": "|".join(_format_latlng(destination) for destination in destinations),
+            "mode": mode,
+            "units": units
+        })
+
+    async def geocode(self, address: str) -> List[Dict[str, Any]]:
+        """Geocode an address.
+
+        Returns:
+            List of geocoding results
+        """
+        body = await self._request("geocode", {"address": address})
+        return body.get("results", [])
+
+    async def reverse_geocode(self, latlng: LatLng) -> List[Dict[str, Any]]:
+        """Reverse geocode a coordinate.
+
+        Returns:
+            List of geocoding results
+        """
+        body = await self._request("geocode", {"latlng": _format_latlng(latlng)})
+        return body.get("results", [])
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client."""
+        await self._http.aclose()
+
+    async def _request(self, path: str, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Send a request with rate limiting and jittered retries.
+
+        Args:
+            path: API path below the base URL
+            params: Query parameters; None values are dropped
+
+        Returns:
+            Decoded response body with status OK or ZERO_RESULTS
+
+        Raises:
+            ApiError: If the API rejects the request
+            HTTPError: If the API returns an unexpected HTTP status
+            Timeout: If the request times out on the last attempt
+            TransportError: If the connection fails on the last attempt
+        """
+        query = {name: value for name, value in params.items() if value is not None}
+        query["key"] = self.api_key
+        url = f"{self.base_url}/{path}/json"
+
+        for attempt in range(self.max_retries):
+            await self.limiter.acquire()
+            try:
+                response = await self._http.get(url, params=query, timeout=self.timeout)
+                if response.status_code == 429:
+                    self.limiter.drain()
+                    raise HTTPError(response.status_code)
+                if response.status_code >= 500:
+                    raise HTTPError(response.status_code)
+                if response.status_code != 200:
+                    # Client errors will not succeed on retry
+                    raise _Fatal(HTTPError(response.status_code))
+
+                body = response.json()
+                status = body.get("status", "OK")
+                if status in ("OK", "ZERO_RESULTS"):
+                    return body
+                error = ApiError(status, body.get("error_message"))
+                if status not in _RETRYABLE_STATUSES:
+                    raise _Fatal(error)
+                if status == "OVER_QUERY_LIMIT":
+                    self.limiter.drain()
+                raise error
+            except _Fatal as fatal:
+                raise fatal.error
+            except (ApiError, HTTPError, httpx.TimeoutException, httpx.TransportError) as e:
+                if attempt == self.max_retries - 1:
+                    raise _translate(e)
+                # Full jitter keeps concurrent retries from arriving in waves
+                delay = random.uniform(0, self.retry_delay * (2 ** attempt))
+                self._logger.warning(
+                    "Google Maps request failed, retrying",
+                    path=path,
+                    error=str(e),
+                    attempt=attempt + 1,
+                    retry_delay=round(delay, 3)
+                )
+                await asyncio.sleep(delay)
+        raise AssertionError("unreachable")
+
+
+class _Fatal(Exception):
+    """Wraps an error that must not be retried."""
+
+    def __init__(self, error: Exception):
+        super().__init__(str(error))
+        self.error = error
+
+
+def _translate(error: Exception) -> Exception:
+    """Map transport errors to googlemaps exceptions."""
+    if isinstance(error, httpx.TimeoutException):
+        return Timeout()
+    if isinstance(error, httpx.TransportError):
+        return TransportError(error)
+    return error
+
+
+def _format_latlng(value: LatLng) -> str:
+    """Format a coordinate pair or address for a query string."""
+    if isinstance(value, str):
+        return value
+    latitude, longitude = value
+    return f"{latitude},{longitude}"
+
+
+class _EventLoopThread:
+    """Event loop running on a daemon thread for synchronous callers."""
+
+    def __init__(self):
+        self.loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(
+            target=self.loop.run_forever,
+            name="google-maps-loop",
+            daemon=True
+        )
+        self._thread.start()
+
+    def run(self, coro: Coroutine[Any, Any, T], timeout: Optional[float] = None) -> T:
+        """Run a coroutine on the loop and wait for its result.
+
+        Args:
+            coro: Coroutine to run
+            timeout: Optional time limit in seconds; the coroutine is
+                cancelled when it expires
+
+        Returns:
+            Coroutine result
+
+        Raises:
+            Timeout: If the time limit expires
+        """
+        if threading.current_thread() is self._thread:
+            coro.close()
+            raise RuntimeError("Cannot block the Google Maps event loop from within itself")
+        future = asyncio.run_coroutine_threadsafe(coro, self.loop)
+        try:
+            return future.result(timeout)
+        except FutureTimeoutError:
+            future.cancel()
+            raise Timeout()
+
+
+@lru_cache
+def get_event_loop_thread() -> _EventLoopThread:
+    """Get the background event loop shared by synchronous clients."""
+    return _EventLoopThread()
+
+
+@lru_cache
+def get_rate_limiter() -> TokenBucket:
+    """Get the token bucket shared by every Google Maps client in the process."""
+    settings = get_settings().api
+    return TokenBucket(rate=settings.gmaps_qps)
+
+
+@lru_cache
+def get_async_maps_client(api_key: str) -> AsyncGoogleMapsClient:
+    """Get the pooled async client for an API key.
+
+    The client is bound to the shared background event loop; coroutines
+    must be run there (``GoogleMapsClient`` does this).
+    """
+    settings = get_settings().api
+    return AsyncGoogleMapsClient(
+        api_key=api_key,
+        limiter=get_rate_limiter(),
+        max_retries=settings.gmaps_max_retries,
+        retry_delay=settings.gmaps_retry_delay,
+        timeout=settings.gmaps_timeout
+    )
+
+
+class GoogleMapsClient:
+    """Synchronous wrapper over the shared async client."""
+
+    def __init__(
+        self,
+        api_key: str,
+        async_client: Optional[AsyncGoogleMapsClient] = None,
+        timeout: Optional[float] = None
+    ):
+        """Initialize the wrapper.
+
+        Args:
+            api_key: Google Maps API key
+            async_client: Optional async client (defaults to the shared one)
+            timeout: Optional time limit per call including retries
+        """
+        if not api_key:
+            raise ValueError("Google Maps API key is required")
+        self.async_client = async_client or get_async_maps_client(api_key)
+        self.timeout = timeout
+        self._loop = get_event_loop_thread()
+
+    def directions(self, *args: Any, **kwargs: Any) -> List[Dict[str, Any]]:
+        """Get directions; see AsyncGoogleMapsClient.directions."""
+        return self._loop.run(self.async_client.directions(*args, **kwargs), self.timeout)
+
+    def distance_matrix(self, *args: Any, **kwargs: Any) -> Dict[str, Any]:
+        """Get a distance matrix; see AsyncGoogleMapsClient.distance_matrix."""
+        return self._loop.run(self.async_client.distance_matrix(*args, **kwargs), self.timeout)
+
+    def geocode(self, *args: Any, **kwargs: Any) -> List[Dict[str, Any]]:
+        """Geocode an address; see AsyncGoogleMapsClient.geocode."""
+        return self._loop.run(self.async_client.geocode(*args, **kwargs), self.timeout)
+
+    def reverse_geocode(self, *args: Any, **kwargs: Any) -> List[Dict[str, Any]]:
+        """Reverse geocode a coordinate; see AsyncGoogleMapsClient.reverse_geocode."""
+        return self._loop.run(self.async_client.reverse_geocode(*args, **kwargs), self.timeout)
@@ -1,32 +1,61 @@
 """Google Maps service implementation."""
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from decimal import Decimal
-from typing import Dict, List, Optional, Any, Callable
+from typing import Dict, List, Optional, Any, Callable, Tuple, Union
 from uuid import UUID
-import time
-from functools import lru_cache
 
-import googlemaps
-from googlemaps.exceptions import ApiError, TransportError
+import numpy as np
+from googlemaps.exceptions import ApiError, HTTPError, Timeout, TransportError
 
-from src.domain.value_objects import Location, CountrySegment
+from src.domain.value_objects import (
+    ArrayDistanceMatrix, CountrySegment, DistanceMatrix, Location, RouteSummary
+)
 from src.domain.interfaces.services.location_service import LocationService, LocationServiceError
 from src.infrastructure.logging import get_logger
 from src.settings import get_settings
 from src.infrastructure.services.toll_rate_service import DefaultTollRateService
+from src.infrastructure.services.google_maps_client import GoogleMapsClient
+from src.infrastructure.services.country_boundary_index import (
+    CountryBoundaryIndex, get_country_boundary_index
+)
+from src.infrastructure.services.response_cache import PersistentResponseCache, get_response_cache
+from src.infrastructure.services.single_flight import SingleFlight, get_single_flight
 
 logger = get_logger()
 
+Coordinate = Tuple[float, float]
+
+# Country of a location that neither the offline index nor geocoding resolves
+UNKNOWN_COUNTRY = "unknown"
+
+
 class GoogleMapsService(LocationService):
     """Google Maps API implementation of LocationService."""
 
-    def __init__(self, api_key: Optional[str] = None, toll_rate_service: Optional[DefaultTollRateService] = None):
+    # Distance Matrix API limits per request
+    MAX_MATRIX_DIMENSION = 25
+    MAX_MATRIX_ELEMENTS = 100
+
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        toll_rate_service: Optional[DefaultTollRateService] = None,
+        country_index: Optional[CountryBoundaryIndex] = None,
+        response_cache: Optional[PersistentResponseCache] = None,
+        client: Optional[GoogleMapsClient] = None,
+        single_flight: Optional[SingleFlight] = None
+    ):
         """
         Initialize the Google Maps service.
 
         Args:
             api_key: Optional API key (defaults to settings.google_maps_api_key)
             toll_rate_service: Optional toll rate service (defaults to DefaultTollRateService)
+            country_index: Optional offline country lookup (defaults to the bundled borders)
+            response_cache: Optional response cache (defaults to the shared on-disk cache)
+            client: Optional maps client (defaults to the shared rate-limited client)
+            single_flight: Optional request coalescing group (defaults to the process-wide one)
 
         Raises:
             LocationServiceError: If API key is not found in settings or environment
@@ -39,12 +68,14 @@ class GoogleMapsService(LocationService):
         
         # Get API settings
         api_settings = settings.api
-        self.max_retries = api_settings.gmaps_max_retries
-        self.retry_delay = api_settings.gmaps_retry_delay
         self.cache_ttl = api_settings.gmaps_cache_ttl
+        self.response_cache = response_cache or get_response_cache()
+        self.matrix_max_workers = api_settings.gmaps_matrix_max_workers
+        # Identical requests in flight from other threads (UI, bulk jobs) share one call
+        self.single_flight = single_flight or get_single_flight("google_maps")
         
         try:
-            self.client = googlemaps.Client(key=self.api_key)
+            self.client = client or GoogleMapsClient(self.api_key)
             self._logger.info("Google Maps client initialized successfully")
         except Exception as e:
             self._logger.error("Failed to initialize Google Maps client", error=str(e))
@@ -53,9 +84,16 @@ class GoogleMapsService(LocationService):
         # Initialize toll rate service
         self.toll_rate_service = toll_rate_service or DefaultTollRateService()
 
+        # Steps are attributed to countries offline; reverse geocoding is only
+        # used for points the index cannot resolve (near borders, uncovered areas)
+        self.country_index = country_index or get_country_boundary_index()
+
     def _make_request(self, request_func: callable, *args, **kwargs) -> Dict[str, Any]:
         """
-        Make a request to Google Maps API with retry logic.
+        Make a request to Google Maps API.
+        
+        Rate limiting and jittered retries happen in the shared client; this
+        only maps its errors to LocationServiceError.
         
         Args:
             request_func: Google Maps API function to call
@@ -66,53 +104,92 @@ class GoogleMapsService(LocationService):
             Dict: API response
             
         Raises:
-            LocationServiceError: If request fails after retries
+            LocationServiceError: If the client gives up on the request
+        """
+        try:
+            return request_func(*args, **kwargs)
+        except (ApiError, HTTPError, Timeout, TransportError) as e:
+            # The client has already retried if the error was retryable
+            self._logger.error("Google Maps API error", 
+                             error=str(e), 
+                             error_type=type(e).__name__)
+            raise LocationServiceError(f"Google Maps API request failed ({type(e).__name__}): {str(e)}")
+        except Exception as e:
+            self._logger.error("Unexpected error in Google Maps request", error=str(e))
+            raise LocationServiceError(f"Unexpected error in Google Maps request: {str(e)}")
+
+    def _cached_request(
+        self,
+        operation: str,
+        request_func: Callable[..., Any],
+        precise: bool = False,
+        **params: Any
+    ) -> Any:
+        """
+        Make a request through the response cache, coalescing identical requests in flight.
+        
+        Args:
+            operation: API operation name used in the cache key
+            request_func: Google Maps API function to call on a miss
+            precise: Only reuse responses for the exact coordinates, skipping snapping
+            **params: Request parameters
+            
+        Returns:
+            Cached or freshly fetched response
         """
-        for attempt in range(self.max_retries):
-            try:
-                return request_func(*args, **kwargs)
-            except (ApiError, Timeout, TransportError) as e:
-                if attempt == self.max_retries - 1:
-                    self._logger.error("Google Maps API error", 
-                                     error=str(e), 
-                                     attempt=attempt + 1, 
-                                     max_retries=self.max_retries)
-                    raise LocationServiceError(f"Google Maps API error after {self.max_retries} retries: {str(e)}")
-                self._logger.warning("Google Maps API error, retrying", 
-                                   error=str(e), 
-                                   attempt=attempt + 1, 
-                                   retry_delay=self.retry_delay * (attempt + 1))
-                time.sleep(self.retry_delay * (attempt + 1))
-            except Exception as e:
-                self._logger.error("Unexpected error in Google Maps request", error=str(e))
-                raise LocationServiceError(f"Unexpected error in Google Maps request: {str(e)}")
-
-    @lru_cache(maxsize=128)
-    def _get_route_data_cached(self, origin_coords: tuple, destination_coords: tuple) -> Dict[str, Any]:
-        """Get cached route data from Google Maps using coordinates."""
-        return self._make_request(
+        key = self.response_cache.make_key(operation, precise=precise, **params)
+        return self.single_flight.do(
+            key,
+            lambda: self.response_cache.get_or_fetch(
+                operation,
+                lambda **request_params: self._make_request(request_func, **request_params),
+                precise=precise,
+                **params
+            )
+        )
+
+    def _get_route_data(
+        self,
+        origin: Location,
+        destination: Location,
+        precise: bool = False
+    ) -> List[Dict[str, Any]]:
+        """Get route data from Google Maps, served from the response cache when possible."""
+        return self._cached_request(
+            "directions",
             self.client.directions,
-            origin=origin_coords,
-            destination=destination_coords,
+            precise=precise,
+            origin=(origin.latitude, origin.longitude),
+            destination=(destination.latitude, destination.longitude),
             mode="driving",
             alternatives=False,
             units="metric"
         )
 
-    def _get_route_data(self, origin: Location, destination: Location) -> Dict[str, Any]:
-        """Get route data from Google Maps."""
-        origin_coords = (origin.latitude, origin.longitude)
-        destination_coords = (destination.latitude, destination.longitude)
-        return self._get_route_data_cached(origin_coords, destination_coords)
-
-    def calculate_distance(self, origin: Location, destination: Location) -> float:
-        """Calculate distance between two locations using Google Maps Distance Matrix API."""
-        self._logger.info("Calculating distance", 
-                         origin=origin.dict(), 
-                         destination=destination.dict())
+    def _get_distance_matrix_element(
+        self,
+        origin: Location,
+        destination: Location,
+        precise: bool = False
+    ) -> Dict[str, Any]:
+        """
+        Get the distance matrix element for a single origin/destination pair.
         
-        result = self._make_request(
+        Args:
+            origin: Starting location
+            destination: End location
+            precise: Skip coordinate snapping in the cache key
+            
+        Returns:
+            Distance matrix element with distance and duration
+            
+        Raises:
+            LocationServiceError: If no route is found
+        """
+        result = self._cached_request(
+            "distance_matrix",
             self.client.distance_matrix,
+            precise=precise,
             origins=[(origin.latitude, origin.longitude)],
             destinations=[(destination.latitude, destination.longitude)],
             mode="driving",
@@ -128,39 +205,185 @@ class GoogleMapsService(LocationService):
             self._logger.error("Route calculation failed", elements=elements)
             raise LocationServiceError("Route calculation failed")
 
+        return elements[0]
+
+    def calculate_distance(self, origin: Location, destination: Location, precise: bool = False) -> float:
+        """Calculate distance between two locations using Google Maps Distance Matrix API.
+
+        Cached responses for nearby coordinates are reused unless precise is set.
+        """
+        self._logger.info("Calculating distance", 
+                         origin=origin.dict(), 
+                         destination=destination.dict())
+        
+        element = self._get_distance_matrix_element(origin, destination, precise)
+
         # Convert meters to kilometers
-        distance = elements[0]['distance']['value'] / 1000.0
+        distance = element['distance']['value'] / 1000.0
         self._logger.info("Distance calculated successfully", distance_km=distance)
         return distance
 
-    def calculate_duration(self, origin: Location, destination: Location) -> float:
-        """Calculate duration between two locations using Google Maps Distance Matrix API."""
+    def calculate_duration(self, origin: Location, destination: Location, precise: bool = False) -> float:
+        """Calculate duration between two locations using Google Maps Distance Matrix API.
+
+        Cached responses for nearby coordinates are reused unless precise is set.
+        """
         self._logger.info("Calculating duration", 
                          origin=origin.dict(), 
                          destination=destination.dict())
         
-        result = self._make_request(
-            self.client.distance_matrix,
-            origins=[(origin.latitude, origin.longitude)],
-            destinations=[(destination.latitude, destination.longitude)],
-            mode="driving",
-            units="metric"
-        )
-
-        if not result.get('rows'):
-            self._logger.error("No route found")
-            raise LocationServiceError("No route found")
-
-        elements = result['rows'][0]['elements']
-        if not elements or elements[0].get('status') != 'OK':
-            self._logger.error("Route calculation failed", elements=elements)
-            raise LocationServiceError("Route calculation failed")
+        element = self._get_distance_matrix_element(origin, destination, precise)
 
         # Convert seconds to hours
-        duration = elements[0]['duration']['value'] / 3600.0
+        duration = element['duration']['value'] / 3600.0
         self._logger.info("Duration calculated successfully", duration_hours=duration)
         return duration
 
+    def get_distance_matrix(
+        self,
+        origins: List[Location],
+        destinations: List[Location],
+        as_array: bool = False,
+        precise: bool = False
+    ) -> Union[DistanceMatrix, ArrayDistanceMatrix]:
+        """
+        Get distances and durations for every origin/destination pair.
+        
+        Repeated coordinates are requested once, the unique pairs are split
+        into blocks within the Distance Matrix API limits, and the blocks are
+        fetched concurrently. Pairs without a route get an infinite distance
+        and duration and mark the matrix as partial.
+        
+        Args:
+            origins: Starting locations
+            destinations: End locations
+            as_array: Whether to return an ArrayDistanceMatrix
+            precise: Skip coordinate snapping in the cache keys
+            
+        Returns:
+            Distance matrix indexed by origin and destination position
+            
+        Raises:
+            LocationServiceError: If matrix calculation fails
+        """
+        if not origins or not destinations:
+            raise LocationServiceError("Origins and destinations are required")
+
+        origin_points, origin_index = self._unique_coordinates(origins)
+        destination_points, destination_index = self._unique_coordinates(destinations)
+
+        # Fill whole destination blocks first so wide matrices need fewer requests
+        destination_block = min(self.MAX_MATRIX_DIMENSION, len(destination_points))
+        origin_block = min(self.MAX_MATRIX_DIMENSION, self.MAX_MATRIX_ELEMENTS // destination_block)
+        blocks = [
+            (i, j)
+            for i in range(0, len(origin_points), origin_block)
+            for j in range(0, len(destination_points), destination_block)
+        ]
+
+        self._logger.info(
+            "Calculating distance matrix",
+            origins=len(origins),
+            destinations=len(destinations),
+            unique_origins=len(origin_points),
+            unique_destinations=len(destination_points),
+            requests=len(blocks)
+        )
+
+        def fetch(block: Tuple[int, int]) -> Dict[str, Any]:
+            i, j = block
+            return self._cached_request(
+                "distance_matrix",
+                self.client.distance_matrix,
+                precise=precise,
+                origins=origin_points[i:i + origin_block],
+                destinations=destination_points[j:j + destination_block],
+                mode="driving",
+                units="metric"
+            )
+
+        try:
+            with ThreadPoolExecutor(max_workers=min(self.matrix_max_workers, len(blocks))) as executor:
+                results = list(executor.map(fetch, blocks))
+        except LocationServiceError:
+            raise
+        except Exception as e:
+            self._logger.error("Distance matrix calculation failed", error=str(e))
+            raise LocationServiceError(f"Distance matrix calculation failed: {str(e)}")
+
+        unique_distances = np.full((len(origin_points), len(destination_points)), np.inf)
+        unique_durations = np.full((len(origin_points), len(destination_points)), np.inf)
+        for (i, j), result in zip(blocks, results):
+            for row_offset, row in enumerate((result or {}).get('rows', [])):
+                for col_offset, element in enumerate(row.get('elements', [])):
+                    if element.get('status') != 'OK':
+                        continue
+                    # Convert meters to kilometers and seconds to hours
+                    unique_distances[i + row_offset, j + col_offset] = element['distance']['value'] / 1000.0
+                    unique_durations[i + row_offset, j + col_offset] = element['duration']['value'] / 3600.0
+
+        # Fan unique pairs back out to the caller's positions
+        pairs = np.ix_(origin_index, destination_index)
+        distances = unique_distances[pairs]
+        durations = unique_durations[pairs]
+        unreachable = int(np.isinf(distances).sum())
+
+        # Resolve each unique origin once; geocoding only runs for index misses
+        point_countries: Dict[int, str] = {}
+        codes: Dict[str, int] = {}
+        country_of_origins = []
+        for origin, point in zip(origins, origin_index):
+            if point not in point_countries:
+                point_countries[point] = self._location_country(origin)
+            country_of_origins.append(codes.setdefault(point_countries[point], len(codes)))
+        origin_countries = np.array(country_of_origins, dtype=np.int64)
+
+        if unreachable:
+            self._logger.warning("Distance matrix has unreachable pairs", unreachable=unreachable)
+
+        status = "PARTIAL" if unreachable else "OK"
+        error_message = f"No route found for {unreachable} pairs" if unreachable else None
+        if as_array:
+            return ArrayDistanceMatrix(
+                origins=origins,
+                destinations=destinations,
+                distances=distances,
+                durations=durations,
+                country_index=np.repeat(origin_countries[:, None], len(destinations), axis=1),
+                country_codes=tuple(codes),
+                status=status,
+                error_message=error_message
+            )
+
+        country_codes = list(codes)
+        return DistanceMatrix(
+            origins=origins,
+            destinations=destinations,
+            distances=distances.tolist(),
+            durations=durations.tolist(),
+            countries=[[country_codes[code]] * len(destinations) for code in origin_countries],
+            status=status,
+            error_message=error_message
+        )
+
+    @staticmethod
+    def _unique_coordinates(locations: List[Location]) -> Tuple[List[Coordinate], List[int]]:
+        """
+        Collapse locations sharing coordinates.
+        
+        Args:
+            locations: Locations in caller order
+            
+        Returns:
+            Unique coordinates and, for each location, its index into them
+        """
+        positions: Dict[Coordinate, int] = {}
+        index = []
+        for location in locations:
+            point = (location.latitude, location.longitude)
+            index.append(positions.setdefault(point, len(positions)))
+        return list(positions), index
+
     def get_country_code(self, country: str) -> str:
         """Convert country name to ISO code."""
         country_codes = {
@@ -188,7 +411,78 @@ class GoogleMapsService(LocationService):
         }
         return country_codes.get(country, country)
 
-    def get_route_segments(self, origin: Location, destination: Location, include_tolls: bool = False) -> List[CountrySegment]:
+    def get_route_summary(
+        self,
+        origin: Location,
+        destination: Location,
+        include_tolls: bool = False,
+        precise: bool = False
+    ) -> RouteSummary:
+        """
+        Get distance, duration, legs and country segments from one directions request.
+        
+        Args:
+            origin: Starting location
+            destination: End location
+            include_tolls: Whether to include toll information
+            precise: Skip coordinate snapping in the cache key
+            
+        Returns:
+            Route summary with totals, raw legs and country segments
+            
+        Raises:
+            LocationServiceError: If route calculation fails
+        """
+        logger = get_logger(__name__).bind(
+            origin=origin.dict(),
+            destination=destination.dict()
+        )
+        
+        try:
+            route = self._get_route(origin, destination, precise)
+            legs = route['legs']
+            
+            # Leg totals are reported by the API; sum the steps if they are missing
+            distance_m = sum(
+                leg['distance']['value'] if 'distance' in leg
+                else sum(step['distance']['value'] for step in leg.get('steps', []))
+                for leg in legs
+            )
+            duration_s = sum(
+                leg['duration']['value'] if 'duration' in leg
+                else sum(step['duration']['value'] for step in leg.get('steps', []))
+                for leg in legs
+            )
+            
+            summary = RouteSummary(
+                origin=origin,
+                destination=destination,
+                distance_km=Decimal(str(distance_m)) / Decimal('1000'),
+                duration_hours=Decimal(str(duration_s)) / Decimal('3600'),
+                legs=legs,
+                country_segments=self._build_country_segments(legs, include_tolls),
+                polyline=route.get('overview_polyline', {}).get('points')
+            )
+            
+            logger.info(
+                "Route summary calculated",
+                distance_km=float(summary.distance_km),
+                duration_hours=float(summary.duration_hours),
+                segments=len(summary.country_segments)
+            )
+            return summary
+            
+        except Exception as e:
+            logger.error("Failed to get route summary", error=str(e))
+            raise LocationServiceError(f"Failed to get route summary: {str(e)}")
+
+    def get_route_segments(
+        self,
+        origin: Location,
+        destination: Location,
+        include_tolls: bool = False,
+        precise: bool = False
+    ) -> List[CountrySegment]:
         """
         Get route segments for a route.
         
@@ -196,6 +490,7 @@ class GoogleMapsService(LocationService):
             origin: Starting location
             destination: End location
             include_tolls: Whether to include toll information
+            precise: Skip coordinate snapping in the cache key
             
         Returns:
             List of country segments with distances
@@ -209,81 +504,156 @@ class GoogleMapsService(LocationService):
         )
         
         try:
-            # Get route data from Google Maps
-            route_data = self._get_route_data(origin, destination)
-            if not route_data:
-                raise LocationServiceError("No route found")
+            route = self._get_route(origin, destination, precise)
+            return self._build_country_segments(route['legs'], include_tolls)
             
-            # Get total distance and duration
-            total_distance = Decimal(str(self.calculate_distance(origin, destination)))
-            total_duration = Decimal(str(self.calculate_duration(origin, destination)))
+        except Exception as e:
+            logger.error("Failed to get route segments", error=str(e))
+            raise LocationServiceError(f"Failed to get route segments: {str(e)}")
+
+    def _get_route(self, origin: Location, destination: Location, precise: bool = False) -> Dict[str, Any]:
+        """
+        Get the first directions result for a route.
+        
+        Args:
+            origin: Starting location
+            destination: End location
+            precise: Skip coordinate snapping in the cache key
             
-            # Process route steps
-            segments = []
-            current_country = None
-            current_distance = Decimal('0')
-            current_duration = Decimal('0')
+        Returns:
+            Route with at least one leg
             
-            if not route_data[0].get('legs', []):
-                raise LocationServiceError("Invalid route data: no legs found")
-                
-            for leg in route_data[0]['legs']:
-                for step in leg.get('steps', []):
-                    # Get location details
-                    end_location = step['end_location']
-                    result = self._make_request(
-                        self.client.reverse_geocode,
-                        (end_location['lat'], end_location['lng'])
-                    )
-                    
-                    if not result:
-                        continue
-                        
-                    # Extract country from geocoding result
-                    country = None
-                    for component in result[0]['address_components']:
-                        if 'country' in component['types']:
-                            country = component['long_name']
-                            break
-                    
-                    if not country:
-                        continue
-                        
-                    # Convert distance to kilometers and duration to hours
-                    step_distance = Decimal(str(step['distance']['value'])) / Decimal('1000')
-                    step_duration = Decimal(str(step['duration']['value'])) / Decimal('3600')  # Convert seconds to hours
+        Raises:
+            LocationServiceError: If no route or no legs are found
+        """
+        route_data = self._get_route_data(origin, destination, precise)
+        if not route_data:
+            raise LocationServiceError("No route found")
+        if not route_data[0].get('legs', []):
+            raise LocationServiceError("Invalid route data: no legs found")
+        return route_data[0]
+
+    def _build_country_segments(self, legs: List[Dict[str, Any]], include_tolls: bool) -> List[CountrySegment]:
+        """
+        Split route steps into consecutive country segments.
+        
+        Args:
+            legs: Route legs from the directions response
+            include_tolls: Whether to include toll information
+            
+        Returns:
+            List of country segments with distances
+        """
+        segments = []
+        current_country = None
+        current_distance = Decimal('0')
+        current_duration = Decimal('0')
+        
+        geocode_fallbacks = 0
+        for leg in legs:
+            for step in leg.get('steps', []):
+                end_location = step['end_location']
+                country = self.country_index.lookup(end_location['lat'], end_location['lng'])
+                if not country:
+                    geocode_fallbacks += 1
+                    country = self._reverse_geocode_country(end_location['lat'], end_location['lng'])
+
+                if not country:
+                    continue
                     
-                    if current_country != country:
-                        if current_country:
-                            # Add completed segment
-                            segments.append(CountrySegment(
-                                country_code=self.get_country_code(current_country),
-                                distance=current_distance,
-                                duration_hours=current_duration,
-                                has_tolls=self._check_for_tolls(current_country) if include_tolls else False
-                            ))
-                        # Start new segment
-                        current_country = country
-                        current_distance = step_distance
-                        current_duration = step_duration
-                    else:
-                        current_distance += step_distance
-                        current_duration += step_duration
+                # Convert distance to kilometers and duration to hours
+                step_distance = Decimal(str(step['distance']['value'])) / Decimal('1000')
+                step_duration = Decimal(str(step['duration']['value'])) / Decimal('3600')  # Convert seconds to hours
+                
+                if current_country != country:
+                    if current_country:
+                        # Add completed segment
+                        segments.append(CountrySegment(
+                            country_code=self.get_country_code(current_country),
+                            distance=current_distance,
+                            duration_hours=current_duration,
+                            has_tolls=self._check_for_tolls(current_country) if include_tolls else False
+                        ))
+                    # Start new segment
+                    current_country = country
+                    current_distance = step_distance
+                    current_duration = step_duration
+                else:
+                    current_distance += step_distance
+                    current_duration += step_duration
+        
+        # Add final segment
+        if current_country:
+            segments.append(CountrySegment(
+                country_code=self.get_country_code(current_country),
+                distance=current_distance,
+                duration_hours=current_duration,
+                has_tolls=self._check_for_tolls(current_country) if include_tolls else False
+            ))
+        
+        self._logger.info(
+            "Route segments calculated",
+            segments=len(segments),
+            geocode_fallbacks=geocode_fallbacks
+        )
+        return segments
+
+    def _location_country(self, location: Location) -> str:
+        """
+        Resolve the country code of a location.
+        
+        The offline index is tried first, then the location's own country,
+        then reverse geocoding.
+        
+        Args:
+            location: Location to resolve
             
-            # Add final segment
-            if current_country:
-                segments.append(CountrySegment(
-                    country_code=self.get_country_code(current_country),
-                    distance=current_distance,
-                    duration_hours=current_duration,
-                    has_tolls=self._check_for_tolls(current_country) if include_tolls else False
-                ))
+        Returns:
+            ISO country code, or UNKNOWN_COUNTRY if none of the sources has one
+        """
+        country = self.country_index.lookup(location.latitude, location.longitude)
+        if country:
+            return country
+        # Locations built without a country carry the "Unknown" placeholder
+        if location.country and location.country != "Unknown":
+            return self.get_country_code(location.country)
+        try:
+            country = self._reverse_geocode_country(location.latitude, location.longitude)
+        except LocationServiceError as e:
+            self._logger.warning(
+                "Country lookup failed",
+                latitude=location.latitude,
+                longitude=location.longitude,
+                error=str(e)
+            )
+            country = None
+        return country or UNKNOWN_COUNTRY
+
+    def _reverse_geocode_country(self, latitude: float, longitude: float) -> Optional[str]:
+        """
+        Resolve the country of a coordinate with the Geocoding API.
+        
+        Args:
+            latitude: Latitude in decimal degrees
+            longitude: Longitude in decimal degrees
             
-            return segments
+        Returns:
+            ISO country code, or None if the point has no country
+        """
+        result = self.single_flight.do(
+            ("reverse_geocode", round(latitude, 5), round(longitude, 5)),
+            lambda: self._make_request(
+                self.client.reverse_geocode,
+                (latitude, longitude)
+            )
+        )
+        if not result:
+            return None
             
-        except Exception as e:
-            logger.error("Failed to get route segments", error=str(e))
-            raise LocationServiceError(f"Failed to get route segments: {str(e)}")
+        for component in result[0]['address_components']:
+            if 'country' in component['types']:
+                return self.get_country_code(component['long_name'])
+        return None
 
     def validate_location(self, location: Location) -> bool:
         """
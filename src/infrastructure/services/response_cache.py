@@ -0,0 +1,324 @@
+"""Persistent cache for external API responses.
+
+Responses are stored in a SQLite database so that every worker process on a
+host, and every restart, reuses lookups that were already paid for. The
+database runs in WAL mode, which lets concurrent readers proceed while a
+single writer appends.
+
+Keys are built from the operation name plus its request parameters, with
+coordinates rounded so that float noise does not produce distinct keys.
+With a ``CoordinateSnapper`` coordinate pairs are snapped to cells instead,
+so nearby points (e.g. the same warehouse entered by hand and geocoded)
+share entries. Each entry also records the exact key of the request that
+filled it, which lets the stats report how many hits only snapping found.
+
+Responses are stored as serializer registry payloads, which load faster
+than JSON; rows written as JSON text by older versions are still read.
+"""
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional
+
+from src.infrastructure.services.serialization import get_serializer_registry
+from src.infrastructure.logging import get_logger
+from src.infrastructure.services.coordinate_snapping import CoordinateSnapper
+from src.settings import get_settings
+
+logger = get_logger()
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    operation TEXT NOT NULL,
+    payload TEXT NOT NULL,
+    expires_at REAL NOT NULL,
+    accessed_at REAL NOT NULL,
+    exact_key TEXT
+);
+CREATE INDEX IF NOT EXISTS ix_responses_expires_at ON responses (expires_at);
+CREATE INDEX IF NOT EXISTS ix_responses_accessed_at ON responses (accessed_at);
+"""
+
+
+class PersistentResponseCache:
+    """SQLite-backed response cache with TTL and LRU size bound."""
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        ttl: int = 3600,
+        max_entries: int = 10000,
+        coordinate_precision: int = 5,
+        snapper: Optional[CoordinateSnapper] = None
+    ):
+        """Initialize the cache.
+
+        Args:
+            path: Database file path; None keeps the cache in memory for this process
+            ttl: Entry time-to-live in seconds
+            max_entries: Maximum number of stored responses
+            coordinate_precision: Decimal places kept when normalizing coordinates
+            snapper: Optional snapper applied to coordinate pairs in keys
+        """
+        if ttl <= 0:
+            raise ValueError("Cache TTL must be positive")
+        if max_entries <= 0:
+            raise ValueError("Cache size must be positive")
+
+        self.path = path or ":memory:"
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.coordinate_precision = coordinate_precision
+        self.snapper = snapper if snapper is not None and snapper.enabled else None
+        self._logger = logger.bind(service="response_cache", path=self.path)
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._snapped_hits = 0
+        self._registry = get_serializer_registry()
+
+        if self.path != ":memory:":
+            directory = os.path.dirname(os.path.abspath(self.path))
+            os.makedirs(directory, exist_ok=True)
+
+        self._conn = sqlite3.connect(
+            self.path,
+            timeout=30.0,
+            check_same_thread=False,
+            isolation_level=None
+        )
+        if self.path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(responses)")}
+        if "exact_key" not in columns:
+            # Databases created before snapping lack the column
+            self._conn.execute("ALTER TABLE responses ADD COLUMN exact_key TEXT")
+
+    def make_key(self, operation: str, precise: bool = False, **params: Any) -> str:
+        """Build a cache key for a request.
+
+        Args:
+            operation: API operation name (e.g. "directions")
+            precise: Skip coordinate snapping for this key
+            **params: Request parameters
+
+        Returns:
+            Stable hex digest identifying the request
+        """
+        snap = self.snapper is not None and not precise
+        normalized = {
+            name: self._normalize(value, snap)
+            for name, value in params.items()
+        }
+        raw = json.dumps([operation, normalized], sort_keys=True, default=str)
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def get(self, key: str, exact_key: Optional[str] = None) -> Optional[Any]:
+        """Get a cached response.
+
+        Args:
+            key: Cache key from make_key
+            exact_key: Optional unsnapped key of the request, used to count
+                hits that only snapping found
+
+        Returns:
+            Cached response or None if missing or expired
+        """
+        now = time.time()
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT payload, expires_at, exact_key FROM responses WHERE key = ?",
+                (key,)
+            ).fetchone()
+            if row is None or row[1] <= now:
+                self._misses += 1
+                return None
+            self._conn.execute(
+                "UPDATE responses SET accessed_at = ? WHERE key = ?",
+                (now, key)
+            )
+            self._hits += 1
+            if exact_key is not None and row[2] is not None and row[2] != exact_key:
+                self._snapped_hits += 1
+        try:
+            return self._decode(row[0])
+        except ValueError as e:
+            # Written with another model schema version
+            self._logger.debug("Ignoring cached response", key=key, error=str(e))
+            with self._lock:
+                self._hits -= 1
+                self._misses += 1
+            return None
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        operation: str = "",
+        ttl: Optional[int] = None,
+        exact_key: Optional[str] = None
+    ) -> None:
+        """Store a response.
+
+        Args:
+            key: Cache key from make_key
+            value: Serializable response
+            operation: API operation name, kept for stats
+            ttl: Optional TTL override in seconds
+            exact_key: Optional unsnapped key of the request
+        """
+        now = time.time()
+        payload = self._registry.dumps(value)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, operation, payload, expires_at, accessed_at, exact_key) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (key, operation, payload, now + (ttl or self.ttl), now, exact_key or key)
+            )
+            self._evict(now)
+
+    def get_or_fetch(
+        self,
+        operation: str,
+        fetch: Callable[..., Any],
+        precise: bool = False,
+        **params: Any
+    ) -> Any:
+        """Get a cached response or fetch and store it.
+
+        Args:
+            operation: API operation name
+            fetch: Callable invoked with **params on a miss
+            precise: Match the exact coordinates only, skipping snapping
+            **params: Request parameters
+
+        Returns:
+            Cached or freshly fetched response
+        """
+        key = self.make_key(operation, precise=precise, **params)
+        exact_key = key
+        if self.snapper is not None and not precise:
+            exact_key = self.make_key(operation, precise=True, **params)
+        cached = self.get(key, exact_key=exact_key)
+        if cached is not None:
+            return cached
+
+        result = fetch(**params)
+        if result:
+            self.set(key, result, operation=operation, exact_key=exact_key)
+        return result
+
+    def clear(self) -> None:
+        """Remove all cached responses."""
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics.
+
+        Returns:
+            Hit/miss counters for this process and entry counts for the store
+        """
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+            expired = self._conn.execute(
+                "SELECT COUNT(*) FROM responses WHERE expires_at <= ?",
+                (time.time(),)
+            ).fetchone()[0]
+            hits, misses = self._hits, self._misses
+            snapped_hits = self._snapped_hits
+        lookups = hits + misses
+        hit_rate = hits / lookups if lookups else 0.0
+        exact_hit_rate = (hits - snapped_hits) / lookups if lookups else 0.0
+        return {
+            "path": self.path,
+            "entries": entries,
+            "expired": expired,
+            "max_entries": self.max_entries,
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hit_rate,
+            "snapping": self.snapper.describe() if self.snapper else "off",
+            "snapped_hits": snapped_hits,
+            "exact_hit_rate": exact_hit_rate,
+            "hit_rate_improvement": hit_rate - exact_hit_rate,
+            "evictions": self._evictions
+        }
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def _decode(self, payload: Any) -> Any:
+        """Deserialize a stored payload, including legacy JSON text."""
+        if isinstance(payload, str):
+            return json.loads(payload)
+        return self._registry.loads(payload)
+
+    def _normalize(self, value: Any, snap: bool = False) -> Any:
+        """Normalize request parameters for key building."""
+        if isinstance(value, float):
+            return round(value, self.coordinate_precision)
+        if isinstance(value, (list, tuple)):
+            if snap and _is_coordinate(value):
+                return self.snapper.snap(float(value[0]), float(value[1]))
+            return [self._normalize(item, snap) for item in value]
+        if isinstance(value, dict):
+            return {k: self._normalize(v, snap) for k, v in value.items()}
+        return value
+
+    def _evict(self, now: float) -> None:
+        """Drop expired entries, then least recently used ones over the size bound.
+
+        Must be called with the lock held.
+        """
+        removed = self._conn.execute(
+            "DELETE FROM responses WHERE expires_at <= ?",
+            (now,)
+        ).rowcount
+        entries = self._conn.execute("SELECT COUNT(*) FROM responses").fetchone()[0]
+        overflow = entries - self.max_entries
+        if overflow > 0:
+            removed += self._conn.execute(
+                "DELETE FROM responses WHERE key IN ("
+                "SELECT key FROM responses ORDER BY accessed_at LIMIT ?)",
+                (overflow,)
+            ).rowcount
+        if removed:
+            self._evictions += removed
+            self._logger.debug("Evicted cached responses", removed=removed)
+
+
+@lru_cache
+def get_response_cache() -> PersistentResponseCache:
+    """Get the response cache shared by services in the process."""
+    settings = get_settings().api
+    return PersistentResponseCache(
+        path=settings.gmaps_cache_path,
+        ttl=settings.gmaps_cache_ttl,
+        max_entries=settings.gmaps_cache_max_entries,
+        snapper=CoordinateSnapper(
+            tolerance_m=settings.gmaps_cache_snap_meters,
+            method=settings.gmaps_cache_snap_method
+        )
+    )
+
+
+def _is_coordinate(value: Any) -> bool:
+    """Check whether a value is a (latitude, longitude) pair."""
+    return (
+        len(value) == 2
+        and all(isinstance(item, (int, float)) and not isinstance(item, bool) for item in value)
+        and -90 <= value[0] <= 90
+        and -180 <= value[1] <= 180
+    )
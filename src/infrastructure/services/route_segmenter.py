@@ -0,0 +1,326 @@
+"""Bulk country segmentation of encoded route polylines.
+
+Splitting a route into country segments step by step, with a lookup and
+Decimal arithmetic per step, is too slow for backfilling thousands of stored
+routes. ``RouteSegmenter`` works on whole batches instead:
+
+1. Step polylines (or the overview polyline) of every route are decoded in
+   one pass into a coordinate array.
+2. Haversine lengths of all polyline edges are computed at once and used to
+   spread each step's reported distance and duration over its edges.
+3. Edge end points are attributed to countries with the offline boundary
+   index. Points the index leaves unresolved (near a land border) take the
+   country of the nearest resolved point along the route, which places the
+   split close to the border itself.
+4. Consecutive edges of the same route and country are summed with
+   ``np.add.reduceat`` and returned as ``CountrySegment`` objects.
+
+No remote lookups are made.
+"""
+from decimal import Decimal
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from src.domain.value_objects import CountrySegment
+from src.infrastructure.services.country_boundary_index import (
+    CountryBoundaryIndex, get_country_boundary_index
+)
+
+EARTH_RADIUS_KM = 6371.0
+
+# Polyline piece: encoded points, distance in km and duration in hours
+Piece = Tuple[str, float, float]
+
+
+def decode_polylines(encoded: Sequence[str]) -> Tuple[np.ndarray, np.ndarray]:
+    """Decode encoded polylines into one coordinate array.
+
+    Args:
+        encoded: Polylines in the Google encoded polyline format
+
+    Returns:
+        Tuple of (N, 2) latitude/longitude array and offsets, where the
+        points of polyline i are coordinates[offsets[i]:offsets[i + 1]]
+
+    Raises:
+        ValueError: If a polyline is malformed
+    """
+    lengths = np.array([len(text) for text in encoded], dtype=np.int64)
+    if not lengths.sum():
+        return np.empty((0, 2)), np.zeros(len(encoded) + 1, dtype=np.int64)
+
+    try:
+        raw = "".join(encoded).encode("ascii")
+    except UnicodeEncodeError:
+        raise ValueError("Polyline contains non-ASCII characters")
+    values = np.frombuffer(raw, dtype=np.uint8).astype(np.int64) - 63
+    if values.min() < 0 or values.max() > 63:
+        raise ValueError("Polyline contains invalid characters")
+
+    # A chunk without the continuation bit ends a number
+    ends = values < 0x20
+    text_ends = np.cumsum(lengths)
+    if not ends[text_ends[lengths > 0] - 1].all():
+        raise ValueError("Polyline is truncated")
+
+    starts = np.flatnonzero(np.concatenate(([True], ends[:-1])))
+    number_of_chunk = np.cumsum(np.concatenate(([0], ends[:-1])))
+    shifts = 5 * (np.arange(len(values)) - starts[number_of_chunk])
+    numbers = np.add.reduceat((values & 0x1F) << shifts, starts)
+    deltas = np.where(numbers & 1, ~(numbers >> 1), numbers >> 1)
+
+    # Numbers per polyline, from the number of chunk ends in each text
+    counts = np.diff(np.concatenate(([0], np.cumsum(ends)[text_ends - 1])))
+    if (counts % 2).any():
+        raise ValueError("Polyline has an odd number of values")
+    point_counts = counts // 2
+    offsets = np.concatenate(([0], np.cumsum(point_counts)))
+
+    # Each polyline starts from absolute values, so the running sum restarts
+    totals = np.cumsum(deltas.reshape(-1, 2), axis=0)
+    restart = np.vstack(([0, 0], totals))[offsets[:-1]]
+    coordinates = (totals - np.repeat(restart, point_counts, axis=0)) / 1e5
+    return coordinates, offsets
+
+
+def decode_polyline(encoded: str) -> np.ndarray:
+    """Decode one encoded polyline.
+
+    Args:
+        encoded: Polyline in the Google encoded polyline format
+
+    Returns:
+        (N, 2) array of latitude/longitude pairs
+    """
+    return decode_polylines([encoded])[0]
+
+
+def haversine_km(coordinates: np.ndarray) -> np.ndarray:
+    """Get great-circle lengths between consecutive coordinates.
+
+    Args:
+        coordinates: (N, 2) array of latitude/longitude pairs
+
+    Returns:
+        (N - 1,) array of lengths in kilometers
+    """
+    radians = np.radians(coordinates)
+    lat, lng = radians[:, 0], radians[:, 1]
+    a = (
+        np.sin(np.diff(lat) / 2) ** 2
+        + np.cos(lat[:-1]) * np.cos(lat[1:]) * np.sin(np.diff(lng) / 2) ** 2
+    )
+    return 2 * EARTH_RADIUS_KM * np.arcsin(np.sqrt(np.clip(a, 0.0, 1.0)))
+
+
+class RouteSegmenter:
+    """Splits directions results into country segments in bulk."""
+
+    def __init__(self, country_index: Optional[CountryBoundaryIndex] = None):
+        """Initialize the segmenter.
+
+        Args:
+            country_index: Offline country lookup (defaults to the bundled borders)
+        """
+        self.country_index = country_index or get_country_boundary_index()
+
+    def segment_route(self, route: Dict[str, Any]) -> List[CountrySegment]:
+        """Split one directions route into country segments.
+
+        Args:
+            route: Directions route with legs and polylines
+
+        Returns:
+            Country segments in route order
+        """
+        return self.segment_routes([route])[0]
+
+    def segment_routes(self, routes: Iterable[Dict[str, Any]]) -> List[List[CountrySegment]]:
+        """Split directions routes into country segments.
+
+        Step polylines are used when every step has one; otherwise the
+        overview polyline carries the leg totals.
+
+        Args:
+            routes: Directions routes with legs and polylines
+
+        Returns:
+            Country segments per route, in route order
+
+        Raises:
+            ValueError: If a route has no polyline or a polyline is malformed
+        """
+        pieces = [self._pieces(route) for route in routes]
+        return self._segment(
+            [piece for route_pieces in pieces for piece in route_pieces],
+            [len(route_pieces) for route_pieces in pieces]
+        )
+
+    def segment_polyline(
+        self,
+        encoded: str,
+        distance_km: Optional[float] = None,
+        duration_hours: Optional[float] = None
+    ) -> List[CountrySegment]:
+        """Split an encoded polyline into country segments.
+
+        Args:
+            encoded: Polyline in the Google encoded polyline format
+            distance_km: Reported route distance (defaults to the polyline length)
+            duration_hours: Reported route duration
+
+        Returns:
+            Country segments in route order
+
+        Raises:
+            ValueError: If the polyline is malformed or no duration is given
+        """
+        if duration_hours is None:
+            raise ValueError("Route duration is required")
+        if distance_km is None:
+            distance_km = float(haversine_km(decode_polyline(encoded)).sum())
+        return self._segment([(encoded, distance_km, duration_hours)], [1])[0]
+
+    @staticmethod
+    def _pieces(route: Dict[str, Any]) -> List[Piece]:
+        """Get the polyline pieces of a route with their reported totals."""
+        steps = [step for leg in route.get('legs', []) for step in leg.get('steps', [])]
+        if steps and all(step.get('polyline', {}).get('points') for step in steps):
+            return [
+                (
+                    step['polyline']['points'],
+                    step['distance']['value'] / 1000.0,
+                    step['duration']['value'] / 3600.0
+                )
+                for step in steps
+            ]
+
+        overview = route.get('overview_polyline', {}).get('points')
+        if not overview:
+            raise ValueError("Route has no polyline")
+        legs = route.get('legs', [])
+        if not legs or any('duration' not in leg for leg in legs):
+            raise ValueError("Route duration is required")
+        if all('distance' in leg for leg in legs):
+            distance_km = sum(leg['distance']['value'] for leg in legs) / 1000.0
+        else:
+            distance_km = float(haversine_km(decode_polyline(overview)).sum())
+        duration_hours = sum(leg['duration']['value'] for leg in legs) / 3600.0
+        return [(overview, distance_km, duration_hours)]
+
+    def _segment(self, pieces: List[Piece], pieces_per_route: List[int]) -> List[List[CountrySegment]]:
+        """Split polyline pieces into country segments per route.
+
+        Args:
+            pieces: Pieces of all routes, in route order
+            pieces_per_route: Number of pieces of each route
+
+        Returns:
+            Country segments per route
+        """
+        results: List[List[CountrySegment]] = [[] for _ in pieces_per_route]
+        if not pieces:
+            return results
+
+        coordinates, offsets = decode_polylines([encoded for encoded, _, _ in pieces])
+        point_counts = np.diff(offsets)
+        piece_of_point = np.repeat(np.arange(len(pieces)), point_counts)
+        route_of_piece = np.repeat(np.arange(len(pieces_per_route)), pieces_per_route)
+        if len(coordinates) < 2:
+            return results
+
+        # Edges join consecutive points of the same piece
+        lengths = haversine_km(coordinates)
+        piece_of_edge = piece_of_point[1:]
+        inside = piece_of_point[:-1] == piece_of_edge
+        lengths = np.where(inside, lengths, 0.0)
+        edge_counts = np.bincount(piece_of_edge, weights=inside, minlength=len(pieces))
+        piece_lengths = np.bincount(piece_of_edge, weights=lengths, minlength=len(pieces))
+
+        # Spread reported totals over edges by length (evenly for zero-length pieces)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            weights = np.where(
+                piece_lengths[piece_of_edge] > 0,
+                lengths / piece_lengths[piece_of_edge],
+                inside / edge_counts[piece_of_edge]
+            )
+        weights = np.where(inside, weights, 0.0)
+        piece_distances = np.array([distance for _, distance, _ in pieces])
+        piece_durations = np.array([duration for _, _, duration in pieces])
+        distances = weights * piece_distances[piece_of_edge]
+        durations = weights * piece_durations[piece_of_edge]
+        route_of_edge = route_of_piece[piece_of_edge]
+
+        # Attribute each edge to the country of its end point
+        codes: Dict[str, int] = {}
+        countries = np.array([
+            -1 if country is None else codes.setdefault(country, len(codes))
+            for country in self.country_index.lookup_many(coordinates[1:, 0], coordinates[1:, 1])
+        ], dtype=np.int64)
+        countries = self._fill_unresolved(countries, route_of_edge, np.cumsum(distances))
+
+        keep = (distances > 0) & (countries >= 0)
+        if not keep.any():
+            return results
+        distances, durations = distances[keep], durations[keep]
+        countries, route_of_edge = countries[keep], route_of_edge[keep]
+
+        # Runs of the same route and country form one segment
+        breaks = np.flatnonzero(
+            (countries[1:] != countries[:-1]) | (route_of_edge[1:] != route_of_edge[:-1])
+        ) + 1
+        starts = np.concatenate(([0], breaks))
+        segment_distances = np.add.reduceat(distances, starts)
+        segment_durations = np.add.reduceat(durations, starts)
+
+        country_codes = list(codes)
+        for start, distance, duration in zip(starts, segment_distances, segment_durations):
+            distance = Decimal(str(round(float(distance), 3)))
+            duration = Decimal(str(round(float(duration), 6)))
+            if distance <= 0 or duration <= 0:
+                continue
+            results[route_of_edge[start]].append(CountrySegment(
+                country_code=country_codes[countries[start]],
+                distance=distance,
+                duration_hours=duration
+            ))
+        return results
+
+    @staticmethod
+    def _fill_unresolved(countries: np.ndarray, routes: np.ndarray, positions: np.ndarray) -> np.ndarray:
+        """Give unresolved edges the country of the nearest resolved edge of the same route.
+
+        Args:
+            countries: Country index per edge, -1 where unresolved
+            routes: Route index per edge
+            positions: Cumulative distance per edge
+
+        Returns:
+            Country index per edge, -1 where the route has no resolved edge
+        """
+        resolved = countries >= 0
+        if resolved.all() or not resolved.any():
+            return countries
+
+        index = np.arange(len(countries))
+        previous = np.maximum.accumulate(np.where(resolved, index, -1))
+        following = np.minimum.accumulate(np.where(resolved, index, len(countries))[::-1])[::-1]
+        has_previous = previous >= 0
+        has_previous[has_previous] &= routes[previous[has_previous]] == routes[has_previous]
+        has_following = following < len(countries)
+        has_following[has_following] &= routes[following[has_following]] == routes[has_following]
+
+        gap_before = np.where(has_previous, positions - positions[np.maximum(previous, 0)], np.inf)
+        gap_after = np.where(
+            has_following,
+            positions[np.minimum(following, len(countries) - 1)] - positions,
+            np.inf
+        )
+        nearest = np.where(gap_before <= gap_after, previous, following)
+        filled = np.where(
+            has_previous | has_following,
+            countries[np.clip(nearest, 0, len(countries) - 1)],
+            -1
+        )
+        return np.where(resolved, countries, filled)
@@ -0,0 +1,361 @@
+"""Serialization of cached values.
+
+This module turns cached values into compact binary payloads and back.
+It provides:
+- Serializers: pickle protocol 5 (always available) and msgpack (when the
+  msgpack package is installed)
+- A registry of serializers and of cached pydantic models with schema versions
+- Trusted rehydration of models with ``model_construct``, skipping validation
+
+Payloads start with a small header naming the serializer, so any registered
+serializer can read a payload written by another process. Every model in a
+payload records the schema version it was written with; if the model has
+since been registered with a different version, loading raises
+``SchemaVersionMismatch`` and the caller should treat the entry as a miss.
+
+Payloads are only read back from our own caches, so they are trusted: models
+are rebuilt from their field values without running validators.
+"""
+import io
+import pickle
+import struct
+from abc import ABC, abstractmethod
+from datetime import date, datetime, time
+from decimal import Decimal
+from functools import lru_cache
+from importlib import import_module
+from typing import Any, Dict, Optional, Tuple, Type
+from uuid import UUID
+
+from pydantic import BaseModel
+
+# Magic, serializer code, header version
+_HEADER = struct.Struct(">2sBB")
+_MAGIC = b"LC"
+_HEADER_VERSION = 1
+
+
+class SchemaVersionMismatch(ValueError):
+    """Raised when a payload holds a model written with another schema version."""
+
+
+class Serializer(ABC):
+    """Converts values to bytes and back."""
+
+    name = ""
+    code = 0
+
+    def __init__(self, registry: "SerializerRegistry"):
+        self.registry = registry
+
+    @abstractmethod
+    def dumps(self, value: Any) -> bytes:
+        """Serialize a value (without the payload header)."""
+
+    @abstractmethod
+    def loads(self, data: bytes) -> Any:
+        """Deserialize a value (without the payload header)."""
+
+
+class _ModelPickler(pickle.Pickler):
+    """Pickler reducing models to their field values."""
+
+    def __init__(self, file: io.BytesIO, registry: "SerializerRegistry"):
+        super().__init__(file, protocol=5)
+        self._registry = registry
+
+    def reducer_override(self, obj: Any) -> Any:
+        if isinstance(obj, BaseModel):
+            name, version = self._registry.model_key(type(obj))
+            return _construct, (name, version, obj.__dict__, obj.model_fields_set)
+        return NotImplemented
+
+
+class _ModelUnpickler(pickle.Unpickler):
+    """Unpickler rebuilding models through the loading registry."""
+
+    def __init__(self, file: io.BytesIO, registry: "SerializerRegistry"):
+        super().__init__(file)
+        self._registry = registry
+
+    def find_class(self, module: str, name: str) -> Any:
+        if module == __name__ and name == "_construct":
+            return self._registry.construct
+        return super().find_class(module, name)
+
+
+def _construct(name: str, version: int, fields: Dict[str, Any], fields_set: set) -> BaseModel:
+    """Rebuild a pickled model without validation (plain pickle.loads)."""
+    return get_serializer_registry().construct(name, version, fields, fields_set)
+
+
+class PickleSerializer(Serializer):
+    """Pickle protocol 5 with models rebuilt by model_construct."""
+
+    name = "pickle"
+    code = 1
+
+    def dumps(self, value: Any) -> bytes:
+        buffer = io.BytesIO()
+        _ModelPickler(buffer, self.registry).dump(value)
+        return buffer.getvalue()
+
+    def loads(self, data: bytes) -> Any:
+        return _ModelUnpickler(io.BytesIO(data), self.registry).load()
+
+
+class MsgpackSerializer(Serializer):
+    """msgpack with extension types for decimals, UUIDs, dates and models."""
+
+    name = "msgpack"
+    code = 2
+
+    _DECIMAL, _UUID, _DATETIME, _DATE, _TIME, _SET, _TUPLE = range(1, 8)
+    _MODEL_KEY = "__model__"
+
+    def __init__(self, registry: "SerializerRegistry"):
+        super().__init__(registry)
+        import msgpack
+        self._msgpack = msgpack
+
+    def dumps(self, value: Any) -> bytes:
+        return self._msgpack.packb(value, default=self._default, use_bin_type=True, strict_types=True)
+
+    def loads(self, data: bytes) -> Any:
+        return self._msgpack.unpackb(
+            data,
+            ext_hook=self._ext_hook,
+            object_hook=self._object_hook,
+            raw=False,
+            strict_map_key=False
+        )
+
+    def _default(self, obj: Any) -> Any:
+        ext = self._msgpack.ExtType
+        if isinstance(obj, BaseModel):
+            name, version = self.registry.model_key(type(obj))
+            return {self._MODEL_KEY: [name, version, list(obj.model_fields_set)], **obj.__dict__}
+        if isinstance(obj, Decimal):
+            return ext(self._DECIMAL, str(obj).encode())
+        if isinstance(obj, UUID):
+            return ext(self._UUID, obj.bytes)
+        if isinstance(obj, datetime):
+            return ext(self._DATETIME, obj.isoformat().encode())
+        if isinstance(obj, date):
+            return ext(self._DATE, obj.isoformat().encode())
+        if isinstance(obj, time):
+            return ext(self._TIME, obj.isoformat().encode())
+        if isinstance(obj, (set, frozenset)):
+            return ext(self._SET, self.dumps(list(obj)))
+        if isinstance(obj, tuple):
+            return ext(self._TUPLE, self.dumps(list(obj)))
+        if isinstance(obj, str):
+            # Enum members that subclass str
+            return str(obj)
+        raise TypeError(f"Cannot serialize {type(obj).__name__}")
+
+    def _ext_hook(self, code: int, data: bytes) -> Any:
+        if code == self._DECIMAL:
+            return Decimal(data.decode())
+        if code == self._UUID:
+            return UUID(bytes=data)
+        if code == self._DATETIME:
+            return datetime.fromisoformat(data.decode())
+        if code == self._DATE:
+            return date.fromisoformat(data.decode())
+        if code == self._TIME:
+            return time.fromisoformat(data.decode())
+        if code == self._SET:
+            return set(self.loads(data))
+        if code == self._TUPLE:
+            return tuple(self.loads(data))
+        return self._msgpack.ExtType(code, data)
+
+    def _object_hook(self, obj: Dict[Any, Any]) -> Any:
+        header = obj.pop(self._MODEL_KEY, None)
+        if header is None:
+            return obj
+        name, version, fields_set = header
+        return self.registry.construct(name, version, obj, set(fields_set))
+
+
+class SerializerRegistry:
+    """Known serializers and cached model schema versions."""
+
+    def __init__(self, default: str = "pickle"):
+        """Initialize the registry.
+
+        Args:
+            default: Name of the serializer used by dumps() when none is given
+        """
+        self._by_name: Dict[str, Serializer] = {}
+        self._by_code: Dict[int, Serializer] = {}
+        self._versions: Dict[str, int] = {}
+        self._models: Dict[str, Type[BaseModel]] = {}
+        self.default = default
+        self.register(PickleSerializer)
+        try:
+            self.register(MsgpackSerializer)
+        except ImportError:
+            pass
+
+    def register(self, serializer_cls: Type[Serializer]) -> None:
+        """Add a serializer.
+
+        Args:
+            serializer_cls: Serializer class
+
+        Raises:
+            ImportError: If the serializer's library is not installed
+        """
+        serializer = serializer_cls(self)
+        self._by_name[serializer.name] = serializer
+        self._by_code[serializer.code] = serializer
+
+    def register_model(self, model_cls: Type[BaseModel], version: int) -> None:
+        """Set the schema version of a cached model.
+
+        Bump the version whenever the model's fields change incompatibly, so
+        entries written by older code are dropped instead of rebuilt wrongly.
+
+        Args:
+            model_cls: Pydantic model class
+            version: Schema version
+        """
+        name = _model_name(model_cls)
+        self._versions[name] = version
+        self._models[name] = model_cls
+
+    @property
+    def available(self) -> Tuple[str, ...]:
+        """Names of the usable serializers."""
+        return tuple(self._by_name)
+
+    def dumps(self, value: Any, serializer: Optional[str] = None) -> bytes:
+        """Serialize a value into a payload.
+
+        Args:
+            value: Value to serialize
+            serializer: Serializer name (defaults to the registry default)
+
+        Returns:
+            Payload with header
+
+        Raises:
+            ValueError: If the serializer is unknown or unavailable
+        """
+        name = serializer or self.default
+        try:
+            chosen = self._by_name[name]
+        except KeyError:
+            raise ValueError(f"Unknown or unavailable serializer: {name}")
+        return _HEADER.pack(_MAGIC, chosen.code, _HEADER_VERSION) + chosen.dumps(value)
+
+    def loads(self, payload: bytes) -> Any:
+        """Deserialize a payload.
+
+        Args:
+            payload: Payload produced by dumps()
+
+        Returns:
+            Deserialized value
+
+        Raises:
+            ValueError: If the payload is not recognized
+            SchemaVersionMismatch: If a model schema changed since writing
+        """
+        if not self.is_payload(payload):
+            raise ValueError("Not a serialized cache payload")
+        _, code, _ = _HEADER.unpack_from(payload)
+        try:
+            serializer = self._by_code[code]
+        except KeyError:
+            raise ValueError(f"Payload serializer {code} is not available")
+        return serializer.loads(memoryview(payload)[_HEADER.size:])
+
+    @staticmethod
+    def is_payload(value: Any) -> bool:
+        """Check whether a value is a payload produced by dumps()."""
+        return (
+            isinstance(value, (bytes, bytearray, memoryview))
+            and len(value) >= _HEADER.size
+            and bytes(value[:2]) == _MAGIC
+        )
+
+    def model_key(self, model_cls: Type[BaseModel]) -> Tuple[str, int]:
+        """Get the stored name and schema version of a model class."""
+        name = _model_name(model_cls)
+        return name, self._versions.get(name, 0)
+
+    def construct(
+        self,
+        name: str,
+        version: int,
+        fields: Dict[str, Any],
+        fields_set: set
+    ) -> BaseModel:
+        """Rebuild a model from trusted field values.
+
+        Args:
+            name: Model name from model_key()
+            version: Schema version the payload was written with
+            fields: Field values
+            fields_set: Names of explicitly set fields
+
+        Returns:
+            Model instance
+
+        Raises:
+            SchemaVersionMismatch: If the model's current version differs
+        """
+        current = self._versions.get(name, 0)
+        if version != current:
+            raise SchemaVersionMismatch(
+                f"{name} payload has schema version {version}, expected {current}"
+            )
+        model_cls = self._models.get(name)
+        if model_cls is None:
+            module, _, qualname = name.partition(":")
+            model_cls = import_module(module)
+            for part in qualname.split("."):
+                model_cls = getattr(model_cls, part)
+            self._models[name] = model_cls
+        if (
+            model_cls.__private_attributes__
+            or model_cls.model_config.get("extra") == "allow"
+            or len(fields) < len(model_cls.model_fields)
+        ):
+            return model_cls.model_construct(_fields_set=set(fields_set), **fields)
+        # Every field is present: restore the state directly, as unpickling
+        # a model does, instead of looping over the fields for defaults
+        model = model_cls.__new__(model_cls)
+        object.__setattr__(model, "__dict__", fields)
+        object.__setattr__(model, "__pydantic_fields_set__", set(fields_set))
+        object.__setattr__(model, "__pydantic_extra__", None)
+        object.__setattr__(model, "__pydantic_private__", None)
+        return model
+
+
+def _model_name(model_cls: Type[BaseModel]) -> str:
+    """Get the import path of a model class."""
+    return f"{model_cls.__module__}:{model_cls.__qualname__}"
+
+
+@lru_cache
+def get_serializer_registry() -> SerializerRegistry:
+    """Get the registry shared by the caches in the process."""
+    from src.domain.value_objects import (
+        CompetitorPrice, CostBreakdown, CountrySegment, MarketConditions,
+        PriceHistory, RouteOptimization
+    )
+    from src.domain.value_objects.country_segment import (
+        CountrySegment as SegmentWithCosts
+    )
+
+    registry = SerializerRegistry()
+    for model_cls in (
+        CompetitorPrice, CostBreakdown, CountrySegment, MarketConditions,
+        PriceHistory, RouteOptimization, SegmentWithCosts
+    ):
+        registry.register_model(model_cls, version=1)
+    return registry
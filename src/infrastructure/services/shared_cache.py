@@ -0,0 +1,323 @@
+"""Host-wide cache tier shared by worker processes.
+
+Every gunicorn worker keeps its own CacheService memory tier, so a value
+computed in one worker is a miss in all the others. ``SharedCacheTier``
+sits between the memory tier and the optional Redis client: a SQLite
+database in WAL mode that all workers on the host read and write.
+
+- Values are stored as serializer registry payloads (pickle protocol 5 by
+  default), which are compact and rebuild pydantic models with
+  ``model_construct`` instead of validating them again on every hit.
+- The database is memory-mapped (``PRAGMA mmap_size``), so reads are served
+  from the shared page cache instead of read() copies into each worker.
+- Readers never write: entries are bounded by evicting the ones closest to
+  expiry, so a hit does not take the WAL write lock.
+- Tags are indexed in a side table so tag invalidation reaches the entries
+  written by every worker.
+"""
+import os
+import sqlite3
+import threading
+import time
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from src.infrastructure.services.serialization import get_serializer_registry
+from src.infrastructure.logging import get_logger
+from src.settings import get_settings
+
+logger = get_logger()
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    payload BLOB NOT NULL,
+    expires_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS ix_entries_expires_at ON entries (expires_at);
+CREATE TABLE IF NOT EXISTS entry_tags (
+    tag TEXT NOT NULL,
+    key TEXT NOT NULL,
+    PRIMARY KEY (tag, key)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS ix_entry_tags_key ON entry_tags (key);
+"""
+
+_MMAP_SIZE = 256 * 1024 * 1024
+# Keys per IN (...) query, below SQLite's bound parameter limit
+_QUERY_CHUNK = 500
+# Writes between size-bound checks
+_EVICT_EVERY = 100
+
+
+class SharedCacheTier:
+    """SQLite-backed cache shared by the processes on one host."""
+
+    def __init__(
+        self,
+        path: Optional[str] = None,
+        max_entries: int = 50000,
+        serializer: Optional[str] = None
+    ):
+        """Initialize the tier.
+
+        Args:
+            path: Database file path; None keeps the tier in memory for this process
+            max_entries: Maximum number of stored entries
+            serializer: Serializer for new payloads (defaults to the registry default)
+        """
+        if max_entries <= 0:
+            raise ValueError("Cache size must be positive")
+
+        self.path = path or ":memory:"
+        self.max_entries = max_entries
+        self.serializer = serializer
+        self._registry = get_serializer_registry()
+        self._logger = logger.bind(service="shared_cache", path=self.path)
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._writes = 0
+
+        if self.path != ":memory:":
+            directory = os.path.dirname(os.path.abspath(self.path))
+            os.makedirs(directory, exist_ok=True)
+
+        self._conn = sqlite3.connect(
+            self.path,
+            timeout=30.0,
+            check_same_thread=False,
+            isolation_level=None
+        )
+        if self.path != ":memory:":
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(f"PRAGMA mmap_size={_MMAP_SIZE}")
+        self._conn.executescript(_SCHEMA)
+
+    def get(self, key: str) -> Optional[Tuple[Any, float]]:
+        """Get a cached value.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            Tuple of value and absolute expiry time, or None if missing or expired
+        """
+        return self.get_many([key]).get(key)
+
+    def get_many(self, keys: Sequence[str]) -> Dict[str, Tuple[Any, float]]:
+        """Get several cached values with one query per chunk of keys.
+
+        Args:
+            keys: Cache keys
+
+        Returns:
+            Tuple of value and absolute expiry time by key; missing or
+            expired keys are left out
+        """
+        now = time.time()
+        rows = []
+        with self._lock:
+            for start in range(0, len(keys), _QUERY_CHUNK):
+                chunk = keys[start:start + _QUERY_CHUNK]
+                rows.extend(self._conn.execute(
+                    "SELECT key, payload, expires_at FROM entries "
+                    f"WHERE key IN ({', '.join('?' * len(chunk))}) AND expires_at > ?",
+                    (*chunk, now)
+                ))
+        # Deserialize outside the lock; the blobs are not shared with other threads
+        found = {}
+        for key, payload, expires_at in rows:
+            try:
+                found[key] = (self._registry.loads(payload), expires_at)
+            except ValueError as e:
+                # Unknown format or another model schema version: treat as a miss
+                self._logger.debug("Dropping stale shared cache payload", key=key, error=str(e))
+        with self._lock:
+            self._hits += len(found)
+            self._misses += len(set(keys)) - len(found)
+        return found
+
+    def set(
+        self,
+        key: str,
+        value: Any,
+        ttl: float,
+        tags: Iterable[str] = ()
+    ) -> bool:
+        """Store a value.
+
+        Args:
+            key: Cache key
+            value: Serializable value
+            ttl: TTL in seconds
+            tags: Tags for invalidate_tag()
+
+        Returns:
+            False if the value cannot be serialized
+        """
+        return self.set_many({key: (value, ttl, tags)}) == 1
+
+    def set_many(self, items: Dict[str, Tuple[Any, float, Iterable[str]]]) -> int:
+        """Store several values in one transaction.
+
+        Args:
+            items: Value, TTL in seconds and tags by key
+
+        Returns:
+            Number of values stored; values that cannot be serialized are skipped
+        """
+        now = time.time()
+        rows = []
+        tag_rows = []
+        for key, (value, ttl, tags) in items.items():
+            try:
+                payload = self._registry.dumps(value, self.serializer)
+            except Exception as e:
+                self._logger.warning("Cannot store value in shared cache", key=key, error=str(e))
+                continue
+            rows.append((key, payload, now + ttl))
+            tag_rows.extend((tag, key) for tag in tags)
+        if not rows:
+            return 0
+
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO entries (key, payload, expires_at) VALUES (?, ?, ?)",
+                    rows
+                )
+                self._conn.executemany(
+                    "DELETE FROM entry_tags WHERE key = ?",
+                    [(key,) for key, _, _ in rows]
+                )
+                self._conn.executemany(
+                    "INSERT OR IGNORE INTO entry_tags (tag, key) VALUES (?, ?)",
+                    tag_rows
+                )
+                # Bound the table every so often rather than on every write
+                previous = self._writes
+                self._writes += len(rows)
+                if self._writes // _EVICT_EVERY != previous // _EVICT_EVERY:
+                    self._evict(now)
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return len(rows)
+
+    def delete(self, key: str) -> bool:
+        """Delete an entry.
+
+        Args:
+            key: Cache key
+
+        Returns:
+            True if an entry was deleted
+        """
+        with self._lock:
+            self._conn.execute("DELETE FROM entry_tags WHERE key = ?", (key,))
+            return self._conn.execute(
+                "DELETE FROM entries WHERE key = ?",
+                (key,)
+            ).rowcount > 0
+
+    def invalidate_tag(self, tag: str) -> List[str]:
+        """Delete all entries carrying a tag.
+
+        Args:
+            tag: Tag given when the entries were set
+
+        Returns:
+            Keys that carried the tag
+        """
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                keys = [
+                    row[0] for row in self._conn.execute(
+                        "SELECT key FROM entry_tags WHERE tag = ?",
+                        (tag,)
+                    )
+                ]
+                self._conn.executemany("DELETE FROM entries WHERE key = ?", [(key,) for key in keys])
+                self._conn.executemany("DELETE FROM entry_tags WHERE key = ?", [(key,) for key in keys])
+                self._conn.execute("COMMIT")
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+        return keys
+
+    def clear(self) -> None:
+        """Remove all entries."""
+        with self._lock:
+            self._conn.execute("DELETE FROM entries")
+            self._conn.execute("DELETE FROM entry_tags")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get tier statistics.
+
+        Returns:
+            Hit/miss counters for this process and entry counts for the store
+        """
+        with self._lock:
+            entries = self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+            size = self._conn.execute(
+                "SELECT COALESCE(SUM(LENGTH(payload)), 0) FROM entries"
+            ).fetchone()[0]
+            hits, misses = self._hits, self._misses
+        lookups = hits + misses
+        return {
+            "path": self.path,
+            "entries": entries,
+            "payload_bytes": size,
+            "max_entries": self.max_entries,
+            "hits": hits,
+            "misses": misses,
+            "hit_rate": hits / lookups if lookups else 0.0,
+            "evictions": self._evictions
+        }
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def _evict(self, now: float) -> None:
+        """Drop expired entries, then those closest to expiry over the size bound.
+
+        Must be called with the lock held, inside a transaction.
+        """
+        removed = self._conn.execute(
+            "DELETE FROM entries WHERE expires_at <= ?",
+            (now,)
+        ).rowcount
+        entries = self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+        overflow = entries - self.max_entries
+        if overflow > 0:
+            removed += self._conn.execute(
+                "DELETE FROM entries WHERE key IN ("
+                "SELECT key FROM entries ORDER BY expires_at LIMIT ?)",
+                (overflow,)
+            ).rowcount
+        if removed:
+            self._conn.execute(
+                "DELETE FROM entry_tags WHERE key NOT IN (SELECT key FROM entries)"
+            )
+            self._evictions += removed
+            self._logger.debug("Evicted shared cache entries", removed=removed)
+
+
+@lru_cache
+def get_shared_cache_tier() -> Optional[SharedCacheTier]:
+    """Get the host-wide cache tier, or None if it is disabled."""
+    settings = get_settings().service
+    if not settings.cache_shared_path:
+        return None
+    return SharedCacheTier(
+        path=settings.cache_shared_path,
+        max_entries=settings.cache_shared_max_entries
+    )
@@ -0,0 +1,109 @@
+"""Coalescing of identical in-flight calls.
+
+A cache only helps once the first call for a key has finished. While that
+call is still running, every other caller for the same key would start its
+own request. ``SingleFlight`` lets the first caller run the call and makes
+the others wait on its future, so they share its result or its error.
+"""
+import threading
+from concurrent.futures import Future
+from functools import lru_cache
+from typing import Any, Callable, Dict, Hashable, TypeVar
+
+from src.infrastructure.logging import get_logger
+
+logger = get_logger()
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """Runs at most one call per key at a time and shares its outcome."""
+
+    def __init__(self, name: str = "default"):
+        """Initialize the group.
+
+        Args:
+            name: Name used in logs and stats
+        """
+        self.name = name
+        self._lock = threading.Lock()
+        self._in_flight: Dict[Hashable, Future] = {}
+        self._calls = 0
+        self._executions = 0
+        self._coalesced = 0
+        self._logger = logger.bind(service="single_flight", group=name)
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        """Run a call, or wait for the identical call already in flight.
+
+        Args:
+            key: Normalized key identifying the call
+            fn: Callable producing the result
+
+        Returns:
+            Result of the call that ran for this key
+
+        Raises:
+            Exception: Whatever the call that ran for this key raised
+        """
+        with self._lock:
+            self._calls += 1
+            future = self._in_flight.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._in_flight[key] = future
+                self._executions += 1
+            else:
+                self._coalesced += 1
+
+        if not leader:
+            self._logger.debug("Coalesced call", key=str(key))
+            return future.result()
+
+        try:
+            result = fn()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            # Later callers start a fresh call (and usually hit the cache)
+            with self._lock:
+                del self._in_flight[key]
+
+    def in_flight(self, key: Hashable) -> bool:
+        """Check whether a call for a key is running.
+
+        Args:
+            key: Normalized key identifying the call
+
+        Returns:
+            True if a caller is currently running the call
+        """
+        with self._lock:
+            return key in self._in_flight
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get coalescing statistics.
+
+        Returns:
+            Call, execution and coalesced counts plus calls currently in flight
+        """
+        with self._lock:
+            return {
+                "name": self.name,
+                "calls": self._calls,
+                "executions": self._executions,
+                "coalesced": self._coalesced,
+                "in_flight": len(self._in_flight)
+            }
+
+
+@lru_cache(maxsize=None)
+def get_single_flight(name: str) -> SingleFlight:
+    """Get the process-wide coalescing group for a name."""
+    return SingleFlight(name)
@@ -5,7 +5,6 @@ from typing import Dict, List, Optional, Any
 from uuid import UUID
 from functools import lru_cache
 
-import googlemaps
 from googlemaps.exceptions import ApiError, TransportError
 import requests
 import json
@@ -14,6 +13,9 @@ import re
 from src.domain.value_objects import CountrySegment, Location
 from src.domain.interfaces.services.toll_rate_service import TollRateService, TollRateServiceError
 from src.infrastructure.logging import get_logger
+from src.infrastructure.services.google_maps_client import GoogleMapsClient
+from src.infrastructure.services.response_cache import PersistentResponseCache, get_response_cache
+from src.infrastructure.services.single_flight import SingleFlight, get_single_flight
 from src.settings import get_settings
 from src.infrastructure.data.toll_roads import (
     TOLL_KEYWORDS, TOLL_RATES, is_toll_road, get_toll_rate
@@ -24,12 +26,22 @@ logger = get_logger()
 class GoogleMapsTollRateService(TollRateService):
     """Google Maps implementation of toll rate service."""
 
-    def __init__(self, api_key: Optional[str] = None, route_repository: Optional['RouteRepository'] = None):
+    def __init__(
+        self,
+        api_key: Optional[str] = None,
+        route_repository: Optional['RouteRepository'] = None,
+        client: Optional[GoogleMapsClient] = None,
+        single_flight: Optional[SingleFlight] = None,
+        response_cache: Optional[PersistentResponseCache] = None
+    ):
         """Initialize Google Maps toll rate service.
         
         Args:
             api_key: Optional API key (defaults to settings.api.google_maps_key)
             route_repository: Optional repository for route lookups
+            client: Optional maps client (defaults to the shared rate-limited client)
+            single_flight: Optional request coalescing group (defaults to the process-wide one)
+            response_cache: Optional response cache (defaults to the shared on-disk cache)
             
         Raises:
             TollRateServiceError: If API key is not found
@@ -47,18 +59,23 @@ class GoogleMapsTollRateService(TollRateService):
             self.api_key = api_key
             
         self.route_repository = route_repository
-        
-        # Get API settings
-        self.max_retries = settings.api.gmaps_max_retries
-        self.retry_delay = settings.api.gmaps_retry_delay
+        self.single_flight = single_flight or get_single_flight("toll_rates")
+        self._response_cache = response_cache
         
         try:
-            self.client = googlemaps.Client(key=self.api_key)
+            self.client = client or GoogleMapsClient(self.api_key)
             self._logger.info("Google Maps client initialized successfully")
         except Exception as e:
             self._logger.error("Failed to initialize Google Maps client", error=str(e))
             raise TollRateServiceError(f"Failed to initialize Google Maps client: {str(e)}")
 
+    @property
+    def response_cache(self) -> PersistentResponseCache:
+        """Get the response cache, opening the shared one on first use."""
+        if self._response_cache is None:
+            self._response_cache = get_response_cache()
+        return self._response_cache
+
     def _extract_road_name(self, text: str) -> Optional[str]:
         """Extract road name from text using common patterns.
         
@@ -105,13 +122,20 @@ class GoogleMapsTollRateService(TollRateService):
         text = ' '.join(text.split())
         return text.lower()
 
-    def _get_toll_data(self, origin: Location, destination: Location, vehicle_type: str) -> Dict[str, Any]:
+    def _get_toll_data(
+        self,
+        origin: Location,
+        destination: Location,
+        vehicle_type: str,
+        precise: bool = False
+    ) -> Dict[str, Any]:
         """Get toll data from Google Maps Directions API.
         
         Args:
             origin: Start location
             destination: End location
             vehicle_type: Type of vehicle
+            precise: Only reuse responses for the exact coordinates, skipping snapping
             
         Returns:
             Dict containing route and toll information
@@ -120,8 +144,7 @@ class GoogleMapsTollRateService(TollRateService):
             TollRateServiceError: If API call fails
         """
         try:
-            # Use the standard directions API
-            result = self.client.directions(
+            params = dict(
                 origin=(origin.latitude, origin.longitude),
                 destination=(destination.latitude, destination.longitude),
                 mode="driving",
@@ -132,6 +155,15 @@ class GoogleMapsTollRateService(TollRateService):
                 departure_time="now",  # Get current traffic
                 language="en"  # Ensure English responses
             )
+            # Nearby lanes share cached responses, and concurrent lookups of
+            # the same lane share one directions call
+            key = self.response_cache.make_key("toll_directions", precise=precise, **params)
+            result = self.single_flight.do(key, lambda: self.response_cache.get_or_fetch(
+                "toll_directions",
+                self.client.directions,
+                precise=precise,
+                **params
+            ))
             
             if not result:
                 raise TollRateServiceError("No route found")
@@ -146,7 +178,8 @@ class GoogleMapsTollRateService(TollRateService):
         self,
         route_id: UUID,
         vehicle_type: str,
-        time: Optional[datetime] = None
+        time: Optional[datetime] = None,
+        precise: bool = False
     ) -> Decimal:
         """Calculate toll for a route.
         
@@ -154,6 +187,7 @@ class GoogleMapsTollRateService(TollRateService):
             route_id: Route ID
             vehicle_type: Type of vehicle
             time: Optional time for rate calculation
+            precise: Skip coordinate snapping when reusing cached routes
             
         Returns:
             Calculated toll amount
@@ -175,7 +209,7 @@ class GoogleMapsTollRateService(TollRateService):
             destination = Location(**route.destination)
             
             # Get route data from Google Maps
-            route_data = self._get_toll_data(origin, destination, vehicle_type)
+            route_data = self._get_toll_data(origin, destination, vehicle_type, precise)
             
             # Extract toll information from route data
             toll_amount = Decimal('0')
@@ -19,6 +19,14 @@ class DatabaseSettings(BaseModel):
         default=False,
         description="Enable SQL query logging"
     )
+    fast_hydration: bool = Field(
+        default=True,
+        description="Build entities read from the database without validation"
+    )
+    validate_sample_rate: float = Field(
+        default=0.0,
+        description="Share of fast-built entities to re-validate (0 disables)"
+    )
 
 
 class APISettings(BaseModel):
@@ -59,6 +67,34 @@ class APISettings(BaseModel):
         default=3600,
         description="Cache TTL for Google Maps API responses"
     )
+    gmaps_cache_path: Optional[str] = Field(
+        default="instance/gmaps_cache.db",
+        description="SQLite file shared by all workers for Google Maps responses"
+    )
+    gmaps_cache_max_entries: int = Field(
+        default=10000,
+        description="Maximum number of cached Google Maps responses"
+    )
+    gmaps_cache_snap_meters: float = Field(
+        default=100.0,
+        description="Cell size in meters for snapping coordinates in cache keys (0 disables)"
+    )
+    gmaps_cache_snap_method: str = Field(
+        default="grid",
+        description="Coordinate snapping method for cache keys (grid or geohash)"
+    )
+    gmaps_matrix_max_workers: int = Field(
+        default=4,
+        description="Maximum concurrent Distance Matrix requests per matrix"
+    )
+    gmaps_qps: float = Field(
+        default=50.0,
+        description="Google Maps requests per second allowed for the whole process"
+    )
+    gmaps_timeout: float = Field(
+        default=10.0,
+        description="Timeout for a single Google Maps HTTP request in seconds"
+    )
 
 
 class ServiceSettings(BaseModel):
@@ -83,6 +119,22 @@ class ServiceSettings(BaseModel):
         default=False,
         description="Enable market data service integration"
     )
+    cache_shared_path: Optional[str] = Field(
+        default="instance/shared_cache.db",
+        description="SQLite file for the cache tier shared by all workers (empty disables)"
+    )
+    cache_shared_max_entries: int = Field(
+        default=50000,
+        description="Maximum number of entries in the shared cache tier"
+    )
+    cost_cache_ttl: int = Field(
+        default=1800,
+        description="Seconds a computed route cost is kept"
+    )
+    cost_cache_max_entries: int = Field(
+        default=5000,
+        description="Maximum number of cached route costs"
+    )
 
 
 class Settings(BaseSettings):
@@ -114,6 +166,16 @@ class Settings(BaseSettings):
         alias="SQL_ECHO",
         description="Enable SQL query logging"
     )
+    repository_fast_hydration: bool = Field(
+        default=True,
+        alias="REPOSITORY_FAST_HYDRATION",
+        description="Build entities read from the database without validation"
+    )
+    repository_validate_sample_rate: float = Field(
+        default=0.0,
+        alias="REPOSITORY_VALIDATE_SAMPLE_RATE",
+        description="Share of fast-built entities to re-validate (0 disables)"
+    )
 
     # API settings
     openai_api_key: Optional[str] = Field(
@@ -161,6 +223,41 @@ class Settings(BaseSettings):
         alias="GMAPS_CACHE_TTL",
         description="Cache TTL for Google Maps API responses"
     )
+    gmaps_cache_path: Optional[str] = Field(
+        default="instance/gmaps_cache.db",
+        alias="GMAPS_CACHE_PATH",
+        description="SQLite file shared by all workers for Google Maps responses"
+    )
+    gmaps_cache_max_entries: int = Field(
+        default=10000,
+        alias="GMAPS_CACHE_MAX_ENTRIES",
+        description="Maximum number of cached Google Maps responses"
+    )
+    gmaps_cache_snap_meters: float = Field(
+        default=100.0,
+        alias="GMAPS_CACHE_SNAP_METERS",
+        description="Cell size in meters for snapping coordinates in cache keys (0 disables)"
+    )
+    gmaps_cache_snap_method: str = Field(
+        default="grid",
+        alias="GMAPS_CACHE_SNAP_METHOD",
+        description="Coordinate snapping method for cache keys (grid or geohash)"
+    )
+    gmaps_matrix_max_workers: int = Field(
+        default=4,
+        alias="GMAPS_MATRIX_MAX_WORKERS",
+        description="Maximum concurrent Distance Matrix requests per matrix"
+    )
+    gmaps_qps: float = Field(
+        default=50.0,
+        alias="GMAPS_QPS",
+        description="Google Maps requests per second allowed for the whole process"
+    )
+    gmaps_timeout: float = Field(
+        default=10.0,
+        alias="GMAPS_TIMEOUT",
+        description="Timeout for a single Google Maps HTTP request in seconds"
+    )
 
     # Service settings
     flask_port: int = Field(
@@ -184,12 +281,36 @@ class Settings(BaseSettings):
         description="Enable market data"
     )
 
+    # Cache settings
+    cache_shared_path: Optional[str] = Field(
+        default="instance/shared_cache.db",
+        alias="CACHE_SHARED_PATH",
+        description="SQLite file for the cache tier shared by all workers (empty disables)"
+    )
+    cache_shared_max_entries: int = Field(
+        default=50000,
+        alias="CACHE_SHARED_MAX_ENTRIES",
+        description="Maximum number of entries in the shared cache tier"
+    )
+    cost_cache_ttl: int = Field(
+        default=1800,
+        alias="COST_CACHE_TTL",
+        description="Seconds a computed route cost is kept"
+    )
+    cost_cache_max_entries: int = Field(
+        default=5000,
+        alias="COST_CACHE_MAX_ENTRIES",
+        description="Maximum number of cached route costs"
+    )
+
     @property
     def database(self) -> DatabaseSettings:
         """Get database settings."""
         return DatabaseSettings(
             url=self.database_url,
-            echo=self.sql_echo
+            echo=self.sql_echo,
+            fast_hydration=self.repository_fast_hydration,
+            validate_sample_rate=self.repository_validate_sample_rate
         )
 
     @property
@@ -204,7 +325,14 @@ class Settings(BaseSettings):
             google_maps_key=SecretStr(self.google_maps_api_key) if self.google_maps_api_key else None,
             gmaps_max_retries=self.gmaps_max_retries,
             gmaps_retry_delay=self.gmaps_retry_delay,
-            gmaps_cache_ttl=self.gmaps_cache_ttl
+            gmaps_cache_ttl=self.gmaps_cache_ttl,
+            gmaps_cache_path=self.gmaps_cache_path,
+            gmaps_cache_max_entries=self.gmaps_cache_max_entries,
+            gmaps_cache_snap_meters=self.gmaps_cache_snap_meters,
+            gmaps_cache_snap_method=self.gmaps_cache_snap_method,
+            gmaps_matrix_max_workers=self.gmaps_matrix_max_workers,
+            gmaps_qps=self.gmaps_qps,
+            gmaps_timeout=self.gmaps_timeout
         )
 
     @property
@@ -215,7 +343,11 @@ class Settings(BaseSettings):
             backend_port=self.flask_port,
             weather_enabled=self.weather_enabled,
             traffic_enabled=self.traffic_enabled,
-            market_data_enabled=self.market_data_enabled
+            market_data_enabled=self.market_data_enabled,
+            cache_shared_path=self.cache_shared_path,
+            cache_shared_max_entries=self.cache_shared_max_entries,
+            cost_cache_ttl=self.cost_cache_ttl,
+            cost_cache_max_entries=self.cost_cache_max_entries
         )
 
     @field_validator("env")
@@ -0,0 +1,32 @@
+"""Shared fixtures for costs blueprint tests."""
+from contextlib import contextmanager
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.domain.services.cost.cost_cache import CostResultCache
+
+BLUEPRINT = "src.api.blueprints.costs.costs"
+
+
+@pytest.fixture
+def cost_cache():
+    """Patch the cost cache the blueprint uses with a private one."""
+    cache = CostResultCache(ttl=60, max_entries=100)
+    with patch(f"{BLUEPRINT}.get_cost_result_cache", return_value=cache):
+        yield cache
+    cache.cache_service.close()
+
+
+@pytest.fixture
+def settings_repository():
+    """Patch the blueprint's database session and cost settings repository."""
+    @contextmanager
+    def get_db():
+        yield Mock()
+
+    repository = Mock()
+    repository.save.side_effect = lambda settings: settings
+    with patch(f"{BLUEPRINT}.get_db", get_db), \
+            patch(f"{BLUEPRINT}.CostSettingsRepository", return_value=repository):
+        yield repository
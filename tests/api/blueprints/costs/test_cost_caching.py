@@ -0,0 +1,51 @@
+"""Tests for cached route cost calculations through the costs blueprint."""
+import random
+from unittest.mock import Mock, patch
+
+import pytest
+
+from tests.fixtures.cost_data import make_route, rate_settings
+
+
+@pytest.fixture
+def route():
+    """Create a stored route."""
+    return make_route(random.Random(21), with_empty_driving=True)
+
+
+@pytest.fixture
+def blueprint(route, settings_repository):
+    """Patch the blueprint's repositories to serve the route and its settings."""
+    settings_repository.get_by_route_id.return_value = rate_settings({
+        "DE": {"fuel": 1.79, "toll": 0.348, "driver": 35.5}
+    })
+    route_repository = Mock()
+    route_repository.get.side_effect = lambda route_id: route if route_id == route.id else None
+    with patch("src.api.blueprints.costs.costs.RouteRepository", return_value=route_repository):
+        yield
+
+
+def test_repeated_calculation_is_served_from_cache(client, route, cost_cache, blueprint):
+    """Test that a repeated calculation is a cache hit with a new cost record."""
+    url = f"/api/costs/routes/{route.id}/calculate"
+
+    first = client.post(url)
+    second = client.post(url)
+
+    assert first.status_code == second.status_code == 200
+    first, second = first.get_json(), second.get_json()
+    assert first["cost_id"] != second["cost_id"]
+    assert first["breakdown"] == second["breakdown"]
+    assert first["total"] == second["total"]
+    assert float(first["total"]["amount"]) > 0
+    assert set(first["breakdown"]["fuel_costs"]) <= {segment.country_code for segment in route.country_segments}
+    assert cost_cache.get_stats()["hits"] == 1
+    assert client.get("/api/costs/costs/cache").get_json()["hits"] == 1
+
+
+def test_calculation_of_unknown_route(client, cost_cache, blueprint):
+    """Test that an unknown route is not found and not cached."""
+    response = client.post(f"/api/costs/routes/{make_route(random.Random(1), False).id}/calculate")
+
+    assert response.status_code == 404
+    assert cost_cache.get_stats()["misses"] == 0
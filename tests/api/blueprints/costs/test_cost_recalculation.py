@@ -0,0 +1,115 @@
+"""Tests for stored cost recalculation through the costs blueprint."""
+import random
+import time
+from decimal import Decimal
+from unittest.mock import patch
+from uuid import uuid4
+
+import pytest
+
+from src.domain.services.cost.compiled_settings import CompiledCostSettings
+from src.domain.services.cost.cost_calculation import CostCalculationService
+from src.domain.services.cost.recalculation import COMPLETED, CostRecalculationService
+from tests.fixtures.cost_data import make_route, rate_settings
+from tests.mocks.memory_cost_repository import MemoryCostRepository
+
+
+@pytest.fixture
+def settings(settings_repository):
+    """Serve stored settings of a route from the patched repository."""
+    settings = rate_settings({
+        "DE": {"fuel": 1.79, "toll": 0.348, "driver": 35.5},
+        "PL": {"fuel": 1.52, "toll": 0.187, "driver": 22.0}
+    })
+    settings_repository.get_by_route_id.return_value = settings
+    return settings
+
+
+@pytest.fixture
+def cost_repository(settings):
+    """Store costs computed with the settings."""
+    rng = random.Random(23)
+    service = CostCalculationService()
+    rates = CompiledCostSettings.compile(settings)
+    repository = MemoryCostRepository()
+    for i in range(10):
+        route = make_route(rng, with_empty_driving=i % 2 == 0)
+        repository.save(uuid4(), service.get_cost_dependencies(route, settings), rates)
+    return repository
+
+
+@pytest.fixture
+def recalculator(cost_repository):
+    """Patch the blueprint's recalculator."""
+    recalculator = CostRecalculationService(cost_repository)
+    with patch("src.api.blueprints.costs.costs.get_cost_recalculator", return_value=recalculator):
+        yield recalculator
+    recalculator.close()
+
+
+def poll(client, job_id: str) -> dict:
+    """Poll a recalculation job until it finishes."""
+    deadline = time.monotonic() + 10
+    while True:
+        response = client.get(f"/api/costs/costs/recalculations/{job_id}")
+        assert response.status_code == 200
+        job = response.get_json()
+        if job["finished_at"] or time.monotonic() > deadline:
+            return job
+        time.sleep(0.01)
+
+
+def test_settings_update_recalculates_stored_costs(
+    client, settings, settings_repository, cost_repository, recalculator, cost_cache
+):
+    """Test that a settings PUT starts a job recomputing the stale costs."""
+    before = {cost_id: dict(amounts) for cost_id, amounts in cost_repository.amounts.items()}
+
+    response = client.put(
+        f"/api/costs/routes/{settings.route_id}/settings",
+        json={"driver_rates": {"default": "30.0", "DE": "35.5", "PL": "24.5"}}
+    )
+
+    assert response.status_code == 200
+    body = response.get_json()
+    assert body["driver_rates"]["PL"] == "24.5"
+    assert body["modified_at"] != settings.modified_at.isoformat()
+    saved = settings_repository.save.call_args.args[0]
+    assert saved.id == settings.id
+    assert saved.driver_rates["PL"] == Decimal("24.5")
+
+    job = poll(client, body["recalculation_job_id"])
+
+    affected = [cost_id for cost_id, amounts in before.items() if "driver_costs.PL" in amounts]
+    assert affected
+    assert job["status"] == COMPLETED
+    assert job["changed_keys"] == ["driver_rate:PL"]
+    assert job["processed"] == job["total"] == len(affected)
+    assert job["progress"] == 1.0
+    for cost_id, amounts in cost_repository.amounts.items():
+        for path, amount in amounts.items():
+            if path == "driver_costs.PL":
+                assert amount > before[cost_id][path]
+            else:
+                assert amount == before[cost_id][path]
+    listed = client.get("/api/costs/costs/recalculations").get_json()["jobs"]
+    assert [listed_job["id"] for listed_job in listed] == [job["id"]]
+
+
+def test_invalid_settings_update_is_rejected(client, settings, settings_repository, recalculator):
+    """Test that an invalid update is not saved and starts no job."""
+    response = client.put(
+        f"/api/costs/routes/{settings.route_id}/settings",
+        json={"enabled_components": "all"}
+    )
+
+    assert response.status_code == 400
+    settings_repository.save.assert_not_called()
+    assert recalculator.list_jobs() == []
+
+
+def test_unknown_job(client, recalculator):
+    """Test that a job unknown to this process is not found."""
+    response = client.get(f"/api/costs/costs/recalculations/{uuid4()}")
+
+    assert response.status_code == 404
@@ -0,0 +1,45 @@
+"""Benchmark repricing many routes one at a time and in one batch.
+
+The per-route path calls calculate_detailed_cost for every route, with a
+cache too small to hold results; the batch path is calculate_batch.
+
+Usage:
+    python -m tests.benchmarks.bench_batch_cost [--routes 5000]
+"""
+import argparse
+import random
+import time
+
+from src.domain.services.cost.cost_cache import CostResultCache
+from src.domain.services.cost.cost_calculation import CostCalculationService
+from tests.fixtures.cost_data import make_route, rate_settings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--routes", type=int, default=5000)
+    args = parser.parse_args()
+
+    rng = random.Random(0)
+    routes = [make_route(rng, with_empty_driving=i % 3 == 0) for i in range(args.routes)]
+    settings = rate_settings({})
+    cache = CostResultCache(max_entries=1)
+    service = CostCalculationService(result_cache=cache)
+
+    start = time.perf_counter()
+    for route in routes:
+        service.calculate_detailed_cost(route, settings)
+    per_route = time.perf_counter() - start
+    cache.cache_service.close()
+
+    start = time.perf_counter()
+    result = service.calculate_batch(routes, settings)
+    batch = time.perf_counter() - start
+
+    print(f"{'path':<10}{'routes':>10}{'seconds':>10}{'routes/s':>12}")
+    print(f"{'per-route':<10}{len(routes):>10}{per_route:>10.3f}{len(routes) / per_route:>12,.0f}")
+    print(f"{'batch':<10}{len(result):>10}{batch:>10.3f}{len(routes) / batch:>12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Benchmark cache eviction policies at growing cache sizes.
+
+Fills a policy to capacity, then measures mean and p99 latency of a mixed
+workload (80% gets, 20% sets of new keys, so every set evicts). With O(1)
+policies the latency should stay flat from 10k to 1M items.
+
+Usage:
+    python -m tests.benchmarks.bench_cache_eviction [--sizes 10000 100000 1000000]
+"""
+import argparse
+import random
+import time
+from typing import Dict, List
+
+from src.domain.services.common.eviction import create_eviction_policy
+
+POLICIES = ("lru", "tinylfu")
+
+
+def run(policy_name: str, size: int, operations: int = 100_000, seed: int = 0) -> Dict[str, float]:
+    """Benchmark one policy at one size.
+
+    Args:
+        policy_name: Eviction policy name
+        size: Cache capacity, filled before measuring
+        operations: Number of measured operations
+        seed: Random seed
+
+    Returns:
+        Mean and p99 latency per operation in microseconds
+    """
+    rng = random.Random(seed)
+    policy = create_eviction_policy(policy_name, size)
+    for key in range(size):
+        policy.put(key, key, expires_at=float("inf"))
+
+    next_key = size
+    timings: List[float] = []
+    clock = time.perf_counter
+    for _ in range(operations):
+        if rng.random() < 0.8:
+            key = rng.randrange(next_key)
+            start = clock()
+            policy.get(key)
+        else:
+            key = next_key
+            next_key += 1
+            start = clock()
+            policy.put(key, key, expires_at=float("inf"))
+        timings.append(clock() - start)
+
+    timings.sort()
+    return {
+        "mean_us": sum(timings) / len(timings) * 1e6,
+        "p99_us": timings[int(len(timings) * 0.99)] * 1e6
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--operations", type=int, default=100_000)
+    args = parser.parse_args()
+
+    print(f"{'policy':<10}{'items':>12}{'mean us':>12}{'p99 us':>12}")
+    for policy_name in POLICIES:
+        for size in args.sizes:
+            result = run(policy_name, size, args.operations)
+            print(f"{policy_name:<10}{size:>12,}{result['mean_us']:>12.2f}{result['p99_us']:>12.2f}")
+
+
+if __name__ == "__main__":
+    main()
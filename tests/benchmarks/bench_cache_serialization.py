@@ -0,0 +1,107 @@
+"""Benchmark the cost of a cache hit for our largest cached objects.
+
+Compares, per object, the old remote-hit path (a ``.dict()`` value rebuilt
+with full validation) against serializer registry payloads rebuilt with
+``model_construct``, and reports payload sizes. The memory tier keeps
+objects as is, so a memory hit costs neither.
+
+Usage:
+    python -m tests.benchmarks.bench_cache_serialization [--repeat 2000]
+"""
+import argparse
+import json
+import time
+from datetime import datetime
+from decimal import Decimal
+from typing import Any, Callable, Dict
+from uuid import uuid4
+
+from src.domain.value_objects import CostBreakdown, CountrySegment, RouteOptimization
+from src.infrastructure.services.serialization import get_serializer_registry
+
+COUNTRIES = ("DE", "PL", "CZ", "AT", "HU", "SK", "FR", "BE", "NL", "IT", "ES", "PT")
+
+
+def build_objects() -> Dict[str, Any]:
+    """Build realistic worst-case cached values."""
+    costs = {code: Decimal("123.45") for code in COUNTRIES}
+    breakdown = CostBreakdown(
+        route_id=uuid4(),
+        fuel_costs=costs,
+        toll_costs=costs,
+        maintenance_costs=costs,
+        driver_costs=costs,
+        empty_driving_costs={code: {"fuel": Decimal("10.00"), "toll": Decimal("5.00")} for code in COUNTRIES},
+        cargo_specific_costs={"cleaning": Decimal("50.00"), "insurance": Decimal("75.00")},
+        overheads={"admin": Decimal("40.00"), "insurance": Decimal("30.00")},
+        total_cost=Decimal("9876.54")
+    )
+    optimization = RouteOptimization(
+        optimization_id=uuid4(),
+        timestamp=datetime.now(),
+        objective_value=0.85,
+        route_id=uuid4(),
+        original_distance=2400.0,
+        optimized_distance=2250.0,
+        original_duration=30.0,
+        optimized_duration=28.0,
+        alternative_routes=[
+            {"distance": 2300.0 + n, "duration": 29.0, "countries": list(COUNTRIES)}
+            for n in range(20)
+        ],
+        optimization_parameters={"weights": {code: 1.0 for code in COUNTRIES}}
+    )
+    segments = [
+        CountrySegment(
+            country_code=code,
+            distance=Decimal("200.5"),
+            duration_hours=Decimal("2.5"),
+            has_tolls=True
+        )
+        for code in COUNTRIES
+    ]
+    return {"CostBreakdown": breakdown, "RouteOptimization": optimization, "CountrySegment x12": segments}
+
+
+def validate_from_dict(value: Any) -> Callable[[], Any]:
+    """Old remote hit: JSON-compatible dict rebuilt with validation."""
+    if isinstance(value, list):
+        model_cls = type(value[0])
+        data = json.dumps([item.dict() for item in value], default=str)
+        return lambda: [model_cls(**item) for item in json.loads(data)]
+    model_cls = type(value)
+    data = json.dumps(value.dict(), default=str)
+    return lambda: model_cls(**json.loads(data))
+
+
+def timed(func: Callable[[], Any], repeat: int) -> float:
+    """Mean call time in microseconds."""
+    func()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=2000)
+    args = parser.parse_args()
+
+    registry = get_serializer_registry()
+    print(f"{'object':<22}{'path':<22}{'hit us':>10}{'bytes':>10}")
+    for name, value in build_objects().items():
+        data = json.dumps(
+            [item.dict() for item in value] if isinstance(value, list) else value.dict(),
+            default=str
+        )
+        hit = timed(validate_from_dict(value), args.repeat)
+        print(f"{name:<22}{'json + validation':<22}{hit:>10.1f}{len(data):>10,}")
+        for serializer in registry.available:
+            payload = registry.dumps(value, serializer)
+            hit = timed(lambda: registry.loads(payload), args.repeat)
+            print(f"{name:<22}{serializer + ' + construct':<22}{hit:>10.1f}{len(payload):>10,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""Benchmark building entities for list endpoints from repository rows.
+
+Converts pages of unsaved ORM rows with each repository's ``_to_entity``,
+once with full validation and once with fast hydration, so the numbers
+cover entity construction only, not the query.
+
+Usage:
+    python -m tests.benchmarks.bench_repository_hydration [--rows 100] [--repeat 50]
+"""
+import argparse
+import time
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from typing import Any, Callable, Dict, List, Tuple
+from uuid import uuid4
+
+from src.infrastructure.models import Cost as CostModel, Offer as OfferModel, Route as RouteModel
+from src.infrastructure.repositories.cost_repository import CostRepository
+from src.infrastructure.repositories.hydration import EntityHydrator
+from src.infrastructure.repositories.offer_repository import OfferRepository
+from src.infrastructure.repositories.route_repository import RouteRepository
+
+COUNTRIES = ("DE", "PL", "CZ", "AT", "HU", "SK")
+
+
+def build_rows(count: int) -> Dict[str, List[Any]]:
+    """Build ORM rows the way the repositories store them."""
+    now = datetime.now(timezone.utc)
+    location = {"address": "Berlin, Germany", "latitude": 52.52, "longitude": 13.405, "country": "DE"}
+    offers = [
+        OfferModel(
+            id=str(uuid4()),
+            route_id=str(uuid4()),
+            cost_history_id=str(uuid4()),
+            total_cost=Decimal("1000.50"),
+            margin=Decimal("0.1500"),
+            final_price=Decimal("1150.58"),
+            fun_fact="Trucks in Germany drive 60 billion km a year",
+            status="active",
+            is_active=True,
+            valid_until=now + timedelta(days=7),
+            version="1.0",
+            extra_data={"source": "benchmark"},
+            created_at=now,
+            modified_at=now
+        )
+        for _ in range(count)
+    ]
+    routes = [
+        RouteModel(
+            id=str(uuid4()),
+            origin=location,
+            destination={**location, "address": "Warsaw, Poland", "country": "PL"},
+            pickup_time=now,
+            delivery_time=now + timedelta(hours=10),
+            transport_type="truck",
+            distance_km=575.0,
+            duration_hours=7.5,
+            empty_driving={"distance_km": 200.0, "duration_hours": 4.0, "origin": location},
+            is_feasible=True,
+            status="planned",
+            is_active=True,
+            extra_data={"version": "1.0", "tags": ["benchmark"], "notes": ""}
+        )
+        for _ in range(count)
+    ]
+    costs = {code: 123.45 for code in COUNTRIES}
+    cost_rows = [
+        CostModel(
+            id=str(uuid4()),
+            route_id=str(uuid4()),
+            calculation_date=now,
+            total_cost=2962.8,
+            version="2.0",
+            is_final=True,
+            calculation_method="standard",
+            cost_components={
+                "fuel_costs": costs,
+                "toll_costs": costs,
+                "driver_costs": costs,
+                "maintenance_costs": costs,
+                "empty_driving_costs": {code: {"fuel": 10.0, "toll": 5.0} for code in COUNTRIES},
+                "total_cost": 2962.8
+            },
+            settings_snapshot={"currency": "EUR"}
+        )
+        for _ in range(count)
+    ]
+    return {"offers": offers, "routes": routes, "costs": cost_rows}
+
+
+def repositories(hydrator: EntityHydrator) -> Dict[str, Callable[[Any], Any]]:
+    """Get each repository's row converter using the given hydrator."""
+    return {
+        "offers": OfferRepository(None, hydrator=hydrator)._to_entity,
+        "routes": RouteRepository(hydrator=hydrator)._to_entity,
+        "costs": CostRepository(None, hydrator=hydrator)._to_entity
+    }
+
+
+def timed(func: Callable[[], Any], repeat: int) -> float:
+    """Mean call time in milliseconds."""
+    func()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat * 1e3
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100)
+    parser.add_argument("--repeat", type=int, default=50)
+    args = parser.parse_args()
+
+    rows = build_rows(args.rows)
+    modes: Tuple[Tuple[str, EntityHydrator], ...] = (
+        ("validated", EntityHydrator(fast=False)),
+        ("fast", EntityHydrator(fast=True))
+    )
+    print(f"{'endpoint':<12}{'hydration':<12}{'page ms':>10}")
+    for name, page in rows.items():
+        for mode, hydrator in modes:
+            to_entity = repositories(hydrator)[name]
+            page_ms = timed(lambda: [to_entity(row) for row in page], args.repeat)
+            print(f"{name:<12}{mode:<12}{page_ms:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
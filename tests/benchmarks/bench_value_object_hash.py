@@ -0,0 +1,81 @@
+"""Benchmark hashing and comparing value objects used as cache keys.
+
+Compares the old ``model_dump`` based hash and equality against the cached
+hash and field comparison of BaseValueObject.
+
+Usage:
+    python -m tests.benchmarks.bench_value_object_hash [--repeat 20000]
+"""
+import argparse
+import time
+from decimal import Decimal
+from typing import Any, Callable, Dict
+
+from src.domain.value_objects import CountrySegment, Location
+
+COUNTRIES = ("DE", "PL", "CZ", "AT", "HU", "SK", "FR", "BE", "NL", "IT", "ES", "PT")
+
+
+def build_objects() -> Dict[str, Any]:
+    """Build value objects the way route planning uses them."""
+    location = Location(
+        latitude=52.5200,
+        longitude=13.4050,
+        address="Berlin, Germany",
+        metadata={"source": "geocoder", "bounds": {"north": 52.7, "south": 52.3}}
+    )
+    segment = CountrySegment(
+        country_code="DE",
+        distance=Decimal("200.5"),
+        duration_hours=Decimal("2.5"),
+        toll_rates={code: Decimal("0.187") for code in COUNTRIES}
+    )
+    return {"Location": location, "CountrySegment": segment}
+
+
+def dump_hash(value: Any) -> int:
+    """Old hash: dump the model and hash its sorted items.
+
+    Values are repr'd, as the old hash failed on nested dict metadata.
+    """
+    return hash(tuple(sorted(
+        (key, repr(item)) for key, item in value.model_dump().items()
+    )))
+
+
+def dump_eq(value: Any, other: Any) -> bool:
+    """Old equality: dump and compare both sides."""
+    return value.model_dump() == other.model_dump()
+
+
+def timed(func: Callable[[], Any], repeat: int) -> float:
+    """Mean call time in microseconds."""
+    func()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func()
+    return (time.perf_counter() - start) / repeat * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=20000)
+    args = parser.parse_args()
+
+    print(f"{'object':<16}{'operation':<22}{'us':>10}")
+    for name, value in build_objects().items():
+        other = value.model_copy()
+        lookup = {other: True}
+        rows = (
+            ("model_dump hash", lambda: dump_hash(value)),
+            ("hash", lambda: hash(value)),
+            ("model_dump eq", lambda: dump_eq(value, other)),
+            ("eq", lambda: value == other),
+            ("dict lookup", lambda: value in lookup),
+        )
+        for operation, func in rows:
+            print(f"{name:<16}{operation:<22}{timed(func, args.repeat):>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
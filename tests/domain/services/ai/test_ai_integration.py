@@ -52,7 +52,8 @@ class TestAIIntegrationService:
         cache_service = mock_factory.create(
             'CacheService',
             get=lambda key: None,
-            set=lambda key, value, ttl: True
+            set=lambda key, value, ttl: True,
+            get_or_compute=lambda key, loader, ttl, **kwargs: loader()
         )
         
         # Create mock model client
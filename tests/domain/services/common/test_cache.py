@@ -0,0 +1,396 @@
+"""Tests for cache service."""
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock
+
+import pytest
+
+from src.domain.services.common.cache import CacheService
+from src.infrastructure.services.serialization import get_serializer_registry
+from src.infrastructure.services.shared_cache import SharedCacheTier
+from tests.mocks.fake_redis import FakeRedis
+
+
+@pytest.fixture
+def cache():
+    """Memory-only cache service."""
+    return CacheService(max_memory_items=3, default_ttl=60)
+
+
+def test_set_and_get(cache):
+    """Test values round-trip through the memory tier."""
+    assert cache.set("a", {"value": 1})
+    assert cache.get("a") == {"value": 1}
+    assert cache.get("missing", default="fallback") == "fallback"
+
+
+def test_expired_entries_are_misses(cache):
+    """Test expired entries are dropped on read."""
+    cache.set("a", 1, ttl=60)
+    cache._memory.peek("a").expires_at = time.time() - 1
+    assert cache.get("a") is None
+    assert "a" not in cache._memory
+
+
+def test_full_cache_evicts_one_entry(cache):
+    """Test a full cache evicts only the least recently used entry."""
+    for key in "abc":
+        cache.set(key, key)
+    cache.get("a")
+    cache.set("d", "d")
+
+    assert cache.get("b") is None
+    assert [cache.get(key) for key in "acd"] == ["a", "c", "d"]
+    assert cache.get_stats()["memory_cache"]["evictions"] == 1
+
+
+def test_update_does_not_reset_hot_keys():
+    """Test refreshing a hot key keeps it ahead of cold keys."""
+    cache = CacheService(max_memory_items=2, eviction_policy="tinylfu")
+    cache.set("hot", 1)
+    for _ in range(5):
+        cache.get("hot")
+    cache.set("hot", 2)
+
+    for n in range(20):
+        cache.set(f"cold-{n}", n)
+
+    assert cache.get("hot") == 2
+
+
+def test_delete_and_clear(cache):
+    """Test deleting single entries and clearing the cache."""
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.delete("a")
+    assert not cache.delete("a")
+    assert cache.clear()
+    assert cache.get("b") is None
+
+
+def test_stats(cache):
+    """Test hit, miss and size counters."""
+    cache.set("a", 1)
+    cache.get("a")
+    cache.get("missing")
+
+    stats = cache.get_stats()["memory_cache"]
+    assert stats["policy"] == "lru"
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["size"] == 1
+    assert stats["expired"] == 0
+
+
+def test_redis_hit_populates_memory():
+    """Test values found in Redis are cached in memory."""
+    redis = FakeRedis()
+    redis.set("a", {"value": 1}, ex=30)
+    cache = CacheService(redis_client=redis)
+
+    redis.round_trips = 0
+    assert cache.get("a") == {"value": 1}
+    assert redis.round_trips == 1
+    assert cache.get("a") == {"value": 1}
+    assert redis.round_trips == 1
+    assert 25 <= cache._memory.peek("a").expires_at - time.time() <= 30
+
+
+def test_unknown_policy_is_rejected():
+    """Test an unknown eviction policy name is rejected."""
+    with pytest.raises(ValueError):
+        CacheService(eviction_policy="random")
+
+
+def test_sweep_removes_only_due_entries():
+    """Test the expiry sweep removes expired entries and leaves the rest."""
+    cache = CacheService(max_memory_items=100, sweep_interval=0.05, sweep_batch_size=2)
+    cache.close()
+    for n in range(5):
+        cache.set(f"short-{n}", n, ttl=1)
+    cache.set("long", 1, ttl=60)
+    for n in range(5):
+        entry = cache._memory.peek(f"short-{n}")
+        entry.expires_at = time.time() - 1
+        cache._expiry.schedule(entry)
+
+    assert cache.get_stats()["memory_cache"]["expired"] == 5
+    assert cache._remove_expired() == 5
+
+    stats = cache.get_stats()["memory_cache"]
+    assert stats["expired"] == 0
+    assert stats["expirations"] == 5
+    assert stats["size"] == 1
+    assert cache.get("long") == 1
+
+
+def test_background_sweep_expires_entries():
+    """Test the background thread removes entries once they expire."""
+    cache = CacheService(sweep_interval=0.05)
+    try:
+        cache.set("a", 1, ttl=60)
+        entry = cache._memory.peek("a")
+        entry.expires_at = time.time() - 1
+        cache._expiry.schedule(entry)
+
+        deadline = time.time() + 2
+        while "a" in cache._memory and time.time() < deadline:
+            time.sleep(0.01)
+        assert "a" not in cache._memory
+    finally:
+        cache.close()
+
+
+def test_get_or_compute_runs_loader_once_for_concurrent_misses():
+    """Test concurrent misses for one key share a single loader call."""
+    cache = CacheService()
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def loader():
+        calls.append(1)
+        started.set()
+        release.wait(2)
+        return {"price": 100}
+
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        futures = [pool.submit(cache.get_or_compute, "k", loader, 60) for _ in range(8)]
+        started.wait(2)
+        time.sleep(0.05)
+        release.set()
+        results = [future.result() for future in futures]
+
+    assert calls == [1]
+    assert results == [{"price": 100}] * 8
+    assert cache.get_or_compute("k", loader, 60) == {"price": 100}
+    assert cache.get_stats()["memory_cache"]["computes"] == 1
+
+
+def test_get_or_compute_propagates_loader_errors(cache):
+    """Test loader errors reach the caller and nothing is cached."""
+    def loader():
+        raise RuntimeError("market client down")
+
+    with pytest.raises(RuntimeError):
+        cache.get_or_compute("k", loader)
+    assert cache.get("k") is None
+
+
+def test_get_or_compute_refreshes_early_near_expiry(cache, monkeypatch):
+    """Test XFetch recomputes a slow value once it is close to expiry."""
+    monkeypatch.setattr(random, "random", lambda: 0.99)
+    cache.get_or_compute("k", lambda: 1, ttl=60)
+    # A 100s compute time and -log(0.01) give a 460s head start
+    cache._memory.peek("k").delta = 100.0
+
+    assert cache.get_or_compute("k", lambda: 2, ttl=60) == 2
+    assert cache.get_stats()["memory_cache"]["early_refreshes"] == 1
+
+    # Without a recorded compute time there is no early refresh
+    cache._memory.peek("k").delta = 0.0
+    assert cache.get_or_compute("k", lambda: 3, ttl=60) == 2
+
+
+def test_get_or_compute_serves_stale_while_revalidating(cache):
+    """Test an expired value is served while one background call refreshes it."""
+    cache.get_or_compute("k", lambda: "old", ttl=60, stale_ttl=30)
+    cache._memory.peek("k").fresh_until = time.time() - 1
+    assert cache.get("k") is None
+
+    refreshed = threading.Event()
+
+    def loader():
+        refreshed.set()
+        return "new"
+
+    assert cache.get_or_compute("k", loader, ttl=60, stale_ttl=30) == "old"
+    assert refreshed.wait(2)
+    deadline = time.time() + 2
+    while cache.get("k") != "new" and time.time() < deadline:
+        time.sleep(0.01)
+    assert cache.get("k") == "new"
+    assert cache.get_stats()["memory_cache"]["stale_served"] == 1
+
+
+def test_invalidate_tag_removes_only_tagged_entries():
+    """Test invalidating a tag leaves entries without it."""
+    cache = CacheService()
+    cache.set("cost:1", 1, tags=["country:DE", "settings:1"])
+    cache.set("cost:2", 2, tags=["country:PL", "settings:1"])
+    cache.set("other", 3)
+
+    assert cache.invalidate_tag("country:DE") == 1
+    assert cache.get("cost:1") is None
+    assert cache.get("cost:2") == 2
+
+    assert cache.invalidate_tag("settings:1") == 1
+    assert cache.get("cost:2") is None
+    assert cache.get("other") == 3
+    assert cache.get_stats()["memory_cache"]["invalidations"] == 2
+
+
+def test_invalidate_namespace():
+    """Test a namespace covers every key built with its prefix."""
+    cache = CacheService()
+    cache.set(CacheService.make_key("cost", "route-1", 3), 1)
+    cache.set(CacheService.make_key("cost", "route-2", 3), 2)
+    cache.set(CacheService.make_key("market", "route-1"), 3)
+
+    assert cache.invalidate_namespace("cost") == 2
+    assert cache.get("cost:route-1:3") is None
+    assert cache.get("market:route-1") == 3
+
+
+def test_tag_index_follows_evictions_and_updates(cache):
+    """Test the tag index drops keys that were evicted or retagged."""
+    cache.set("a", 1, tags=["t"])
+    cache.set("a", 2, tags=["u"])
+    for key in "bcd":
+        cache.set(key, key, tags=["u"])
+
+    assert "t" not in cache._tags
+    assert cache._tags["u"] == {"b", "c", "d"}
+    assert cache.invalidate_tag("u") == 3
+    assert cache.get_stats()["memory_cache"]["tags"] == 0
+
+
+def test_invalidate_tag_uses_redis_index():
+    """Test tagged keys are indexed in Redis and deleted from both tiers."""
+    redis = FakeRedis()
+    # Tagged by another process
+    redis.set("cost:2", 2, ex=60)
+    redis.sadd("cache-tag:country:DE", "cost:2")
+    cache = CacheService(redis_client=redis)
+
+    cache.set("cost:1", 1, ttl=60, tags=["country:DE"])
+    cache.set("cost:3", 3, ttl=60, tags=["country:PL"])
+    assert redis.smembers("cache-tag:country:DE") == {b"cost:1", b"cost:2"}
+    assert redis.smembers("cache-tag:namespace:cost") == {b"cost:1", b"cost:3"}
+    assert 0 < redis.ttl("cache-tag:country:DE") <= 60
+
+    assert cache.invalidate_tag("country:DE") == 2
+    assert redis.get("cost:1") is None and redis.get("cost:2") is None
+    assert get_serializer_registry().loads(redis.get("cost:3")) == 3
+    assert redis.ttl("cache-tag:country:DE") == -2
+    assert "cost:1" not in cache._memory
+
+
+def test_byte_budget_limits_memory_size():
+    """Test the memory tier evicts by approximate size, not item count."""
+    cache = CacheService(max_memory_items=1000, max_memory_bytes=15_000)
+    for n in range(50):
+        cache.set(f"toll:{n}", "x" * 200)
+    cache.set("directions:1", {"steps": [str(n) * 1000 for n in range(10)]})
+
+    stats = cache.get_stats()["memory_cache"]
+    assert stats["bytes"] <= 15_000
+    assert stats["evictions"] > 0
+    assert cache.get("directions:1") is not None
+
+
+def test_oversized_entries_are_compressed():
+    """Test values over the entry limit are stored compressed."""
+    cache = CacheService(max_entry_bytes=5_000)
+    value = {"polyline": "abc" * 10_000}
+    assert cache.set("directions:1", value)
+
+    assert cache.get("directions:1") == value
+    stats = cache.get_stats()["memory_cache"]
+    assert stats["compressed"] == 1
+    assert stats["bytes"] <= 5_000
+
+
+def test_oversized_entries_can_be_rejected():
+    """Test values over the entry limit stay out of memory when compression is off."""
+    cache = CacheService(max_entry_bytes=1_000, compress_oversized=False)
+    cache.set("directions:1", "small")
+    assert not cache.set("directions:1", "x" * 10_000)
+
+    assert cache.get("directions:1") is None
+    assert cache.get_stats()["memory_cache"]["rejected"] == 1
+
+
+def test_stats_report_usage_by_namespace():
+    """Test memory usage is broken down by key namespace."""
+    cache = CacheService()
+    cache.set("toll:1", 1.5)
+    cache.set("toll:2", 2.5)
+    cache.set("directions:1", {"steps": list(range(100))})
+    cache.set("plain", 1)
+    cache.delete("toll:2")
+
+    namespaces = cache.get_stats()["memory_cache"]["namespaces"]
+    assert set(namespaces) == {"default", "directions", "toll"}
+    assert namespaces["toll"]["items"] == 1
+    assert namespaces["directions"]["bytes"] > namespaces["toll"]["bytes"]
+    assert sum(usage["bytes"] for usage in namespaces.values()) == cache.get_stats()["memory_cache"]["bytes"]
+
+
+def test_shared_tier_serves_other_workers(tmp_path):
+    """Test a value computed in one worker is a hit in another."""
+    path = str(tmp_path / "shared.db")
+    first = CacheService(shared_tier=SharedCacheTier(path))
+    second = CacheService(shared_tier=SharedCacheTier(path))
+
+    first.get_or_compute("market:1", lambda: {"demand": 0.7}, ttl=60, tags=["country:DE"])
+    loader = Mock(return_value={"demand": 0.1})
+    assert second.get_or_compute("market:1", loader, ttl=60) == {"demand": 0.7}
+    loader.assert_not_called()
+    assert "market:1" in second._memory
+
+    # Invalidation through either worker clears the shared copy
+    assert second.invalidate_tag("country:DE") == 1
+    assert first.get("market:1") == {"demand": 0.7}
+    first.delete("market:1")
+    assert second.get("market:1") is None
+
+
+def test_get_many_uses_one_redis_round_trip():
+    """Test bulk lookups fetch values and TTLs in one pipeline."""
+    redis = FakeRedis()
+    for n in range(100):
+        redis.set(f"cost:{n}", n, ex=60)
+    cache = CacheService(redis_client=redis)
+    cache.set("cost:0", 0)
+
+    redis.round_trips = 0
+    found = cache.get_many([f"cost:{n}" for n in range(120)])
+    assert found == {f"cost:{n}": n for n in range(100)}
+    assert redis.round_trips == 1
+
+    # Every remote hit is now in memory
+    assert cache.get_many([f"cost:{n}" for n in range(100)]) == found
+    assert redis.round_trips == 1
+
+
+def test_set_many_pipelines_values_and_tags():
+    """Test bulk writes cost a constant number of round trips."""
+    redis = FakeRedis()
+    cache = CacheService(redis_client=redis)
+
+    redis.round_trips = 0
+    assert cache.set_many({f"cost:{n}": n for n in range(100)}, ttl=60, tags=["settings:1"])
+    assert redis.round_trips <= 2
+    assert get_serializer_registry().loads(redis.get("cost:42")) == 42
+    assert len(redis.smembers("cache-tag:settings:1")) == 100
+
+    assert cache.get_many(["cost:1", "cost:2"]) == {"cost:1": 1, "cost:2": 2}
+    assert cache.invalidate_tag("settings:1") == 100
+    assert cache.get_many(["cost:1"]) == {}
+
+
+def test_get_many_reads_shared_tier_before_redis(tmp_path):
+    """Test bulk lookups try the shared tier first and fill it from Redis."""
+    redis = FakeRedis()
+    redis.set("cost:2", 2, ex=60)
+    shared = SharedCacheTier(str(tmp_path / "shared.db"))
+    shared.set("cost:1", 1, ttl=60)
+    cache = CacheService(redis_client=redis, shared_tier=shared)
+
+    redis.round_trips = 0
+    assert cache.get_many(["cost:1", "cost:2", "cost:3"]) == {"cost:1": 1, "cost:2": 2}
+    assert redis.round_trips == 1
+    assert shared.get("cost:2")[0] == 2
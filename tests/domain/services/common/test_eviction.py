@@ -0,0 +1,143 @@
+"""Tests for cache eviction policies."""
+import pytest
+
+from src.domain.services.common.eviction import (
+    FrequencySketch,
+    LRUPolicy,
+    TinyLFUPolicy,
+    create_eviction_policy
+)
+
+
+def test_lru_evicts_least_recently_used():
+    """Test the least recently accessed entry is evicted first."""
+    policy = LRUPolicy(3)
+    for key in "abc":
+        policy.put(key, key.upper(), expires_at=100.0)
+    policy.get("a")
+
+    evicted = policy.put("d", "D", expires_at=100.0)
+
+    assert [entry.key for entry in evicted] == ["b"]
+    assert "b" not in policy
+    assert len(policy) == 3
+
+
+def test_update_keeps_frequency():
+    """Test updating a key keeps its frequency and counts as an access."""
+    policy = LRUPolicy(2)
+    policy.put("hot", 1, expires_at=100.0)
+    policy.get("hot")
+    policy.put("cold", 1, expires_at=100.0)
+
+    assert policy.put("hot", 2, expires_at=200.0) == []
+    entry = policy.peek("hot")
+    assert entry.value == 2
+    assert entry.expires_at == 200.0
+    assert entry.frequency == 2
+
+    # The update made "hot" the most recent, so "cold" goes first
+    assert [entry.key for entry in policy.put("new", 1, expires_at=100.0)] == ["cold"]
+
+
+def test_pop_and_clear():
+    """Test entries can be removed individually and all at once."""
+    policy = LRUPolicy(3)
+    policy.put("a", 1, expires_at=100.0)
+    policy.put("b", 2, expires_at=100.0)
+
+    assert policy.pop("a").value == 1
+    assert policy.pop("a") is None
+    policy.clear()
+    assert len(policy) == 0
+    assert policy.put("c", 3, expires_at=100.0) == []
+
+
+def test_tinylfu_keeps_frequent_keys_under_scan():
+    """Test a scan of one-off keys does not flush frequently used ones."""
+    policy = TinyLFUPolicy(100)
+    hot = [f"hot-{n}" for n in range(50)]
+    for _ in range(5):
+        for key in hot:
+            if policy.get(key) is None:
+                policy.put(key, key, expires_at=100.0)
+
+    for n in range(1000):
+        policy.put(f"scan-{n}", n, expires_at=100.0)
+
+    # Count-min estimates are approximate, so allow a few losses
+    assert sum(key in policy for key in hot) >= 45
+    assert len(policy) <= 100
+
+
+def test_lru_is_flushed_by_scan():
+    """Test the same scan flushes an LRU cache, for contrast."""
+    policy = LRUPolicy(100)
+    hot = [f"hot-{n}" for n in range(50)]
+    for key in hot:
+        policy.put(key, key, expires_at=100.0)
+    for n in range(1000):
+        policy.put(f"scan-{n}", n, expires_at=100.0)
+
+    assert not any(key in policy for key in hot)
+
+
+def test_tinylfu_never_exceeds_capacity():
+    """Test inserts and promotions stay within capacity."""
+    policy = TinyLFUPolicy(10)
+    evicted = 0
+    for n in range(200):
+        evicted += len(policy.put(n % 37, n, expires_at=100.0))
+        policy.get((n * 7) % 37)
+        assert len(policy) <= 10
+    assert evicted > 0
+
+
+def test_frequency_sketch_ages_counts():
+    """Test counters saturate and are halved after the sample size."""
+    sketch = FrequencySketch(16)
+    for _ in range(20):
+        sketch.increment("key")
+    assert sketch.estimate("key") == 15
+
+    for n in range(sketch.sample_size):
+        sketch.increment(n)
+    assert sketch.estimate("key") < 15
+
+
+def test_create_eviction_policy():
+    """Test policies are selected by name."""
+    assert isinstance(create_eviction_policy("lru", 10), LRUPolicy)
+    assert isinstance(create_eviction_policy("tinylfu", 10), TinyLFUPolicy)
+    with pytest.raises(ValueError):
+        create_eviction_policy("random", 10)
+    with pytest.raises(ValueError):
+        create_eviction_policy("lru", 0)
+
+
+@pytest.mark.parametrize("policy_cls", [LRUPolicy, TinyLFUPolicy])
+def test_weight_budget_evicts_until_total_fits(policy_cls):
+    """Test heavy entries push out enough others to stay within budget."""
+    policy = policy_cls(100, max_weight=100)
+    for n in range(10):
+        policy.put(n, n, 0.0, weight=10)
+    assert policy.weight == 100
+
+    evicted = policy.put("big", "big", 0.0, weight=45)
+    assert sum(entry.weight for entry in evicted) >= 45
+    assert policy.weight <= 100
+    assert "big" in policy
+
+    # An entry larger than the budget is kept alone
+    policy.put("huge", "huge", 0.0, weight=500)
+    assert len(policy) == 1 and policy.weight == 500
+
+
+def test_update_adjusts_weight():
+    """Test replacing a value updates the total weight."""
+    policy = LRUPolicy(10, max_weight=1000)
+    policy.put("a", 1, 0.0, weight=10)
+    policy.put("a", 2, 0.0, weight=30)
+    assert policy.weight == 30
+    policy.pop("a")
+    assert policy.weight == 0
@@ -0,0 +1,78 @@
+"""Tests for cache expiry tracking."""
+import pytest
+
+from src.domain.services.common.eviction import CacheEntry
+from src.domain.services.common.expiry import ExpiryWheel
+
+
+def _entry(key, expires_at):
+    return CacheEntry(key, key, expires_at)
+
+
+def test_pop_due_returns_only_expired_entries():
+    """Test only buckets that have fully expired are drained."""
+    wheel = ExpiryWheel(resolution=1.0)
+    entries = [_entry(n, 100.0 + n) for n in range(5)]
+    for entry in entries:
+        wheel.schedule(entry)
+
+    due = wheel.pop_due(now=102.0)
+
+    assert sorted(entry.key for entry in due) == [0, 1, 2]
+    assert len(wheel) == 2
+    assert all(entry.expiry_slot is None for entry in due)
+
+
+def test_pop_due_respects_batch_limit():
+    """Test large drains are split into batches."""
+    wheel = ExpiryWheel()
+    for n in range(10):
+        wheel.schedule(_entry(n, 50.0))
+
+    assert len(wheel.pop_due(now=60.0, limit=4)) == 4
+    assert len(wheel.pop_due(now=60.0, limit=4)) == 4
+    assert len(wheel.pop_due(now=60.0, limit=4)) == 2
+    assert wheel.pop_due(now=60.0) == []
+
+
+def test_reschedule_and_cancel():
+    """Test moved and cancelled entries are not drained at their old time."""
+    wheel = ExpiryWheel()
+    moved = _entry("moved", 10.0)
+    cancelled = _entry("cancelled", 10.0)
+    wheel.schedule(moved)
+    wheel.schedule(cancelled)
+
+    moved.expires_at = 100.0
+    wheel.schedule(moved)
+    wheel.cancel(cancelled)
+
+    assert len(wheel) == 1
+    assert wheel.pop_due(now=50.0) == []
+    assert wheel.pop_due(now=100.0) == [moved]
+
+
+def test_due_count():
+    """Test due entries are counted without draining them."""
+    wheel = ExpiryWheel()
+    for n in range(20):
+        wheel.schedule(_entry(n, float(n)))
+
+    assert wheel.due_count(now=9.5) == 10
+    assert wheel.due_count(now=100.0) == 20
+    assert len(wheel) == 20
+
+
+def test_clear():
+    """Test clearing drops all tracked entries."""
+    wheel = ExpiryWheel()
+    wheel.schedule(_entry("a", 1.0))
+    wheel.clear()
+    assert len(wheel) == 0
+    assert wheel.pop_due(now=10.0) == []
+
+
+def test_invalid_resolution():
+    """Test a non-positive resolution is rejected."""
+    with pytest.raises(ValueError):
+        ExpiryWheel(resolution=0)
@@ -0,0 +1,281 @@
+"""Tests for batch cost calculation."""
+import random
+from datetime import datetime, timedelta, timezone
+from decimal import ROUND_HALF_UP, Decimal
+from typing import Dict, List, Optional
+from uuid import uuid4
+
+import pytest
+
+from src.domain.entities.cost import CostSettings
+from src.domain.entities.route import Route
+from src.domain.services.cost.batch_cost import COMPONENTS, CENT
+from src.domain.interfaces.services.cost_service import CostServiceError
+from src.domain.services.cost.compiled_settings import DEFAULT_FUEL_CONSUMPTION
+from src.domain.services.cost.cost_cache import CostResultCache
+from src.domain.services.cost.cost_calculation import CostCalculationService
+from src.domain.value_objects import CountrySegment
+from tests.fixtures.cost_data import make_route, rate_settings
+
+# Float products drop noise past six places before rounding to the cent
+NOISE = Decimal("0.000001")
+
+
+def exact_amounts(route: Route, settings: CostSettings) -> Dict[str, List[Decimal]]:
+    """Unrounded segment and route amounts in exact decimal arithmetic."""
+    def rate(table: Dict, code: Optional[str]):
+        return table.get(code, table["default"])
+
+    consumption = DEFAULT_FUEL_CONSUMPTION
+    maintenance_rate = settings.maintenance_rates["truck"]
+    amounts: Dict[str, List[Decimal]] = {name: [] for name in COMPONENTS}
+    for segment in route.country_segments:
+        code = segment.country_code
+        amounts["fuel"].append(segment.distance * consumption * rate(settings.fuel_rates, code))
+        amounts["toll"].append(segment.distance * rate(settings.toll_rates, code)["truck"])
+        amounts["driver"].append(segment.duration_hours * rate(settings.driver_rates, code))
+    amounts["maintenance"].append(Decimal(str(route.distance_km)) * maintenance_rate)
+    amounts["overhead"].append(Decimal(str(route.duration_hours)) * settings.overhead_rates["time"])
+    if route.empty_driving:
+        distance = Decimal(str(route.empty_driving.distance_km))
+        fuel_price = rate(settings.fuel_rates, route.empty_driving.origin.country)
+        amounts["empty_driving_fuel"].append(distance * consumption * fuel_price)
+        amounts["empty_driving_maintenance"].append(distance * maintenance_rate)
+    return amounts
+
+
+def baseline_entries(route: Route, settings: CostSettings) -> List[Decimal]:
+    """Cost entries as cost code stored them before Money, unrounded float products."""
+    def rate(table: Dict, code: Optional[str]) -> float:
+        return float(table.get(code, table["default"]))
+
+    consumption = float(DEFAULT_FUEL_CONSUMPTION)
+    maintenance_rate = float(settings.maintenance_rates["truck"])
+    entries = []
+    for segment in route.country_segments:
+        code = segment.country_code
+        distance = float(segment.distance)
+        toll_rate = float(settings.toll_rates.get(code, settings.toll_rates["default"])["truck"])
+        entries.append(Decimal(str(distance * consumption * rate(settings.fuel_rates, code))))
+        entries.append(Decimal(str(distance * toll_rate)))
+        entries.append(Decimal(str(float(segment.duration_hours) * rate(settings.driver_rates, code))))
+    entries.append(Decimal(str(route.distance_km * maintenance_rate)))
+    entries.append(Decimal(str(route.duration_hours * float(settings.overhead_rates["time"]))))
+    if route.empty_driving:
+        distance = route.empty_driving.distance_km
+        fuel_price = rate(settings.fuel_rates, route.empty_driving.origin.country)
+        entries.append(Decimal(str(distance * consumption * fuel_price)))
+        entries.append(Decimal(str(distance * maintenance_rate)))
+    return entries
+
+
+def cents(amount: Decimal) -> Decimal:
+    """Round an amount to the cent."""
+    return amount.quantize(CENT, rounding=ROUND_HALF_UP)
+
+
+def breakdown_amounts(breakdown) -> Dict:
+    """Cost amounts of a breakdown by field."""
+    return {
+        field: getattr(breakdown, field)
+        for field in (
+            "fuel_costs", "toll_costs", "driver_costs", "maintenance_costs",
+            "overheads", "empty_driving_costs", "total_cost"
+        )
+    }
+
+
+def rounded_totals(route: Route, settings: CostSettings) -> Dict[str, Decimal]:
+    """Component totals as sums of exact amounts rounded to the cent."""
+    return {
+        name: sum((cents(amount) for amount in amounts), Decimal("0.00"))
+        for name, amounts in exact_amounts(route, settings).items()
+    }
+
+
+@pytest.fixture
+def settings() -> CostSettings:
+    """Create settings with country rates."""
+    return rate_settings({
+        "DE": {"fuel": 1.79, "toll": 0.348, "driver": 35.5},
+        "PL": {"fuel": 1.52, "toll": 0.187, "driver": 22.0},
+        "FR": {"fuel": 1.85, "toll": 0.256, "driver": 38.25}
+    })
+
+
+def test_batch_matches_exact_amounts_to_the_cent(settings):
+    """Test that batch totals are sums of exact amounts rounded to the cent."""
+    rng = random.Random(21)
+    routes = [make_route(rng, with_empty_driving=i % 3 == 0) for i in range(300)]
+
+    result = CostCalculationService().calculate_batch(routes, settings)
+
+    assert len(result) == len(routes)
+    assert result.route_ids == [route.id for route in routes]
+    for i, route in enumerate(routes):
+        expected = rounded_totals(route, settings)
+        assert result.component_totals(i) == expected
+        assert result.total(i) == sum(expected.values())
+
+
+def test_totals_stay_within_rounding_of_exact_totals(settings):
+    """Test parity with the unrounded decimal totals costs were reported at."""
+    rng = random.Random(23)
+    routes = [make_route(rng, with_empty_driving=i % 2 == 0) for i in range(300)]
+
+    result = CostCalculationService().calculate_batch(routes, settings)
+
+    for i, route in enumerate(routes):
+        amounts = exact_amounts(route, settings)
+        totals = result.component_totals(i)
+        for name, component_amounts in amounts.items():
+            assert abs(totals[name] - sum(component_amounts, Decimal("0"))) <= CENT / 2 * len(component_amounts)
+        entries = [amount for component_amounts in amounts.values() for amount in component_amounts]
+        assert abs(result.total(i) - sum(entries, Decimal("0"))) <= CENT / 2 * len(entries)
+
+
+def test_batch_matches_detailed_costs(settings):
+    """Test that batch breakdowns equal detailed cost breakdowns route by route."""
+    rng = random.Random(27)
+    routes = [make_route(rng, with_empty_driving=i % 3 == 0) for i in range(200)]
+    service = CostCalculationService(result_cache=CostResultCache(max_entries=1))
+
+    result = service.calculate_batch(routes, settings)
+
+    for i, route in enumerate(routes):
+        cost = service.calculate_detailed_cost(route, settings)
+        assert breakdown_amounts(cost.breakdown) == breakdown_amounts(result.breakdown(i))
+        assert cost.total_cost == result.total(i)
+    service.result_cache.cache_service.close()
+
+
+def test_batch_matches_route_costs(settings):
+    """Test that batch totals equal route costs built from the same segments."""
+    rng = random.Random(29)
+    routes = [make_route(rng, with_empty_driving=False) for _ in range(200)]
+    service = CostCalculationService(result_cache=CostResultCache(max_entries=1))
+
+    result = service.calculate_batch(routes, settings)
+
+    for i, route in enumerate(routes):
+        cost = service.calculate_route_cost(
+            route_id=route.id,
+            distance_km=Decimal(str(route.distance_km)),
+            duration_hours=Decimal(str(route.duration_hours)),
+            country_segments=[
+                {
+                    "country_code": segment.country_code,
+                    "distance_km": segment.distance,
+                    "duration_hours": segment.duration_hours
+                }
+                for segment in route.country_segments
+            ],
+            settings=settings
+        )
+        assert breakdown_amounts(cost.breakdown) == breakdown_amounts(result.breakdown(i))
+        assert cost.total_cost == result.total(i)
+    service.result_cache.cache_service.close()
+
+
+def test_detailed_costs_stay_within_rounding_of_baseline_costs(settings):
+    """Test detailed cost totals against the unrounded entries summed before Money."""
+    rng = random.Random(25)
+    routes = [make_route(rng, with_empty_driving=i % 2 == 0) for i in range(200)]
+    service = CostCalculationService(result_cache=CostResultCache(max_entries=1))
+
+    for route in routes:
+        entries = baseline_entries(route, settings)
+        cost = service.calculate_detailed_cost(route, settings)
+        assert abs(cost.total_cost - sum(entries, Decimal("0"))) <= (CENT / 2 + NOISE) * len(entries)
+    service.result_cache.cache_service.close()
+
+
+def test_batch_breakdown_per_country(settings):
+    """Test the per-country breakdown of one route."""
+    now = datetime.now(timezone.utc)
+    route = Route(
+        origin={"address": "Berlin"},
+        destination={"address": "Warsaw"},
+        pickup_time=now,
+        delivery_time=now + timedelta(hours=8),
+        distance_km=600.0,
+        duration_hours=7.0,
+        country_segments=[
+            CountrySegment(country_code="DE", distance=Decimal("100"), duration_hours=Decimal("1")),
+            CountrySegment(country_code="PL", distance=Decimal("400"), duration_hours=Decimal("5")),
+            CountrySegment(country_code="DE", distance=Decimal("100"), duration_hours=Decimal("1"))
+        ]
+    )
+
+    breakdown = CostCalculationService().calculate_batch([route], settings).breakdown(0)
+
+    assert breakdown.route_id == route.id
+    assert breakdown.fuel_costs == {"DE": Decimal("125.30"), "PL": Decimal("212.80")}
+    assert breakdown.toll_costs == {"DE": Decimal("69.60"), "PL": Decimal("74.80")}
+    assert breakdown.driver_costs == {"DE": Decimal("71.00"), "PL": Decimal("110.00")}
+    assert breakdown.maintenance_costs == {"truck": Decimal("90.00")}
+    assert breakdown.overheads == {"overhead": Decimal("70.00")}
+    assert breakdown.empty_driving_costs == {}
+    assert breakdown.total_cost == Decimal("823.50")
+
+
+def test_batch_without_empty_driving(settings):
+    """Test that empty driving can be left out of a batch."""
+    rng = random.Random(7)
+    routes = [make_route(rng, with_empty_driving=True) for _ in range(5)]
+
+    result = CostCalculationService().calculate_batch(routes, settings, include_empty_driving=False)
+
+    for i in range(len(routes)):
+        totals = result.component_totals(i)
+        assert totals["empty_driving_fuel"] == Decimal("0.00")
+        assert totals["empty_driving_maintenance"] == Decimal("0.00")
+
+
+def test_batch_of_no_routes(settings):
+    """Test an empty batch."""
+    result = CostCalculationService().calculate_batch([], settings)
+
+    assert len(result) == 0
+    assert result.route_totals().shape == (0,)
+
+
+def test_batch_requires_settings():
+    """Test that a batch without settings fails."""
+    with pytest.raises(ValueError):
+        CostCalculationService().calculate_batch([])
+
+
+def test_calculate_route_cost(settings):
+    """Test costing a route from its distance, duration and segments."""
+    route_id = uuid4()
+
+    cost = CostCalculationService().calculate_route_cost(
+        route_id=route_id,
+        distance_km=Decimal("450"),
+        duration_hours=Decimal("5"),
+        country_segments=[
+            {"country": "DE", "distance": 200},
+            {"country_code": "PL", "distance_km": 250, "duration_hours": 3}
+        ],
+        settings=settings
+    )
+
+    assert cost.route_id == route_id
+    assert cost.calculation_method == "standard"
+    assert cost.breakdown.fuel_costs == {"DE": Decimal("125.30"), "PL": Decimal("133.00")}
+    assert cost.breakdown.driver_costs == {"DE": Decimal("78.89"), "PL": Decimal("66.00")}
+    assert cost.total_cost == cost.breakdown.total_cost
+    assert CostCalculationService().validate_cost(cost)
+
+
+def test_calculate_route_cost_requires_settings():
+    """Test that costing a route without settings fails."""
+    with pytest.raises(CostServiceError):
+        CostCalculationService().calculate_route_cost(uuid4(), Decimal("1"), Decimal("1"), [])
+
+
+def test_cost_history_requires_a_repository():
+    """Test that history lookups fail without a cost repository."""
+    with pytest.raises(CostServiceError):
+        CostCalculationService().get_cost_history(uuid4())
@@ -0,0 +1,229 @@
+"""Tests for compiled cost settings."""
+import random
+from datetime import datetime, timezone
+from decimal import Decimal
+from types import SimpleNamespace
+from uuid import uuid4
+
+import numpy as np
+import pytest
+
+from src.domain.entities.cost import CostSettings, CostSettingsVersion
+from src.domain.services.cost.compiled_settings import (
+    ALL_COMPONENTS, COMPONENT_BITS, VEHICLE_MULTIPLIERS,
+    CompiledCostSettings, CompiledSettingsHolder
+)
+from src.domain.services.cost.cost_calculation import CostCalculationService
+from tests.fixtures.cost_data import make_route, rate_settings
+
+
+@pytest.fixture
+def settings() -> CostSettings:
+    """Create settings with country rates."""
+    return rate_settings({
+        "PL": {"fuel": 1.52, "toll": 0.187, "driver": 22.0},
+        "DE": {"fuel": 1.79, "toll": 0.348, "driver": 35.5}
+    })
+
+
+def versioned(settings: CostSettings, settings_id, version: CostSettingsVersion) -> CostSettings:
+    """Give settings an ID, version and modification time."""
+    settings.id = settings_id
+    settings.version = version
+    settings.modified_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    return settings
+
+
+def test_compile_indexes_countries(settings):
+    """Test that configured countries get a dense sorted index."""
+    compiled = CompiledCostSettings.compile(settings)
+
+    assert compiled.country_codes == ("DE", "PL")
+    assert dict(compiled.country_index) == {"DE": 0, "PL": 1}
+    assert compiled.fuel.tolist() == [1.79, 1.52]
+    assert compiled.toll.tolist() == [0.348, 0.187]
+    assert compiled.driver.tolist() == [35.5, 22.0]
+    assert compiled.overhead_rate == 10.0
+    assert dict(compiled.vehicle_multipliers) == dict(VEHICLE_MULTIPLIERS)
+    assert compiled.enabled_mask == ALL_COMPONENTS
+
+
+def test_compiled_tables_are_read_only(settings):
+    """Test that a snapshot cannot be modified."""
+    compiled = CompiledCostSettings.compile(settings)
+
+    with pytest.raises(ValueError):
+        compiled.fuel[0] = 0.0
+    with pytest.raises(TypeError):
+        compiled.country_index["FR"] = 2
+    with pytest.raises(TypeError):
+        compiled.vehicle_multipliers["truck"] = Decimal("2")
+
+
+def test_unknown_country_uses_settings_default(settings):
+    """Test that countries outside the tables get the "default" entries."""
+    compiled = CompiledCostSettings.compile(settings)
+
+    assert not compiled.has_country("FR")
+    assert compiled.fuel_price("FR") == 1.5
+    assert compiled.toll_rate("FR") == 0.2
+    assert compiled.driver_rate("FR") == 30.0
+
+    rates = compiled.rate_vectors(("FR", "DE"))
+    assert rates.fuel.tolist() == [1.5, 1.79]
+    assert rates.toll.tolist() == [0.2, 0.348]
+    assert rates.driver.tolist() == [30.0, 35.5]
+
+
+def test_vehicle_spec_overrides_defaults(settings):
+    """Test that vehicle specifications override default rates."""
+    compiled = CompiledCostSettings.compile(settings)
+    vehicle_spec = SimpleNamespace(fuel_consumption=0.4, maintenance_rate=0.2)
+
+    assert compiled.consumption_for(None) == 0.35
+    assert compiled.consumption_for(vehicle_spec) == 0.4
+    assert compiled.maintenance_rate_for(None) == 0.15
+    assert compiled.maintenance_rate_for(vehicle_spec) == 0.2
+
+
+def test_enabled_components_bitmask(settings):
+    """Test that enabled components compile to a bitmask."""
+    settings.enabled_components = {"fuel", "toll", "unknown"}
+
+    compiled = CompiledCostSettings.compile(settings)
+
+    assert compiled.enabled_mask == COMPONENT_BITS["fuel"] | COMPONENT_BITS["toll"]
+    assert compiled.is_enabled("fuel")
+    assert not compiled.is_enabled("driver")
+    assert not compiled.is_enabled("overhead")
+
+
+def test_disabled_components_are_zero_in_batch(settings):
+    """Test that the batch path leaves disabled components at zero."""
+    settings.enabled_components = {"toll", "driver"}
+    rng = random.Random(3)
+    routes = [make_route(rng, with_empty_driving=True) for _ in range(10)]
+
+    result = CostCalculationService().calculate_batch(routes, settings)
+
+    for i in range(len(routes)):
+        totals = result.component_totals(i)
+        assert totals["toll"] > 0 and totals["driver"] > 0
+        for name in ("fuel", "maintenance", "overhead", "empty_driving_fuel", "empty_driving_maintenance"):
+            assert totals[name] == Decimal("0.00")
+    assert not result.segment_cents[:, 0].any()
+
+
+def test_holder_compiles_once_per_version(settings):
+    """Test that the holder reuses snapshots of a version."""
+    holder = CompiledSettingsHolder()
+    settings_id = uuid4()
+    first = holder.get(versioned(settings, settings_id, CostSettingsVersion.V1_0))
+
+    refetched = versioned(settings.model_copy(deep=True), settings_id, CostSettingsVersion.V1_0)
+    assert holder.get(refetched) is first
+    assert holder.get(first) is first
+    assert holder.get_stats()["compiles"] == 1
+
+    updated = versioned(rate_settings({}), settings_id, CostSettingsVersion.V2_0)
+    assert holder.get(updated) is not first
+    assert holder.get_stats()["compiles"] == 2
+
+
+def test_holder_publish_swaps_current(settings):
+    """Test that publishing settings replaces the current snapshot."""
+    holder = CompiledSettingsHolder()
+    assert holder.current is None
+
+    first = holder.publish(versioned(settings, uuid4(), CostSettingsVersion.V1_0))
+    assert holder.current is first
+
+    second = holder.publish(versioned(rate_settings({}), uuid4(), CostSettingsVersion.V1_0))
+    assert holder.current is second
+    assert holder.get_stats()["current"] == second.key
+
+
+def test_holder_evicts_old_versions(settings):
+    """Test that the holder keeps a bounded number of versions."""
+    holder = CompiledSettingsHolder(max_versions=2)
+    for version in CostSettingsVersion:
+        holder.get(versioned(rate_settings({}), uuid4(), version))
+
+    assert holder.get_stats()["versions"] == 2
+
+    with pytest.raises(ValueError):
+        CompiledSettingsHolder(max_versions=0)
+
+
+def test_rate_vectors_do_not_alias_tables(settings):
+    """Test that gathered rate vectors are copies of the snapshot tables."""
+    compiled = CompiledCostSettings.compile(settings)
+
+    rates = compiled.rate_vectors(("DE", "PL"))
+
+    assert not np.shares_memory(rates.fuel, compiled.fuel)
+    assert rates.enabled_mask == compiled.enabled_mask
+
+
+def test_compile_reads_settings_entity_fields():
+    """Test compiling settings with per-vehicle tolls and partial tables."""
+    settings = CostSettings(
+        route_id=uuid4(),
+        fuel_rates={"DE": Decimal("1.8")},
+        toll_rates={"PL": {"truck": Decimal("0.187"), "van": Decimal("0.09")}},
+        driver_rates={"default": Decimal("28")},
+        maintenance_rates={"truck": Decimal("0.18")},
+        overhead_rates={"time": Decimal("12"), "fixed": Decimal("50")},
+        enabled_components={"fuel", "toll", "maintenance"}
+    )
+
+    compiled = CompiledCostSettings.compile(settings)
+
+    assert compiled.country_codes == ("DE", "PL")
+    assert compiled.fuel.tolist() == [1.8, 1.5]
+    assert compiled.toll.tolist() == [0.2, 0.187]
+    assert compiled.driver.tolist() == [28.0, 28.0]
+    assert compiled.driver_rate("FR") == 28.0
+    assert compiled.maintenance_rate_for(None) == 0.18
+    assert compiled.overhead_rate == 12.0
+    assert dict(compiled.vehicle_toll_rates("PL")) == {"truck": Decimal("0.187"), "van": Decimal("0.09")}
+    assert dict(compiled.vehicle_toll_rates("FR")) == {}
+    assert compiled.enabled_mask == (
+        COMPONENT_BITS["fuel"] | COMPONENT_BITS["toll"] | COMPONENT_BITS["maintenance"]
+    )
+
+
+def test_holder_publishes_settings_entity():
+    """Test publishing default settings and a new version of them."""
+    holder = CompiledSettingsHolder()
+    settings = CostSettings.get_default(uuid4())
+
+    current = holder.publish(settings)
+
+    assert holder.current is current
+    assert current.fuel_price("DE") == 1.5
+    assert current.toll_rate("DE") == 0.2
+    assert current.driver_rate("DE") == 30.0
+    assert holder.get(settings.model_copy(deep=True)) is current
+
+    updated = settings.model_copy(deep=True)
+    updated.fuel_rates["DE"] = Decimal("1.99")
+    updated.modified_at = datetime(2030, 1, 1, tzinfo=timezone.utc)
+
+    assert holder.publish(updated).fuel_price("DE") == 1.99
+    assert holder.current.fuel_price("PL") == 1.5
+
+
+def test_holder_recompiles_settings_changed_in_place():
+    """Test that settings changed in place get a new snapshot."""
+    holder = CompiledSettingsHolder()
+    settings = CostSettings.get_default(uuid4())
+    holder.publish(settings)
+
+    settings.fuel_rates = {"DE": Decimal("2.5")}
+    settings.enabled_components.add("maintenance")
+
+    compiled = holder.get(settings)
+    assert compiled.fuel_price("DE") == 2.5
+    assert compiled.is_enabled("maintenance")
+    assert holder.get(settings) is compiled
@@ -0,0 +1,237 @@
+"""Tests for the cost result cache."""
+import random
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+from src.domain.entities.cost import CostSettings, CostSettingsVersion
+from src.domain.services.common import cache as cache_module
+from src.domain.services.cost import cost_cache as cost_cache_module
+from src.domain.services.cost.compiled_settings import CompiledCostSettings
+from src.domain.services.cost.cost_cache import CostResultCache, get_cost_result_cache, route_fingerprint
+from src.domain.services.cost.cost_calculation import CostCalculationService
+from src.infrastructure.services import shared_cache as shared_cache_module
+from src.infrastructure.services.shared_cache import get_shared_cache_tier
+from tests.fixtures.cost_data import make_route, rate_settings
+
+
+@pytest.fixture
+def cache():
+    """Create a cost result cache."""
+    cache = CostResultCache(ttl=60, max_entries=100)
+    yield cache
+    cache.cache_service.close()
+
+
+@pytest.fixture
+def settings() -> CostSettings:
+    """Create versioned settings."""
+    settings = rate_settings({"DE": {"fuel": 1.79, "toll": 0.348, "driver": 35.5}})
+    settings.version = CostSettingsVersion.V1_0
+    settings.modified_at = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    return settings
+
+
+class Counter:
+    """Compute callable counting its calls."""
+
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return {"result": self.calls}
+
+
+def test_repeated_request_is_served_from_cache(cache, settings):
+    """Test that a repeated request does not recompute."""
+    route_id = uuid4()
+    compute = Counter()
+
+    first = cache.get_or_compute(route_id, "abc", settings, compute)
+    second = cache.get_or_compute(route_id, "abc", settings, compute)
+
+    assert first is second
+    assert compute.calls == 1
+    stats = cache.get_stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["hit_rate"] == 0.5
+
+
+def test_compiled_settings_share_entries_with_source(cache, settings):
+    """Test that compiled settings key like the settings they came from."""
+    route_id = uuid4()
+    compute = Counter()
+
+    cache.get_or_compute(route_id, "abc", settings, compute)
+    cache.get_or_compute(route_id, "abc", CompiledCostSettings.compile(settings), compute)
+
+    assert compute.calls == 1
+
+
+def test_key_covers_route_settings_and_specs(cache, settings):
+    """Test that any change of the inputs is a miss."""
+    route_id = uuid4()
+    compute = Counter()
+    cache.get_or_compute(route_id, "abc", settings, compute)
+
+    cache.get_or_compute(route_id, "changed", settings, compute)
+    cache.get_or_compute(uuid4(), "abc", settings, compute)
+    cache.get_or_compute(route_id, "abc", settings, compute, vehicle_spec=SimpleNamespace(vehicle_type="van"))
+    cache.get_or_compute(route_id, "abc", settings, compute, cargo_spec=SimpleNamespace(weight=1000))
+    cache.get_or_compute(route_id, "abc", settings, compute, include_empty_driving=False)
+    settings.version = CostSettingsVersion.V2_0
+    cache.get_or_compute(route_id, "abc", settings, compute)
+
+    assert compute.calls == 7
+
+
+def test_settings_without_id_are_not_cached(cache):
+    """Test that unversioned settings always recompute."""
+    compute = Counter()
+    settings = rate_settings({})
+    settings.id = None
+
+    cache.get_or_compute(uuid4(), "abc", settings, compute)
+    cache.get_or_compute(uuid4(), "abc", settings, compute)
+
+    assert compute.calls == 2
+    assert cache.get_stats()["skipped"] == 2
+
+
+def test_explicit_invalidation(cache, settings):
+    """Test invalidation by route, settings and specification."""
+    route_id = uuid4()
+    vehicle_spec = SimpleNamespace(vehicle_type="truck")
+    compute = Counter()
+
+    def request():
+        cache.get_or_compute(route_id, "abc", settings, compute, vehicle_spec=vehicle_spec)
+
+    request()
+    assert cache.invalidate_route(route_id) == 1
+    request()
+    assert cache.invalidate_settings(settings.id) == 1
+    request()
+    assert cache.invalidate_vehicle(vehicle_spec) == 1
+    request()
+    assert cache.invalidate_cargo(None) == 1
+    request()
+    assert cache.invalidate_route(uuid4()) == 0
+    request()
+
+    assert compute.calls == 5
+    assert cache.get_stats()["invalidations"] == 4
+
+
+def test_clear(cache, settings):
+    """Test that clear drops every result."""
+    compute = Counter()
+    for _ in range(3):
+        cache.get_or_compute(uuid4(), "abc", settings, compute)
+
+    assert cache.clear() == 3
+
+
+def test_route_fingerprint_follows_contents():
+    """Test that the fingerprint changes with the route contents only."""
+    rng = random.Random(5)
+    route = make_route(rng, with_empty_driving=True)
+    service = CostCalculationService(result_cache=CostResultCache())
+
+    fingerprint = service._get_route_fingerprint(route)
+
+    assert fingerprint == service._get_route_fingerprint(route.model_copy())
+    moved = route.model_copy(update={"distance_km": route.distance_km + 1})
+    assert service._get_route_fingerprint(moved) != fingerprint
+    without_empty = route.model_copy(update={"empty_driving": None})
+    assert service._get_route_fingerprint(without_empty) != fingerprint
+    service.result_cache.cache_service.close()
+
+
+def test_route_fingerprint_is_order_sensitive():
+    """Test that segment order is part of the fingerprint."""
+    segments = [
+        {"country_code": "DE", "distance_km": 100.0, "duration_hours": 1.0},
+        {"country_code": "PL", "distance_km": 200.0, "duration_hours": 2.0}
+    ]
+
+    assert route_fingerprint(segments, 300.0, 3.0) != route_fingerprint(segments[::-1], 300.0, 3.0)
+
+
+def test_cached_costs_are_fresh_records(cache, settings):
+    """Test that a cache hit returns its own cost record."""
+    route = make_route(random.Random(9), with_empty_driving=True)
+    service = CostCalculationService(result_cache=cache)
+
+    first = service.calculate_detailed_cost(route, settings)
+    second = service.calculate_detailed_cost(route, settings)
+
+    assert cache.get_stats()["hits"] == 1
+    assert second.id != first.id
+    assert second.calculated_at >= first.calculated_at
+    assert second.breakdown == first.breakdown
+    assert second.total_cost == first.total_cost > 0
+    assert second.validity_period == timedelta(hours=24)
+    second.breakdown.fuel_costs.clear()
+    assert service.calculate_detailed_cost(route, settings).breakdown == first.breakdown
+
+
+def test_results_are_kept_no_longer_than_valid(cache, settings, monkeypatch):
+    """Test that the cache TTL is capped at the validity period."""
+    clock = [1000.0]
+    monkeypatch.setattr(cache_module, "time", SimpleNamespace(time=lambda: clock[0]))
+    compute = Counter()
+    route_id = uuid4()
+
+    cache.get_or_compute(route_id, "abc", settings, compute, max_ttl=10)
+    clock[0] += 9
+    cache.get_or_compute(route_id, "abc", settings, compute, max_ttl=10)
+    clock[0] += 2
+    cache.get_or_compute(route_id, "abc", settings, compute, max_ttl=10)
+
+    assert compute.calls == 2
+
+
+@pytest.fixture
+def worker_caches(tmp_path, monkeypatch):
+    """Build the process-wide cost caches of two workers sharing one tier file."""
+    service_settings = SimpleNamespace(
+        cost_cache_ttl=60,
+        cost_cache_max_entries=100,
+        cache_shared_path=str(tmp_path / "shared_cache.db"),
+        cache_shared_max_entries=100
+    )
+    app_settings = SimpleNamespace(service=service_settings)
+    monkeypatch.setattr(cost_cache_module, "get_settings", lambda: app_settings)
+    monkeypatch.setattr(shared_cache_module, "get_settings", lambda: app_settings)
+    caches = []
+    for _ in range(2):
+        # Each worker process builds its own singletons
+        get_cost_result_cache.cache_clear()
+        get_shared_cache_tier.cache_clear()
+        caches.append(get_cost_result_cache())
+    get_cost_result_cache.cache_clear()
+    get_shared_cache_tier.cache_clear()
+    yield caches
+    for cache in caches:
+        cache.cache_service.close()
+        cache.cache_service._shared.close()
+
+
+def test_workers_share_results_through_the_shared_tier(worker_caches, settings):
+    """Test that a cost computed in one worker is a hit in another."""
+    first_worker, second_worker = worker_caches
+    route = make_route(random.Random(12), with_empty_driving=True)
+
+    first = CostCalculationService(result_cache=first_worker).calculate_detailed_cost(route, settings)
+    second = CostCalculationService(result_cache=second_worker).calculate_detailed_cost(route, settings)
+
+    assert first_worker.cache_service._shared is not second_worker.cache_service._shared
+    assert first_worker.get_stats()["misses"] == 1
+    assert second_worker.get_stats()["hits"] == 1
+    assert second.breakdown == first.breakdown
+    assert second.total_cost == first.total_cost
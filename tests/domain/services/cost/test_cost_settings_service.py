@@ -0,0 +1,54 @@
+"""Tests for the cost settings service."""
+from unittest.mock import Mock
+from uuid import uuid4
+
+import pytest
+
+from src.domain.entities.cost import CostSettings
+from src.domain.interfaces.repositories.cost_settings_repository import CostSettingsRepository
+from src.domain.services.cost.compiled_settings import CompiledSettingsHolder
+from src.domain.services.cost.cost_cache import CostResultCache
+from src.domain.services.cost.cost_settings import CostSettingsServiceImpl
+
+
+@pytest.fixture
+def repository() -> Mock:
+    """Create a cost settings repository mock."""
+    return Mock(spec=CostSettingsRepository)
+
+
+@pytest.fixture
+def service(repository):
+    """Create a cost settings service with its own snapshot holder and cache."""
+    cache = CostResultCache(max_entries=1)
+    yield CostSettingsServiceImpl(
+        repository,
+        compiled_settings=CompiledSettingsHolder(),
+        result_cache=cache
+    )
+    cache.cache_service.close()
+
+
+def test_reads_go_to_the_repository(service, repository):
+    """Test defaults, history and versions come from the repository."""
+    settings = CostSettings.get_default(uuid4())
+    repository.get_defaults.return_value = settings
+    repository.get_history.return_value = [{"version": "1.0"}]
+    repository.get_version.return_value = settings
+
+    assert service.get_defaults() is settings
+    assert service.get_settings_history() == [{"version": "1.0"}]
+    assert service.get_settings_version("1.0") is settings
+    repository.get_version.assert_called_once_with("1.0")
+
+
+def test_validate_settings(service, repository):
+    """Test validation with the repository rules."""
+    settings = CostSettings.get_default(uuid4())
+    repository.validate.return_value = True
+
+    assert service.validate_settings(settings)
+
+    repository.validate.side_effect = RuntimeError("negative rate")
+    with pytest.raises(ValueError, match="negative rate"):
+        service.validate_settings(settings)
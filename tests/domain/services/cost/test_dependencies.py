@@ -0,0 +1,268 @@
+"""Tests for cost component dependencies and stored cost recalculation."""
+import copy
+import random
+from datetime import datetime, timezone
+from decimal import Decimal
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+from src.domain.entities.cost import CostSettings
+from src.domain.services.cost.compiled_settings import CompiledCostSettings, CompiledSettingsHolder
+from src.domain.services.cost.cost_cache import CostResultCache
+from src.domain.services.cost.cost_calculation import CostCalculationService
+from src.domain.services.cost.dependencies import (
+    ComponentDependency, diff_settings, split_path, stale_components
+)
+from src.domain.services.cost.recalculation import (
+    COMPLETED, CostRecalculationService, RecalculationJob
+)
+from src.domain.services.cost.toll_rates import TollRateServiceImpl
+from src.domain.value_objects import Money
+from tests.fixtures.cost_data import make_route, rate_settings
+from tests.mocks.memory_cost_repository import MemoryCostRepository
+
+
+@pytest.fixture
+def settings() -> CostSettings:
+    """Create settings with country rates."""
+    return rate_settings({
+        "DE": {"fuel": 1.79, "toll": 0.348, "driver": 35.5},
+        "PL": {"fuel": 1.52, "toll": 0.187, "driver": 22.0}
+    })
+
+
+def breakdown_amounts(breakdown) -> dict:
+    """Flatten a cost breakdown into amounts by component path."""
+    amounts = {}
+    for field in ("fuel_costs", "toll_costs", "driver_costs", "maintenance_costs", "overheads"):
+        for key, amount in getattr(breakdown, field).items():
+            amounts[f"{field}.{key}"] = amount
+    for code, costs in breakdown.empty_driving_costs.items():
+        for key, amount in costs.items():
+            amounts[f"empty_driving_costs.{code}.{key}"] = amount
+    return amounts
+
+
+def modified(settings: CostSettings) -> CostSettings:
+    """Copy settings as a new modification of the same version."""
+    changed = copy.deepcopy(settings)
+    changed.modified_at = datetime(2030, 1, 1, tzinfo=timezone.utc)
+    return changed
+
+
+def test_recompute_matches_calculated_breakdown(settings):
+    """Test that every recorded entry recomputes to the calculated amount."""
+    rng = random.Random(11)
+    service = CostCalculationService()
+    for i in range(50):
+        route = make_route(rng, with_empty_driving=i % 2 == 0)
+        breakdown = service.calculate_batch([route], settings).breakdown(0)
+        rates = CompiledCostSettings.compile(settings)
+
+        dependencies = service.get_cost_dependencies(route, settings)
+
+        amounts = breakdown_amounts(breakdown)
+        assert set(dependencies) == set(amounts)
+        for path, dependency in dependencies.items():
+            assert dependency.recompute(rates).to_decimal() == amounts[path], path
+
+
+def test_dependencies_record_keys_and_countries(settings):
+    """Test the settings keys and countries of recorded entries."""
+    rng = random.Random(2)
+    route = make_route(rng, with_empty_driving=False)
+    code = route.country_segments[0].country_code
+
+    dependencies = CostCalculationService().get_cost_dependencies(route, settings)
+
+    fuel = dependencies[f"fuel_costs.{code}"]
+    assert fuel.keys == {"enabled:fuel", "fuel_consumption", f"fuel_price:{code}"}
+    assert fuel.countries == {code}
+    assert dependencies["overheads.overhead"].keys == {"enabled:overhead", "overhead_rate"}
+    assert dependencies["overheads.overhead"].countries == frozenset()
+
+
+def test_vehicle_spec_values_are_fixed_factors(settings):
+    """Test that vehicle specification values are not settings keys."""
+    rng = random.Random(4)
+    route = make_route(rng, with_empty_driving=False)
+    vehicle_spec = SimpleNamespace(fuel_consumption=0.4, maintenance_rate=0.2, vehicle_type="van")
+
+    dependencies = CostCalculationService().get_cost_dependencies(route, settings, vehicle_spec)
+
+    assert dependencies["maintenance_costs.van"].keys == {"enabled:maintenance"}
+    assert all("fuel_consumption" not in dependency.keys for dependency in dependencies.values())
+
+
+def test_toll_rate_changes_mark_service_priced_tolls_stale(settings):
+    """Test that tolls priced by a toll service depend on the toll rates."""
+    route = make_route(random.Random(5), with_empty_driving=False)
+    cache = CostResultCache(ttl=60, max_entries=10)
+    service = CostCalculationService(
+        toll_service=TollRateServiceImpl(compiled_settings=CompiledSettingsHolder()),
+        result_cache=cache
+    )
+    dependencies = service.get_cost_dependencies(route, settings)
+    changed = modified(settings)
+    changed.toll_rates["DE"] = {"truck": Decimal("0.4")}
+    changed.toll_rates["PL"] = {"truck": Decimal("0.2")}
+    new_rates = CompiledCostSettings.compile(changed)
+
+    keys = diff_settings(CompiledCostSettings.compile(settings), new_rates)
+    stale = stale_components(dependencies, keys)
+
+    assert keys == {"toll_rate:DE", "toll_rate:PL"}
+    assert sorted(dependency.path for dependency in stale) == ["toll_costs.DE", "toll_costs.PL"]
+    tolls = service.calculate_detailed_cost(route, changed).breakdown.toll_costs
+    for dependency in stale:
+        assert dependency.recompute(new_rates).to_decimal() == tolls[split_path(dependency.path)[1]]
+    cache.cache_service.close()
+
+
+def test_diff_settings_finds_changed_keys(settings):
+    """Test that a diff lists exactly the changed settings keys."""
+    old = CompiledCostSettings.compile(settings)
+    changed = modified(settings)
+    changed.fuel_rates["DE"] = Decimal("1.99")
+    changed.overhead_rates["time"] = Decimal("30")
+    changed.enabled_components = {"fuel", "toll", "driver", "maintenance"}
+
+    keys = diff_settings(old, CompiledCostSettings.compile(changed))
+
+    assert keys == {"fuel_price:DE", "overhead_rate", "enabled:overhead"}
+
+
+def test_diff_settings_covers_given_countries(settings):
+    """Test that default rates are compared for countries the settings omit."""
+    old = CompiledCostSettings.compile(settings)
+    changed = modified(settings)
+    changed.toll_rates["default"] = {"truck": Decimal("0.25")}
+    new = CompiledCostSettings.compile(changed)
+
+    assert diff_settings(old, new) == frozenset()
+    assert diff_settings(old, new, ["FR"]) == {"toll_rate:FR"}
+
+
+def test_stale_components(settings):
+    """Test that only entries depending on changed keys are stale."""
+    rng = random.Random(8)
+    route = make_route(rng, with_empty_driving=True)
+    dependencies = CostCalculationService().get_cost_dependencies(route, settings)
+
+    stale = stale_components(dependencies, frozenset({"driver_price:XX", "overhead_rate"}))
+
+    assert [dependency.path for dependency in stale] == ["overheads.overhead"]
+
+
+def test_disabled_component_recomputes_to_zero(settings):
+    """Test that disabling a component zeroes its entries."""
+    dependency = ComponentDependency("toll_costs.DE", "toll")
+    dependency.add_term(100.0, "toll_rate:DE")
+    settings.enabled_components = {"fuel"}
+
+    assert dependency.recompute(CompiledCostSettings.compile(settings)) == Money()
+
+
+def test_dependency_round_trip():
+    """Test that dependencies survive serialization."""
+    dependency = ComponentDependency("empty_driving_costs.DE.fuel", "fuel")
+    dependency.add_term(12.5, 0.4, "fuel_price:DE")
+
+    data = dependency.to_dict()
+    restored = ComponentDependency.from_dict(dependency.path, data)
+
+    assert data["keys"] == ["enabled:fuel", "fuel_price:DE"]
+    assert data["countries"] == ["DE"]
+    assert restored.terms == dependency.terms
+    assert split_path(restored.path) == ("empty_driving_costs", "DE", "fuel")
+
+
+def test_recalculation_updates_only_stale_components(settings):
+    """Test that a job recomputes the stale entries of affected costs."""
+    rng = random.Random(13)
+    service = CostCalculationService()
+    repository = MemoryCostRepository()
+    rates = CompiledCostSettings.compile(settings)
+    for _ in range(20):
+        route = make_route(rng, with_empty_driving=True)
+        repository.save(uuid4(), service.get_cost_dependencies(route, settings), rates)
+    before = copy.deepcopy(repository.amounts)
+    changed = modified(settings)
+    changed.driver_rates["PL"] = Decimal("24")
+    recalculator = CostRecalculationService(repository)
+
+    job = recalculator.run(RecalculationJob(), settings, changed)
+
+    affected = [cost_id for cost_id, amounts in before.items() if "driver_costs.PL" in amounts]
+    assert job.status == COMPLETED
+    assert job.changed_keys == ["driver_rate:PL"]
+    assert job.total == job.processed == len(affected)
+    assert job.recomputed_components == len(affected)
+    new_rates = CompiledCostSettings.compile(changed)
+    for cost_id, amounts in repository.amounts.items():
+        for path, amount in amounts.items():
+            if path == "driver_costs.PL":
+                assert amount == repository.dependencies[cost_id][path].recompute(new_rates)
+                assert amount > before[cost_id][path]
+            else:
+                assert amount == before[cost_id][path]
+    recalculator.close()
+
+
+def test_recalculation_records_cost_failures(settings):
+    """Test that one failing cost does not stop a job."""
+    rng = random.Random(17)
+    service = CostCalculationService()
+    repository = MemoryCostRepository()
+    rates = CompiledCostSettings.compile(settings)
+    cost_ids = [uuid4() for _ in range(3)]
+    for cost_id in cost_ids:
+        repository.save(cost_id, service.get_cost_dependencies(make_route(rng, False), settings), rates)
+    repository.failing.add(cost_ids[0])
+    changed = modified(settings)
+    changed.overhead_rates["time"] = Decimal("40")
+    recalculator = CostRecalculationService(repository)
+
+    job = recalculator.start(settings, changed)
+    recalculator.close()
+
+    assert recalculator.get_job(job.id) is job
+    progress = job.to_dict()
+    assert progress["status"] == COMPLETED
+    assert progress["processed"] == progress["total"] == 3
+    assert progress["progress"] == 1.0
+    assert list(progress["errors"]) == [str(cost_ids[0])]
+    assert progress["recomputed_components"] == 2
+
+
+def test_recalculation_of_settings_updated_in_place(settings):
+    """Test that a change keeping the version key is still recalculated."""
+    rng = random.Random(19)
+    service = CostCalculationService()
+    repository = MemoryCostRepository()
+    rates = service.compiled_settings.get(settings)
+    repository.save(uuid4(), service.get_cost_dependencies(make_route(rng, True), settings), rates)
+    previous = copy.deepcopy(settings)
+    settings.overhead_rates["time"] = Decimal("40")
+    recalculator = CostRecalculationService(repository)
+
+    job = recalculator.run(RecalculationJob(), previous, settings)
+
+    assert job.changed_keys == ["overhead_rate"]
+    assert job.recomputed_components == 1
+    recalculator.close()
+
+
+def test_recalculation_without_changes(settings):
+    """Test that unchanged settings recompute nothing."""
+    repository = MemoryCostRepository()
+    recalculator = CostRecalculationService(repository)
+
+    job = recalculator.run(RecalculationJob(), settings, copy.deepcopy(settings))
+
+    assert job.status == COMPLETED
+    assert job.total == 0
+    assert job.to_dict()["progress"] == 1.0
+    recalculator.close()
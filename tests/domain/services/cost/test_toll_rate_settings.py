@@ -0,0 +1,135 @@
+"""Tests for the toll rate service."""
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from types import SimpleNamespace
+from uuid import uuid4
+
+import pytest
+
+from src.domain.entities.route import Route
+from src.domain.interfaces.services.toll_rate_service import TollRateServiceError
+from src.domain.services.cost.compiled_settings import CompiledCostSettings, CompiledSettingsHolder
+from src.domain.services.cost.cost_cache import CostResultCache
+from src.domain.services.cost.cost_calculation import CostCalculationService
+from src.domain.services.cost.toll_rates import TollRateServiceImpl
+from src.domain.value_objects import CountrySegment
+from tests.fixtures.cost_data import rate_settings
+
+
+@pytest.fixture
+def settings():
+    """Create settings with per-vehicle toll rates."""
+    settings = rate_settings({"DE": {"fuel": 1.79, "toll": 0.348, "driver": 35.5}})
+    settings.toll_rates["DE"]["van"] = Decimal("0.123")
+    return settings
+
+
+@pytest.fixture
+def service():
+    """Create a toll rate service with its own snapshot holder."""
+    return TollRateServiceImpl(compiled_settings=CompiledSettingsHolder())
+
+
+def test_explicit_settings_price_tolls(service, settings):
+    """Test that tolls are priced with the given settings as Decimal."""
+    truck = service.get_toll_rate("DE", "truck", settings=settings)
+    van = service.get_toll_rate("DE", "van", settings=settings)
+    bus = service.get_toll_rate("DE", "bus", settings=settings)
+
+    assert truck.effective_rate == Decimal("0.348")
+    assert van.base_rate == Decimal("0.123")
+    assert van.effective_rate == Decimal("0.123")
+    assert bus.effective_rate == Decimal("0.348") * Decimal("0.8")
+    assert service.calculate_toll(uuid4(), "van", "DE", 100.0, settings=settings) == Decimal("12.300")
+
+
+def test_compiled_settings_are_accepted(service, settings):
+    """Test that a compiled snapshot prices like its settings."""
+    compiled = CompiledCostSettings.compile(settings)
+
+    assert service.get_toll_rate("DE", "truck", settings=compiled).effective_rate == Decimal("0.348")
+
+
+def test_settings_do_not_leak_between_calculations(service, settings):
+    """Test that two settings versions price independently."""
+    other = rate_settings({"DE": {"fuel": 1.79, "toll": 0.5, "driver": 35.5}})
+
+    first = service.calculate_toll(uuid4(), "truck", "DE", 10.0, settings=settings)
+    second = service.calculate_toll(uuid4(), "truck", "DE", 10.0, settings=other)
+
+    assert first == Decimal("3.480")
+    assert second == Decimal("5.00")
+    assert service.calculate_toll(uuid4(), "truck", "DE", 10.0, settings=settings) == first
+
+
+def test_current_settings_are_the_fallback(settings):
+    """Test that calls without settings use the settings service."""
+    settings_service = SimpleNamespace(get_current_settings=lambda: settings)
+    service = TollRateServiceImpl(settings_service, compiled_settings=CompiledSettingsHolder())
+
+    assert service.get_toll_rate("DE", "truck").effective_rate == Decimal("0.348")
+    assert service.get_toll_rate("FR", "truck").effective_rate == Decimal("0.25")
+
+
+def test_update_rates_changes_current_settings(settings):
+    """Test that updated rates reach the settings and the history."""
+    updates = []
+
+    def update_settings(settings_id, changes):
+        updates.append(changes)
+        for key, value in changes.items():
+            setattr(settings, key, value)
+        settings.modified_at = datetime(2030, 1, 1, tzinfo=timezone.utc)
+        return settings
+
+    settings_service = SimpleNamespace(get_current_settings=lambda: settings, update_settings=update_settings)
+    service = TollRateServiceImpl(settings_service, compiled_settings=CompiledSettingsHolder())
+    effective = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+    assert service.update_rates("PL", {"Truck": "0.2", "van": 0.1}, effective)
+
+    assert updates[0]["toll_rates"]["PL"] == {"truck": Decimal("0.2"), "van": Decimal("0.1")}
+    assert service.get_current_rates("PL") == {"truck": Decimal("0.2"), "van": Decimal("0.1")}
+    assert service.get_current_rates("DE")["truck"] == Decimal("0.348")
+    assert service.has_toll_roads("PL")
+    history = service.get_rate_history("PL", effective, effective)
+    assert [entry["rates"]["van"] for entry in history] == [Decimal("0.1")]
+    assert service.get_rate_history("DE", effective, effective) == []
+
+
+def test_invalid_rates_are_rejected(service):
+    """Test that invalid rates raise toll rate errors."""
+    with pytest.raises(TollRateServiceError):
+        service.validate_rates({"truck": -1})
+    with pytest.raises(TollRateServiceError):
+        service.validate_rates({"truck": "abc"})
+    with pytest.raises(TollRateServiceError):
+        service.update_rates("DE", {"truck": 0.3}, datetime.now(timezone.utc))
+
+
+def test_detailed_costs_price_tolls_with_the_service(service, settings):
+    """Test that a configured toll service prices the tolls of detailed costs."""
+    now = datetime.now(timezone.utc)
+    route = Route(
+        origin={"address": "Munich"},
+        destination={"address": "Verona"},
+        pickup_time=now,
+        delivery_time=now + timedelta(hours=6),
+        distance_km=300.0,
+        duration_hours=4.0,
+        country_segments=[
+            CountrySegment(country_code="DE", distance=Decimal("100"), duration_hours=Decimal("1")),
+            CountrySegment(country_code="IT", distance=Decimal("200"), duration_hours=Decimal("3"))
+        ]
+    )
+    cache = CostResultCache(ttl=60, max_entries=10)
+
+    from_settings = CostCalculationService(result_cache=cache).calculate_detailed_cost(route, settings)
+    cost = CostCalculationService(toll_service=service, result_cache=cache).calculate_detailed_cost(route, settings)
+    cache.cache_service.close()
+
+    # The service prices countries without settings rates at its own defaults
+    assert from_settings.breakdown.toll_costs == {"DE": Decimal("34.80"), "IT": Decimal("40.00")}
+    assert cost.breakdown.toll_costs == {"DE": Decimal("34.80"), "IT": Decimal("44.00")}
+    assert cost.total_cost == cost.breakdown.total_cost == from_settings.total_cost + Decimal("4.00")
+    assert cache.get_stats()["hits"] == 0
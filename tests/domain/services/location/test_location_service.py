@@ -4,7 +4,7 @@ from decimal import Decimal
 from unittest.mock import Mock, patch
 
 from src.domain.services.location.location_service import LocationIntegrationService
-from src.domain.value_objects import Location, CountrySegment
+from src.domain.value_objects import Location, CountrySegment, RouteSummary
 from src.infrastructure.services.google_maps_service import GoogleMapsService
 from src.infrastructure.services.toll_rate_service import DefaultTollRateService
 
@@ -345,6 +345,97 @@ def test_get_route_segments_fallback(
     )
 
 
+def test_get_route_summary_with_maps_client(
+    location_service,
+    mock_maps_client,
+    mock_toll_rate_service,
+    sample_locations
+):
+    """Test route summary comes from one maps client call with toll rates applied."""
+    mock_maps_client.get_route_summary.return_value = RouteSummary(
+        origin=sample_locations["berlin"],
+        destination=sample_locations["warsaw"],
+        distance_km=Decimal("575"),
+        duration_hours=Decimal("6"),
+        country_segments=[
+            CountrySegment(country_code="DE", distance=Decimal("90"), duration_hours=Decimal("1")),
+            CountrySegment(country_code="PL", distance=Decimal("485"), duration_hours=Decimal("5"))
+        ]
+    )
+    mock_toll_rate_service.get_toll_rates.side_effect = lambda country, vehicle_type: {
+        "highway": Decimal("0.20") if country == "DE" else Decimal("0.12")
+    }
+    location_service._maps_client = mock_maps_client
+    location_service._toll_rate_service = mock_toll_rate_service
+
+    summary = location_service.get_route_summary(
+        origin=sample_locations["berlin"],
+        destination=sample_locations["warsaw"],
+        include_tolls=True
+    )
+
+    assert summary.distance_km == Decimal("575")
+    assert summary.duration_hours == Decimal("6")
+    assert summary.country_segments[0].toll_rates == {"highway": Decimal("0.20")}
+    assert summary.country_segments[1].toll_rates == {"highway": Decimal("0.12")}
+    mock_maps_client.get_route_summary.assert_called_once_with(
+        sample_locations["berlin"],
+        sample_locations["warsaw"]
+    )
+    mock_maps_client.calculate_distance.assert_not_called()
+    mock_maps_client.calculate_duration.assert_not_called()
+    mock_maps_client.get_route_segments.assert_not_called()
+
+
+def test_get_route_summary_fallback(location_service, sample_locations):
+    """Test route summary totals match the fallback segments."""
+    summary = location_service.get_route_summary(
+        origin=sample_locations["berlin"],
+        destination=sample_locations["warsaw"]
+    )
+
+    assert [s.country_code for s in summary.country_segments] == ["DE", "PL"]
+    assert summary.distance_km == sum(s.distance for s in summary.country_segments)
+    assert summary.duration_hours == sum(s.duration_hours for s in summary.country_segments)
+
+
+def test_get_distance_matrix_fallback(location_service, sample_locations):
+    """Test distance matrix fallback uses straight-line distances."""
+    origins = [sample_locations["berlin"], sample_locations["paris"]]
+    destinations = [sample_locations["warsaw"]]
+
+    matrix = location_service.get_distance_matrix(origins, destinations)
+
+    assert matrix.get_distance(0, 0) == pytest.approx(517.17, rel=1e-3)
+    assert matrix.get_duration(0, 0) == pytest.approx(matrix.get_distance(0, 0) / 60.0)
+    assert matrix.get_country(1, 0) == "FR"
+
+
+def test_get_distance_matrix_fallback_as_array(location_service, sample_locations):
+    """Test array fallback matches the list-backed fallback."""
+    origins = [sample_locations["berlin"], sample_locations["paris"]]
+    destinations = [sample_locations["warsaw"], sample_locations["berlin"]]
+
+    matrix = location_service.get_distance_matrix(origins, destinations)
+    array_matrix = location_service.get_distance_matrix(origins, destinations, as_array=True)
+
+    assert array_matrix.get_distance(1, 0) == pytest.approx(matrix.get_distance(1, 0), rel=1e-6)
+    assert array_matrix.nearest_destination(0) == 1
+    assert array_matrix.get_country(1, 1) == "FR"
+
+
+def test_get_distance_matrix_with_maps_client(location_service, mock_maps_client, sample_locations):
+    """Test distance matrix is delegated to the maps client in one call."""
+    origins = [sample_locations["berlin"]]
+    destinations = [sample_locations["warsaw"], sample_locations["paris"]]
+    location_service._maps_client = mock_maps_client
+
+    location_service.get_distance_matrix(origins, destinations)
+
+    mock_maps_client.get_distance_matrix.assert_called_once_with(origins, destinations, as_array=False)
+    mock_maps_client.calculate_distance.assert_not_called()
+
+
 def test_address_validation(location_service):
     """Test address validation for different countries."""
     # Test valid addresses
@@ -2,12 +2,17 @@
 
 This module contains tests for the route planning service.
 """
+import time
 from datetime import datetime, timedelta
+from decimal import Decimal
 from typing import Dict, List
+from unittest.mock import Mock
 import pytest
 
 from src.domain.entities.route import Route, RouteStatus
+from src.domain.interfaces.services.location_service import LocationService
 from src.domain.services.route.route_planning import RoutePlanningService
+from src.domain.value_objects import CountrySegment, Location, RouteSummary
 from tests.infrastructure.base_test import BaseTestService
 from tests.infrastructure.mock_factory import MockFactory
 
@@ -296,3 +301,140 @@ class TestRoutePlanningService:
             len(repository.get_calls('get_history')),
             1
         )
+
+
+def _summary(start: Location, end: Location) -> RouteSummary:
+    """Build a Berlin-Warsaw style summary between two locations."""
+    return RouteSummary(
+        origin=start,
+        destination=end,
+        distance_km=Decimal("575"),
+        duration_hours=Decimal("6"),
+        country_segments=[
+            CountrySegment(country_code=start.country, distance=Decimal("90"), duration_hours=Decimal("1")),
+            CountrySegment(country_code=end.country, distance=Decimal("485"), duration_hours=Decimal("5"))
+        ]
+    )
+
+
+@pytest.fixture
+def berlin_warsaw() -> tuple:
+    """Origin and destination for planning tests."""
+    return (
+        Location(address="Berlin, Germany", latitude=52.52, longitude=13.405, country="DE"),
+        Location(address="Warsaw, Poland", latitude=52.2297, longitude=21.0122, country="PL")
+    )
+
+
+def test_create_route_uses_route_summaries(berlin_warsaw: tuple) -> None:
+    """Test route creation makes one summary lookup per direction."""
+    origin, destination = berlin_warsaw
+    location_service = Mock(spec=LocationService)
+    location_service.get_route_summary.side_effect = _summary
+
+    route = RoutePlanningService(location_service=location_service).create_route(
+        origin=origin,
+        destination=destination,
+        pickup_time=datetime(2024, 1, 1, 8),
+        delivery_time=datetime(2024, 1, 1, 18)
+    )
+
+    assert route.distance_km == 575.0
+    assert route.duration_hours == 6.0
+    assert [s.country_code for s in route.country_segments] == ["DE", "PL"]
+    assert route.empty_driving.distance_km == 575.0
+    assert [s.country_code for s in route.empty_driving.segments] == ["PL", "DE"]
+    assert location_service.get_route_summary.call_count == 2
+    location_service.calculate_distance.assert_not_called()
+    location_service.calculate_duration.assert_not_called()
+
+
+def test_create_route_runs_lookups_concurrently(berlin_warsaw: tuple) -> None:
+    """Test route creation takes about as long as the slowest lookup."""
+    origin, destination = berlin_warsaw
+
+    def slow_summary(start: Location, end: Location) -> RouteSummary:
+        time.sleep(0.2)
+        return _summary(start, end)
+
+    location_service = Mock(spec=LocationService)
+    location_service.get_route_summary.side_effect = slow_summary
+
+    started = time.perf_counter()
+    route = RoutePlanningService(location_service=location_service).create_route(
+        origin=origin,
+        destination=destination,
+        pickup_time=datetime(2024, 1, 1, 8),
+        delivery_time=datetime(2024, 1, 1, 18),
+        metadata={"tags": ["express"]}
+    )
+    elapsed = time.perf_counter() - started
+
+    planning = route.metadata.planning_data
+    assert elapsed < 0.35
+    assert set(planning["lookup_seconds"]) == {"route", "empty_driving"}
+    assert planning["wall_clock_seconds"] < 0.35
+    assert planning["time_saved_seconds"] > 0.1
+    assert route.metadata.tags == ["express"]
+
+
+def test_create_route_keeps_planning_data(berlin_warsaw: tuple) -> None:
+    """Test caller metadata cannot replace the lookup timings."""
+    origin, destination = berlin_warsaw
+    location_service = Mock(spec=LocationService)
+    location_service.get_route_summary.side_effect = _summary
+
+    route = RoutePlanningService(location_service=location_service).create_route(
+        origin=origin,
+        destination=destination,
+        pickup_time=datetime(2024, 1, 1, 8),
+        delivery_time=datetime(2024, 1, 1, 18),
+        metadata={"notes": "Fragile", "planning_data": {"lookup_seconds": {}}}
+    )
+
+    assert route.metadata.notes == "Fragile"
+    assert set(route.metadata.planning_data["lookup_seconds"]) == {"route", "empty_driving"}
+
+
+def test_services_share_the_lookup_executor() -> None:
+    """Test services built per request reuse one lookup thread pool."""
+    first = RoutePlanningService(location_service=Mock(spec=LocationService))
+    second = RoutePlanningService(location_service=Mock(spec=LocationService))
+
+    assert first._executor is second._executor
+
+
+def test_create_route_enforces_lookup_deadline(berlin_warsaw: tuple) -> None:
+    """Test route creation fails when lookups exceed the deadline."""
+    origin, destination = berlin_warsaw
+
+    def stuck_summary(start: Location, end: Location) -> RouteSummary:
+        time.sleep(0.5)
+        return _summary(start, end)
+
+    location_service = Mock(spec=LocationService)
+    location_service.get_route_summary.side_effect = stuck_summary
+    service = RoutePlanningService(location_service=location_service, lookup_deadline=0.05)
+
+    with pytest.raises(ValueError, match="exceeded deadline"):
+        service.create_route(
+            origin=origin,
+            destination=destination,
+            pickup_time=datetime(2024, 1, 1, 8),
+            delivery_time=datetime(2024, 1, 1, 18)
+        )
+
+
+def test_create_route_propagates_lookup_errors(berlin_warsaw: tuple) -> None:
+    """Test a failing lookup fails route creation without waiting for the deadline."""
+    origin, destination = berlin_warsaw
+    location_service = Mock(spec=LocationService)
+    location_service.get_route_summary.side_effect = RuntimeError("No route found")
+
+    with pytest.raises(ValueError, match="No route found"):
+        RoutePlanningService(location_service=location_service).create_route(
+            origin=origin,
+            destination=destination,
+            pickup_time=datetime(2024, 1, 1, 8),
+            delivery_time=datetime(2024, 1, 1, 18)
+        )
@@ -1,7 +1,7 @@
 """Tests for common value object functionality."""
 
 from typing import Dict, Optional
-from pydantic import Field, ValidationError
+from pydantic import ConfigDict, Field, ValidationError
 import pytest
 
 from src.domain.value_objects.common import BaseValueObject
@@ -87,3 +87,59 @@ def test_base_value_object_model_dump():
     assert dumped["name"] == "test"
     assert dumped["value"] == 42
     assert dumped["metadata"] == metadata
+
+
+def test_base_value_object_hash_is_cached():
+    """Test that a frozen value object computes its hash once."""
+    obj = TestValueObject(name="test", value=42)
+
+    first = hash(obj)
+    assert obj._hash_value == first
+    assert hash(obj) == first
+
+
+def test_base_value_object_hash_with_nested_metadata():
+    """Test hashing metadata with nested dicts and lists."""
+    obj1 = TestValueObject(
+        name="test",
+        value=42,
+        metadata={"a": {"x": 1, "y": [1, 2]}, "b": 2}
+    )
+    obj2 = TestValueObject(
+        name="test",
+        value=42,
+        metadata={"b": 2, "a": {"y": [1, 2], "x": 1}}
+    )
+    obj3 = TestValueObject(name="test", value=42, metadata={"a": {"x": 2}})
+
+    assert obj1 == obj2
+    assert hash(obj1) == hash(obj2)
+    assert obj1 != obj3
+    assert len({obj1, obj2, obj3}) == 2
+
+
+def test_base_value_object_copy_hashes_afresh():
+    """Test that an updated copy does not reuse the original's hash."""
+    obj = TestValueObject(name="test", value=42)
+    hash(obj)
+
+    copied = obj.model_copy(update={"value": 43})
+
+    assert copied != obj
+    assert hash(copied) == hash(TestValueObject(name="test", value=43))
+
+
+def test_mutable_value_object_hash_is_not_cached():
+    """Test that value objects that allow updates hash their current state."""
+
+    class MutableValueObject(BaseValueObject):
+        model_config = ConfigDict(frozen=False)
+
+        value: int = Field(..., description="Test value")
+
+    obj = MutableValueObject(value=1)
+    before = hash(obj)
+    obj.value = 2
+
+    assert hash(obj) != before
+    assert hash(obj) == hash(MutableValueObject(value=2))
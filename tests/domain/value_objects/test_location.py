@@ -1,9 +1,12 @@
 """Tests for location-related value objects."""
 
+import numpy as np
 import pytest
 from pydantic import ValidationError
 
-from src.domain.value_objects.location import Location, DistanceMatrix, Address
+from src.domain.value_objects.location import (
+    Location, DistanceMatrix, ArrayDistanceMatrix, Address
+)
 
 
 def test_address_creation():
@@ -204,3 +207,102 @@ def test_distance_matrix_helper_methods():
     
     with pytest.raises(IndexError):
         matrix.get_country(1, 1)  # Both indices invalid
+
+
+def _sample_distance_matrix():
+    """Create a 2x3 list-backed matrix."""
+    return DistanceMatrix(
+        origins=[
+            Location(address="Origin1", latitude=52.0, longitude=13.0),
+            Location(address="Origin2", latitude=50.0, longitude=19.0),
+        ],
+        destinations=[
+            Location(address="Dest1", latitude=48.0, longitude=2.0),
+            Location(address="Dest2", latitude=52.2, longitude=21.0),
+            Location(address="Dest3", latitude=51.0, longitude=17.0),
+        ],
+        distances=[[1050.0, 575.5, 330.0], [1400.0, 290.0, 190.25]],
+        durations=[[10.5, 6.0, 3.5], [14.0, 3.0, 2.0]],
+        countries=[["DE", "DE", "DE"], ["PL", "PL", "PL"]],
+    )
+
+
+def test_array_distance_matrix_matches_list_matrix():
+    """Test the array-backed matrix answers like the list-backed one."""
+    matrix = _sample_distance_matrix()
+    array_matrix = ArrayDistanceMatrix.from_distance_matrix(matrix)
+
+    assert array_matrix.distances.dtype == np.float32
+    assert array_matrix.country_codes == ("DE", "PL")
+    for i in range(2):
+        for j in range(3):
+            assert array_matrix.get_distance(i, j) == pytest.approx(matrix.get_distance(i, j))
+            assert array_matrix.get_duration(i, j) == pytest.approx(matrix.get_duration(i, j))
+            assert array_matrix.get_country(i, j) == matrix.get_country(i, j)
+    assert array_matrix.to_distance_matrix() == matrix
+
+
+def test_array_distance_matrix_bulk_queries():
+    """Test row, column and argmin queries."""
+    array_matrix = ArrayDistanceMatrix.from_distance_matrix(_sample_distance_matrix())
+
+    np.testing.assert_allclose(array_matrix.row(1), [1400.0, 290.0, 190.25])
+    np.testing.assert_allclose(array_matrix.column(0, by="duration"), [10.5, 14.0])
+    assert array_matrix.nearest_destination(0) == 2
+    assert array_matrix.nearest_origin(1, by="duration") == 1
+    assert array_matrix.nearest_destinations().tolist() == [2, 2]
+    assert array_matrix.nearest_origins().tolist() == [0, 1, 1]
+    with pytest.raises(ValueError):
+        array_matrix.row(0, by="cost")
+
+
+def test_array_distance_matrix_validation():
+    """Test shape validation and immutability."""
+    origins = [Location(address="Origin", latitude=40.0, longitude=-74.0)]
+    destinations = [
+        Location(address="Dest1", latitude=41.0, longitude=-75.0),
+        Location(address="Dest2", latitude=42.0, longitude=-76.0),
+    ]
+
+    with pytest.raises(ValidationError) as exc_info:
+        ArrayDistanceMatrix(
+            origins=origins,
+            destinations=destinations,
+            distances=[[100.0]],
+            durations=[[2.0, 4.0]],
+            country_index=[[0, 0]],
+            country_codes=("US",),
+        )
+    assert "Distances matrix must be 1x2" in str(exc_info.value)
+
+    with pytest.raises(ValidationError) as exc_info:
+        ArrayDistanceMatrix(
+            origins=origins,
+            destinations=destinations,
+            distances=[[100.0, 200.0]],
+            durations=[[2.0, 4.0]],
+            country_index=[[0, 1]],
+            country_codes=("US",),
+        )
+    assert "Country index out of range" in str(exc_info.value)
+
+    matrix = ArrayDistanceMatrix.from_lists(
+        origins, destinations, [[100.0, 200.0]], [[2.0, 4.0]], [["US", "US"]]
+    )
+    with pytest.raises(ValueError):
+        matrix.distances[0, 0] = 1.0
+    with pytest.raises(IndexError):
+        matrix.get_distance(1, 0)
+
+
+def test_array_distance_matrix_save_and_load(tmp_path):
+    """Test matrices round-trip through memory-mapped .npy files."""
+    array_matrix = ArrayDistanceMatrix.from_distance_matrix(_sample_distance_matrix())
+    array_matrix.save(tmp_path / "matrix")
+
+    loaded = ArrayDistanceMatrix.load(tmp_path / "matrix")
+
+    assert isinstance(loaded.distances, np.memmap)
+    assert loaded == array_matrix
+    assert loaded.get_country(1, 2) == "PL"
+    assert ArrayDistanceMatrix.load(tmp_path / "matrix", mmap_mode=None) == array_matrix
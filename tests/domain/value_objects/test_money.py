@@ -0,0 +1,138 @@
+"""Tests for the Money value object."""
+import pickle
+from decimal import ROUND_HALF_EVEN, ROUND_HALF_UP, Decimal
+
+import numpy as np
+import pytest
+from hypothesis import given, strategies as st
+
+from src.domain.services.cost.batch_cost import to_cent_array
+from src.domain.value_objects.money import Money
+
+CENT = Decimal("0.01")
+# Floats drop noise past six places before rounding to the cent
+NOISE = Decimal("0.000001")
+
+amounts = st.floats(min_value=-1e9, max_value=1e9, allow_nan=False, allow_infinity=False)
+decimals = st.decimals(min_value=-10 ** 9, max_value=10 ** 9, places=6, allow_nan=False, allow_infinity=False)
+roundings = st.sampled_from([ROUND_HALF_UP, ROUND_HALF_EVEN])
+
+
+def float_to_cents(value: float) -> Decimal:
+    """Round a float to six places, then half up to the cent."""
+    return Decimal(repr(round(float(value), 6))).quantize(CENT, rounding=ROUND_HALF_UP)
+
+
+def baseline_amount(value: float) -> Decimal:
+    """Store a float amount the way cost code did before Money, unrounded."""
+    return Decimal(str(value))
+
+
+@given(amounts)
+def test_from_float_rounds_to_cents(value):
+    """Test that float amounts follow the documented rounding rule."""
+    assert Money.from_float(value).to_decimal() == float_to_cents(value)
+
+
+@given(
+    st.floats(min_value=0, max_value=5000),
+    st.floats(min_value=0.01, max_value=1),
+    st.floats(min_value=0.5, max_value=3)
+)
+def test_from_float_matches_cost_products(distance, consumption, price):
+    """Test the rounding rule on products such as distance * consumption * price."""
+    value = distance * consumption * price
+
+    assert Money.from_float(value).to_decimal() == float_to_cents(value)
+
+
+@given(st.lists(amounts, max_size=50))
+def test_sums_stay_within_rounding_of_baseline_amounts(values):
+    """Test that cent sums stay within half a cent per entry of the unrounded sums."""
+    baseline = sum((baseline_amount(value) for value in values), Decimal("0"))
+
+    total = sum((Money.from_float(value) for value in values), Money())
+
+    assert abs(total.to_decimal() - baseline) <= (CENT / 2 + NOISE) * len(values)
+
+
+@given(st.lists(amounts, max_size=50))
+def test_cent_array_matches_from_float(values):
+    """Test that the batch path rounds arrays like from_float."""
+    assert to_cent_array(np.array(values)).tolist() == [Money.from_float(value).cents for value in values]
+
+
+@given(decimals, roundings)
+def test_from_decimal_matches_quantize(value, rounding):
+    """Test that decimal amounts round like quantize."""
+    assert Money.from_decimal(value, rounding=rounding).to_decimal() == value.quantize(CENT, rounding=rounding)
+
+
+@given(decimals)
+def test_half_even_float_matches_stored_amounts(value):
+    """Test parity with quantizing a stored float amount."""
+    stored = float(value)
+
+    money = Money.from_float(stored, rounding=ROUND_HALF_EVEN)
+
+    assert money.to_decimal() == Decimal(str(stored)).quantize(CENT)
+
+
+@given(st.lists(decimals, max_size=20))
+def test_sum_matches_decimal_sum(values):
+    """Test that sums of cents equal sums of quantized decimals."""
+    expected = sum((value.quantize(CENT, rounding=ROUND_HALF_UP) for value in values), Decimal("0"))
+
+    assert sum((Money.from_decimal(value) for value in values), Money()).to_decimal() == expected
+    if values:
+        assert sum(Money.from_decimal(value) for value in values).to_decimal() == expected
+
+
+@given(decimals, st.decimals(min_value=0, max_value=10, places=4), roundings)
+def test_multiply_matches_decimal_product(value, factor, rounding):
+    """Test that products round once, like quantizing the Decimal product."""
+    money = Money.from_decimal(value)
+
+    product = money.multiply(factor, rounding)
+
+    assert product.to_decimal() == (money.to_decimal() * factor).quantize(CENT, rounding=rounding)
+
+
+@given(decimals, decimals)
+def test_ordering_matches_decimals(a, b):
+    """Test that comparisons follow the amounts."""
+    x, y = Money.from_decimal(a), Money.from_decimal(b)
+
+    assert (x < y) == (x.to_decimal() < y.to_decimal())
+    assert (x == y) == (x.to_decimal() == y.to_decimal())
+
+
+def test_ties_and_noise():
+    """Test the documented rounding rules on known values."""
+    assert Money.from_float(14.719 * 25).cents == 36798
+    assert Money.from_float(0.125).cents == 13
+    assert Money.from_float(0.125, rounding=ROUND_HALF_EVEN).cents == 12
+    assert Money.from_float(-0.125).cents == -13
+    assert Money.from_decimal(Decimal("2.675")).cents == 268
+    assert Money.from_float(1e15 + 0.5).to_decimal() == Decimal("1000000000000000.50")
+
+
+def test_immutable_value():
+    """Test that amounts are immutable, hashable and picklable."""
+    money = Money(1050)
+
+    with pytest.raises(AttributeError):
+        money.cents = 1
+    assert pickle.loads(pickle.dumps(money)) == money
+    assert len({money, Money(1050), Money(1050, "PLN")}) == 2
+    assert str(money) == "10.50 EUR"
+    assert float(money) == 10.5
+    assert money * 3 == Money(3150)
+
+
+def test_rejects_mixed_currencies_and_unknown_roundings():
+    """Test that mismatched currencies and rounding modes are rejected."""
+    with pytest.raises(ValueError):
+        Money(100) + Money(100, "PLN")
+    with pytest.raises(ValueError):
+        Money.from_float(1.0, rounding="ROUND_DOWN")
@@ -0,0 +1,57 @@
+"""Routes and cost settings for cost calculation tests."""
+import random
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from typing import Dict
+from uuid import uuid4
+
+from src.domain.entities.cost import CostSettings
+from src.domain.entities.route import Route
+from src.domain.value_objects import CountrySegment, EmptyDriving, Location
+
+COUNTRIES = ("DE", "PL", "CZ", "AT", "FR")
+
+
+def rate_settings(rates: Dict[str, Dict[str, float]]) -> CostSettings:
+    """Build default cost settings with fuel, truck toll and driver rates per country."""
+    settings = CostSettings.get_default(uuid4())
+    for code, country_rates in rates.items():
+        settings.fuel_rates[code] = Decimal(str(country_rates["fuel"]))
+        settings.toll_rates[code] = {"truck": Decimal(str(country_rates["toll"]))}
+        settings.driver_rates[code] = Decimal(str(country_rates["driver"]))
+    return settings
+
+
+def make_route(rng: random.Random, with_empty_driving: bool) -> Route:
+    """Build a route with random country segments."""
+    now = datetime.now(timezone.utc)
+    segments = [
+        CountrySegment(
+            country_code=rng.choice(COUNTRIES),
+            distance=Decimal(str(round(rng.uniform(1, 500), 3))),
+            duration_hours=Decimal(str(round(rng.uniform(0.1, 8), 3)))
+        )
+        for _ in range(rng.randint(1, 6))
+    ]
+    empty_driving = None
+    if with_empty_driving:
+        empty_driving = EmptyDriving(
+            distance_km=round(rng.uniform(1, 200), 3),
+            duration_hours=round(rng.uniform(0.1, 3), 3),
+            origin=Location(
+                address="Depot",
+                latitude=52.52,
+                longitude=13.405,
+                country=rng.choice(COUNTRIES)
+            )
+        )
+    return Route(
+        origin={"address": "Origin"},
+        destination={"address": "Destination"},
+        pickup_time=now,
+        delivery_time=now + timedelta(hours=10),
+        distance_km=float(sum(segment.distance for segment in segments)),
+        duration_hours=float(sum(segment.duration_hours for segment in segments)),
+        country_segments=segments,
+        empty_driving=empty_driving
+    )
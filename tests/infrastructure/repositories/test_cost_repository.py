@@ -10,7 +10,10 @@ from sqlalchemy.orm import Session
 
 from src.domain.entities.cost import Cost, CostBreakdown
 from src.domain.interfaces.exceptions.repository_errors import EntityNotFoundError, ValidationError
+from src.domain.services.cost.dependencies import ComponentDependency
+from src.domain.value_objects import Money
 from src.infrastructure.database import Database
+from src.infrastructure.models import CostDependency
 from src.infrastructure.repositories.cost_repository import CostRepository
 
 
@@ -47,6 +50,7 @@ def cleanup_database(repository: CostRepository):
     """Clean up the database after each test."""
     yield
     with repository.db.session() as session:
+        session.query(CostDependency).delete()
         session.query(repository.model).delete()
         session.commit()
 
@@ -386,3 +390,38 @@ def test_update_cost_with_serialized_uuids_and_decimals(repository: CostReposito
     assert isinstance(updated.metadata.get("route_id"), str)
     assert isinstance(updated.metadata.get("amount"), float)
     assert updated.metadata.get("amount") == 300.0
+
+
+def test_dependencies_find_stale_components(repository: CostRepository, sample_cost: Cost, cleanup_database):
+    """Test recording dependencies and finding costs by settings key."""
+    created = repository.create(sample_cost)
+    fuel = ComponentDependency('fuel_costs.DE', 'fuel')
+    fuel.add_term(100.0, 0.35, 'fuel_price:DE')
+    overhead = ComponentDependency('overheads.overhead', 'overhead')
+    overhead.add_term(2.0, 'overhead_rate')
+
+    repository.save_dependencies(created.id, {fuel.path: fuel, overhead.path: overhead})
+
+    assert set(repository.get_dependencies(created.id)) == {'fuel_costs.DE', 'overheads.overhead'}
+    assert repository.find_by_settings_keys(['fuel_price:DE']) == {created.id: {'fuel_costs.DE'}}
+    assert repository.find_by_settings_keys(['fuel_price:PL']) == {}
+    assert 'overhead_rate' in repository.list_settings_keys()
+
+
+def test_save_dependencies_nonexistent_cost(repository: CostRepository, cleanup_database):
+    """Test recording dependencies of a missing cost."""
+    with pytest.raises(EntityNotFoundError):
+        repository.save_dependencies(uuid.uuid4(), {})
+
+
+def test_update_components_adjusts_total(repository: CostRepository, sample_cost: Cost, cleanup_database):
+    """Test replacing component amounts of a stored cost."""
+    created = repository.create(sample_cost)
+    total = created.total()
+
+    updated = repository.update_components(created.id, {'fuel_costs.DE': Money(12000)})
+
+    assert updated.breakdown.fuel_costs['DE'] == Decimal('120.00')
+    assert updated.breakdown.toll_costs['DE'] == Decimal('50.00')
+    assert updated.total() == total + Decimal('20.00')
+    assert repository.update_components(uuid.uuid4(), {}) is None
@@ -0,0 +1,77 @@
+"""Tests for entity hydration from repository rows."""
+from decimal import Decimal
+
+import pytest
+from pydantic import BaseModel, Field, ValidationError
+
+from src.infrastructure.repositories.hydration import EntityHydrator
+
+
+class SampleEntity(BaseModel):
+    """Entity with a constraint and a coercing field."""
+    name: str
+    amount: Decimal = Field(gt=0)
+    tags: list = Field(default_factory=list)
+
+
+def test_fast_build_skips_validation():
+    """Test that fast hydration builds entities without running validators."""
+    hydrator = EntityHydrator(fast=True)
+
+    entity = hydrator.build(SampleEntity, name="test", amount=Decimal("-1"))
+
+    assert isinstance(entity, SampleEntity)
+    assert entity.amount == Decimal("-1")
+    assert entity.tags == []
+
+
+def test_validating_build():
+    """Test that disabling fast hydration validates every entity."""
+    hydrator = EntityHydrator(fast=False)
+
+    assert hydrator.build(SampleEntity, name="test", amount=Decimal("1")).amount == Decimal("1")
+    with pytest.raises(ValidationError):
+        hydrator.build(SampleEntity, name="test", amount=Decimal("-1"))
+
+
+def test_sampled_revalidation_raises_on_invalid_rows():
+    """Test that a sampled entity failing validation is reported."""
+    hydrator = EntityHydrator(fast=True, validate_sample_rate=1.0)
+
+    with pytest.raises(ValidationError):
+        hydrator.build(SampleEntity, name="test", amount=Decimal("-1"))
+
+    stats = hydrator.get_stats()
+    assert stats["sampled"] == 1
+    assert stats["mismatches"] == 1
+
+
+def test_sampled_revalidation_returns_validated_entity():
+    """Test that coercion differences are counted and the validated entity wins."""
+    hydrator = EntityHydrator(fast=True, validate_sample_rate=1.0)
+
+    entity = hydrator.build(SampleEntity, name="test", amount=1.5)
+
+    assert entity.amount == Decimal("1.5")
+    assert isinstance(entity.amount, Decimal)
+    assert hydrator.get_stats()["mismatches"] == 0
+
+    hydrator.build(SampleEntity, name="test", amount="2.5")
+    assert hydrator.get_stats()["mismatches"] == 1
+
+
+def test_sample_rate_uses_sampler():
+    """Test that only the sampled share of entities is re-validated."""
+    draws = iter([0.05, 0.5, 0.09, 0.9])
+    hydrator = EntityHydrator(fast=True, validate_sample_rate=0.1, sampler=lambda: next(draws))
+
+    for _ in range(4):
+        hydrator.build(SampleEntity, name="test", amount=Decimal("1"))
+
+    assert hydrator.get_stats()["sampled"] == 2
+
+
+def test_invalid_sample_rate():
+    """Test that the sample rate must be a share."""
+    with pytest.raises(ValueError):
+        EntityHydrator(validate_sample_rate=1.5)
@@ -8,6 +8,7 @@ import pytest
 from sqlalchemy.orm import Session
 
 from src.domain.entities.offer import Offer, OfferHistory, OfferStatus
+from src.infrastructure.repositories.hydration import EntityHydrator
 from src.infrastructure.repositories.offer_repository import OfferRepository
 from src.infrastructure.models import (
     Offer as OfferModel,
@@ -336,3 +337,17 @@ def test_get_offer_history(offer_repository, sample_offer):
     # Check order (newest first)
     for i, (status, _) in enumerate(reversed(updates)):
         assert history[i].status == status
+
+
+def test_fast_hydration_matches_validation(db_session: Session, sample_offer):
+    """Test that offers built without validation equal validated ones."""
+    fast_repository = OfferRepository(db_session, hydrator=EntityHydrator(fast=True))
+    validating_repository = OfferRepository(db_session, hydrator=EntityHydrator(fast=False))
+    fast_repository.create(sample_offer)
+
+    fast_offers = fast_repository.get_all()
+    validated_offers = validating_repository.get_all()
+
+    assert fast_offers == validated_offers
+    assert fast_repository.get_offer_history(sample_offer.id) == \
+        validating_repository.get_offer_history(sample_offer.id)
@@ -1,13 +1,14 @@
 """Tests for route repository."""
 import uuid
 from datetime import datetime, timezone, timedelta
+from decimal import Decimal
 from typing import Dict
 
 import pytest
 from sqlalchemy.orm import Session
 
 from src.domain.entities.route import Route, RouteMetadata, TransportType, RouteStatus
-from src.domain.value_objects import Location, EmptyDriving
+from src.domain.value_objects import CountrySegment, Location, EmptyDriving
 from src.infrastructure.repositories.route_repository import RouteRepository
 from src.infrastructure.models import Route as RouteModel
 from src.domain.interfaces.exceptions.repository_errors import EntityNotFoundError
@@ -157,6 +158,24 @@ def test_empty_driving_handling(route_repository, sample_route):
     assert created_route.empty_driving.origin.address == "Previous St 1"
 
 
+def test_country_segments_round_trip(route_repository, sample_route):
+    """Test country segments are stored and loaded with exact amounts."""
+    segments = [
+        CountrySegment(country_code="DE", distance=Decimal("180.125"), duration_hours=Decimal("2.4"), has_tolls=True),
+        CountrySegment(country_code="PL", distance=Decimal("119.875"), duration_hours=Decimal("1.6"))
+    ]
+    route_repository.create(sample_route.model_copy(update={"country_segments": segments}))
+    route_repository.db.expire_all()
+
+    loaded = route_repository.get_by_id(sample_route.id)
+    assert loaded.country_segments == segments
+
+    loaded.country_segments = segments[:1]
+    route_repository.update(loaded.id, loaded)
+    route_repository.db.expire_all()
+    assert route_repository.get_by_id(sample_route.id).country_segments == segments[:1]
+
+
 def test_metadata_handling(route_repository, sample_route):
     """Test handling of route metadata."""
     created_route = route_repository.create(sample_route)
@@ -0,0 +1,54 @@
+"""Test coordinate snapping for cache keys."""
+import pytest
+
+from src.infrastructure.services.coordinate_snapping import CoordinateSnapper, geohash_encode
+
+
+def test_grid_snaps_nearby_points_to_one_cell():
+    """Test points a few meters apart share a grid cell."""
+    snapper = CoordinateSnapper(tolerance_m=100.0)
+    assert snapper.snap(52.52001, 13.40501) == snapper.snap(52.52003, 13.40504)
+    assert snapper.snap(52.52001, 13.40501) != snapper.snap(52.5215, 13.40501)
+
+
+def test_grid_cells_stay_square_at_high_latitudes():
+    """Test the longitude step widens with latitude."""
+    snapper = CoordinateSnapper(tolerance_m=100.0)
+    # 0.0012 degrees of longitude is about 70 m at 54 degrees north
+    lat, lng = snapper.snap(54.3, 18.6)
+    assert snapper.snap(lat, lng + 0.0006) == snapper.snap(lat, lng - 0.0006)
+
+
+def test_grid_cell_is_close_to_the_point():
+    """Test the snapped cell centre lies within the tolerance."""
+    snapper = CoordinateSnapper(tolerance_m=100.0)
+    lat, lng = snapper.snap(50.1109, 8.6821)
+    assert abs(lat - 50.1109) < 0.001
+    assert abs(lng - 8.6821) < 0.0015
+
+
+def test_geohash_precision_follows_tolerance():
+    """Test the coarsest geohash not larger than the tolerance is used."""
+    assert CoordinateSnapper(tolerance_m=100.0, method="geohash").describe() == "geohash:8"
+    assert CoordinateSnapper(tolerance_m=200.0, method="geohash").describe() == "geohash:7"
+    assert len(CoordinateSnapper(tolerance_m=200.0, method="geohash").snap(52.52, 13.405)) == 7
+
+
+def test_geohash_encode():
+    """Test geohash encoding against a known value."""
+    assert geohash_encode(57.64911, 10.40744, 11) == "u4pruydqqvj"
+
+
+def test_zero_tolerance_disables_snapping():
+    """Test a zero tolerance turns snapping off."""
+    snapper = CoordinateSnapper(tolerance_m=0)
+    assert not snapper.enabled
+    assert snapper.describe() == "off"
+
+
+def test_invalid_configuration():
+    """Test invalid parameters are rejected."""
+    with pytest.raises(ValueError):
+        CoordinateSnapper(tolerance_m=-1)
+    with pytest.raises(ValueError):
+        CoordinateSnapper(method="hexagon")
@@ -0,0 +1,102 @@
+"""Test offline country boundary index."""
+import numpy as np
+import pytest
+
+from src.infrastructure.services.country_boundary_index import (
+    CountryBoundaryIndex, get_country_boundary_index
+)
+
+
+@pytest.fixture
+def index():
+    """Index over the bundled borders."""
+    return CountryBoundaryIndex()
+
+
+@pytest.mark.parametrize("latitude,longitude,expected", [
+    (52.52, 13.405, "DE"),   # Berlin
+    (48.137, 11.575, "DE"),  # Munich
+    (52.2297, 21.0122, "PL"),  # Warsaw
+    (50.06, 19.94, "PL"),    # Krakow
+    (48.8566, 2.3522, "FR"),  # Paris
+    (40.42, -3.70, "ES"),    # Madrid
+    (38.72, -9.14, "PT"),    # Lisbon
+    (52.37, 4.90, "NL"),     # Amsterdam
+    (50.85, 4.35, "BE"),     # Brussels
+    (48.21, 16.37, "AT"),    # Vienna
+    (47.38, 8.54, "CH"),     # Zurich
+    (45.46, 9.19, "IT"),     # Milan
+    (50.08, 14.44, "CZ"),    # Prague
+    (47.50, 19.04, "HU"),    # Budapest
+    (54.69, 25.28, "LT"),    # Vilnius
+])
+def test_lookup_resolves_inland_points(index, latitude, longitude, expected):
+    """Test points away from borders resolve to their country."""
+    assert index.lookup(latitude, longitude) == expected
+
+
+def test_lookup_resolves_coastal_points(index):
+    """Test coastlines do not make points ambiguous."""
+    assert index.lookup(54.35, 18.65) == "PL"  # Gdansk
+    assert index.lookup(43.30, 5.37) == "FR"   # Marseille
+
+
+def test_lookup_near_border_is_ambiguous(index):
+    """Test points close to a land border are left to the remote fallback."""
+    assert index.lookup(52.34, 14.55) is None  # Frankfurt (Oder)
+    assert index.lookup(47.59, 7.59) is None   # Basel
+
+
+def test_lookup_outside_known_countries(index):
+    """Test points outside every polygon are not resolved."""
+    assert index.lookup(51.50, -0.12) is None  # London
+    assert index.lookup(45.00, -30.00) is None  # Atlantic
+
+
+def test_lookup_is_stable_within_interior_cells(index):
+    """Test memoized interior cells return consistent results."""
+    first = index.lookup(51.10, 10.30)
+    second = index.lookup(51.20, 10.40)
+    assert first == second == "DE"
+
+
+def test_lookup_many_matches_single_lookups(index):
+    """Test bulk lookups agree with point lookups, border points included."""
+    latitudes = np.array([52.52, 52.2297, 52.35, 48.8566, 35.0, 52.5201])
+    longitudes = np.array([13.405, 21.0122, 14.60, 2.3522, -30.0, 13.4051])
+
+    countries = index.lookup_many(latitudes, longitudes)
+
+    assert countries == [index.lookup(lat, lng) for lat, lng in zip(latitudes, longitudes)]
+    assert countries[:2] == ["DE", "PL"]
+    assert countries[2] is None
+
+
+def test_custom_borders():
+    """Test index built from custom polygons."""
+    square = [(0.0, 0.0), (0.0, 10.0), (10.0, 10.0), (10.0, 0.0)]
+    index = CountryBoundaryIndex(
+        borders={"xx": [square]},
+        coastlines=[],
+        cell_size_deg=1.0,
+        border_margin_km=50.0
+    )
+    assert index.countries == ["XX"]
+    assert index.lookup(5.0, 5.0) == "XX"
+    assert index.lookup(5.0, 0.2) is None  # within margin of the edge
+    assert index.lookup(20.0, 20.0) is None
+
+
+def test_invalid_configuration():
+    """Test invalid index parameters are rejected."""
+    with pytest.raises(ValueError):
+        CountryBoundaryIndex(cell_size_deg=0)
+    with pytest.raises(ValueError):
+        CountryBoundaryIndex(border_margin_km=-1)
+    with pytest.raises(ValueError):
+        CountryBoundaryIndex(borders={"XX": [[(0.0, 0.0), (1.0, 1.0)]]})
+
+
+def test_shared_index_is_cached():
+    """Test the default index is built once."""
+    assert get_country_boundary_index() is get_country_boundary_index()
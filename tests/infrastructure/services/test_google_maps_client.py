@@ -0,0 +1,169 @@
+"""Tests for the asyncio Google Maps client."""
+import asyncio
+import time
+
+import httpx
+import pytest
+from googlemaps.exceptions import ApiError, HTTPError, Timeout
+
+from src.infrastructure.services.google_maps_client import (
+    AsyncGoogleMapsClient, GoogleMapsClient, TokenBucket
+)
+
+
+def _client(handler, limiter=None, max_retries=3):
+    """Create a client backed by a mock transport."""
+    return AsyncGoogleMapsClient(
+        api_key="test_key",
+        limiter=limiter or TokenBucket(rate=1000),
+        http_client=httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+        max_retries=max_retries,
+        retry_delay=0.001,
+        timeout=1.0
+    )
+
+
+def _responses(*responses):
+    """Create a handler replaying responses and recording requests."""
+    requests = []
+
+    def handler(request):
+        requests.append(request)
+        status, body = responses[min(len(requests), len(responses)) - 1]
+        return httpx.Response(status, json=body)
+
+    handler.requests = requests
+    return handler
+
+
+def test_token_bucket_limits_rate():
+    """Test tokens beyond the burst capacity are spaced by the rate."""
+    async def acquire_all():
+        bucket = TokenBucket(rate=50, capacity=5)
+        started = time.monotonic()
+        await asyncio.gather(*(bucket.acquire() for _ in range(15)))
+        return time.monotonic() - started
+
+    # 5 tokens are available at once, the other 10 arrive at 50 per second
+    assert asyncio.run(acquire_all()) >= 0.18
+
+
+def test_token_bucket_drain():
+    """Test draining makes the next caller wait for a fresh token."""
+    async def acquire_after_drain():
+        bucket = TokenBucket(rate=20, capacity=10)
+        bucket.drain()
+        started = time.monotonic()
+        await bucket.acquire()
+        return time.monotonic() - started
+
+    assert asyncio.run(acquire_after_drain()) >= 0.04
+
+
+def test_directions_request_parameters():
+    """Test directions formats coordinates and returns the routes."""
+    handler = _responses((200, {"status": "OK", "routes": [{"legs": []}]}))
+
+    routes = asyncio.run(_client(handler).directions(
+        origin=(52.52, 13.405),
+        destination=(52.2297, 21.0122),
+        alternatives=False
+    ))
+
+    assert routes == [{"legs": []}]
+    params = handler.requests[0].url.params
+    assert handler.requests[0].url.path == "/maps/api/directions/json"
+    assert params["origin"] == "52.52,13.405"
+    assert params["alternatives"] == "false"
+    assert params["key"] == "test_key"
+    assert "avoid" not in params
+
+
+def test_distance_matrix_joins_locations():
+    """Test distance matrix joins origins and destinations with pipes."""
+    handler = _responses((200, {"status": "OK", "rows": []}))
+
+    asyncio.run(_client(handler).distance_matrix(
+        origins=[(1.0, 2.0), (3.0, 4.0)],
+        destinations=[(5.0, 6.0)]
+    ))
+
+    assert handler.requests[0].url.params["origins"] == "1.0,2.0|3.0,4.0"
+
+
+def test_zero_results_is_not_an_error():
+    """Test ZERO_RESULTS returns an empty result."""
+    handler = _responses((200, {"status": "ZERO_RESULTS", "routes": []}))
+
+    assert asyncio.run(_client(handler).directions((1, 2), (3, 4))) == []
+
+
+def test_retries_over_query_limit():
+    """Test quota errors are retried and drain the shared bucket."""
+    limiter = TokenBucket(rate=1000)
+    handler = _responses(
+        (200, {"status": "OVER_QUERY_LIMIT"}),
+        (429, {}),
+        (200, {"status": "OK", "results": [{"formatted_address": "Berlin"}]})
+    )
+
+    results = asyncio.run(_client(handler, limiter=limiter).geocode("Berlin"))
+
+    assert results == [{"formatted_address": "Berlin"}]
+    assert len(handler.requests) == 3
+
+
+def test_request_denied_is_not_retried():
+    """Test permanent API errors fail on the first attempt."""
+    handler = _responses((200, {"status": "REQUEST_DENIED", "error_message": "bad key"}))
+
+    with pytest.raises(ApiError, match="bad key"):
+        asyncio.run(_client(handler).geocode("Berlin"))
+    assert len(handler.requests) == 1
+
+
+def test_server_errors_exhaust_retries():
+    """Test server errors are retried up to the attempt limit."""
+    handler = _responses((503, {}))
+
+    with pytest.raises(HTTPError):
+        asyncio.run(_client(handler, max_retries=3).geocode("Berlin"))
+    assert len(handler.requests) == 3
+
+
+def test_timeouts_raise_googlemaps_timeout():
+    """Test transport timeouts map to googlemaps Timeout."""
+    def handler(request):
+        raise httpx.ReadTimeout("timed out", request=request)
+
+    with pytest.raises(Timeout):
+        asyncio.run(_client(handler, max_retries=2).geocode("Berlin"))
+
+
+def test_sync_wrapper_runs_on_shared_loop():
+    """Test the sync wrapper returns results from the async client."""
+    handler = _responses((200, {"status": "OK", "routes": [{"summary": "A2"}]}))
+    client = GoogleMapsClient("test_key", async_client=_client(handler))
+
+    assert client.directions((52.52, 13.405), (52.2297, 21.0122)) == [{"summary": "A2"}]
+    assert client.reverse_geocode((52.52, 13.405)) == []
+
+
+def test_sync_wrapper_cancels_on_timeout():
+    """Test the sync wrapper cancels calls that exceed its time limit."""
+    cancelled = []
+
+    async def handler(request):
+        try:
+            await asyncio.sleep(1)
+        except asyncio.CancelledError:
+            cancelled.append(request)
+            raise
+        return httpx.Response(200, json={"status": "OK"})
+
+    client = GoogleMapsClient("test_key", async_client=_client(handler), timeout=0.05)
+
+    with pytest.raises(Timeout):
+        client.geocode("Berlin")
+    time.sleep(0.05)
+    assert len(cancelled) == 1
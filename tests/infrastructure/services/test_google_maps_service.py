@@ -1,5 +1,8 @@
 """Test Google Maps service implementation."""
+from concurrent.futures import ThreadPoolExecutor
 from unittest.mock import Mock, patch
+import threading
+import time
 import googlemaps
 from decimal import Decimal
 import pytest
@@ -8,14 +11,18 @@ import os
 from src.domain.interfaces import LocationServiceError
 from src.domain.value_objects import Location, CountrySegment
 from src.infrastructure.services.google_maps_service import GoogleMapsService
+from src.infrastructure.services.response_cache import get_response_cache
+from src.infrastructure.services.single_flight import SingleFlight
 from src.settings import Settings, get_settings
 
 
 @pytest.fixture(autouse=True)
 def clear_settings_cache():
-    """Clear settings cache before each test."""
+    """Clear settings and response cache singletons before each test."""
     get_settings.cache_clear()
+    get_response_cache.cache_clear()
     yield
+    get_response_cache.cache_clear()
 
 
 @pytest.fixture
@@ -28,6 +35,11 @@ def mock_settings(monkeypatch):
             self.api.gmaps_max_retries = 3
             self.api.gmaps_retry_delay = 1.0
             self.api.gmaps_cache_ttl = 3600
+            self.api.gmaps_cache_path = None  # In-memory cache per test
+            self.api.gmaps_cache_max_entries = 100
+            self.api.gmaps_cache_snap_meters = 100.0
+            self.api.gmaps_cache_snap_method = "grid"
+            self.api.gmaps_matrix_max_workers = 4
             self.api.google_maps_key = "test_key"
     
     mock_settings = MockSettings()
@@ -36,6 +48,7 @@ def mock_settings(monkeypatch):
         return mock_settings
     
     monkeypatch.setattr("src.infrastructure.services.google_maps_service.get_settings", mock_get_settings)
+    monkeypatch.setattr("src.infrastructure.services.response_cache.get_settings", mock_get_settings)
     return mock_settings
 
 
@@ -81,20 +94,16 @@ def test_locations():
 
 def test_init_with_api_key(mock_settings, mock_gmaps_client):
     """Test initialization with explicit API key."""
-    with patch('googlemaps.Client', return_value=mock_gmaps_client):
+    with patch('src.infrastructure.services.google_maps_service.GoogleMapsClient', return_value=mock_gmaps_client):
         service = GoogleMapsService(api_key='test_key')
         assert service.api_key == 'test_key'
-        assert service.max_retries == mock_settings.api.gmaps_max_retries
-        assert service.retry_delay == mock_settings.api.gmaps_retry_delay
 
 
 def test_init_with_settings(mock_settings, mock_gmaps_client):
     """Test initialization with settings."""
-    with patch('googlemaps.Client', return_value=mock_gmaps_client):
+    with patch('src.infrastructure.services.google_maps_service.GoogleMapsClient', return_value=mock_gmaps_client):
         service = GoogleMapsService()
         assert service.api_key == mock_settings.google_maps_api_key
-        assert service.max_retries == mock_settings.api.gmaps_max_retries
-        assert service.retry_delay == mock_settings.api.gmaps_retry_delay
 
 
 def test_init_without_api_key(mock_settings):
@@ -109,7 +118,7 @@ def test_get_route_segments_success(mock_settings, mock_gmaps_client, test_locat
     origin, dest = test_locations
     mock_toll_rate_service.get_toll_rate_for_segment.return_value = Decimal('10.00')
 
-    with patch('googlemaps.Client', return_value=mock_gmaps_client), \
+    with patch('src.infrastructure.services.google_maps_service.GoogleMapsClient', return_value=mock_gmaps_client), \
          patch('src.infrastructure.services.toll_rate_service.DefaultTollRateService', return_value=mock_toll_rate_service):
         service = GoogleMapsService(toll_rate_service=mock_toll_rate_service)
         segments = service.get_route_segments(origin, dest, include_tolls=True)
@@ -128,7 +137,7 @@ def test_get_route_segments_no_route(mock_settings, mock_gmaps_client, test_loca
         'rows': [{'elements': [{'status': 'ZERO_RESULTS'}]}]
     }
 
-    with patch('googlemaps.Client', return_value=mock_gmaps_client):
+    with patch('src.infrastructure.services.google_maps_service.GoogleMapsClient', return_value=mock_gmaps_client):
         service = GoogleMapsService()
         with pytest.raises(LocationServiceError, match="No route found"):
             service.get_route_segments(origin, dest)
@@ -142,7 +151,7 @@ def test_get_route_segments_invalid_response(mock_settings, mock_gmaps_client, t
         'rows': [{'elements': [{'status': 'OK', 'distance': {'value': 1000}, 'duration': {'value': 3600}}]}]
     }
 
-    with patch('googlemaps.Client', return_value=mock_gmaps_client):
+    with patch('src.infrastructure.services.google_maps_service.GoogleMapsClient', return_value=mock_gmaps_client):
         service = GoogleMapsService()
         with pytest.raises(LocationServiceError, match="Invalid route data"):
             service.get_route_segments(origin, dest)
@@ -158,7 +167,7 @@ def test_get_route_segments_empty_steps(mock_settings, mock_gmaps_client, test_l
         'rows': [{'elements': [{'status': 'OK', 'distance': {'value': 1000}, 'duration': {'value': 3600}}]}]
     }
 
-    with patch('googlemaps.Client', return_value=mock_gmaps_client):
+    with patch('src.infrastructure.services.google_maps_service.GoogleMapsClient', return_value=mock_gmaps_client):
         service = GoogleMapsService()
         segments = service.get_route_segments(origin, dest)
         assert len(segments) == 0  # Should return empty list for empty steps
@@ -169,12 +178,86 @@ def test_get_route_segments_api_error(mock_settings, mock_gmaps_client, test_loc
     origin, dest = test_locations
     mock_gmaps_client.directions.side_effect = googlemaps.exceptions.ApiError("API Error")
 
-    with patch('googlemaps.Client', return_value=mock_gmaps_client):
+    with patch('src.infrastructure.services.google_maps_service.GoogleMapsClient', return_value=mock_gmaps_client):
         service = GoogleMapsService()
         with pytest.raises(LocationServiceError, match="Failed to get route segments"):
             service.get_route_segments(origin, dest)
 
 
+def test_api_error_message_names_the_failure(mock_settings, mock_gmaps_client, test_locations):
+    """Test API errors report what failed rather than a retry count."""
+    origin, dest = test_locations
+    mock_gmaps_client.directions.side_effect = googlemaps.exceptions.ApiError("INVALID_REQUEST")
+
+    with patch('src.infrastructure.services.google_maps_service.GoogleMapsClient', return_value=mock_gmaps_client):
+        service = GoogleMapsService()
+        with pytest.raises(LocationServiceError) as error:
+            service.get_route_summary(origin, dest)
+
+    assert "request failed (ApiError): INVALID_REQUEST" in str(error.value)
+    assert "retries" not in str(error.value)
+
+
+def test_get_route_segments_uses_offline_country_lookup(mock_settings, mock_gmaps_client, test_locations):
+    """Test that steps away from borders are attributed without geocoding."""
+    origin, dest = test_locations
+    mock_gmaps_client.directions.return_value = [{
+        'legs': [{
+            'steps': [
+                {
+                    'end_location': {'lat': 52.52, 'lng': 13.405},  # Berlin
+                    'distance': {'value': 100000},
+                    'duration': {'value': 3600}
+                },
+                {
+                    'end_location': {'lat': 52.41, 'lng': 16.93},  # Poznan
+                    'distance': {'value': 200000},
+                    'duration': {'value': 7200}
+                },
+                {
+                    'end_location': {'lat': 52.2297, 'lng': 21.0122},  # Warsaw
+                    'distance': {'value': 300000},
+                    'duration': {'value': 10800}
+                }
+            ]
+        }]
+    }]
+
+    with patch('src.infrastructure.services.google_maps_service.GoogleMapsClient', return_value=mock_gmaps_client):
+        service = GoogleMapsService()
+        segments = service.get_route_segments(origin, dest)
+
+    mock_gmaps_client.reverse_geocode.assert_not_called()
+    assert [s.country_code for s in segments] == ['DE', 'PL']
+    assert segments[0].distance == Decimal('100')
+    assert segments[1].distance == Decimal('500')
+    assert segments[1].duration_hours == Decimal('5')
+
+
+def test_get_route_segments_geocodes_near_border(mock_settings, mock_gmaps_client, test_locations):
+    """Test that steps near a border fall back to reverse geocoding."""
+    origin, dest = test_locations
+    mock_gmaps_client.directions.return_value = [{
+        'legs': [{
+            'steps': [{
+                'end_location': {'lat': 52.34, 'lng': 14.55},  # Frankfurt (Oder)
+                'distance': {'value': 1000},
+                'duration': {'value': 60}
+            }]
+        }]
+    }]
+    mock_gmaps_client.reverse_geocode.return_value = [
+        {'address_components': [{'types': ['country'], 'long_name': 'Germany', 'short_name': 'DE'}]}
+    ]
+
+    with patch('src.infrastructure.services.google_maps_service.GoogleMapsClient', return_value=mock_gmaps_client):
+        service = GoogleMapsService()
+        segments = service.get_route_segments(origin, dest)
+
+    mock_gmaps_client.reverse_geocode.assert_called_once_with((52.34, 14.55))
+    assert [s.country_code for s in segments] == ['DE']
+
+
 def test_get_route_segments_geocode_error(mock_settings, mock_gmaps_client, test_locations):
     """Test handling of geocoding errors."""
     origin, dest = test_locations
@@ -182,7 +265,7 @@ def test_get_route_segments_geocode_error(mock_settings, mock_gmaps_client, test
         'legs': [{
             'steps': [
                 {
-                    'end_location': {'lat': 52.5, 'lng': 13.4},
+                    'end_location': {'lat': 52.34, 'lng': 14.55},  # Near DE/PL border
                     'distance': {'value': 45720}
                 }
             ]
@@ -190,7 +273,7 @@ def test_get_route_segments_geocode_error(mock_settings, mock_gmaps_client, test
     }]
     mock_gmaps_client.reverse_geocode.side_effect = googlemaps.exceptions.ApiError("Geocoding Error")
 
-    with patch('googlemaps.Client', return_value=mock_gmaps_client):
+    with patch('src.infrastructure.services.google_maps_service.GoogleMapsClient', return_value=mock_gmaps_client):
         service = GoogleMapsService()
         with pytest.raises(LocationServiceError, match="Failed to get route segments"):
             service.get_route_segments(origin, dest)
@@ -201,7 +284,303 @@ def test_get_route_segments_invalid_response(mock_settings, mock_gmaps_client, t
     origin, dest = test_locations
     mock_gmaps_client.directions.return_value = [{}]  # Invalid response
 
-    with patch('googlemaps.Client', return_value=mock_gmaps_client):
+    with patch('src.infrastructure.services.google_maps_service.GoogleMapsClient', return_value=mock_gmaps_client):
         service = GoogleMapsService()
         with pytest.raises(LocationServiceError, match="Invalid route data"):
             service.get_route_segments(origin, dest)
+
+
+def test_directions_served_from_response_cache(mock_settings, mock_gmaps_client, test_locations):
+    """Test repeated route lookups reuse the cached directions response."""
+    origin, dest = test_locations
+
+    with patch('src.infrastructure.services.google_maps_service.GoogleMapsClient', return_value=mock_gmaps_client):
+        service = GoogleMapsService()
+        first = service.get_route_segments(origin, dest)
+        second = service.get_route_segments(origin, dest)
+
+    assert first == second
+    assert mock_gmaps_client.directions.call_count == 1
+    assert service.response_cache.get_stats()["hits"] >= 1
+
+
+def test_distance_and_duration_share_one_request(mock_settings, mock_gmaps_client, test_locations):
+    """Test distance and duration for the same pair make one matrix request."""
+    origin, dest = test_locations
+
+    with patch('src.infrastructure.services.google_maps_service.GoogleMapsClient', return_value=mock_gmaps_client):
+        service = GoogleMapsService()
+        assert service.calculate_distance(origin, dest) == 1.0
+        assert service.calculate_duration(origin, dest) == 1.0
+
+    assert mock_gmaps_client.distance_matrix.call_count == 1
+
+
+def test_response_cache_shared_between_services(tmp_path, mock_settings, mock_gmaps_client, test_locations):
+    """Test services using the same cache file reuse each other's responses."""
+    origin, dest = test_locations
+    mock_settings.api.gmaps_cache_path = str(tmp_path / "gmaps_cache.db")
+
+    with patch('src.infrastructure.services.google_maps_service.GoogleMapsClient', return_value=mock_gmaps_client):
+        GoogleMapsService().get_route_segments(origin, dest)
+        GoogleMapsService().get_route_segments(origin, dest)
+
+    assert mock_gmaps_client.directions.call_count == 1
+
+
+def test_services_use_the_shared_response_cache(mock_settings, mock_gmaps_client, test_locations):
+    """Test services built per request share one cache connection and its stats."""
+    origin, dest = test_locations
+
+    with patch('src.infrastructure.services.google_maps_service.GoogleMapsClient', return_value=mock_gmaps_client):
+        first = GoogleMapsService()
+        second = GoogleMapsService()
+        first.get_route_segments(origin, dest)
+        second.get_route_segments(origin, dest)
+
+    assert first.response_cache is second.response_cache is get_response_cache()
+    assert second.response_cache.get_stats()["hits"] >= 1
+
+
+def test_get_route_summary_single_request(mock_settings, mock_gmaps_client, test_locations):
+    """Test the route summary is built from one directions response."""
+    origin, dest = test_locations
+    mock_gmaps_client.directions.return_value = [{
+        'overview_polyline': {'points': 'abc'},
+        'legs': [{
+            'distance': {'value': 575000},
+            'duration': {'value': 21600},
+            'steps': [
+                {
+                    'distance': {'value': 90000},
+                    'duration': {'value': 3600},
+                    'start_location': {'lat': 52.52, 'lng': 13.405},
+                    'end_location': {'lat': 52.35, 'lng': 14.0}
+                },
+                {
+                    'distance': {'value': 485000},
+                    'duration': {'value': 18000},
+                    'start_location': {'lat': 52.35, 'lng': 14.0},
+                    'end_location': {'lat': 52.2297, 'lng': 21.0122}
+                }
+            ]
+        }]
+    }]
+
+    with patch('src.infrastructure.services.google_maps_service.GoogleMapsClient', return_value=mock_gmaps_client):
+        service = GoogleMapsService()
+        summary = service.get_route_summary(origin, dest)
+
+    assert summary.distance_km == Decimal('575')
+    assert summary.duration_hours == Decimal('6')
+    assert summary.polyline == 'abc'
+    assert len(summary.steps) == 2
+    assert [s.country_code for s in summary.country_segments] == ['DE', 'PL']
+    assert mock_gmaps_client.directions.call_count == 1
+    mock_gmaps_client.distance_matrix.assert_not_called()
+    mock_gmaps_client.reverse_geocode.assert_not_called()
+
+
+def test_get_route_summary_sums_steps_without_leg_totals(mock_settings, mock_gmaps_client, test_locations):
+    """Test totals fall back to step values when legs carry none."""
+    origin, dest = test_locations
+
+    with patch('src.infrastructure.services.google_maps_service.GoogleMapsClient', return_value=mock_gmaps_client):
+        service = GoogleMapsService()
+        summary = service.get_route_summary(origin, dest)
+
+    assert summary.distance_km == Decimal('1')
+    assert summary.duration_hours == Decimal('1')
+    assert summary.polyline is None
+
+
+def test_get_route_summary_no_route(mock_settings, mock_gmaps_client, test_locations):
+    """Test the route summary fails when no route is found."""
+    origin, dest = test_locations
+    mock_gmaps_client.directions.return_value = []
+
+    with patch('src.infrastructure.services.google_maps_service.GoogleMapsClient', return_value=mock_gmaps_client):
+        service = GoogleMapsService()
+        with pytest.raises(LocationServiceError, match="Failed to get route summary: No route found"):
+            service.get_route_summary(origin, dest)
+
+
+def test_get_route_segments_makes_no_matrix_request(mock_settings, mock_gmaps_client, test_locations):
+    """Test route segments only need the directions response."""
+    origin, dest = test_locations
+
+    with patch('src.infrastructure.services.google_maps_service.GoogleMapsClient', return_value=mock_gmaps_client):
+        service = GoogleMapsService()
+        service.get_route_segments(origin, dest)
+
+    mock_gmaps_client.distance_matrix.assert_not_called()
+
+
+def _matrix_response(origins, destinations, mode, units):
+    """Build a Distance Matrix response with distance growing by pair position."""
+    return {
+        'rows': [
+            {'elements': [
+                {
+                    'status': 'OK',
+                    'distance': {'value': int((o[0] + d[0]) * 1000)},
+                    'duration': {'value': 3600}
+                }
+                for d in destinations
+            ]}
+            for o in origins
+        ]
+    }
+
+
+def _grid_locations(count, offset=0.0):
+    """Create locations with distinct coordinates."""
+    return [
+        Location(address=f"Point {i}", latitude=50.0 + offset + i * 0.01, longitude=10.0 + i * 0.01)
+        for i in range(count)
+    ]
+
+
+def test_get_distance_matrix_splits_into_api_limits(mock_settings, mock_gmaps_client):
+    """Test large matrices are requested in blocks within the element limits."""
+    mock_gmaps_client.distance_matrix.side_effect = _matrix_response
+    origins = _grid_locations(30)
+    destinations = _grid_locations(12, offset=1.0)
+
+    with patch('src.infrastructure.services.google_maps_service.GoogleMapsClient', return_value=mock_gmaps_client):
+        service = GoogleMapsService()
+        matrix = service.get_distance_matrix(origins, destinations)
+
+    assert matrix.status == "OK"
+    assert len(matrix.distances) == 30
+    assert all(len(row) == 12 for row in matrix.distances)
+    for call in mock_gmaps_client.distance_matrix.call_args_list:
+        block_origins = call.kwargs['origins']
+        block_destinations = call.kwargs['destinations']
+        assert len(block_origins) <= 25 and len(block_destinations) <= 25
+        assert len(block_origins) * len(block_destinations) <= 100
+    assert mock_gmaps_client.distance_matrix.call_count == 4
+    expected = (origins[17].latitude + destinations[5].latitude)
+    assert matrix.get_distance(17, 5) == pytest.approx(int(expected * 1000) / 1000.0)
+    assert matrix.get_duration(17, 5) == 1.0
+
+
+def test_get_distance_matrix_dedupes_coordinates(mock_settings, mock_gmaps_client):
+    """Test repeated coordinates are requested once and fanned back out."""
+    mock_gmaps_client.distance_matrix.side_effect = _matrix_response
+    depot, pickup = _grid_locations(2)
+    origins = [depot, pickup, depot]
+    destinations = [pickup, pickup]
+
+    with patch('src.infrastructure.services.google_maps_service.GoogleMapsClient', return_value=mock_gmaps_client):
+        service = GoogleMapsService()
+        matrix = service.get_distance_matrix(origins, destinations)
+
+    call = mock_gmaps_client.distance_matrix.call_args
+    assert len(call.kwargs['origins']) == 2
+    assert len(call.kwargs['destinations']) == 1
+    assert matrix.distances[0] == matrix.distances[2]
+    assert matrix.distances[0][0] == matrix.distances[0][1]
+
+
+def test_get_distance_matrix_marks_unreachable_pairs(mock_settings, mock_gmaps_client):
+    """Test pairs without a route do not fail the whole matrix."""
+    mock_gmaps_client.distance_matrix.return_value = {
+        'rows': [{'elements': [
+            {'status': 'OK', 'distance': {'value': 5000}, 'duration': {'value': 1800}},
+            {'status': 'ZERO_RESULTS'}
+        ]}]
+    }
+    origins = _grid_locations(1)
+    destinations = _grid_locations(2, offset=1.0)
+
+    with patch('src.infrastructure.services.google_maps_service.GoogleMapsClient', return_value=mock_gmaps_client):
+        service = GoogleMapsService()
+        matrix = service.get_distance_matrix(origins, destinations)
+
+    assert matrix.status == "PARTIAL"
+    assert matrix.get_distance(0, 0) == 5.0
+    assert matrix.get_distance(0, 1) == float("inf")
+    assert matrix.get_country(0, 0) == "DE"
+
+
+def test_get_distance_matrix_country_fallbacks_on_index_miss(mock_settings, mock_gmaps_client):
+    """Test origins the offline index misses get a country or an explicit unknown."""
+    mock_gmaps_client.distance_matrix.side_effect = _matrix_response
+    mock_gmaps_client.reverse_geocode.side_effect = [
+        [{'address_components': [{'types': ['country'], 'long_name': 'Poland', 'short_name': 'PL'}]}],
+        []
+    ]
+    country_index = Mock()
+    country_index.lookup.return_value = None
+    geocoded, offshore, named = _grid_locations(3)
+    named = named.model_copy(update={"country": "Germany"})
+    origins = [geocoded, offshore, named, geocoded]
+
+    with patch('src.infrastructure.services.google_maps_service.GoogleMapsClient', return_value=mock_gmaps_client):
+        service = GoogleMapsService(country_index=country_index)
+        matrix = service.get_distance_matrix(origins, _grid_locations(1, offset=1.0))
+
+    assert [matrix.get_country(i, 0) for i in range(len(origins))] == ["PL", "unknown", "DE", "PL"]
+    assert mock_gmaps_client.reverse_geocode.call_count == 2
+
+
+def test_get_distance_matrix_reuses_cached_pairs(mock_settings, mock_gmaps_client, test_locations):
+    """Test single-pair lookups share cached matrix responses."""
+    origin, dest = test_locations
+
+    with patch('src.infrastructure.services.google_maps_service.GoogleMapsClient', return_value=mock_gmaps_client):
+        service = GoogleMapsService()
+        matrix = service.get_distance_matrix([origin], [dest])
+        assert service.calculate_distance(origin, dest) == matrix.get_distance(0, 0)
+
+    assert mock_gmaps_client.distance_matrix.call_count == 1
+
+
+def test_concurrent_route_lookups_are_coalesced(mock_settings, mock_gmaps_client, test_locations):
+    """Test identical lookups in flight share one directions request."""
+    origin, dest = test_locations
+    route = mock_gmaps_client.directions.return_value
+
+    def slow_directions(**kwargs):
+        time.sleep(0.1)
+        return route
+
+    mock_gmaps_client.directions.side_effect = slow_directions
+    single_flight = SingleFlight("test")
+    barrier = threading.Barrier(4)
+
+    with patch('src.infrastructure.services.google_maps_service.GoogleMapsClient', return_value=mock_gmaps_client):
+        service = GoogleMapsService(single_flight=single_flight)
+
+        def lookup(_):
+            barrier.wait()
+            return service.get_route_segments(origin, dest)
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(lookup, range(4)))
+
+    assert all(result == results[0] for result in results)
+    assert mock_gmaps_client.directions.call_count == 1
+    assert single_flight.get_stats()["coalesced"] == 3
+
+
+def test_nearby_coordinates_share_cached_routes(mock_settings, mock_gmaps_client, test_locations):
+    """Test coordinates a few meters apart reuse the cached directions response."""
+    origin, dest = test_locations
+    # About 10 m north of the original pickup point
+    nearby = origin.model_copy(update={"latitude": origin.latitude + 0.0001})
+
+    with patch('src.infrastructure.services.google_maps_service.GoogleMapsClient', return_value=mock_gmaps_client):
+        service = GoogleMapsService()
+        service.get_route_summary(origin, dest)
+        service.get_route_summary(nearby, dest)
+        assert mock_gmaps_client.directions.call_count == 1
+
+        # Precise lookups only reuse responses for the exact coordinates
+        service.get_route_summary(nearby, dest, precise=True)
+        assert mock_gmaps_client.directions.call_count == 2
+
+    stats = service.response_cache.get_stats()
+    assert stats["snapped_hits"] == 1
+    assert stats["hit_rate_improvement"] > 0
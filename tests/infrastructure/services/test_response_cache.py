@@ -0,0 +1,185 @@
+"""Test persistent response cache."""
+import sqlite3
+import time
+
+import pytest
+
+from src.infrastructure.services.coordinate_snapping import CoordinateSnapper
+from src.infrastructure.services.response_cache import PersistentResponseCache
+
+
+@pytest.fixture
+def cache():
+    """In-memory response cache."""
+    cache = PersistentResponseCache(ttl=60, max_entries=3)
+    yield cache
+    cache.close()
+
+
+def test_set_and_get(cache):
+    """Test storing and reading a response."""
+    key = cache.make_key("directions", origin=(52.52, 13.405))
+    cache.set(key, [{"legs": []}], operation="directions")
+    assert cache.get(key) == [{"legs": []}]
+
+
+def test_key_normalizes_coordinates(cache):
+    """Test float noise below the coordinate precision maps to one key."""
+    first = cache.make_key("directions", origin=(52.5200001, 13.405), mode="driving")
+    second = cache.make_key("directions", origin=[52.52, 13.4050002], mode="driving")
+    assert first == second
+    assert first != cache.make_key("directions", origin=(52.52, 13.405), mode="walking")
+    assert first != cache.make_key("distance_matrix", origin=(52.52, 13.405), mode="driving")
+
+
+def test_expired_entries_are_misses(cache):
+    """Test entries past their TTL are not returned."""
+    key = cache.make_key("directions", origin=(1.0, 2.0))
+    cache.set(key, {"ok": True}, ttl=1)
+    cache._conn.execute("UPDATE responses SET expires_at = ?", (time.time() - 1,))
+    assert cache.get(key) is None
+    assert cache.get_stats()["misses"] == 1
+
+
+def test_size_bound_evicts_least_recently_used(cache):
+    """Test the oldest accessed entry is evicted when full."""
+    keys = [cache.make_key("directions", n=n) for n in range(4)]
+    for n, key in enumerate(keys[:3]):
+        cache.set(key, {"n": n})
+        time.sleep(0.01)
+    cache.get(keys[0])  # keys[1] is now least recently used
+    cache.set(keys[3], {"n": 3})
+
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[0]) == {"n": 0}
+    stats = cache.get_stats()
+    assert stats["entries"] == 3
+    assert stats["evictions"] == 1
+
+
+def test_get_or_fetch(cache):
+    """Test misses call the fetcher once and hits reuse the stored response."""
+    calls = []
+
+    def fetch(**params):
+        calls.append(params)
+        return {"origin": params["origin"]}
+
+    first = cache.get_or_fetch("directions", fetch, origin=(1.0, 2.0))
+    second = cache.get_or_fetch("directions", fetch, origin=(1.0, 2.0))
+
+    assert first == {"origin": (1.0, 2.0)}
+    assert second == first
+    assert len(calls) == 1
+    stats = cache.get_stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["hit_rate"] == 0.5
+
+
+def test_empty_responses_are_not_cached(cache):
+    """Test empty responses are fetched again."""
+    calls = []
+    cache.get_or_fetch("directions", lambda **p: calls.append(p) or [], origin=(1.0, 2.0))
+    cache.get_or_fetch("directions", lambda **p: calls.append(p) or [], origin=(1.0, 2.0))
+    assert len(calls) == 2
+
+
+def test_persists_across_instances(tmp_path):
+    """Test a file-backed cache survives reopening."""
+    path = str(tmp_path / "cache" / "responses.db")
+    first = PersistentResponseCache(path=path)
+    key = first.make_key("directions", origin=(1.0, 2.0))
+    first.set(key, {"cached": True})
+    first.close()
+
+    second = PersistentResponseCache(path=path)
+    assert second.get(key) == {"cached": True}
+    second.close()
+
+
+def test_clear(cache):
+    """Test clearing the cache."""
+    key = cache.make_key("directions", origin=(1.0, 2.0))
+    cache.set(key, {"cached": True})
+    cache.clear()
+    assert cache.get(key) is None
+
+
+def test_invalid_configuration():
+    """Test invalid parameters are rejected."""
+    with pytest.raises(ValueError):
+        PersistentResponseCache(ttl=0)
+    with pytest.raises(ValueError):
+        PersistentResponseCache(max_entries=0)
+
+
+@pytest.fixture
+def snapped_cache():
+    """In-memory response cache snapping coordinates to 100 m cells."""
+    cache = PersistentResponseCache(ttl=60, snapper=CoordinateSnapper(100.0))
+    yield cache
+    cache.close()
+
+
+def test_snapped_keys_share_nearby_coordinates(snapped_cache):
+    """Test coordinates within a cell map to one key unless precise."""
+    first = snapped_cache.make_key("directions", origin=(52.52001, 13.40501))
+    second = snapped_cache.make_key("directions", origin=(52.52003, 13.40504))
+    assert first == second
+    assert first != snapped_cache.make_key("directions", origin=(52.53, 13.405))
+    assert (
+        snapped_cache.make_key("directions", precise=True, origin=(52.52001, 13.40501))
+        != snapped_cache.make_key("directions", precise=True, origin=(52.52003, 13.40504))
+    )
+
+
+def test_snapping_applies_to_coordinate_lists(snapped_cache):
+    """Test matrix-style coordinate lists are snapped point by point."""
+    first = snapped_cache.make_key("distance_matrix", origins=[(52.52001, 13.40501), (48.13501, 11.58201)])
+    second = snapped_cache.make_key("distance_matrix", origins=[(52.52003, 13.40504), (48.13503, 11.58203)])
+    assert first == second
+
+
+def test_snapping_stats_report_hit_rate_improvement(snapped_cache):
+    """Test hits only found through snapping are counted separately."""
+    calls = []
+
+    def fetch(**params):
+        calls.append(params)
+        return {"origin": params["origin"]}
+
+    snapped_cache.get_or_fetch("directions", fetch, origin=(52.52001, 13.40501))
+    snapped_cache.get_or_fetch("directions", fetch, origin=(52.52001, 13.40501))
+    snapped_cache.get_or_fetch("directions", fetch, origin=(52.52003, 13.40504))
+    snapped_cache.get_or_fetch("directions", fetch, precise=True, origin=(52.52003, 13.40504))
+
+    assert len(calls) == 2
+    stats = snapped_cache.get_stats()
+    assert stats["snapping"] == "grid:100m"
+    assert stats["hits"] == 2
+    assert stats["snapped_hits"] == 1
+    assert stats["hit_rate"] == 0.5
+    assert stats["exact_hit_rate"] == 0.25
+    assert stats["hit_rate_improvement"] == 0.25
+
+
+def test_opens_cache_created_without_exact_keys(tmp_path):
+    """Test databases from before snapping gain the exact key column."""
+    path = str(tmp_path / "responses.db")
+    conn = sqlite3.connect(path)
+    conn.execute(
+        "CREATE TABLE responses (key TEXT PRIMARY KEY, operation TEXT NOT NULL, "
+        "payload TEXT NOT NULL, expires_at REAL NOT NULL, accessed_at REAL NOT NULL)"
+    )
+    conn.execute(
+        "INSERT INTO responses VALUES (?, ?, ?, ?, ?)",
+        ("old", "directions", '{"cached": true}', time.time() + 60, time.time())
+    )
+    conn.commit()
+    conn.close()
+
+    cache = PersistentResponseCache(path=path, snapper=CoordinateSnapper(100.0))
+    assert cache.get("old", exact_key="other") == {"cached": True}
+    assert cache.get_stats()["snapped_hits"] == 0
+    cache.close()
@@ -0,0 +1,146 @@
+"""Test bulk country segmentation of route polylines."""
+from decimal import Decimal
+
+import numpy as np
+import pytest
+
+from src.infrastructure.services.route_segmenter import (
+    RouteSegmenter, decode_polyline, decode_polylines, haversine_km
+)
+
+
+def _encode(points):
+    """Encode coordinates in the Google polyline format."""
+    chunks = []
+    previous = (0, 0)
+    for lat, lng in points:
+        current = (round(lat * 1e5), round(lng * 1e5))
+        for delta in (current[0] - previous[0], current[1] - previous[1]):
+            value = ~(delta << 1) if delta < 0 else delta << 1
+            while value >= 0x20:
+                chunks.append(chr((0x20 | (value & 0x1F)) + 63))
+                value >>= 5
+            chunks.append(chr(value + 63))
+        previous = current
+    return "".join(chunks)
+
+
+def _line(start, end, count):
+    """Evenly spaced points between two coordinates."""
+    return [tuple(point) for point in np.linspace(start, end, count)]
+
+
+def _step(points, distance_m, duration_s):
+    return {
+        'polyline': {'points': _encode(points)},
+        'distance': {'value': distance_m},
+        'duration': {'value': duration_s}
+    }
+
+
+# Berlin to Poznan, crossing the German-Polish border near 14.6 E
+BERLIN = (52.52, 13.405)
+BORDER_WEST = (52.35, 14.45)
+BORDER_EAST = (52.35, 14.75)
+POZNAN = (52.4064, 16.9252)
+
+BERLIN_POZNAN = {
+    'legs': [{
+        'distance': {'value': 280000},
+        'duration': {'value': 10800},
+        'steps': [
+            _step(_line(BERLIN, BORDER_WEST, 40), 80000, 3600),
+            _step(_line(BORDER_WEST, BORDER_EAST, 20), 20000, 900),
+            _step(_line(BORDER_EAST, POZNAN, 60), 180000, 6300)
+        ]
+    }],
+    'overview_polyline': {'points': _encode(_line(BERLIN, POZNAN, 200))}
+}
+
+
+def test_decode_polyline():
+    """Test decoding the reference polyline."""
+    coordinates = decode_polyline("_p~iF~ps|U_ulLnnqC_mqNvxq`@")
+    np.testing.assert_allclose(coordinates, [[38.5, -120.2], [40.7, -120.95], [43.252, -126.453]])
+
+
+def test_decode_polylines_restarts_each_polyline():
+    """Test several polylines decode into one array with offsets."""
+    first = [(52.52, 13.405), (52.4, 14.0)]
+    second = [(48.1351, 11.582)]
+    coordinates, offsets = decode_polylines([_encode(first), "", _encode(second)])
+
+    assert offsets.tolist() == [0, 2, 2, 3]
+    np.testing.assert_allclose(coordinates, first + second)
+
+
+def test_decode_rejects_malformed_polylines():
+    """Test truncated and invalid input is rejected."""
+    with pytest.raises(ValueError):
+        decode_polyline("_p~iF~ps|U_")
+    with pytest.raises(ValueError):
+        decode_polyline("_p~iF")
+    with pytest.raises(ValueError):
+        decode_polyline("ab cd")
+
+
+def test_haversine_km():
+    """Test great-circle lengths between consecutive points."""
+    lengths = haversine_km(np.array([BERLIN, (52.2297, 21.0122)]))
+    assert lengths.shape == (1,)
+    assert lengths[0] == pytest.approx(517, abs=2)
+
+
+def test_segment_route_from_step_polylines():
+    """Test steps are split at the border and keep the reported totals."""
+    segments = RouteSegmenter().segment_route(BERLIN_POZNAN)
+
+    assert [segment.country_code for segment in segments] == ["DE", "PL"]
+    assert sum(segment.distance for segment in segments) == Decimal("280")
+    assert sum(segment.duration_hours for segment in segments) == Decimal("3")
+    # The border step is split roughly where it crosses 14.6 E
+    assert Decimal("85") < segments[0].distance < Decimal("95")
+
+
+def test_segment_route_from_overview_polyline():
+    """Test routes without step polylines use the overview with leg totals."""
+    route = {
+        'legs': [{'distance': {'value': 280000}, 'duration': {'value': 10800}, 'steps': []}],
+        'overview_polyline': BERLIN_POZNAN['overview_polyline']
+    }
+    segments = RouteSegmenter().segment_route(route)
+
+    assert [segment.country_code for segment in segments] == ["DE", "PL"]
+    assert sum(segment.distance for segment in segments) == Decimal("280")
+
+
+def test_segment_routes_in_bulk_matches_single_routes():
+    """Test a batch gives the same segments as routes one by one."""
+    segmenter = RouteSegmenter()
+    reverse = {
+        'legs': [{'distance': {'value': 280000}, 'duration': {'value': 10800}}],
+        'overview_polyline': {'points': _encode(_line(POZNAN, BERLIN, 200))}
+    }
+
+    batch = segmenter.segment_routes([BERLIN_POZNAN, reverse, BERLIN_POZNAN])
+
+    assert batch[0] == segmenter.segment_route(BERLIN_POZNAN)
+    assert batch[1] == segmenter.segment_route(reverse)
+    assert [segment.country_code for segment in batch[1]] == ["PL", "DE"]
+    assert batch[2] == batch[0]
+
+
+def test_segment_polyline_requires_duration():
+    """Test a polyline without a duration is rejected."""
+    segmenter = RouteSegmenter()
+    with pytest.raises(ValueError, match="duration"):
+        segmenter.segment_polyline(BERLIN_POZNAN['overview_polyline']['points'])
+
+    segments = segmenter.segment_polyline(BERLIN_POZNAN['overview_polyline']['points'], duration_hours=3.0)
+    assert sum(segment.duration_hours for segment in segments) == Decimal("3")
+
+
+def test_route_without_polyline_is_rejected():
+    """Test routes without any polyline are rejected."""
+    with pytest.raises(ValueError, match="no polyline"):
+        RouteSegmenter().segment_route({'legs': [{'duration': {'value': 60}}]})
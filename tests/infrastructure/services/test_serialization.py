@@ -0,0 +1,116 @@
+"""Tests for cache value serialization."""
+from datetime import datetime
+from decimal import Decimal
+from uuid import uuid4
+
+import pytest
+
+from src.domain.services.common.cache import CacheService
+from src.infrastructure.services.serialization import (
+    SchemaVersionMismatch, SerializerRegistry, get_serializer_registry
+)
+from src.domain.value_objects import CostBreakdown, RouteOptimization
+from tests.mocks.fake_redis import FakeRedis
+
+
+def _cost_breakdown():
+    return CostBreakdown(
+        route_id=uuid4(),
+        fuel_costs={"DE": Decimal("120.50"), "PL": Decimal("80.25")},
+        toll_costs={"DE": Decimal("45.00")},
+        empty_driving_costs={"DE": {"fuel": Decimal("10.00")}},
+        total_cost=Decimal("255.75")
+    )
+
+
+def _route_optimization():
+    return RouteOptimization(
+        optimization_id=uuid4(),
+        timestamp=datetime(2024, 1, 1, 12, 0),
+        objective_value=0.8,
+        route_id=uuid4(),
+        original_distance=1000.0,
+        optimized_distance=950.0,
+        original_duration=12.0,
+        optimized_duration=11.5,
+        alternative_routes=[{"distance": 980.0}]
+    )
+
+
+@pytest.fixture
+def registry():
+    """Registry with the cached models registered."""
+    return get_serializer_registry()
+
+
+@pytest.mark.parametrize("serializer", get_serializer_registry().available)
+def test_round_trip_models_and_containers(registry, serializer):
+    """Test models nested in containers come back equal and typed."""
+    value = {"costs": [_cost_breakdown()], "optimization": _route_optimization(), "n": 3}
+
+    loaded = registry.loads(registry.dumps(value, serializer))
+
+    assert loaded == value
+    assert isinstance(loaded["costs"][0], CostBreakdown)
+    assert loaded["costs"][0].fuel_costs["DE"] == Decimal("120.50")
+    assert loaded["optimization"].model_fields_set == value["optimization"].model_fields_set
+
+
+def test_loads_skips_validation(registry, monkeypatch):
+    """Test cached models are rebuilt without running validators."""
+    payload = registry.dumps(_cost_breakdown())
+
+    def fail(*args, **kwargs):
+        raise AssertionError("validated on load")
+    monkeypatch.setattr(CostBreakdown, "__init__", fail)
+
+    assert isinstance(registry.loads(payload), CostBreakdown)
+
+
+def test_schema_version_change_rejects_payload():
+    """Test payloads written with an older model version are not loaded."""
+    old = SerializerRegistry()
+    old.register_model(CostBreakdown, version=1)
+    payload = old.dumps(_cost_breakdown())
+
+    get_serializer_registry().register_model(CostBreakdown, version=2)
+    try:
+        with pytest.raises(SchemaVersionMismatch):
+            get_serializer_registry().loads(payload)
+    finally:
+        get_serializer_registry().register_model(CostBreakdown, version=1)
+
+
+def test_unknown_payloads_are_rejected(registry):
+    """Test values not written by the registry are refused."""
+    assert not registry.is_payload(b"{}")
+    with pytest.raises(ValueError):
+        registry.loads(b"not a payload")
+    with pytest.raises(ValueError):
+        registry.dumps(1, serializer="unknown")
+
+
+def test_cache_redis_values_are_payloads():
+    """Test models round-trip through Redis as payloads."""
+    redis = FakeRedis()
+    writer = CacheService(redis_client=redis)
+    reader = CacheService(redis_client=redis)
+    breakdown = _cost_breakdown()
+
+    writer.set("cost:1", breakdown, ttl=60)
+
+    assert isinstance(redis.get("cost:1"), bytes)
+    assert reader.get("cost:1") == breakdown
+
+
+def test_cache_treats_stale_schema_as_miss():
+    """Test Redis values of another schema version are cache misses."""
+    redis = FakeRedis()
+    old = SerializerRegistry()
+    old.register_model(CostBreakdown, version=0)
+    redis.set("cost:1", old.dumps(_cost_breakdown()), ex=60)
+    redis.set("cost:2", old.dumps(_cost_breakdown()), ex=60)
+    cache = CacheService(redis_client=redis)
+
+    assert cache.get("cost:1", default="miss") == "miss"
+    assert cache.get_many(["cost:2"]) == {}
@@ -0,0 +1,69 @@
+"""Test host-wide shared cache tier."""
+import time
+from decimal import Decimal
+
+import pytest
+
+from src.infrastructure.services.shared_cache import SharedCacheTier
+
+
+@pytest.fixture
+def path(tmp_path):
+    """Database file shared by the tiers of one test."""
+    return str(tmp_path / "shared.db")
+
+
+def test_workers_share_entries(path):
+    """Test a value written through one connection is read through another."""
+    first, second = SharedCacheTier(path), SharedCacheTier(path)
+    try:
+        first.set("cost:1", {"total": Decimal("12.50"), "items": [1, 2]}, ttl=60)
+        value, expires_at = second.get("cost:1")
+        assert value == {"total": Decimal("12.50"), "items": [1, 2]}
+        assert expires_at > time.time()
+        assert second.get_stats()["hits"] == 1
+    finally:
+        first.close()
+        second.close()
+
+
+def test_expired_entries_are_misses():
+    """Test entries past their TTL are not returned."""
+    tier = SharedCacheTier()
+    tier.set("a", 1, ttl=60)
+    tier._conn.execute("UPDATE entries SET expires_at = ?", (time.time() - 1,))
+    assert tier.get("a") is None
+    assert tier.get_stats()["misses"] == 1
+
+
+def test_invalidate_tag_and_delete():
+    """Test tag invalidation removes only tagged entries."""
+    tier = SharedCacheTier()
+    tier.set("cost:1", 1, ttl=60, tags=["country:DE"])
+    tier.set("cost:2", 2, ttl=60, tags=["country:PL"])
+
+    assert tier.invalidate_tag("country:DE") == ["cost:1"]
+    assert tier.get("cost:1") is None
+    assert tier.get("cost:2") == (2, pytest.approx(time.time() + 60, abs=5))
+    assert tier.delete("cost:2")
+    assert not tier.delete("cost:2")
+
+
+def test_size_bound_evicts_soonest_expiring():
+    """Test the table is bounded by dropping entries closest to expiry."""
+    tier = SharedCacheTier(max_entries=50)
+    for n in range(100):
+        tier.set(f"k{n}", n, ttl=1000 + n)
+
+    stats = tier.get_stats()
+    assert stats["entries"] == 50
+    assert stats["evictions"] == 50
+    assert tier.get("k0") is None
+    assert tier.get("k99")[0] == 99
+
+
+def test_unpicklable_values_are_skipped():
+    """Test values that cannot be pickled are not stored."""
+    tier = SharedCacheTier()
+    assert not tier.set("a", lambda: None, ttl=60)
+    assert tier.get("a") is None
@@ -0,0 +1,96 @@
+"""Tests for request coalescing."""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from src.infrastructure.services.single_flight import SingleFlight, get_single_flight
+
+
+def _run_concurrently(count, fn):
+    """Run a callable from several threads released at the same moment."""
+    barrier = threading.Barrier(count)
+
+    def call(_):
+        barrier.wait()
+        return fn()
+
+    with ThreadPoolExecutor(max_workers=count) as executor:
+        return list(executor.map(call, range(count)))
+
+
+def test_concurrent_calls_share_one_execution():
+    """Test callers for the same key wait on the call in flight."""
+    group = SingleFlight("test")
+    executions = []
+
+    def slow_lookup():
+        executions.append(1)
+        time.sleep(0.1)
+        return {"distance": 575}
+
+    results = _run_concurrently(5, lambda: group.do(("BER", "WAW"), slow_lookup))
+
+    assert results == [{"distance": 575}] * 5
+    assert len(executions) == 1
+    stats = group.get_stats()
+    assert stats["calls"] == 5
+    assert stats["executions"] == 1
+    assert stats["coalesced"] == 4
+    assert stats["in_flight"] == 0
+
+
+def test_errors_are_shared():
+    """Test waiting callers receive the error of the call in flight."""
+    group = SingleFlight("test")
+
+    def failing_lookup():
+        time.sleep(0.1)
+        raise RuntimeError("quota exceeded")
+
+    def call():
+        try:
+            group.do("lane", failing_lookup)
+        except RuntimeError as e:
+            return str(e)
+
+    assert _run_concurrently(3, call) == ["quota exceeded"] * 3
+    assert group.get_stats()["executions"] == 1
+
+
+def test_different_keys_run_independently():
+    """Test calls for different keys are not coalesced."""
+    group = SingleFlight("test")
+
+    assert group.do("a", lambda: 1) == 1
+    assert group.do("b", lambda: 2) == 2
+    assert group.get_stats()["coalesced"] == 0
+
+
+def test_sequential_calls_run_again():
+    """Test a finished call does not answer later callers."""
+    group = SingleFlight("test")
+    calls = []
+
+    group.do("lane", lambda: calls.append(1))
+    group.do("lane", lambda: calls.append(1))
+
+    assert len(calls) == 2
+    assert group.get_stats()["executions"] == 2
+
+
+def test_failed_call_releases_key():
+    """Test a failed call does not block later callers."""
+    group = SingleFlight("test")
+
+    with pytest.raises(ValueError):
+        group.do("lane", lambda: (_ for _ in ()).throw(ValueError("boom")))
+
+    assert group.do("lane", lambda: "ok") == "ok"
+
+
+def test_get_single_flight_is_shared():
+    """Test groups are shared by name within the process."""
+    assert get_single_flight("google_maps") is get_single_flight("google_maps")
+    assert get_single_flight("google_maps") is not get_single_flight("toll_rates")
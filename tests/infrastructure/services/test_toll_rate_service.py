@@ -8,6 +8,8 @@ from uuid import UUID
 from src.domain.value_objects import Location
 from src.domain.entities.route import Route
 from src.domain.interfaces.services.toll_rate_service import TollRateServiceError
+from src.infrastructure.services.coordinate_snapping import CoordinateSnapper
+from src.infrastructure.services.response_cache import PersistentResponseCache
 from src.infrastructure.services.toll_rate_service import GoogleMapsTollRateService
 from src.infrastructure.data.toll_roads import TOLL_RATES
 
@@ -76,7 +78,7 @@ def mock_repository():
 @pytest.fixture
 def service(mock_repository):
     """Create a service instance with mocked dependencies."""
-    with patch('googlemaps.Client') as mock_client:
+    with patch('src.infrastructure.services.toll_rate_service.GoogleMapsClient') as mock_client:
         # Configure mock client
         instance = mock_client.return_value
         instance.directions.return_value = [MOCK_GMAPS_RESPONSE]
@@ -84,17 +86,18 @@ def service(mock_repository):
         # Create service
         service = GoogleMapsTollRateService(
             api_key="test_key",
-            route_repository=mock_repository
+            route_repository=mock_repository,
+            response_cache=PersistentResponseCache(snapper=CoordinateSnapper(100.0))
         )
         return service
 
 
 def test_service_initialization():
     """Test service initialization with explicit API key."""
-    with patch('googlemaps.Client') as mock_client:
+    with patch('src.infrastructure.services.toll_rate_service.GoogleMapsClient') as mock_client:
         service = GoogleMapsTollRateService(api_key="test_key")
         assert service.api_key == "test_key"
-        mock_client.assert_called_once_with(key="test_key")
+        mock_client.assert_called_once_with("test_key")
 
 
 def test_clean_html(service):
@@ -186,3 +189,16 @@ def test_unsupported_operations(service):
     
     with pytest.raises(NotImplementedError):
         service.get_rate_history("DE", datetime.now(), datetime.now())
+
+
+def test_toll_data_is_cached_for_nearby_lanes(service):
+    """Test nearby coordinates reuse the cached toll route unless precise."""
+    client = service.client
+    nearby = Location(address="Frankfurt, Germany", latitude=50.11095, longitude=8.68215)
+
+    service._get_toll_data(FRANKFURT, MUNICH, "truck")
+    service._get_toll_data(nearby, MUNICH, "truck")
+    assert client.directions.call_count == 1
+
+    service._get_toll_data(nearby, MUNICH, "truck", precise=True)
+    assert client.directions.call_count == 2
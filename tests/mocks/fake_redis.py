@@ -0,0 +1,135 @@
+"""In-process Redis stand-in for cache tests."""
+import time
+from typing import Any, Dict, List, Optional, Set
+
+
+class FakeRedis:
+    """Dict-backed subset of the redis-py client.
+
+    Every direct command and every pipeline execute() counts as one round
+    trip, so tests can assert how many network calls a bulk operation makes.
+    Values are kept as given rather than serialized.
+    """
+
+    def __init__(self):
+        self._data: Dict[str, Any] = {}
+        self._expires: Dict[str, float] = {}
+        self.round_trips = 0
+
+    def pipeline(self, transaction: bool = True) -> "FakePipeline":
+        return FakePipeline(self)
+
+    def get(self, key: str) -> Optional[Any]:
+        self.round_trips += 1
+        return self._get(key)
+
+    def mget(self, keys: List[str]) -> List[Optional[Any]]:
+        self.round_trips += 1
+        return [self._get(key) for key in keys]
+
+    def set(self, key: str, value: Any, ex: Optional[float] = None) -> bool:
+        self.round_trips += 1
+        return self._set(key, value, ex)
+
+    def ttl(self, key: str) -> int:
+        self.round_trips += 1
+        return self._ttl(key)
+
+    def expire(self, key: str, seconds: float) -> bool:
+        self.round_trips += 1
+        return self._expire(key, seconds)
+
+    def delete(self, *keys: str) -> int:
+        self.round_trips += 1
+        return self._delete(*keys)
+
+    def sadd(self, key: str, *members: str) -> int:
+        self.round_trips += 1
+        return self._sadd(key, *members)
+
+    def srem(self, key: str, *members: str) -> int:
+        self.round_trips += 1
+        members_set = self._get(key) or set()
+        removed = len(members_set & set(members))
+        members_set -= set(members)
+        return removed
+
+    def smembers(self, key: str) -> Set[bytes]:
+        self.round_trips += 1
+        return {member.encode() for member in self._get(key) or set()}
+
+    def flushdb(self) -> bool:
+        self.round_trips += 1
+        self._data.clear()
+        self._expires.clear()
+        return True
+
+    def dbsize(self) -> int:
+        self.round_trips += 1
+        return sum(1 for key in list(self._data) if self._get(key) is not None)
+
+    def info(self) -> Dict[str, Any]:
+        self.round_trips += 1
+        return {"used_memory": 0, "keyspace_hits": 0, "keyspace_misses": 0}
+
+    def _get(self, key: str) -> Optional[Any]:
+        expires_at = self._expires.get(key)
+        if expires_at is not None and expires_at <= time.time():
+            self._delete(key)
+        return self._data.get(key)
+
+    def _set(self, key: str, value: Any, ex: Optional[float] = None) -> bool:
+        self._data[key] = value
+        self._expires.pop(key, None)
+        if ex is not None:
+            self._expires[key] = time.time() + ex
+        return True
+
+    def _ttl(self, key: str) -> int:
+        if self._get(key) is None:
+            return -2
+        if key not in self._expires:
+            return -1
+        return int(self._expires[key] - time.time())
+
+    def _expire(self, key: str, seconds: float) -> bool:
+        if self._get(key) is None:
+            return False
+        self._expires[key] = time.time() + seconds
+        return True
+
+    def _delete(self, *keys: str) -> int:
+        deleted = 0
+        for key in keys:
+            if self._data.pop(key, None) is not None:
+                deleted += 1
+            self._expires.pop(key, None)
+        return deleted
+
+    def _sadd(self, key: str, *members: str) -> int:
+        members_set = self._data.setdefault(key, set())
+        added = len(set(members) - members_set)
+        members_set.update(members)
+        return added
+
+
+class FakePipeline:
+    """Queues commands and runs them in one round trip."""
+
+    def __init__(self, redis: FakeRedis):
+        self._redis = redis
+        self._commands = []
+
+    def __getattr__(self, name: str):
+        command = getattr(self._redis, f"_{name}")
+
+        def queue(*args, **kwargs):
+            self._commands.append((command, args, kwargs))
+            return self
+        return queue
+
+    def execute(self) -> List[Any]:
+        self._redis.round_trips += 1
+        results = [command(*args, **kwargs) for command, args, kwargs in self._commands]
+        self._commands = []
+        return results
@@ -0,0 +1,39 @@
+"""In-process cost repository stand-in for recalculation tests."""
+
+
+class MemoryCostRepository:
+    """Dict-backed stand-in for the stored cost dependencies.
+
+    Saved costs keep the amounts their dependencies recompute to, and
+    update_components overwrites single entries, like the database
+    repository does.
+    """
+
+    def __init__(self):
+        self.dependencies = {}
+        self.amounts = {}
+        self.failing = set()
+
+    def save(self, cost_id, dependencies, rates):
+        self.dependencies[cost_id] = dependencies
+        self.amounts[cost_id] = {
+            path: dependency.recompute(rates) for path, dependency in dependencies.items()
+        }
+
+    def get_dependencies(self, cost_id):
+        if cost_id in self.failing:
+            raise RuntimeError("storage unavailable")
+        return self.dependencies[cost_id]
+
+    def find_by_settings_keys(self, keys):
+        return {
+            cost_id: {path for path, dependency in dependencies.items() if dependency.keys & set(keys)}
+            for cost_id, dependencies in self.dependencies.items()
+            if any(dependency.keys & set(keys) for dependency in dependencies.values())
+        }
+
+    def list_settings_keys(self):
+        return {key for dependencies in self.dependencies.values() for dependency in dependencies.values() for key in dependency.keys}
+
+    def update_components(self, cost_id, amounts):
+        self.amounts[cost_id].update(amounts)